@@ -20,23 +20,34 @@ The BaseApiClient is intended to be a private module and is subject to change.
 """
 
 import asyncio
+import base64
+import collections
+from collections.abc import AsyncGenerator
 from collections.abc import Generator
+from collections.abc import Sequence
+import concurrent.futures
 import copy
+import datetime
+import functools
+import importlib.util
 from dataclasses import dataclass
 import inspect
 import io
 import json
 import logging
 import math
+import mmap
 import os
 import random
+import re
 import ssl
 import sys
 import threading
 import time
-from typing import Any, AsyncIterator, Iterator, Optional, TYPE_CHECKING, Tuple, Union
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional, TYPE_CHECKING, Tuple, Union
 from urllib.parse import urlparse
 from urllib.parse import urlunparse
+import uuid
 import warnings
 
 import anyio
@@ -51,21 +62,22 @@ from pydantic import BaseModel
 from pydantic import ValidationError
 import tenacity
 
+from . import _circuit_breaker
 from . import _common
+from . import _hedging
+from . import _json_codec
+from . import _rate_limiter
+from . import _token_refresher
 from . import errors
+from . import instrumentation
 from . import version
+from .types import ConnectionPoolOptions
 from .types import HttpOptions
 from .types import HttpOptionsOrDict
 from .types import HttpResponse as SdkHttpResponse
 from .types import HttpRetryOptions
 from .types import ResourceScope
-
-
-try:
-  from websockets.asyncio.client import connect as ws_connect
-except ModuleNotFoundError:
-  # This try/except is for TAP, mypy complains about it which is why we have the type: ignore
-  from websockets.client import connect as ws_connect  # type: ignore
+from .types import WarmupResult
 
 
 has_aiohttp = False
@@ -95,6 +107,19 @@ READ_BUFFER_SIZE = 2**22
 MAX_RETRY_COUNT = 3
 INITIAL_RETRY_DELAY = 1  # second
 DELAY_MULTIPLIER = 2
+# Chunks of a resumable upload, except the last, must be multiples of 256 KiB.
+UPLOAD_CHUNK_GRANULARITY = 256 * 1024
+DOWNLOAD_CHUNK_SIZE = 2**20
+
+# The connection pool defaults of httpx.
+_HTTPX_MAX_CONNECTIONS = 100
+_HTTPX_MAX_KEEPALIVE_CONNECTIONS = 20
+_HTTPX_KEEPALIVE_EXPIRY = 5.0
+
+# Seconds before expiry that access tokens are refreshed in the background.
+# Larger than google-auth's own refresh threshold, so the background refresh
+# happens before requests consider the token expired.
+_TOKEN_REFRESH_MARGIN = 300.0
 
 _MULTI_REGIONAL_LOCATIONS = {'us', 'eu'}
 
@@ -105,6 +130,8 @@ _MULTI_REGIONAL_LOCATIONS = {'us', 'eu'}
 _HTTPX_RESPONSE_TYPES = (
     (httpx.Response,) if httpx2 is None else (httpx.Response, httpx2.Response)
 )
+# The type of a response sent by the httpx client, which may be either.
+_HttpxResponse = Union[httpx.Response, 'httpx2.Response']
 _HTTPX_HEADERS_TYPES = (
     (httpx.Headers,) if httpx2 is None else (httpx.Headers, httpx2.Headers)
 )
@@ -119,6 +146,20 @@ _HTTPX_TRANSIENT_EXC = (
     )
 )
 
+# Errors after which a streaming download resumes from the bytes written.
+_DOWNLOAD_RESUMABLE_EXC: tuple[type[Exception], ...] = (
+    (httpx.TransportError,)
+    if httpx2 is None
+    else (httpx.TransportError, httpx2.TransportError)
+)
+if has_aiohttp:
+  _DOWNLOAD_RESUMABLE_EXC += (
+      aiohttp.ClientPayloadError,
+      aiohttp.ClientConnectionError,
+      asyncio.TimeoutError,
+  )
+_CONTENT_RANGE = re.compile(r'bytes (\d+)-\d+/(\d+|\*)')
+
 
 class EphemeralTokenAPIKeyError(ValueError):
   """Error raised when the API key is invalid."""
@@ -211,6 +252,18 @@ def populate_server_timeout_header(
     headers['X-Server-Timeout'] = str(math.ceil(timeout_in_seconds))
 
 
+def _is_upload_chunk_accepted(response: Any) -> bool:
+  """Returns whether the server accepted a chunk that does not finalize."""
+  if isinstance(response, _HTTPX_RESPONSE_TYPES):
+    status_code = response.status_code
+  else:
+    status_code = response.status
+  return bool(
+      status_code < 400
+      and response.headers.get('x-goog-upload-status') == 'active'
+  )
+
+
 def join_url_path(base_url: str, path: str) -> str:
   parsed_base = urlparse(base_url)
   base_path = (
@@ -265,6 +318,382 @@ class HttpRequest:
   method: str
   data: Union[dict[str, object], bytes]
   timeout: Optional[float] = None
+  # The model whose rate limits the request is subject to, if any.
+  rate_limited_model: Optional[str] = None
+  estimated_tokens: int = 0
+  # Set when the client is instrumented.
+  request_id: Optional[int] = None
+  attempts: int = 0
+  # Emits the event of the last failed attempt, once it is known whether and
+  # when the attempt is retried.
+  failed_attempt: Optional[Callable[..., None]] = None
+
+
+class _MemoryMappedFile(io.RawIOBase):
+  """A read-only file whose reads return views of a memory map of the file.
+
+  Reads do not copy the file content: each chunk is a memoryview backed by the
+  page cache. The pages of the chunks read before are released from the
+  process as reading moves on, so that the resident memory of an upload stays
+  around the size of the chunks in flight.
+  """
+
+  def __init__(self, file: io.IOBase):
+    self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    self._view = memoryview(self._mmap)
+    self._position = 0
+    self._released = 0
+
+  def readable(self) -> bool:
+    return True
+
+  def seekable(self) -> bool:
+    return True
+
+  def tell(self) -> int:
+    return self._position
+
+  def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+    if whence == os.SEEK_CUR:
+      offset += self._position
+    elif whence == os.SEEK_END:
+      offset += len(self._view)
+    self._position = max(0, offset)
+    return self._position
+
+  def read(self, size: Optional[int] = -1) -> memoryview:  # type: ignore[override]
+    start = min(self._position, len(self._view))
+    end = len(self._view)
+    if size is not None and size >= 0:
+      end = min(start + size, end)
+    self._release_pages(start)
+    self._position = end
+    return self._view[start:end]
+
+  def _release_pages(self, end: int) -> None:
+    """Releases the pages mapped before `end` from the process."""
+    end -= end % mmap.PAGESIZE
+    if end > self._released:
+      self._mmap.madvise(
+          mmap.MADV_DONTNEED, self._released, end - self._released
+      )
+      self._released = end
+
+  def close(self) -> None:
+    if not self.closed:
+      self._view.release()
+      try:
+        self._mmap.close()
+      except BufferError:
+        # A chunk is still referenced. The map is closed once it is collected.
+        pass
+    super().close()
+
+
+def _memory_map(file: io.IOBase) -> Optional[_MemoryMappedFile]:
+  """Maps a file to memory, or returns None if it cannot be read that way."""
+  if not hasattr(mmap, 'MADV_DONTNEED'):
+    # Without releasing pages the whole file would become resident.
+    return None
+  try:
+    return _MemoryMappedFile(file)
+  except (OSError, ValueError):
+    # Empty files and some special files cannot be mapped.
+    return None
+
+
+def _upload_content(chunk: Union[bytes, memoryview]) -> Any:
+  """Returns the request content that sends an upload chunk without a copy."""
+  if isinstance(chunk, memoryview):
+    # httpx reads any content that is not bytes as an iterable of byte strings.
+    return [chunk]
+  return chunk
+
+
+def _range_header(start: int, end: Optional[int]) -> str:
+  """Returns the `Range` header value of the bytes from `start` to `end`."""
+  return f'bytes={start}-{"" if end is None else end - 1}'
+
+
+def _download_body_offset(response: Any, requested_start: int) -> int:
+  """Returns the offset in the file of the first byte of a download body."""
+  if isinstance(response, _HTTPX_RESPONSE_TYPES):
+    status_code = response.status_code
+  else:
+    status_code = response.status
+  if status_code != 206:
+    # The server ignored the range and sends the whole file.
+    return 0
+  match = _CONTENT_RANGE.fullmatch(response.headers.get('content-range', ''))
+  return int(match.group(1)) if match else requested_start
+
+
+def _download_total_size(response: Any) -> Optional[int]:
+  """Returns the file size given by a partial download response."""
+  match = _CONTENT_RANGE.fullmatch(response.headers.get('content-range', ''))
+  if match is None or match.group(2) == '*':
+    return None
+  return int(match.group(2))
+
+
+def _is_empty_download(status_code: int, response: Any) -> bool:
+  """Returns whether a range request was rejected because the file is empty."""
+  content_range = response.headers.get('content-range', '')
+  return status_code == 416 and content_range.strip() == 'bytes */0'
+
+
+def _split_lines(line: bytearray, chunk: bytes) -> Iterator[bytes]:
+  """Yields the lines completed by `chunk`, and keeps the rest in `line`."""
+  start = 0
+  while (end := chunk.find(b'\n', start)) >= 0:
+    line += chunk[start:end]
+    yield bytes(line.rstrip(b'\r'))
+    line.clear()
+    start = end + 1
+  line += chunk[start:]
+
+
+def _download_slice(
+    chunk: bytes, chunk_offset: int, position: int, end: Optional[int]
+) -> bytes:
+  """Returns the part of a chunk at `chunk_offset` from `position` to `end`."""
+  if chunk_offset < position:
+    chunk = chunk[position - chunk_offset :]
+  if end is not None and len(chunk) > end - position:
+    chunk = chunk[: max(end - position, 0)]
+  return chunk
+
+
+def _download_segments(
+    total: int, segments: int, chunk_size: int
+) -> list[Tuple[int, int]]:
+  """Splits the bytes of a download into ranges fetched concurrently."""
+  segment_size = max(-(-total // segments), chunk_size)
+  return [
+      (start, min(start + segment_size, total))
+      for start in range(0, total, segment_size)
+  ]
+
+
+def _is_seekable(file: Any) -> bool:
+  seekable = getattr(file, 'seekable', None)
+  return bool(seekable and seekable())
+
+
+class _DownloadSink:
+  """Writes the bytes of a download to a file like object.
+
+  With `at_offsets`, each write seeks to the offset of its bytes, so that
+  concurrent ranges of the download can be written as they arrive.
+  """
+
+  def __init__(self, file: Any, at_offsets: bool):
+    self._file = file
+    self._at_offsets = at_offsets
+    self._start = file.tell() if at_offsets else 0
+    self._lock = threading.Lock()
+
+  def write(self, offset: int, data: bytes) -> None:
+    if not self._at_offsets:
+      self._file.write(data)
+      return
+    with self._lock:
+      self._file.seek(self._start + offset)
+      self._file.write(data)
+
+  def finish(self, size: int) -> int:
+    """Positions the file after the downloaded bytes and returns their size."""
+    if self._at_offsets:
+      self._file.seek(self._start + size)
+    return size
+
+
+class _AsyncDownloadSink:
+  """Writes the bytes of a download to a file like object asynchronously.
+
+  The file may have blocking methods, such as an `io.IOBase`, or coroutine
+  methods, such as an `anyio.AsyncFile`.
+  """
+
+  def __init__(self, file: Any, at_offsets: bool):
+    self._file = file
+    self._at_offsets = at_offsets
+    self._start = 0
+    self._lock = asyncio.Lock()
+
+  async def start(self) -> None:
+    if self._at_offsets:
+      self._start = await _maybe_await(self._file.tell())
+
+  async def write(self, offset: int, data: bytes) -> None:
+    if not self._at_offsets:
+      await _maybe_await(self._file.write(data))
+      return
+    async with self._lock:
+      await _maybe_await(self._file.seek(self._start + offset))
+      await _maybe_await(self._file.write(data))
+
+  async def finish(self, size: int) -> int:
+    """Positions the file after the downloaded bytes and returns their size."""
+    if self._at_offsets:
+      await _maybe_await(self._file.seek(self._start + size))
+    return size
+
+
+async def _maybe_await(value: Any) -> Any:
+  if inspect.isawaitable(value):
+    return await value
+  return value
+
+
+class _InlineBytesBody:
+  """A JSON request body whose bytes values are base64 encoded as it is sent.
+
+  The JSON document is encoded once with every bytes value replaced by a
+  placeholder. The body is then written as the encoded JSON between the
+  placeholders, interleaved with the base64 encoding of each bytes value,
+  produced slice by slice from a memoryview. Neither the base64 strings nor the
+  complete JSON document are held in memory.
+  """
+
+  # A multiple of 3, so only the final slice of a value is padded.
+  _BASE64_SLICE_SIZE = 3 * 256 * 1024
+
+  def __init__(self, segments: list[bytes], values: list[memoryview]):
+    self._segments = segments
+    self._values = values
+    self.content_length = sum(len(segment) for segment in segments) + sum(
+        4 * ((value.nbytes + 2) // 3) for value in values
+    )
+
+  @classmethod
+  def encode(
+      cls, data: dict[str, object], codec: _json_codec.Codec
+  ) -> Union[bytes, '_InlineBytesBody']:
+    """Encodes `data`, deferring the base64 encoding of its bytes values."""
+    values: list[memoryview] = []
+    placeholder = f'__genai_inline_bytes_{uuid.uuid4().hex}__'
+
+    def replace_bytes(value: Any) -> Any:
+      if isinstance(value, (bytes, bytearray, memoryview)):
+        values.append(memoryview(value).cast('B'))
+        return placeholder
+      if isinstance(value, dict):
+        return {key: replace_bytes(item) for key, item in value.items()}
+      if isinstance(value, list):
+        return [replace_bytes(item) for item in value]
+      return value
+
+    skeleton = codec.dumps(replace_bytes(data))
+    if not values:
+      return skeleton
+    return cls(skeleton.split(placeholder.encode('ascii')), values)
+
+  def iter_bytes(self) -> Iterator[bytes]:
+    slice_size = self._BASE64_SLICE_SIZE
+    for segment, value in zip(self._segments, self._values):
+      yield segment
+      for start in range(0, value.nbytes, slice_size):
+        yield base64.urlsafe_b64encode(value[start : start + slice_size])
+    yield self._segments[-1]
+
+  async def aiter_bytes(self) -> AsyncIterator[bytes]:
+    for chunk in self.iter_bytes():
+      yield chunk
+
+
+def _request_headers(
+    http_request: 'HttpRequest', data: Union[bytes, _InlineBytesBody, None]
+) -> dict[str, str]:
+  """Returns the request headers, sized for a streamed inline bytes body."""
+  if isinstance(data, _InlineBytesBody):
+    return {**http_request.headers, 'Content-Length': str(data.content_length)}
+  return http_request.headers
+
+
+class _ResponseStreamFramer:
+  """Incrementally splits a raw response byte stream into JSON chunks.
+
+  Streaming responses are server-sent events: each JSON chunk is carried on
+  one or more lines prefixed with "data: " and terminated by a blank line.
+  When the API returns an error instead, the JSON payload arrives line by line
+  without a prefix, so those lines are accumulated until the curly braces are
+  balanced.
+
+  The framer works directly on bytes, so lines are located with `bytes.find`
+  and only complete chunks are decoded. It is shared by every transport.
+  """
+
+  def __init__(self) -> None:
+    # Bytes received after the last complete line.
+    self._pending: list[bytes] = []
+    self._data_buffer: list[bytes] = []
+    self._chunk: list[bytes] = []
+    self._balance = 0
+
+  def feed(self, data: bytes) -> list[str]:
+    """Consumes `data` and returns the chunks it completes."""
+    if b'\n' not in data:
+      if data:
+        self._pending.append(bytes(data))
+      return []
+    if self._pending:
+      self._pending.append(data)
+      buffer = b''.join(self._pending)
+      self._pending = []
+    else:
+      buffer = bytes(data)
+
+    chunks: list[str] = []
+    data_buffer = self._data_buffer
+    find = buffer.find
+    start = 0
+    while True:
+      end = find(b'\n', start)
+      if end < 0:
+        break
+      line_end = end - 1 if end > start and buffer[end - 1] == 0x0D else end
+      if line_end == start:
+        if data_buffer:
+          chunks.append(self._join(data_buffer))
+          data_buffer.clear()
+      # In streaming mode, the response of JSON is prefixed with "data: "
+      # which we must strip before parsing.
+      elif buffer.startswith(b'data: ', start, line_end):
+        data_buffer.append(buffer[start + 6 : line_end])
+      else:
+        # When API returns an error message, it comes line by line. So we
+        # buffer the lines until a complete JSON string is read. A complete
+        # JSON string is found when the balance is 0.
+        line = buffer[start:line_end]
+        self._balance += line.count(b'{') - line.count(b'}')
+        self._chunk.append(line)
+        if self._balance == 0:
+          chunks.append(b''.join(self._chunk).decode('utf-8'))
+          self._chunk.clear()
+      start = end + 1
+
+    if start < len(buffer):
+      self._pending.append(buffer[start:])
+    return chunks
+
+  def close(self) -> list[str]:
+    """Returns the remaining chunks once the byte stream is exhausted."""
+    chunks = self.feed(b'\n') if self._pending else []
+    # If there is any remaining chunk, yield it.
+    if self._chunk:
+      chunks.append(b''.join(self._chunk).decode('utf-8'))
+      self._chunk.clear()
+    if self._data_buffer:
+      chunks.append(self._join(self._data_buffer))
+      self._data_buffer.clear()
+    return chunks
+
+  @staticmethod
+  def _join(data_buffer: list[bytes]) -> str:
+    if len(data_buffer) == 1:
+      return data_buffer[0].decode('utf-8')
+    return b'\n'.join(data_buffer).decode('utf-8')
 
 
 class HttpResponse:
@@ -279,6 +708,7 @@ class HttpResponse:
       ],
       response_stream: Union[Any, str] = None,
       byte_stream: Union[Any, bytes] = None,
+      json_codec: Optional[_json_codec.Codec] = None,
   ):
     if isinstance(headers, dict):
       self.headers = headers
@@ -300,6 +730,7 @@ class HttpResponse:
     self.status_code: int = 200
     self.response_stream = response_stream
     self.byte_stream = byte_stream
+    self._json_codec = json_codec or _json_codec.get_codec()
 
   # Async iterator for async streaming.
   def __aiter__(self) -> 'HttpResponse':
@@ -381,45 +812,14 @@ class HttpResponse:
           f'but got {type(self.response_stream).__name__}.'
       )
 
-    chunk = ''
-    balance = 0
-    data_buffer: list[str] = []
+    framer = _ResponseStreamFramer()
     if isinstance(self.response_stream, _HTTPX_RESPONSE_TYPES):
-      response_stream = self.response_stream.iter_lines()
+      byte_stream = self.response_stream.iter_bytes()
     else:
-      response_stream = self.response_stream.iter_lines(decode_unicode=True)
-    for line in response_stream:
-      if not line:
-        if data_buffer:
-          yield '\n'.join(data_buffer)
-          data_buffer = []
-        continue
-
-      # In streaming mode, the response of JSON is prefixed with "data: " which
-      # we must strip before parsing.
-      if line.startswith('data: '):
-        data_buffer.append(line[len('data: '):])
-        continue
-
-      # When API returns an error message, it comes line by line. So we buffer
-      # the lines until a complete JSON string is read. A complete JSON string
-      # is found when the balance is 0.
-      for c in line:
-        if c == '{':
-          balance += 1
-        elif c == '}':
-          balance -= 1
-
-      chunk += line
-      if balance == 0:
-        yield chunk
-        chunk = ''
-
-    # If there is any remaining chunk, yield it.
-    if chunk:
-      yield chunk
-    if data_buffer:
-      yield '\n'.join(data_buffer)
+      byte_stream = self.response_stream.iter_content(chunk_size=None)
+    for data in byte_stream:
+      yield from framer.feed(data)
+    yield from framer.close()
 
   async def _aiter_response_stream(self) -> AsyncIterator[str]:
     """Asynchronously iterates over chunks retrieved from the API."""
@@ -435,105 +835,41 @@ class HttpResponse:
           f' {type(self.response_stream).__name__}.'
       )
 
-    chunk = ''
-    balance = 0
-    data_buffer: list[str] = []
-    # httpx.Response has a dedicated async line iterator.
+    framer = _ResponseStreamFramer()
+    # httpx.Response has a dedicated async byte iterator.
     if isinstance(self.response_stream, _HTTPX_RESPONSE_TYPES):
       try:
         response_stream: Any = self.response_stream
-        async for line in response_stream.aiter_lines():
-          if not line:
-            if data_buffer:
-              yield '\n'.join(data_buffer)
-              data_buffer = []
-            continue
-          # In streaming mode, the response of JSON is prefixed with "data: "
-          # which we must strip before parsing.
-          if line.startswith('data: '):
-            data_buffer.append(line[len('data: '):])
-            continue
-
-          # When API returns an error message, it comes line by line. So we buffer
-          # the lines until a complete JSON string is read. A complete JSON string
-          # is found when the balance is 0.
-          for c in line:
-            if c == '{':
-              balance += 1
-            elif c == '}':
-              balance -= 1
-
-          chunk += line
-          if balance == 0:
+        async for data in response_stream.aiter_bytes():
+          for chunk in framer.feed(data):
             yield chunk
-            chunk = ''
-        # If there is any remaining chunk, yield it.
-        if chunk:
+        for chunk in framer.close():
           yield chunk
-        if data_buffer:
-          yield '\n'.join(data_buffer)
       finally:
         # Close the response and release the connection.
         await response_stream.aclose()
 
-    # aiohttp.ClientResponse uses a content stream that we read line by line.
+    # aiohttp.ClientResponse exposes the bytes as they arrive on the wire.
     elif has_aiohttp and isinstance(
         self.response_stream, aiohttp.ClientResponse
     ):
       try:
         while True:
-          # Read a line from the stream. This returns bytes.
-          try:
-            line_bytes = await self.response_stream.content.readline(
-                max_line_length=READ_BUFFER_SIZE
-            )
-          except TypeError:
-            # Ensure backwards compatibility with older versions of
-            # aiohttp that do not support max_line_length.
-            line_bytes = await self.response_stream.content.readline()
-          if not line_bytes:
+          data = await self.response_stream.content.readany()
+          if not data:
             break
-          # Decode the bytes and remove trailing whitespace and newlines.
-          line = line_bytes.decode('utf-8').rstrip()
-          if not line:
-            if data_buffer:
-              yield '\n'.join(data_buffer)
-              data_buffer = []
-            continue
-
-          # In streaming mode, the response of JSON is prefixed with "data: "
-          # which we must strip before parsing.
-          if line.startswith('data: '):
-            data_buffer.append(line[len('data: '):])
-            continue
-
-          # When API returns an error message, it comes line by line. So we
-          # buffer the lines until a complete JSON string is read. A complete
-          # JSON strings found when the balance is 0.
-          for c in line:
-            if c == '{':
-              balance += 1
-            elif c == '}':
-              balance -= 1
-
-          chunk += line
-          if balance == 0:
+          for chunk in framer.feed(data):
             yield chunk
-            chunk = ''
-        # If there is any remaining chunk, yield it.
-        if chunk:
+        for chunk in framer.close():
           yield chunk
-        if data_buffer:
-          yield '\n'.join(data_buffer)
       finally:
         # Release the connection back to the pool for potential reuse.
         self.response_stream.release()
 
-  @classmethod
-  def _load_json_from_response(cls, response: Any) -> Any:
+  def _load_json_from_response(self, response: Any) -> Any:
     """Loads JSON from the response, or raises an error if the parsing fails."""
     try:
-      return json.loads(response)
+      return self._json_codec.loads(response)
     except json.JSONDecodeError as e:
       raise errors.UnknownApiResponseError(
           f'Failed to parse response as JSON. Raw response: {response}'
@@ -559,12 +895,86 @@ _RETRY_HTTP_STATUS_CODES = (
 )
 
 
-def retry_args(options: Optional[HttpRetryOptions]) -> _common.StringDict:
+class _ServerHintedWait(tenacity.wait_exponential_jitter):
+  """Waits as long as the server asked to, or else exponentially with jitter.
+
+  The server's hint is read from `APIError.retry_after` and capped at the
+  maximum delay.
+  """
+
+  def __call__(self, retry_state: tenacity.RetryCallState) -> float:
+    retry_after = _retry_after(retry_state)
+    if retry_after is not None:
+      return min(retry_after, self.max)
+    return super().__call__(retry_state)
+
+
+def _retry_after(retry_state: tenacity.RetryCallState) -> Optional[float]:
+  """Returns the delay the server asked for before the next attempt."""
+  outcome = retry_state.outcome
+  if outcome is None or not outcome.failed:
+    return None
+  error = outcome.exception()
+  return error.retry_after if isinstance(error, errors.APIError) else None
+
+
+def _emit_failed_attempt(http_request: HttpRequest, **attributes: Any) -> None:
+  """Emits the event of the last failed attempt of a request, if pending."""
+  emit = http_request.failed_attempt
+  if emit is not None:
+    http_request.failed_attempt = None
+    emit(**attributes)
+
+
+def _log_retry(retry_state: tenacity.RetryCallState) -> None:
+  """Logs an upcoming retry and the delay chosen for it.
+
+  The delay and the server's hint are attached to the log record as
+  `retry_delay` and `retry_after`, so that logging handlers can observe them.
+  They are also added to the `request.attempt` event of the failed attempt.
+  """
+  delay = retry_state.next_action.sleep if retry_state.next_action else 0.0
+  retry_after = _retry_after(retry_state)
+  http_request = retry_state.args[0] if retry_state.args else None
+  if isinstance(http_request, HttpRequest):
+    _emit_failed_attempt(
+        http_request, retry_delay=delay, retry_after=retry_after
+    )
+  error = retry_state.outcome.exception() if retry_state.outcome else None
+  logger.info(
+      'Retrying %s in %.3f seconds (attempt %d) as it raised %r.',
+      getattr(retry_state.fn, '__qualname__', retry_state.fn),
+      delay,
+      retry_state.attempt_number,
+      error,
+      extra={
+          'retry_attempt': retry_state.attempt_number,
+          'retry_delay': delay,
+          'retry_after': retry_after,
+      },
+  )
+
+
+class _StopWhenRetryBudgetSpent(tenacity.stop.stop_base):
+  """Stops retrying once the retry budget of the client is spent."""
+
+  def __init__(self, retry_budget: _circuit_breaker.RetryBudget):
+    self._retry_budget = retry_budget
+
+  def __call__(self, retry_state: tenacity.RetryCallState) -> bool:
+    return not self._retry_budget.try_spend()
+
+
+def retry_args(
+    options: Optional[HttpRetryOptions],
+    retry_budget: Optional[_circuit_breaker.RetryBudget] = None,
+) -> _common.StringDict:
   """Returns the retry args for the given http retry options.
 
   Args:
     options: The http retry options to use for the retry configuration. If None,
       the 'never retry' stop strategy will be used.
+    retry_budget: The retry budget each retry is withdrawn from, if any.
 
   Returns:
     The arguments passed to the tenacity.(Async)Retrying constructor.
@@ -573,13 +983,21 @@ def retry_args(options: Optional[HttpRetryOptions]) -> _common.StringDict:
     return {'stop': tenacity.stop_after_attempt(1), 'reraise': True}
   if options.attempts == 0:
     options.attempts = 1
-  stop = tenacity.stop_after_attempt(options.attempts or _RETRY_ATTEMPTS)
+  stop: tenacity.stop.stop_base = tenacity.stop_after_attempt(
+      options.attempts or _RETRY_ATTEMPTS
+  )
+  if retry_budget is not None:
+    stop = stop | _StopWhenRetryBudgetSpent(retry_budget)
   retriable_codes = options.http_status_codes or _RETRY_HTTP_STATUS_CODES
   retry = tenacity.retry_if_exception(
-      lambda e: (isinstance(e, errors.APIError) and e.code in retriable_codes)
+      lambda e: (
+          isinstance(e, errors.APIError)
+          and e.code in retriable_codes
+          and not isinstance(e, errors.CircuitOpenError)
+      )
       or isinstance(e, _HTTPX_TRANSIENT_EXC),
   )
-  wait = tenacity.wait_exponential_jitter(
+  wait = _ServerHintedWait(
       initial=options.initial_delay or _RETRY_INITIAL_DELAY,
       max=options.max_delay or _RETRY_MAX_DELAY,
       exp_base=options.exp_base or _RETRY_EXP_BASE,
@@ -590,10 +1008,112 @@ def retry_args(options: Optional[HttpRetryOptions]) -> _common.StringDict:
       'retry': retry,
       'reraise': True,
       'wait': wait,
-      'before_sleep': tenacity.before_sleep_log(logger, logging.INFO),
+      'before_sleep': _log_retry,
   }
 
 
+def _backend_of(http_request: HttpRequest) -> str:
+  """Returns the base URL and model a request is sent to."""
+  url = urlparse(http_request.url)
+  backend = f'{url.scheme}://{url.netloc}'
+  model = _rate_limiter.model_of(url.path)
+  return f'{backend}/models/{model}' if model else backend
+
+
+def _is_backend_failure(error: Exception) -> bool:
+  """Returns whether an error shows that the backend is unhealthy."""
+  return isinstance(error, _DOWNLOAD_RESUMABLE_EXC) or (
+      isinstance(error, errors.ServerError)
+      and not isinstance(error, errors.CircuitOpenError)
+  )
+
+
+def _httpx_pool_args(options: HttpOptions) -> _common.StringDict:
+  """Returns the httpx client args of the connection pool options.
+
+  HTTP/2 is used by default for googleapis.com endpoints when the `h2` package
+  is installed.
+  """
+  pool = options.connection_pool_options or ConnectionPoolOptions()
+  args: _common.StringDict = {}
+  if (
+      pool.max_connections is not None
+      or pool.max_keepalive_connections is not None
+      or pool.keepalive_expiry is not None
+  ):
+    args['limits'] = httpx.Limits(
+        max_connections=(
+            _HTTPX_MAX_CONNECTIONS
+            if pool.max_connections is None
+            else pool.max_connections
+        ),
+        max_keepalive_connections=(
+            _HTTPX_MAX_KEEPALIVE_CONNECTIONS
+            if pool.max_keepalive_connections is None
+            else pool.max_keepalive_connections
+        ),
+        keepalive_expiry=(
+            _HTTPX_KEEPALIVE_EXPIRY
+            if pool.keepalive_expiry is None
+            else pool.keepalive_expiry
+        ),
+    )
+  http2 = pool.http2
+  if http2 is None:
+    host = urlparse(options.base_url or '').hostname or ''
+    http2 = (
+        host == 'googleapis.com' or host.endswith('.googleapis.com')
+    ) and importlib.util.find_spec('h2') is not None
+  if http2:
+    args['http2'] = True
+  return args
+
+
+def _aiohttp_connector_args(options: HttpOptions) -> _common.StringDict:
+  """Returns the aiohttp connector args of the connection pool options."""
+  pool = options.connection_pool_options or ConnectionPoolOptions()
+  args: _common.StringDict = {'limit': pool.max_connections or 0}
+  if pool.max_connections_per_host is not None:
+    args['limit_per_host'] = pool.max_connections_per_host
+  if pool.keepalive_expiry is not None:
+    args['keepalive_timeout'] = pool.keepalive_expiry
+  return args
+
+
+def _build_validators(model_types: Sequence[type[BaseModel]]) -> float:
+  """Builds the deferred validators of the types, returning the seconds taken."""
+  start = time.perf_counter()
+  for model_type in model_types:
+    if not model_type.__pydantic_complete__:
+      model_type.model_rebuild(force=True)
+  return time.perf_counter() - start
+
+
+def _error_attributes(error: BaseException) -> dict[str, Any]:
+  """Returns the instrumentation attributes describing a failure."""
+  attributes: dict[str, Any] = {'error': type(error).__name__}
+  if isinstance(error, errors.APIError):
+    attributes['status_code'] = error.code
+  return attributes
+
+
+class _TimedCodec(_json_codec.Codec):
+  """Records the decoding of the responses of an instrumented client."""
+
+  def __init__(self, codec: _json_codec.Codec):
+    self._codec = codec
+    self.name = codec.name
+
+  def dumps(self, obj: Any) -> bytes:
+    return self._codec.dumps(obj)
+
+  def loads(self, data: Union[str, bytes]) -> Any:
+    start = time.perf_counter()
+    result = self._codec.loads(data)
+    instrumentation.record_decode(start, time.perf_counter())
+    return result
+
+
 class SyncHttpxClient(httpx.Client):
   """Sync httpx client."""
 
@@ -722,6 +1242,7 @@ class BaseApiClient:
     # might be accessing the credentials at the same time.
     self._sync_auth_lock = threading.Lock()
     self._async_auth_locks: dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+    self._token_refresher: Optional[_token_refresher.TokenRefresher] = None
 
     # Handle when to use Vertex AI in express mode (api key).
     # Explicit initializer arguments are already validated above.
@@ -854,6 +1375,9 @@ class BaseApiClient:
         self._http_options,
         vertexai=bool(self.vertexai),
     )
+    for key, value in _httpx_pool_args(self._http_options).items():
+      client_args.setdefault(key, value)
+      async_client_args.setdefault(key, value)
     self._async_httpx_client_args = async_client_args
     self._authorized_session: Optional['AuthorizedSession'] = None
 
@@ -899,14 +1423,60 @@ class BaseApiClient:
       except ImportError:
         pass
 
-    retry_kwargs = retry_args(self._http_options.retry_options)
-    self._websocket_ssl_ctx = self._ensure_websocket_ssl_ctx(
-        self._http_options,
-        vertexai=bool(self.vertexai),
+    self._json_codec = _json_codec.get_codec(self._http_options.json_codec)
+    self._instrumentation: Optional[instrumentation._Recorder] = None
+    if self._http_options.instrumentation_hooks:
+      self._instrumentation = instrumentation._Recorder(
+          self._http_options.instrumentation_hooks
+      )
+      self._json_codec = _TimedCodec(self._json_codec)
+    self._stream_inline_data = bool(self._http_options.stream_inline_data)
+    self._skip_response_validation = bool(
+        self._http_options.skip_response_validation
     )
+
+    self._rate_limiter: Optional[_rate_limiter.RateLimiter] = None
+    if self._http_options.rate_limit_options:
+      self._rate_limiter = _rate_limiter.RateLimiter(
+          self._http_options.rate_limit_options
+      )
+
+    self._hedger: Optional[_hedging.Hedger] = None
+    if self._http_options.hedging_options:
+      self._hedger = _hedging.Hedger(self._http_options.hedging_options)
+
+    retry_options = self._http_options.retry_options
+    self._retry_budget: Optional[_circuit_breaker.RetryBudget] = None
+    self._circuit_breaker: Optional[_circuit_breaker.CircuitBreaker] = None
+    if retry_options and retry_options.retry_budget_ratio is not None:
+      self._retry_budget = _circuit_breaker.RetryBudget(
+          retry_options.retry_budget_ratio
+      )
+    if retry_options and retry_options.circuit_breaker_threshold is not None:
+      self._circuit_breaker = _circuit_breaker.CircuitBreaker(
+          retry_options.circuit_breaker_threshold,
+          retry_options.circuit_breaker_reset_timeout,
+      )
+
+    retry_kwargs = retry_args(retry_options, self._retry_budget)
+    # Built on first use by the live API, which is the only user of websockets.
+    self._websocket_ssl_ctx_args: Optional[_common.StringDict] = None
     self._retry = tenacity.Retrying(**retry_kwargs)
     self._async_retry = tenacity.AsyncRetrying(**retry_kwargs)
 
+  @property
+  def _websocket_ssl_ctx(self) -> _common.StringDict:
+    if self._websocket_ssl_ctx_args is None:
+      self._websocket_ssl_ctx_args = self._ensure_websocket_ssl_ctx(
+          self._http_options,
+          vertexai=bool(self.vertexai),
+      )
+    return self._websocket_ssl_ctx_args
+
+  @_websocket_ssl_ctx.setter
+  def _websocket_ssl_ctx(self, args: _common.StringDict) -> None:
+    self._websocket_ssl_ctx_args = args
+
   def _use_google_auth_sync(self) -> bool:
     if not hasattr(mtls, 'should_use_client_cert'):
       return False
@@ -1052,7 +1622,9 @@ class BaseApiClient:
             # Remove this self._loop.call_exception_handler(context)
 
         session = AiohttpClientSession(
-            connector=AiohttpTCPConnector(limit=0),
+            connector=AiohttpTCPConnector(
+                **_aiohttp_connector_args(self._http_options)
+            ),
             trust_env=True,
             read_bufsize=READ_BUFFER_SIZE,
         )
@@ -1263,6 +1835,12 @@ class BaseApiClient:
       Returns:
         The client args with the SSL context included.
       """
+      try:
+        from websockets.asyncio.client import connect as ws_connect  # pylint: disable=g-import-not-at-top
+      except ModuleNotFoundError:
+        # This try/except is for TAP, mypy complains about it which is why we have the type: ignore
+        from websockets.client import connect as ws_connect  # type: ignore  # pylint: disable=g-import-not-at-top
+
       if not args or not args.get(verify):
         args = (args or {}).copy()
         args[verify] = ctx
@@ -1303,10 +1881,35 @@ class BaseApiClient:
           self.project = project
 
       if self._credentials:
-        return get_token_from_credentials(self, self._credentials)  # type: ignore[no-any-return]
+        token = get_token_from_credentials(self, self._credentials)
+        self._start_token_refresher()
+        return token
       else:
         raise RuntimeError('Could not resolve API token from the environment')
 
+  def _start_token_refresher(self) -> None:
+    """Starts refreshing the credentials in the background, once.
+
+    Must be called with the sync auth lock held.
+    """
+    if self._token_refresher is not None:
+      return
+    margin = self._http_options.token_refresh_margin
+    if margin is None:
+      margin = _TOKEN_REFRESH_MARGIN
+    expiry = getattr(self._credentials, 'expiry', None)
+    if margin <= 0 or not isinstance(expiry, datetime.datetime):
+      return
+    self._token_refresher = _token_refresher.TokenRefresher(
+        self._credentials, refresh_auth, margin  # type: ignore[arg-type]
+    )
+
+  def _stop_token_refresher(self) -> None:
+    with self._sync_auth_lock:
+      if self._token_refresher is not None:
+        self._token_refresher.stop()
+        self._token_refresher = None
+
   async def _get_async_auth_lock(self) -> asyncio.Lock:
     """Lazily initializes and returns an asyncio.Lock for async authentication.
 
@@ -1336,10 +1939,11 @@ class BaseApiClient:
             self.project = project
 
     if self._credentials:
-      return await async_get_token_from_credentials(
-          self,
-          self._credentials
-      )  # type: ignore[no-any-return]
+      token = await async_get_token_from_credentials(self, self._credentials)
+      if self._token_refresher is None:
+        with self._sync_auth_lock:
+          self._start_token_refresher()
+      return token
     else:
       raise RuntimeError('Could not resolve API token from the environment')
 
@@ -1442,34 +2046,43 @@ class BaseApiClient:
     populate_server_timeout_header(
         patched_http_options.headers, timeout_in_seconds
     )
-    return HttpRequest(
+    http_request = HttpRequest(
         method=http_method,
         url=url,
         headers=patched_http_options.headers,
         data=request_dict,
         timeout=timeout_in_seconds,
     )
+    if self._rate_limiter is not None:
+      http_request.rate_limited_model = _rate_limiter.model_of(path)
+      if http_request.rate_limited_model is not None:
+        http_request.estimated_tokens = _rate_limiter.estimate_tokens(
+            request_dict
+        )
+    return http_request
 
   def _request_once(
       self,
       http_request: HttpRequest,
       stream: bool = False,
   ) -> HttpResponse:
-    data: Optional[Union[str, bytes]] = None
+    data: Union[bytes, _InlineBytesBody, None] = None
     # If using proj/location, fetch ADC
     if self.vertexai and (self.project or self.location) and not self.api_key:
+      auth_start = time.perf_counter()
       http_request.headers['Authorization'] = f'Bearer {self._access_token()}'
+      self._record_phase('request.auth', auth_start, http_request)
       if self._credentials and self._credentials.quota_project_id:
         http_request.headers['x-goog-user-project'] = (
             self._credentials.quota_project_id
         )
-      data = json.dumps(http_request.data) if http_request.data else None
-    else:
-      if http_request.data:
-        if not isinstance(http_request.data, bytes):
-          data = json.dumps(http_request.data) if http_request.data else None
-        else:
-          data = http_request.data
+    if http_request.data:
+      if not isinstance(http_request.data, bytes):
+        encode_start = time.perf_counter()
+        data = self._encode_request_data(http_request.data)
+        self._record_phase('request.encode', encode_start, http_request)
+      else:
+        data = http_request.data
 
     if self._use_google_auth_sync():
       url = str(http_request.url)
@@ -1494,7 +2107,11 @@ class BaseApiClient:
       response = self._authorized_session.request(  # type: ignore[no-untyped-call]
           method=http_request.method.upper(),
           url=url,
-          data=data,
+          data=(
+              b''.join(data.iter_bytes())
+              if isinstance(data, _InlineBytesBody)
+              else data
+          ),
           headers=http_request.headers,
           timeout=http_request.timeout,
           stream=stream,
@@ -1503,22 +2120,168 @@ class BaseApiClient:
       httpx_request = self._httpx_client.build_request(  # type: ignore[union-attr]
           method=http_request.method,
           url=http_request.url,
-          content=data,
-          headers=http_request.headers,
+          content=(
+              data.iter_bytes() if isinstance(data, _InlineBytesBody) else data
+          ),
+          headers=_request_headers(http_request, data),
           timeout=http_request.timeout,
+          extensions=self._httpx_extensions(http_request),
       )
       response = self._httpx_client.send(httpx_request, stream=stream)  # type: ignore[union-attr, arg-type]
     errors.APIError.raise_for_response(response)
     return HttpResponse(
-        response.headers, response if stream else [response.text]
+        response.headers,
+        response if stream else [response.text],
+        json_codec=self._json_codec,
+    )
+
+  def _encode_request_data(
+      self, data: dict[str, object]
+  ) -> Union[bytes, _InlineBytesBody]:
+    """Encodes the JSON request body."""
+    if self._stream_inline_data:
+      return _InlineBytesBody.encode(data, self._json_codec)
+    return self._json_codec.dumps(data)
+
+  def _begin_request(self, http_request: HttpRequest, start: float) -> None:
+    """Instruments a request built since `start`, if instrumentation is on."""
+    if self._instrumentation is None:
+      return
+    http_request.request_id = self._instrumentation.new_request_id()
+    self._instrumentation.track_response(http_request.request_id)
+    self._record_phase('request.build', start, http_request)
+
+  def _end_request(
+      self,
+      http_request: HttpRequest,
+      start: float,
+      error: Optional[BaseException] = None,
+  ) -> None:
+    """Emits an instrumented request, which started at `start`."""
+    if http_request.request_id is None:
+      return
+    # The last attempt was not retried.
+    _emit_failed_attempt(http_request)
+    attributes: dict[str, Any] = {
+        'method': http_request.method.upper(),
+        'url': http_request.url,
+        'attempts': http_request.attempts,
+    }
+    if error is not None:
+      attributes.update(_error_attributes(error))
+    self._record_phase('request', start, http_request, **attributes)
+
+  def _record_phase(
+      self,
+      name: str,
+      start: float,
+      http_request: HttpRequest,
+      end: Optional[float] = None,
+      **attributes: Any,
+  ) -> None:
+    """Emits a phase of a request, if the request is instrumented."""
+    if http_request.request_id is None:
+      return
+    assert self._instrumentation is not None
+    self._instrumentation.emit(
+        name, start, end, request_id=http_request.request_id, **attributes
+    )
+
+  def _defer_failed_attempt(
+      self,
+      http_request: HttpRequest,
+      start: float,
+      attempt: int,
+      error: BaseException,
+  ) -> None:
+    """Holds the event of a failed attempt until its retry delay is known."""
+    _emit_failed_attempt(http_request)
+    http_request.failed_attempt = functools.partial(
+        self._record_phase,
+        'request.attempt',
+        start,
+        http_request,
+        time.perf_counter(),
+        attempt=attempt,
+        **_error_attributes(error),
     )
 
+  def _httpx_extensions(
+      self, http_request: HttpRequest, is_async: bool = False
+  ) -> Optional[dict[str, Any]]:
+    """Returns the httpx extensions tracing an instrumented request."""
+    if http_request.request_id is None:
+      return None
+    assert self._instrumentation is not None
+    if is_async:
+      trace: Any = self._instrumentation.async_httpx_trace(
+          http_request.request_id
+      )
+    else:
+      trace = self._instrumentation.httpx_trace(http_request.request_id)
+    return {'trace': trace}
+
+  def _instrumented_request_once(
+      self,
+      request_once: Callable[[HttpRequest, bool], HttpResponse],
+      http_request: HttpRequest,
+      stream: bool = False,
+  ) -> HttpResponse:
+    """Sends a request and emits the attempt."""
+    _emit_failed_attempt(http_request)
+    http_request.attempts += 1
+    attempt = http_request.attempts
+    start = time.perf_counter()
+    try:
+      response = request_once(http_request, stream)
+    except Exception as e:
+      self._defer_failed_attempt(http_request, start, attempt, e)
+      raise
+    self._record_phase('request.attempt', start, http_request, attempt=attempt)
+    return response
+
+  async def _async_instrumented_request_once(
+      self,
+      request_once: Callable[[HttpRequest, bool], Awaitable[HttpResponse]],
+      http_request: HttpRequest,
+      stream: bool = False,
+  ) -> HttpResponse:
+    """Sends a request and emits the attempt."""
+    _emit_failed_attempt(http_request)
+    http_request.attempts += 1
+    attempt = http_request.attempts
+    start = time.perf_counter()
+    try:
+      response = await request_once(http_request, stream)
+    except Exception as e:
+      self._defer_failed_attempt(http_request, start, attempt, e)
+      raise
+    self._record_phase('request.attempt', start, http_request, attempt=attempt)
+    return response
+
   def _request(
       self,
       http_request: HttpRequest,
       http_options: Optional[HttpOptionsOrDict] = None,
       stream: bool = False,
   ) -> HttpResponse:
+    request_once = self._request_once
+    if http_request.rate_limited_model is not None:
+      request_once = self._rate_limited_request_once
+    if self._hedger is not None and not stream:
+      hedging_key = self._hedger.key_of(http_request.url)
+      if hedging_key is not None:
+        request_once = functools.partial(
+            self._hedged_request_once, hedging_key, request_once
+        )
+    if self._retry_budget is not None or self._circuit_breaker is not None:
+      request_once = functools.partial(
+          self._guarded_request_once, request_once
+      )
+    if http_request.request_id is not None:
+      request_once = functools.partial(
+          self._instrumented_request_once, request_once
+      )
     if http_options:
       parameter_model = (
           HttpOptions(**http_options)
@@ -1527,29 +2290,134 @@ class BaseApiClient:
       )
       # Support per request retry options.
       if parameter_model.retry_options:
-        retry_kwargs = retry_args(parameter_model.retry_options)
+        retry_kwargs = retry_args(
+            parameter_model.retry_options, self._retry_budget
+        )
         retry = tenacity.Retrying(**retry_kwargs)
-        return retry(self._request_once, http_request, stream)  # type: ignore[no-any-return]
+        return retry(request_once, http_request, stream)  # type: ignore[no-any-return]
+
+    return self._retry(request_once, http_request, stream)  # type: ignore[no-any-return]
+
+  def _hedged_request_once(
+      self,
+      hedging_key: str,
+      request_once: Callable[[HttpRequest, bool], HttpResponse],
+      http_request: HttpRequest,
+      stream: bool = False,
+  ) -> HttpResponse:
+    """Sends a request, and a duplicate of it if it is slow."""
+    assert self._hedger is not None
+    return self._hedger.run(
+        hedging_key, lambda: request_once(http_request, stream)
+    )
+
+  def _guarded_request_once(
+      self,
+      request_once: Callable[[HttpRequest, bool], HttpResponse],
+      http_request: HttpRequest,
+      stream: bool = False,
+  ) -> HttpResponse:
+    """Sends a request through the circuit breaker of its backend."""
+    backend = _backend_of(http_request)
+    if self._circuit_breaker is not None:
+      self._circuit_breaker.before_request(backend)
+    try:
+      response = request_once(http_request, stream)
+    except Exception as e:
+      self._record_request_outcome(backend, _is_backend_failure(e))
+      raise
+    except BaseException:
+      self._record_request_outcome(backend, None)
+      raise
+    self._record_request_outcome(backend, False, succeeded=True)
+    return response
+
+  def _record_request_outcome(
+      self, backend: str, failed: Optional[bool], succeeded: bool = False
+  ) -> None:
+    """Records the outcome of a request in the circuit breaker and budget.
+
+    A client error such as a 429 is not a failure of the backend, but neither
+    is it a success that earns retries.
+    """
+    if self._circuit_breaker is not None:
+      self._circuit_breaker.record(backend, failed)
+    if self._retry_budget is not None and succeeded:
+      self._retry_budget.record_success()
+
+  def _rate_limited_request_once(
+      self, http_request: HttpRequest, stream: bool = False
+  ) -> HttpResponse:
+    """Sends a request once the rate limits of its model allow it."""
+    assert self._rate_limiter is not None and http_request.rate_limited_model
+    self._rate_limiter.acquire(
+        http_request.rate_limited_model, http_request.estimated_tokens
+    )
+    try:
+      response = self._request_once(http_request, stream)
+    except errors.APIError as e:
+      self._record_rate_limited_error(http_request, e)
+      raise
+    if not stream:
+      self._record_rate_limited_success(
+          http_request,
+          response.response_stream[0] if response.response_stream else '',
+      )
+    return response
+
+  def _record_rate_limited_error(
+      self, http_request: HttpRequest, error: errors.APIError
+  ) -> None:
+    if (
+        self._rate_limiter is not None
+        and http_request.rate_limited_model is not None
+        and error.code == 429
+    ):
+      self._rate_limiter.record_throttled(
+          http_request.rate_limited_model, error.retry_after
+      )
 
-    return self._retry(self._request_once, http_request, stream)  # type: ignore[no-any-return]
+  def _record_rate_limited_success(
+      self,
+      http_request: HttpRequest,
+      response_body: Optional[str] = None,
+      usage_metadata: Optional[dict[str, Any]] = None,
+  ) -> None:
+    """Records a successful request with the usage reported in its response."""
+    if self._rate_limiter is None or http_request.rate_limited_model is None:
+      return
+    prompt_tokens = None
+    if usage_metadata is not None:
+      prompt_tokens = usage_metadata.get('promptTokenCount')
+    elif isinstance(response_body, str):
+      prompt_tokens = _rate_limiter.prompt_token_count(response_body)
+    self._rate_limiter.record_success(
+        http_request.rate_limited_model,
+        http_request.estimated_tokens,
+        prompt_tokens,
+    )
 
   async def _async_request_once(
       self, http_request: HttpRequest, stream: bool = False
   ) -> HttpResponse:
-    data: Optional[bytes] = None
+    data: Union[bytes, _InlineBytesBody, None] = None
 
     # If using proj/location, fetch ADC
     if self.vertexai and (self.project or self.location) and not self.api_key:
+      auth_start = time.perf_counter()
       http_request.headers['Authorization'] = (
           f'Bearer {await self._async_access_token()}'
       )
+      self._record_phase('request.auth', auth_start, http_request)
       if self._credentials and self._credentials.quota_project_id:
         http_request.headers['x-goog-user-project'] = (
             self._credentials.quota_project_id
         )
     if http_request.data:
       if not isinstance(http_request.data, bytes):
-        data = json.dumps(http_request.data).encode('utf-8')
+        encode_start = time.perf_counter()
+        data = self._encode_request_data(http_request.data)
+        self._record_phase('request.encode', encode_start, http_request)
       else:
         data = http_request.data
 
@@ -1573,8 +2441,12 @@ class BaseApiClient:
           response = await session.request(  # type: ignore[union-attr]
               method=http_request.method,
               url=url,
-              headers=http_request.headers,
-              data=data,
+              headers=_request_headers(http_request, data),
+              data=(
+                  data.aiter_bytes()
+                  if isinstance(data, _InlineBytesBody)
+                  else data
+              ),
               timeout=aiohttp.ClientTimeout(total=http_request.timeout),
               **self._async_client_session_request_args,
           )
@@ -1599,8 +2471,12 @@ class BaseApiClient:
           response = await session.request(  # type: ignore[union-attr]
               method=http_request.method,
               url=url,
-              headers=http_request.headers,
-              data=data,
+              headers=_request_headers(http_request, data),
+              data=(
+                  data.aiter_bytes()
+                  if isinstance(data, _InlineBytesBody)
+                  else data
+              ),
               timeout=aiohttp.ClientTimeout(total=http_request.timeout),
               **self._async_client_session_request_args,
           )
@@ -1610,22 +2486,33 @@ class BaseApiClient:
           # Extract the underlying aiohttp.ClientResponse from the
           # AsyncAuthorizedSession Response.
           response = response._response
-        return HttpResponse(response.headers, response)
+        return HttpResponse(
+            response.headers, response, json_codec=self._json_codec
+        )
       else:
         # aiohttp is not available. Fall back to httpx.
         httpx_request = self._async_httpx_client.build_request(  # type: ignore[union-attr]
             method=http_request.method,
             url=http_request.url,
-            content=data,
-            headers=http_request.headers,
+            content=(
+                data.aiter_bytes()
+                if isinstance(data, _InlineBytesBody)
+                else data
+            ),
+            headers=_request_headers(http_request, data),
             timeout=http_request.timeout,
+            extensions=self._httpx_extensions(http_request, is_async=True),
         )
         client_response = await self._async_httpx_client.send(  # type: ignore[union-attr]
             httpx_request,  # type: ignore[arg-type]
             stream=stream,
         )
         await errors.APIError.raise_for_async_response(client_response)
-        return HttpResponse(client_response.headers, client_response)
+        return HttpResponse(
+            client_response.headers,
+            client_response,
+            json_codec=self._json_codec,
+        )
     else:
       if self._use_aiohttp():
         session = await self._get_aiohttp_session()  # type: ignore[assignment]
@@ -1646,8 +2533,12 @@ class BaseApiClient:
           response = await session.request(  # type: ignore[union-attr]
               method=http_request.method,
               url=url,
-              headers=http_request.headers,
-              data=data,
+              headers=_request_headers(http_request, data),
+              data=(
+                  data.aiter_bytes()
+                  if isinstance(data, _InlineBytesBody)
+                  else data
+              ),
               timeout=aiohttp.ClientTimeout(total=http_request.timeout),
               **self._async_client_session_request_args,
           )
@@ -1680,8 +2571,12 @@ class BaseApiClient:
           response = await session.request(  # type: ignore[union-attr]
               method=http_request.method,
               url=url,
-              headers=http_request.headers,
-              data=data,
+              headers=_request_headers(http_request, data),
+              data=(
+                  data.aiter_bytes()
+                  if isinstance(data, _InlineBytesBody)
+                  else data
+              ),
               timeout=aiohttp.ClientTimeout(total=http_request.timeout),
               **self._async_client_session_request_args,
           )
@@ -1699,9 +2594,14 @@ class BaseApiClient:
         client_response = await self._async_httpx_client.request(  # type: ignore[union-attr]
             method=http_request.method,
             url=http_request.url,
-            headers=http_request.headers,
-            content=data,
+            headers=_request_headers(http_request, data),
+            content=(
+                data.aiter_bytes()
+                if isinstance(data, _InlineBytesBody)
+                else data
+            ),
             timeout=http_request.timeout,
+            extensions=self._httpx_extensions(http_request, is_async=True),
         )
         await errors.APIError.raise_for_async_response(client_response)
         return HttpResponse(client_response.headers, [client_response.text])
@@ -1712,6 +2612,23 @@ class BaseApiClient:
       http_options: Optional[HttpOptionsOrDict] = None,
       stream: bool = False,
   ) -> HttpResponse:
+    request_once = self._async_request_once
+    if http_request.rate_limited_model is not None:
+      request_once = self._async_rate_limited_request_once
+    if self._hedger is not None and not stream:
+      hedging_key = self._hedger.key_of(http_request.url)
+      if hedging_key is not None:
+        request_once = functools.partial(
+            self._async_hedged_request_once, hedging_key, request_once
+        )
+    if self._retry_budget is not None or self._circuit_breaker is not None:
+      request_once = functools.partial(
+          self._async_guarded_request_once, request_once
+      )
+    if http_request.request_id is not None:
+      request_once = functools.partial(
+          self._async_instrumented_request_once, request_once
+      )
     if http_options:
       parameter_model = (
           HttpOptions(**http_options)
@@ -1720,12 +2637,73 @@ class BaseApiClient:
       )
       # Support per request retry options.
       if parameter_model.retry_options:
-        retry_kwargs = retry_args(parameter_model.retry_options)
+        retry_kwargs = retry_args(
+            parameter_model.retry_options, self._retry_budget
+        )
         retry = tenacity.AsyncRetrying(**retry_kwargs)
-        return await retry(self._async_request_once, http_request, stream)  # type: ignore[no-any-return]
+        return await retry(request_once, http_request, stream)  # type: ignore[no-any-return]
     return await self._async_retry(  # type: ignore[no-any-return]
-        self._async_request_once, http_request, stream
+        request_once, http_request, stream
+    )
+
+  async def _async_hedged_request_once(
+      self,
+      hedging_key: str,
+      request_once: Callable[[HttpRequest, bool], Awaitable[HttpResponse]],
+      http_request: HttpRequest,
+      stream: bool = False,
+  ) -> HttpResponse:
+    """Sends a request, and a duplicate of it if it is slow."""
+    assert self._hedger is not None
+    return await self._hedger.async_run(
+        hedging_key, lambda: request_once(http_request, stream)
+    )
+
+  async def _async_guarded_request_once(
+      self,
+      request_once: Callable[[HttpRequest, bool], Awaitable[HttpResponse]],
+      http_request: HttpRequest,
+      stream: bool = False,
+  ) -> HttpResponse:
+    """Sends a request through the circuit breaker of its backend."""
+    backend = _backend_of(http_request)
+    if self._circuit_breaker is not None:
+      self._circuit_breaker.before_request(backend)
+    try:
+      response = await request_once(http_request, stream)
+    except Exception as e:
+      self._record_request_outcome(backend, _is_backend_failure(e))
+      raise
+    except BaseException:
+      self._record_request_outcome(backend, None)
+      raise
+    self._record_request_outcome(backend, False, succeeded=True)
+    return response
+
+  async def _async_rate_limited_request_once(
+      self, http_request: HttpRequest, stream: bool = False
+  ) -> HttpResponse:
+    """Sends a request once the rate limits of its model allow it."""
+    assert self._rate_limiter is not None and http_request.rate_limited_model
+    await self._rate_limiter.async_acquire(
+        http_request.rate_limited_model, http_request.estimated_tokens
     )
+    try:
+      response = await self._async_request_once(http_request, stream)
+    except errors.APIError as e:
+      self._record_rate_limited_error(http_request, e)
+      raise
+    if not stream:
+      self._record_rate_limited_success(
+          http_request,
+          response.response_stream[0] if response.response_stream else '',
+      )
+    return response
+
+  @property
+  def hedging_stats(self) -> Optional[_hedging.HedgingStats]:
+    """The counters of the hedged requests, if hedging is enabled."""
+    return self._hedger.stats if self._hedger is not None else None
 
   def get_read_only_http_options(self) -> _common.StringDict:
     if isinstance(self._http_options, BaseModel):
@@ -1741,10 +2719,17 @@ class BaseApiClient:
       request_dict: dict[str, object],
       http_options: Optional[HttpOptionsOrDict] = None,
   ) -> SdkHttpResponse:
+    start = time.perf_counter()
     http_request = self._build_request(
         http_method, path, request_dict, http_options
     )
-    response = self._request(http_request, http_options, stream=False)
+    self._begin_request(http_request, start)
+    try:
+      response = self._request(http_request, http_options, stream=False)
+    except BaseException as e:
+      self._end_request(http_request, start, e)
+      raise
+    self._end_request(http_request, start)
     response_body = (
         response.response_stream[0] if response.response_stream else ''
     )
@@ -1757,27 +2742,45 @@ class BaseApiClient:
       request_dict: dict[str, object],
       http_options: Optional[HttpOptionsOrDict] = None,
   ) -> Generator[SdkHttpResponse, None, None]:
+    start = time.perf_counter()
     http_request = self._build_request(
         http_method, path, request_dict, http_options
     )
-
-    session_response = self._request(http_request, http_options, stream=True)
-    for chunk in session_response.segments():
-      chunk_dump = json.dumps(chunk)
-      try:
+    self._begin_request(http_request, start)
+    try:
+      session_response = self._request(
+          http_request, http_options, stream=True
+      )
+      usage_metadata = None
+      chunk_start = time.perf_counter()
+      for index, chunk in enumerate(session_response.segments()):
+        self._record_phase(
+            'stream.chunk', chunk_start, http_request, index=index
+        )
+        chunk_dump = json.dumps(chunk)
         if chunk_dump.startswith('{"error":'):
-          chunk_json = json.loads(chunk_dump)
-          errors.APIError.raise_error(
-              chunk_json.get('error', {}).get('code'),
-              chunk_json,
-              session_response,
-          )
-      except json.decoder.JSONDecodeError:
-        logger.debug(
-            'Failed to decode chunk that contains an error: %s' % chunk_dump
+          try:
+            errors.APIError.raise_error(
+                chunk.get('error', {}).get('code'),
+                chunk,
+                session_response,
+            )
+          except errors.APIError as e:
+            self._record_rate_limited_error(http_request, e)
+            raise
+        if http_request.rate_limited_model is not None:
+          usage_metadata = chunk.get('usageMetadata', usage_metadata)
+        yield SdkHttpResponse(
+            headers=session_response.headers, body=chunk_dump
         )
-        pass
-      yield SdkHttpResponse(headers=session_response.headers, body=chunk_dump)
+        chunk_start = time.perf_counter()
+      self._record_rate_limited_success(
+          http_request, usage_metadata=usage_metadata
+      )
+    except BaseException as e:
+      self._end_request(http_request, start, e)
+      raise
+    self._end_request(http_request, start)
 
   async def async_request(
       self,
@@ -1786,13 +2789,19 @@ class BaseApiClient:
       request_dict: dict[str, object],
       http_options: Optional[HttpOptionsOrDict] = None,
   ) -> SdkHttpResponse:
+    start = time.perf_counter()
     http_request = self._build_request(
         http_method, path, request_dict, http_options
     )
-
-    result = await self._async_request(
-        http_request=http_request, http_options=http_options, stream=False
-    )
+    self._begin_request(http_request, start)
+    try:
+      result = await self._async_request(
+          http_request=http_request, http_options=http_options, stream=False
+      )
+    except BaseException as e:
+      self._end_request(http_request, start, e)
+      raise
+    self._end_request(http_request, start)
     response_body = result.response_stream[0] if result.response_stream else ''
     return SdkHttpResponse(headers=result.headers, body=response_body)
 
@@ -1803,38 +2812,291 @@ class BaseApiClient:
       request_dict: dict[str, object],
       http_options: Optional[HttpOptionsOrDict] = None,
   ) -> Any:
+    start = time.perf_counter()
     http_request = self._build_request(
         http_method, path, request_dict, http_options
     )
-
-    response = await self._async_request(
-        http_request=http_request, http_options=http_options, stream=True
-    )
+    self._begin_request(http_request, start)
+    try:
+      response = await self._async_request(
+          http_request=http_request, http_options=http_options, stream=True
+      )
+    except BaseException as e:
+      self._end_request(http_request, start, e)
+      raise
 
     async def async_generator():  # type: ignore[no-untyped-def]
-      async for chunk in response:
-        chunk_dump = json.dumps(chunk)
-        try:
-          if chunk_dump.startswith('{"error":'):
-            chunk_json = json.loads(chunk_dump)
-            await errors.APIError.raise_error_async(
-                chunk_json.get('error', {}).get('code'),
-                chunk_json,
-                response,
-            )
-        except json.decoder.JSONDecodeError:
-          logger.debug(
-              'Failed to decode chunk that contains an error: %s' % chunk_dump
+      try:
+        usage_metadata = None
+        chunk_start = time.perf_counter()
+        index = 0
+        async for chunk in response:
+          self._record_phase(
+              'stream.chunk', chunk_start, http_request, index=index
           )
-          pass
-        yield SdkHttpResponse(headers=response.headers, body=chunk_dump)
+          index += 1
+          chunk_dump = json.dumps(chunk)
+          if chunk_dump.startswith('{"error":'):
+            try:
+              await errors.APIError.raise_error_async(
+                  chunk.get('error', {}).get('code'),
+                  chunk,
+                  response,
+              )
+            except errors.APIError as e:
+              self._record_rate_limited_error(http_request, e)
+              raise
+          if http_request.rate_limited_model is not None:
+            usage_metadata = chunk.get('usageMetadata', usage_metadata)
+          yield SdkHttpResponse(headers=response.headers, body=chunk_dump)
+          chunk_start = time.perf_counter()
+        self._record_rate_limited_success(
+            http_request, usage_metadata=usage_metadata
+        )
+      except BaseException as e:
+        self._end_request(http_request, start, e)
+        raise
+      self._end_request(http_request, start)
 
     return async_generator()  # type: ignore[no-untyped-call]
 
-  def upload_file(
-      self,
-      file_path: Union[str, io.IOBase],
-      upload_url: str,
+  def _get_transfer_option(
+      self, http_options: Optional[HttpOptionsOrDict], name: str
+  ) -> Optional[int]:
+    """Returns a file transfer option set on the request or on the client."""
+    for options in (http_options, self._http_options):
+      value = (
+          options.get(name)
+          if isinstance(options, dict)
+          else getattr(options, name, None)
+      )
+      if value is None:
+        continue
+      if isinstance(value, bool) or not isinstance(value, int):
+        raise TypeError(f'{name} must be an int, got {value!r}.')
+      return value
+    return None
+
+  def _get_upload_chunking(
+      self, http_options: HttpOptionsOrDict
+  ) -> Tuple[int, int]:
+    """Returns the upload chunk size and the number of chunks kept in flight."""
+    chunk_size = self._get_transfer_option(http_options, 'upload_chunk_size')
+    if chunk_size is None:
+      chunk_size = CHUNK_SIZE
+    elif chunk_size <= 0 or chunk_size % UPLOAD_CHUNK_GRANULARITY:
+      raise ValueError(
+          'upload_chunk_size must be a positive multiple of'
+          f' {UPLOAD_CHUNK_GRANULARITY} bytes, got {chunk_size}.'
+      )
+    max_in_flight = self._get_transfer_option(
+        http_options, 'upload_max_in_flight_chunks'
+    )
+    if max_in_flight is None:
+      max_in_flight = 1
+    elif max_in_flight < 1:
+      raise ValueError(
+          'upload_max_in_flight_chunks must be at least 1, got'
+          f' {max_in_flight}.'
+      )
+    return chunk_size, max_in_flight
+
+  def _get_upload_headers_and_timeout(
+      self, http_options: HttpOptionsOrDict
+  ) -> Tuple[dict[str, str], Optional[float]]:
+    """Returns the user headers and the timeout in seconds of an upload."""
+    timeout = (
+        http_options.get('timeout')
+        if isinstance(http_options, dict)
+        else http_options.timeout
+    )
+    if timeout is None:
+      # Per request timeout is not configured. Check the global timeout.
+      timeout = (
+          self._http_options.get('timeout')
+          if isinstance(self._http_options, dict)
+          else self._http_options.timeout
+      )
+    user_headers = (
+        http_options.get('headers', {})
+        if isinstance(http_options, dict)
+        else (getattr(http_options, 'headers', {}) or {})
+    )
+    return dict(user_headers or {}), get_timeout_in_seconds(timeout)
+
+  def _send_upload_request(
+      self,
+      upload_url: str,
+      headers: dict[str, str],
+      content: Union[bytes, memoryview],
+      timeout_in_seconds: Optional[float],
+  ) -> _HttpxResponse:
+    """Sends a request of a resumable upload.
+
+    The request is retried until the response reports the upload status.
+    """
+    retry_count = 0
+    while True:
+      response = self._httpx_client.request(  # type: ignore[union-attr]
+          method='POST',
+          url=upload_url,
+          headers=headers,
+          content=_upload_content(content),
+          timeout=timeout_in_seconds,
+      )
+      retry_count += 1
+      if (
+          response.headers.get('x-goog-upload-status')
+          or retry_count >= MAX_RETRY_COUNT
+      ):
+        return response
+      time.sleep(INITIAL_RETRY_DELAY * (DELAY_MULTIPLIER ** (retry_count - 1)))
+
+  def _upload_chunk(
+      self,
+      upload_url: str,
+      chunk: Union[bytes, memoryview],
+      offset: int,
+      upload_command: str,
+      user_headers: dict[str, str],
+      timeout_in_seconds: Optional[float],
+  ) -> _HttpxResponse:
+    """Sends one chunk of a resumable upload at the given offset."""
+    upload_headers = dict(user_headers)
+    upload_headers.update({
+        'X-Goog-Upload-Command': upload_command,
+        'X-Goog-Upload-Offset': str(offset),
+        'Content-Length': str(len(chunk)),
+    })
+    populate_server_timeout_header(upload_headers, timeout_in_seconds)
+    return self._send_upload_request(
+        upload_url, upload_headers, chunk, timeout_in_seconds
+    )
+
+  def _query_upload_offset(
+      self,
+      upload_url: str,
+      user_headers: dict[str, str],
+      timeout_in_seconds: Optional[float],
+  ) -> Optional[int]:
+    """Returns the bytes received by the server, or None if the upload ended."""
+    query_headers = dict(user_headers)
+    query_headers.update({
+        'X-Goog-Upload-Command': 'query',
+        'Content-Length': '0',
+    })
+    populate_server_timeout_header(query_headers, timeout_in_seconds)
+    response = self._send_upload_request(
+        upload_url, query_headers, b'', timeout_in_seconds
+    )
+    received = response.headers.get('x-goog-upload-size-received')
+    if not _is_upload_chunk_accepted(response) or received is None:
+      return None
+    return int(received)
+
+  def _pipeline_upload_fd(
+      self,
+      file: io.IOBase,
+      upload_url: str,
+      upload_size: int,
+      chunk_size: int,
+      max_in_flight: int,
+      http_options: HttpOptionsOrDict,
+  ) -> Tuple[Optional[_HttpxResponse], int]:
+    """Transfers the chunks of a file over concurrent requests.
+
+    Every chunk but the last is sent with up to `max_in_flight` requests
+    outstanding. The last chunk finalizes the upload once all the earlier
+    chunks have been accepted.
+
+    Args:
+      file: A file like object inherited from io.BytesIO.
+      upload_url: The URL to upload the file to.
+      upload_size: The size of file content to be uploaded.
+      chunk_size: The size of each chunk.
+      max_in_flight: The maximum number of chunks sent but not yet accepted.
+      http_options: The http options to use for the requests.
+
+    returns:
+          The response to the last request that was sent and the offset the
+          upload reached. If the server did not accept a chunk but kept the
+          upload active, the response is None and the file is positioned at
+          the returned offset, from which the upload can continue.
+    """
+    user_headers, timeout_in_seconds = self._get_upload_headers_and_timeout(
+        http_options
+    )
+    start = file.tell()
+    offset = 0
+    pending: collections.deque[concurrent.futures.Future[_HttpxResponse]] = (
+        collections.deque()
+    )
+    rejected: Optional[_HttpxResponse] = None
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_in_flight
+    ) as executor:
+      try:
+        while True:
+          chunk = file.read(chunk_size) or b''
+          if not chunk or offset + len(chunk) >= upload_size:
+            break
+          if len(pending) >= max_in_flight:
+            response = pending.popleft().result()
+            if not _is_upload_chunk_accepted(response):
+              rejected = response
+              break
+          pending.append(
+              executor.submit(
+                  self._upload_chunk,
+                  upload_url,
+                  chunk,
+                  offset,
+                  'upload',
+                  user_headers,
+                  timeout_in_seconds,
+              )
+          )
+          offset += len(chunk)
+        while pending:
+          response = pending.popleft().result()
+          if rejected is None and not _is_upload_chunk_accepted(response):
+            rejected = response
+      finally:
+        for future in pending:
+          future.cancel()
+
+    if rejected is not None:
+      # The server may not accept chunks out of order. Continue from the
+      # offset it has received if the upload is still active.
+      received = self._query_upload_offset(
+          upload_url, user_headers, timeout_in_seconds
+      )
+      if received is None or not _is_seekable(file):
+        return rejected, offset
+      file.seek(start + received)
+      return None, received
+
+    response = self._upload_chunk(
+        upload_url,
+        chunk,
+        offset,
+        'upload, finalize',
+        user_headers,
+        timeout_in_seconds,
+    )
+    return response, offset + len(chunk)
+
+  def _finalize_upload(self, response: _HttpxResponse) -> HttpResponse:
+    """Returns the response to a finalized upload or raises its error."""
+    errors.APIError.raise_for_response(response)
+    if response.headers.get('x-goog-upload-status') != 'final':
+      raise ValueError('Failed to upload file: Upload status is not finalized.')
+    return HttpResponse(response.headers, response_stream=[response.text])
+
+  def upload_file(
+      self,
+      file_path: Union[str, io.IOBase],
+      upload_url: str,
       upload_size: int,
       *,
       http_options: Optional[HttpOptionsOrDict] = None,
@@ -1859,9 +3121,15 @@ class BaseApiClient:
       )
     else:
       with open(file_path, 'rb') as file:
-        return self._upload_fd(
-            file, upload_url, upload_size, http_options=http_options
-        )
+        mapped_file = _memory_map(file)
+        if mapped_file is None:
+          return self._upload_fd(
+              file, upload_url, upload_size, http_options=http_options
+          )
+        with mapped_file:
+          return self._upload_fd(
+              mapped_file, upload_url, upload_size, http_options=http_options
+          )
 
   def _upload_fd(
       self,
@@ -1899,9 +3167,22 @@ class BaseApiClient:
           )
       )
 
+    upload_chunk_size, max_in_flight = self._get_upload_chunking(http_options)
+    if max_in_flight > 1 and upload_size > upload_chunk_size:
+      pipelined_response, offset = self._pipeline_upload_fd(
+          file,
+          upload_url,
+          upload_size,
+          upload_chunk_size,
+          max_in_flight,
+          http_options,
+      )
+      if pipelined_response is not None:
+        return self._finalize_upload(pipelined_response)
+
     # Upload the file in chunks
     while True:
-      file_chunk = file.read(CHUNK_SIZE)
+      file_chunk = file.read(upload_chunk_size)
       chunk_size = 0
       if file_chunk:
         chunk_size = len(file_chunk)
@@ -1940,7 +3221,7 @@ class BaseApiClient:
             method='POST',
             url=upload_url,
             headers=upload_headers,
-            content=file_chunk,
+            content=_upload_content(file_chunk),
             timeout=timeout_in_seconds,
         )
         if response.headers.get('x-goog-upload-status'):
@@ -1957,10 +3238,7 @@ class BaseApiClient:
             f'All content has been uploaded, but the upload status is not'
             f' finalized.'
         )
-    errors.APIError.raise_for_response(response)
-    if response.headers.get('x-goog-upload-status') != 'final':
-      raise ValueError('Failed to upload file: Upload status is not finalized.')
-    return HttpResponse(response.headers, response_stream=[response.text])
+    return self._finalize_upload(response)
 
   def download_file(
       self,
@@ -1981,10 +3259,10 @@ class BaseApiClient:
         'get', path=path, request_dict={}, http_options=http_options
     )
 
-    data: Optional[Union[str, bytes]] = None
+    data: Optional[bytes] = None
     if http_request.data:
       if not isinstance(http_request.data, bytes):
-        data = json.dumps(http_request.data)
+        data = self._json_codec.dumps(http_request.data)
       else:
         data = http_request.data
 
@@ -2001,6 +3279,450 @@ class BaseApiClient:
         response.headers, byte_stream=[response.read()]
     ).byte_stream[0]
 
+  async def _async_send_upload_request(
+      self,
+      upload_url: str,
+      headers: dict[str, str],
+      content: bytes,
+      timeout_in_seconds: Optional[float],
+  ) -> Any:
+    """Sends a request of a resumable upload asynchronously.
+
+    The request is retried until the response reports the upload status.
+    """
+    retry_count = 0
+    while True:
+      response: Any
+      if self._use_aiohttp():
+        session = await self._get_aiohttp_session()
+        response = await session.request(
+            method='POST',
+            url=upload_url,
+            data=content,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout_in_seconds),
+        )
+        # Read the body so that the connection is released to the pool.
+        await response.read()
+      else:
+        response = await self._async_httpx_client.request(  # type: ignore[union-attr]
+            method='POST',
+            url=upload_url,
+            content=content,
+            headers=headers,
+            timeout=timeout_in_seconds,
+        )
+      retry_count += 1
+      if (
+          response.headers.get('x-goog-upload-status')
+          or retry_count >= MAX_RETRY_COUNT
+      ):
+        return response
+      await asyncio.sleep(
+          INITIAL_RETRY_DELAY * (DELAY_MULTIPLIER ** (retry_count - 1))
+      )
+
+  async def _async_upload_chunk(
+      self,
+      upload_url: str,
+      chunk: bytes,
+      offset: int,
+      upload_command: str,
+      user_headers: dict[str, str],
+      timeout_in_seconds: Optional[float],
+  ) -> Any:
+    """Sends one chunk of a resumable upload at the given offset."""
+    upload_headers = dict(user_headers)
+    upload_headers.update({
+        'X-Goog-Upload-Command': upload_command,
+        'X-Goog-Upload-Offset': str(offset),
+        'Content-Length': str(len(chunk)),
+    })
+    populate_server_timeout_header(upload_headers, timeout_in_seconds)
+    return await self._async_send_upload_request(
+        upload_url, upload_headers, chunk, timeout_in_seconds
+    )
+
+  async def _async_query_upload_offset(
+      self,
+      upload_url: str,
+      user_headers: dict[str, str],
+      timeout_in_seconds: Optional[float],
+  ) -> Optional[int]:
+    """Returns the bytes received by the server, or None if the upload ended."""
+    query_headers = dict(user_headers)
+    query_headers.update({
+        'X-Goog-Upload-Command': 'query',
+        'Content-Length': '0',
+    })
+    populate_server_timeout_header(query_headers, timeout_in_seconds)
+    response = await self._async_send_upload_request(
+        upload_url, query_headers, b'', timeout_in_seconds
+    )
+    received = response.headers.get('x-goog-upload-size-received')
+    if not _is_upload_chunk_accepted(response) or received is None:
+      return None
+    return int(received)
+
+  async def _async_pipeline_upload_fd(
+      self,
+      file: Union[io.IOBase, anyio.AsyncFile[Any]],
+      upload_url: str,
+      upload_size: int,
+      chunk_size: int,
+      max_in_flight: int,
+      http_options: HttpOptionsOrDict,
+  ) -> Tuple[Any, int]:
+    """Transfers the chunks of a file over concurrent requests asynchronously.
+
+    Every chunk but the last is sent with up to `max_in_flight` requests
+    outstanding. The last chunk finalizes the upload once all the earlier
+    chunks have been accepted.
+
+    Args:
+      file: A file like object inherited from io.BytesIO.
+      upload_url: The URL to upload the file to.
+      upload_size: The size of file content to be uploaded.
+      chunk_size: The size of each chunk.
+      max_in_flight: The maximum number of chunks sent but not yet accepted.
+      http_options: The http options to use for the requests.
+
+    returns:
+          The response to the last request that was sent and the offset the
+          upload reached. If the server did not accept a chunk but kept the
+          upload active, the response is None and the file is positioned at
+          the returned offset, from which the upload can continue.
+    """
+    user_headers, timeout_in_seconds = self._get_upload_headers_and_timeout(
+        http_options
+    )
+    if isinstance(file, io.IOBase):
+      start = file.tell()
+    else:
+      start = await file.tell()
+    offset = 0
+    pending: collections.deque[asyncio.Task[Any]] = collections.deque()
+    rejected: Any = None
+    try:
+      while True:
+        if isinstance(file, io.IOBase):
+          chunk = file.read(chunk_size) or b''
+        else:
+          chunk = await file.read(chunk_size) or b''
+        if not chunk or offset + len(chunk) >= upload_size:
+          break
+        if len(pending) >= max_in_flight:
+          response = await pending.popleft()
+          if not _is_upload_chunk_accepted(response):
+            rejected = response
+            break
+        pending.append(
+            asyncio.create_task(
+                self._async_upload_chunk(
+                    upload_url,
+                    chunk,
+                    offset,
+                    'upload',
+                    user_headers,
+                    timeout_in_seconds,
+                )
+            )
+        )
+        offset += len(chunk)
+      while pending:
+        response = await pending.popleft()
+        if rejected is None and not _is_upload_chunk_accepted(response):
+          rejected = response
+    finally:
+      for task in pending:
+        task.cancel()
+
+    if rejected is not None:
+      # The server may not accept chunks out of order. Continue from the
+      # offset it has received if the upload is still active.
+      received = await self._async_query_upload_offset(
+          upload_url, user_headers, timeout_in_seconds
+      )
+      if received is None or not _is_seekable(file):
+        return rejected, offset
+      if isinstance(file, io.IOBase):
+        file.seek(start + received)
+      else:
+        await file.seek(start + received)
+      return None, received
+
+    response = await self._async_upload_chunk(
+        upload_url,
+        chunk,
+        offset,
+        'upload, finalize',
+        user_headers,
+        timeout_in_seconds,
+    )
+    return response, offset + len(chunk)
+
+  async def _async_finalize_upload(self, response: Any) -> HttpResponse:
+    """Returns the response to a finalized upload or raises its error."""
+    await errors.APIError.raise_for_async_response(response)
+    if response.headers.get('x-goog-upload-status') != 'final':
+      raise ValueError('Failed to upload file: Upload status is not finalized.')
+    if isinstance(response, _HTTPX_RESPONSE_TYPES):
+      text = response.text
+    else:
+      text = await response.text()
+    return HttpResponse(response.headers, response_stream=[text])
+
+  def download_file_to(
+      self,
+      path: str,
+      destination: Union[str, os.PathLike[str], io.IOBase],
+      *,
+      http_options: Optional[HttpOptionsOrDict] = None,
+  ) -> int:
+    """Downloads the file data into a destination in chunks.
+
+    The file data is never held in memory as a whole. Ranges of it are fetched
+    concurrently with `HttpOptions.download_parallel_segments` and dropped
+    connections are resumed with `HttpOptions.download_max_resumes`.
+
+    Args:
+      path: The request path with query params.
+      destination: The path of the file to write, or a file like object opened
+        for writing in binary mode.
+      http_options: The http options to use for the request.
+
+    returns:
+          The number of bytes written.
+    """
+    if isinstance(destination, (str, os.PathLike)):
+      with open(destination, 'wb') as file:
+        return self._download_to_fd(path, file, http_options=http_options)
+    return self._download_to_fd(path, destination, http_options=http_options)
+
+  def iter_download_lines(
+      self,
+      path: str,
+      *,
+      http_options: Optional[HttpOptionsOrDict] = None,
+  ) -> Iterator[bytes]:
+    """Downloads the file data and yields it line by line.
+
+    Only the current chunk and line are held in memory. Dropped connections are
+    resumed with `HttpOptions.download_max_resumes`.
+
+    Args:
+      path: The request path with query params.
+      http_options: The http options to use for the request.
+
+    Yields:
+      The lines of the file, without their line breaks.
+    """
+    chunk_size, _, max_resumes = self._get_download_options(http_options)
+    http_request = self._build_request(
+        'get', path=path, request_dict={}, http_options=http_options
+    )
+    line = bytearray()
+    for chunk in self._iter_download_range(
+        http_request, 0, None, chunk_size, max_resumes
+    ):
+      for complete in _split_lines(line, chunk):
+        yield complete
+    if line:
+      yield bytes(line)
+
+  def _get_download_options(
+      self, http_options: Optional[HttpOptionsOrDict]
+  ) -> Tuple[int, int, int]:
+    """Returns the chunk size, parallel segments and resumes of a download."""
+    chunk_size = self._get_transfer_option(http_options, 'download_chunk_size')
+    segments = self._get_transfer_option(
+        http_options, 'download_parallel_segments'
+    )
+    max_resumes = self._get_transfer_option(
+        http_options, 'download_max_resumes'
+    )
+    if chunk_size is not None and chunk_size <= 0:
+      raise ValueError(
+          f'download_chunk_size must be positive, got {chunk_size}.'
+      )
+    if segments is not None and segments < 1:
+      raise ValueError(
+          f'download_parallel_segments must be at least 1, got {segments}.'
+      )
+    if max_resumes is not None and max_resumes < 0:
+      raise ValueError(
+          f'download_max_resumes must not be negative, got {max_resumes}.'
+      )
+    return chunk_size or DOWNLOAD_CHUNK_SIZE, segments or 1, max_resumes or 0
+
+  def _download_to_fd(
+      self,
+      path: str,
+      file: Any,
+      *,
+      http_options: Optional[HttpOptionsOrDict] = None,
+  ) -> int:
+    """Downloads the file data into a file like object in chunks."""
+    chunk_size, segments, max_resumes = self._get_download_options(
+        http_options
+    )
+    http_request = self._build_request(
+        'get', path=path, request_dict={}, http_options=http_options
+    )
+    parallel = segments > 1 and _is_seekable(file)
+    sink = _DownloadSink(file, at_offsets=parallel)
+    # A range request tells whether the server supports ranges and the size.
+    response = self._open_download(http_request, (0, None) if parallel else None)
+    if response is None:
+      return sink.finish(0)
+    total = _download_total_size(response) if parallel else None
+    if total is None or total <= chunk_size:
+      return sink.finish(
+          self._download_range(
+              http_request, sink, 0, None, chunk_size, max_resumes, response
+          )
+      )
+
+    ranges = _download_segments(total, segments, chunk_size)
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(len(ranges) - 1, 1)
+    ) as executor:
+      futures = [
+          executor.submit(
+              self._download_range,
+              http_request,
+              sink,
+              start,
+              end,
+              chunk_size,
+              max_resumes,
+          )
+          for start, end in ranges[1:]
+      ]
+      try:
+        # The first range is read from the response already received.
+        start, end = ranges[0]
+        self._download_range(
+            http_request, sink, start, end, chunk_size, max_resumes, response
+        )
+        for future in futures:
+          future.result()
+      finally:
+        for future in futures:
+          future.cancel()
+    return sink.finish(total)
+
+  def _open_download(
+      self,
+      http_request: HttpRequest,
+      byte_range: Optional[Tuple[int, Optional[int]]],
+  ) -> Optional[_HttpxResponse]:
+    """Sends a download request and returns the response before its body.
+
+    Returns None if the file is empty, since no range of it can be served.
+    """
+    headers = dict(http_request.headers)
+    if byte_range is not None:
+      headers['Range'] = _range_header(*byte_range)
+    request = self._httpx_client.build_request(  # type: ignore[union-attr]
+        method=http_request.method,
+        url=http_request.url,
+        headers=headers,
+        timeout=http_request.timeout,
+    )
+    response = self._httpx_client.send(request, stream=True)  # type: ignore[union-attr, arg-type]
+    if _is_empty_download(response.status_code, response):
+      response.close()
+      return None
+    if response.status_code != 206:
+      errors.APIError.raise_for_response(response)
+    return response
+
+  def _download_range(
+      self,
+      http_request: HttpRequest,
+      sink: _DownloadSink,
+      start: int,
+      end: Optional[int],
+      chunk_size: int,
+      max_resumes: int,
+      response: Optional[_HttpxResponse] = None,
+  ) -> int:
+    """Streams the bytes from `start` to `end` of a download into a sink.
+
+    Args:
+      http_request: The download request.
+      sink: The sink to write the bytes to.
+      start: The offset of the first byte.
+      end: The offset after the last byte, or None for the end of the file.
+      chunk_size: The size of the chunks read from the response.
+      max_resumes: The number of times to resume after the connection drops.
+      response: The response to read first, if it was already received.
+
+    returns:
+          The offset after the last byte written.
+    """
+    position = start
+    for data in self._iter_download_range(
+        http_request, start, end, chunk_size, max_resumes, response
+    ):
+      sink.write(position, data)
+      position += len(data)
+    return position
+
+  def _iter_download_range(
+      self,
+      http_request: HttpRequest,
+      start: int,
+      end: Optional[int],
+      chunk_size: int,
+      max_resumes: int,
+      response: Optional[_HttpxResponse] = None,
+  ) -> Iterator[bytes]:
+    """Yields the bytes from `start` to `end` of a download in chunks.
+
+    Args:
+      http_request: The download request.
+      start: The offset of the first byte.
+      end: The offset after the last byte, or None for the end of the file.
+      chunk_size: The size of the chunks read from the response.
+      max_resumes: The number of times to resume after the connection drops.
+      response: The response to read first, if it was already received.
+    """
+    position = start
+    resumes = 0
+    while True:
+      error: Exception
+      try:
+        if response is None:
+          response = self._open_download(http_request, (position, end))
+          if response is None:
+            return
+        chunk_offset = _download_body_offset(response, position)
+        for chunk in response.iter_bytes(chunk_size):
+          data = _download_slice(chunk, chunk_offset, position, end)
+          chunk_offset += len(chunk)
+          if data:
+            position += len(data)
+            yield data
+          if end is not None and position >= end:
+            break
+        if end is None or position >= end:
+          return
+        error = ValueError(
+            f'The download ended at byte {position} instead of byte {end}.'
+        )
+      except _DOWNLOAD_RESUMABLE_EXC as e:
+        error = e
+      finally:
+        if response is not None:
+          response.close()
+          response = None
+      if resumes >= max_resumes:
+        raise error
+      resumes += 1
+      logger.info('Resuming the download from byte %d: %s', position, error)
+
   async def async_upload_file(
       self,
       file_path: Union[str, io.IOBase],
@@ -2070,14 +3792,27 @@ class BaseApiClient:
           )
       )
 
+    upload_chunk_size, max_in_flight = self._get_upload_chunking(http_options)
+    if max_in_flight > 1 and upload_size > upload_chunk_size:
+      pipelined_response, offset = await self._async_pipeline_upload_fd(
+          file,
+          upload_url,
+          upload_size,
+          upload_chunk_size,
+          max_in_flight,
+          http_options,
+      )
+      if pipelined_response is not None:
+        return await self._async_finalize_upload(pipelined_response)
+
     # Upload the file in chunks
     if self._use_aiohttp():  # pylint: disable=g-import-not-at-top
       session = await self._get_aiohttp_session()  # type: ignore[assignment]
       while True:
         if isinstance(file, io.IOBase):
-          file_chunk = file.read(CHUNK_SIZE)
+          file_chunk = file.read(upload_chunk_size)
         else:
-          file_chunk = await file.read(CHUNK_SIZE)
+          file_chunk = await file.read(upload_chunk_size)
         chunk_size = 0
         if file_chunk:
           chunk_size = len(file_chunk)
@@ -2156,9 +3891,9 @@ class BaseApiClient:
       # aiohttp is not available. Fall back to httpx.
       while True:
         if isinstance(file, io.IOBase):
-          file_chunk = file.read(CHUNK_SIZE)
+          file_chunk = file.read(upload_chunk_size)
         else:
-          file_chunk = await file.read(CHUNK_SIZE)
+          file_chunk = await file.read(upload_chunk_size)
         chunk_size = 0
         if file_chunk:
           chunk_size = len(file_chunk)
@@ -2210,7 +3945,7 @@ class BaseApiClient:
             break
           delay_seconds = INITIAL_RETRY_DELAY * (DELAY_MULTIPLIER**retry_count)
           retry_count += 1
-          time.sleep(delay_seconds)
+          await asyncio.sleep(delay_seconds)
 
         offset += chunk_size
         if (
@@ -2259,7 +3994,7 @@ class BaseApiClient:
     data: Optional[bytes] = None
     if http_request.data:
       if not isinstance(http_request.data, bytes):
-        data = json.dumps(http_request.data).encode('utf-8')
+        data = self._json_codec.dumps(http_request.data)
       else:
         data = http_request.data
 
@@ -2292,14 +4027,382 @@ class BaseApiClient:
           client_response.headers, byte_stream=[client_response.read()]
       ).byte_stream[0]
 
+  async def async_download_file_to(
+      self,
+      path: str,
+      destination: Union[str, os.PathLike[str], io.IOBase, anyio.AsyncFile[Any]],
+      *,
+      http_options: Optional[HttpOptionsOrDict] = None,
+  ) -> int:
+    """Downloads the file data into a destination in chunks asynchronously.
+
+    The file data is never held in memory as a whole. Ranges of it are fetched
+    concurrently with `HttpOptions.download_parallel_segments` and dropped
+    connections are resumed with `HttpOptions.download_max_resumes`.
+
+    Args:
+      path: The request path with query params.
+      destination: The path of the file to write, or a file like object opened
+        for writing in binary mode. Its methods may be coroutines, as those of
+        `anyio.AsyncFile`.
+      http_options: The http options to use for the request.
+
+    returns:
+          The number of bytes written.
+    """
+    if isinstance(destination, (str, os.PathLike)):
+      async with await anyio.open_file(destination, 'wb') as file:
+        return await self._async_download_to_fd(
+            path, file, http_options=http_options
+        )
+    return await self._async_download_to_fd(
+        path, destination, http_options=http_options
+    )
+
+  async def async_iter_download_lines(
+      self,
+      path: str,
+      *,
+      http_options: Optional[HttpOptionsOrDict] = None,
+  ) -> AsyncGenerator[bytes, None]:
+    """Downloads the file data asynchronously and yields it line by line.
+
+    Only the current chunk and line are held in memory. Dropped connections are
+    resumed with `HttpOptions.download_max_resumes`.
+
+    Args:
+      path: The request path with query params.
+      http_options: The http options to use for the request.
+
+    Yields:
+      The lines of the file, without their line breaks.
+    """
+    chunk_size, _, max_resumes = self._get_download_options(http_options)
+    http_request = self._build_request(
+        'get', path=path, request_dict={}, http_options=http_options
+    )
+    line = bytearray()
+    chunks = self._async_iter_download_range(
+        http_request, 0, None, chunk_size, max_resumes
+    )
+    try:
+      async for chunk in chunks:
+        for complete in _split_lines(line, chunk):
+          yield complete
+    finally:
+      await chunks.aclose()
+    if line:
+      yield bytes(line)
+
+  async def _async_download_to_fd(
+      self,
+      path: str,
+      file: Any,
+      *,
+      http_options: Optional[HttpOptionsOrDict] = None,
+  ) -> int:
+    """Downloads the file data into a file like object asynchronously."""
+    chunk_size, segments, max_resumes = self._get_download_options(
+        http_options
+    )
+    http_request = self._build_request(
+        'get', path=path, request_dict={}, http_options=http_options
+    )
+    parallel = segments > 1 and _is_seekable(file)
+    sink = _AsyncDownloadSink(file, at_offsets=parallel)
+    await sink.start()
+    # A range request tells whether the server supports ranges and the size.
+    response = await self._async_open_download(
+        http_request, (0, None) if parallel else None
+    )
+    if response is None:
+      return await sink.finish(0)
+    total = _download_total_size(response) if parallel else None
+    if total is None or total <= chunk_size:
+      return await sink.finish(
+          await self._async_download_range(
+              http_request, sink, 0, None, chunk_size, max_resumes, response
+          )
+      )
+
+    ranges = _download_segments(total, segments, chunk_size)
+    # The first range is read from the response already received.
+    tasks = [
+        asyncio.ensure_future(
+            self._async_download_range(
+                http_request,
+                sink,
+                start,
+                end,
+                chunk_size,
+                max_resumes,
+                response if i == 0 else None,
+            )
+        )
+        for i, (start, end) in enumerate(ranges)
+    ]
+    try:
+      await asyncio.gather(*tasks)
+    finally:
+      for task in tasks:
+        task.cancel()
+    return await sink.finish(total)
+
+  async def _async_open_download(
+      self,
+      http_request: HttpRequest,
+      byte_range: Optional[Tuple[int, Optional[int]]],
+  ) -> Any:
+    """Sends a download request and returns the response before its body.
+
+    Returns None if the file is empty, since no range of it can be served.
+    """
+    headers = dict(http_request.headers)
+    if byte_range is not None:
+      headers['Range'] = _range_header(*byte_range)
+    response: Any
+    if self._use_aiohttp():
+      session = await self._get_aiohttp_session()
+      response = await session.request(
+          method=http_request.method,
+          url=http_request.url,
+          headers=headers,
+          timeout=aiohttp.ClientTimeout(total=http_request.timeout),
+      )
+      status_code = response.status
+    else:
+      request = self._async_httpx_client.build_request(  # type: ignore[union-attr]
+          method=http_request.method,
+          url=http_request.url,
+          headers=headers,
+          timeout=http_request.timeout,
+      )
+      response = await self._async_httpx_client.send(request, stream=True)  # type: ignore[union-attr, arg-type]
+      status_code = response.status_code
+    if _is_empty_download(status_code, response):
+      if isinstance(response, _HTTPX_RESPONSE_TYPES):
+        await response.aclose()
+      else:
+        response.release()
+      return None
+    if status_code != 206:
+      await errors.APIError.raise_for_async_response(response)
+    return response
+
+  async def _async_download_range(
+      self,
+      http_request: HttpRequest,
+      sink: _AsyncDownloadSink,
+      start: int,
+      end: Optional[int],
+      chunk_size: int,
+      max_resumes: int,
+      response: Any = None,
+  ) -> int:
+    """Streams the bytes from `start` to `end` of a download into a sink.
+
+    Args:
+      http_request: The download request.
+      sink: The sink to write the bytes to.
+      start: The offset of the first byte.
+      end: The offset after the last byte, or None for the end of the file.
+      chunk_size: The size of the chunks read from the response.
+      max_resumes: The number of times to resume after the connection drops.
+      response: The response to read first, if it was already received.
+
+    returns:
+          The offset after the last byte written.
+    """
+    position = start
+    chunks = self._async_iter_download_range(
+        http_request, start, end, chunk_size, max_resumes, response
+    )
+    try:
+      async for data in chunks:
+        await sink.write(position, data)
+        position += len(data)
+    finally:
+      await chunks.aclose()
+    return position
+
+  async def _async_iter_download_range(
+      self,
+      http_request: HttpRequest,
+      start: int,
+      end: Optional[int],
+      chunk_size: int,
+      max_resumes: int,
+      response: Any = None,
+  ) -> AsyncGenerator[bytes, None]:
+    """Yields the bytes from `start` to `end` of a download in chunks.
+
+    Args:
+      http_request: The download request.
+      start: The offset of the first byte.
+      end: The offset after the last byte, or None for the end of the file.
+      chunk_size: The size of the chunks read from the response.
+      max_resumes: The number of times to resume after the connection drops.
+      response: The response to read first, if it was already received.
+    """
+    position = start
+    resumes = 0
+    while True:
+      error: Exception
+      try:
+        if response is None:
+          response = await self._async_open_download(
+              http_request, (position, end)
+          )
+          if response is None:
+            return
+        chunk_offset = _download_body_offset(response, position)
+        if isinstance(response, _HTTPX_RESPONSE_TYPES):
+          chunks = response.aiter_bytes(chunk_size)
+        else:
+          chunks = response.content.iter_chunked(chunk_size)
+        async for chunk in chunks:
+          data = _download_slice(chunk, chunk_offset, position, end)
+          chunk_offset += len(chunk)
+          if data:
+            position += len(data)
+            yield data
+          if end is not None and position >= end:
+            break
+        if end is None or position >= end:
+          return
+        error = ValueError(
+            f'The download ended at byte {position} instead of byte {end}.'
+        )
+      except _DOWNLOAD_RESUMABLE_EXC as e:
+        error = e
+      finally:
+        if isinstance(response, _HTTPX_RESPONSE_TYPES):
+          await response.aclose()
+        elif response is not None:
+          response.release()
+        response = None
+      if resumes >= max_resumes:
+        raise error
+      resumes += 1
+      logger.info('Resuming the download from byte %d: %s', position, error)
+
   # This method does nothing in the real api client. It is used in the
   # replay_api_client to verify the response from the SDK method matches the
   # recorded response.
   def _verify_response(self, response_model: _common.BaseModel) -> None:
     pass
 
+  def _uses_access_token(self) -> bool:
+    """Returns whether the requests are authorized with an access token."""
+    return bool(
+        self.vertexai and (self.project or self.location) and not self.api_key
+    )
+
+  def _warmup_timeout(self) -> Optional[float]:
+    if self._http_options.timeout is None:
+      return None
+    return self._http_options.timeout / 1000.0
+
+  def warmup(
+      self,
+      connections: int = 1,
+      model_types: Sequence[type[BaseModel]] = (),
+  ) -> WarmupResult:
+    """Pays the costs of the first request ahead of it.
+
+    Resolves the credentials and fetches an access token, sends `connections`
+    concurrent requests to the base URL to open that many pooled connections,
+    and builds the validators of `model_types`, which are otherwise built on
+    first use.
+
+    The connections are only kept while the pool keeps idle connections alive,
+    see `ConnectionPoolOptions`. A custom `httpx_client` is warmed up like the
+    default one. The connections are not opened when requests go through
+    google-auth's authorized session, which is only used for mTLS.
+
+    Returns:
+      The time spent in each phase.
+    """
+    if connections < 0:
+      raise ValueError(f'connections must not be negative, got {connections}.')
+    result = WarmupResult()
+    if self._uses_access_token():
+      start = time.perf_counter()
+      self._access_token()
+      result.auth_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result.connections = 0
+    if self._httpx_client is not None and connections:
+      url = self._http_options.base_url or ''
+      timeout = self._warmup_timeout()
+      with concurrent.futures.ThreadPoolExecutor(connections) as executor:
+        for response in executor.map(
+            lambda _: self._httpx_client.head(url, timeout=timeout),  # type: ignore[union-attr]
+            range(connections),
+        ):
+          response.close()
+      result.connections = connections
+    result.connect_seconds = time.perf_counter() - start
+
+    result.validators_seconds = _build_validators(model_types)
+    return result
+
+  async def async_warmup(
+      self,
+      connections: int = 1,
+      model_types: Sequence[type[BaseModel]] = (),
+  ) -> WarmupResult:
+    """Pays the costs of the first async request ahead of it.
+
+    See `warmup`.
+
+    Returns:
+      The time spent in each phase.
+    """
+    if connections < 0:
+      raise ValueError(f'connections must not be negative, got {connections}.')
+    result = WarmupResult()
+    if self._uses_access_token():
+      start = time.perf_counter()
+      await self._async_access_token()
+      result.auth_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result.connections = 0
+    url = self._http_options.base_url or ''
+    timeout = self._warmup_timeout()
+    head: Optional[Callable[[], Awaitable[Any]]] = None
+    if self._use_aiohttp():
+      if not self._use_google_auth_async():
+        head = functools.partial(
+            self._aiohttp_head, await self._get_aiohttp_session(), url, timeout
+        )
+    elif self._async_httpx_client is not None:
+      head = functools.partial(
+          self._async_httpx_client.head, url, timeout=timeout
+      )
+    if head is not None and connections:
+      await asyncio.gather(*(head() for _ in range(connections)))
+      result.connections = connections
+    result.connect_seconds = time.perf_counter() - start
+
+    result.validators_seconds = _build_validators(model_types)
+    return result
+
+  async def _aiohttp_head(
+      self, session: Any, url: str, timeout: Optional[float]
+  ) -> None:
+    async with session.head(
+        url,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        **self._async_client_session_request_args,
+    ):
+      pass
+
   def close(self) -> None:
     """Closes the API client."""
+    self._stop_token_refresher()
     # Let users close the custom client explicitly by themselves. Otherwise,
     # close the client when the object is garbage collected.
     if not self._http_options.httpx_client and self._httpx_client:
@@ -2309,6 +4412,7 @@ class BaseApiClient:
 
   async def aclose(self) -> None:
     """Closes the API async client."""
+    self._stop_token_refresher()
     # Let users close the custom client explicitly by themselves. Otherwise,
     # close the client when the object is garbage collected.
     if not self._http_options.httpx_async_client:
@@ -2335,6 +4439,13 @@ class BaseApiClient:
     for cleanup.
     """
 
+    try:
+      # The refresher thread would otherwise outlive a client with a custom
+      # httpx client, which is not closed here.
+      self._stop_token_refresher()
+    except Exception:  # pylint: disable=broad-except
+      pass
+
     try:
       if not self._http_options.httpx_client:
         self.close()
@@ -0,0 +1,148 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Retry budget and circuit breaker of the requests of a client.
+
+The retry budget caps the retries of a client at a fraction of its successful
+requests, so that a failing backend does not receive several times the load of
+a healthy one. The circuit breaker stops sending requests to a backend after
+consecutive failures, fails them fast for a while and then lets a single probe
+request through to find out whether the backend has recovered.
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+from . import errors
+
+
+# Retries available whatever the number of successful requests.
+_RETRY_BUDGET_RESERVE = 10.0
+_CIRCUIT_BREAKER_RESET_TIMEOUT = 30.0
+
+
+class RetryBudget:
+  """Allows retries up to a fraction of the successful requests.
+
+  Each successful request deposits `ratio` retries and each retry withdraws
+  one. The balance never exceeds the reserve, which is also its initial value.
+  """
+
+  def __init__(self, ratio: float):
+    if ratio < 0:
+      raise ValueError(f'retry_budget_ratio must not be negative, got {ratio}.')
+    self._ratio = ratio
+    self._balance = _RETRY_BUDGET_RESERVE
+    self._lock = threading.Lock()
+
+  def record_success(self) -> None:
+    with self._lock:
+      self._balance = min(self._balance + self._ratio, _RETRY_BUDGET_RESERVE)
+
+  def try_spend(self) -> bool:
+    """Withdraws a retry from the budget, returning whether there was one."""
+    with self._lock:
+      if self._balance < 1:
+        return False
+      self._balance -= 1
+      return True
+
+
+class _Circuit:
+  """The state of the circuit breaker of one backend."""
+
+  __slots__ = ('failures', 'open_until', 'probing')
+
+  def __init__(self) -> None:
+    self.failures = 0
+    # None while the circuit is closed.
+    self.open_until: Optional[float] = None
+    self.probing = False
+
+
+class CircuitBreaker:
+  """Fails the requests to a backend fast after consecutive failures.
+
+  A circuit opens after `threshold` consecutive failures of its backend. While
+  it is open, requests raise `errors.CircuitOpenError` without being sent. Once
+  `reset_timeout` seconds have passed, the circuit is half-open: one probe
+  request is sent, and its outcome closes the circuit or opens it again.
+  """
+
+  def __init__(
+      self,
+      threshold: int,
+      reset_timeout: Optional[float] = None,
+      clock: Callable[[], float] = time.monotonic,
+  ):
+    if threshold < 1:
+      raise ValueError(
+          f'circuit_breaker_threshold must be positive, got {threshold}.'
+      )
+    self._threshold = threshold
+    self._reset_timeout = (
+        _CIRCUIT_BREAKER_RESET_TIMEOUT
+        if reset_timeout is None
+        else reset_timeout
+    )
+    self._clock = clock
+    self._lock = threading.Lock()
+    self._circuits: dict[str, _Circuit] = {}
+
+  def before_request(self, backend: str) -> None:
+    """Checks that a request may be sent to the backend.
+
+    Raises:
+      errors.CircuitOpenError: If the circuit of the backend is open, or
+        half-open with its probe request in flight.
+    """
+    with self._lock:
+      circuit = self._circuits.get(backend)
+      if circuit is None or circuit.open_until is None:
+        return
+      now = self._clock()
+      if now >= circuit.open_until and not circuit.probing:
+        circuit.probing = True
+        return
+      retry_after = max(circuit.open_until - now, 0.0)
+    raise errors.CircuitOpenError(backend, retry_after)
+
+  def record(self, backend: str, failed: Optional[bool]) -> None:
+    """Records the outcome of a request to the backend.
+
+    Args:
+      backend: The backend the request was sent to.
+      failed: Whether the backend failed the request, or None if the request
+        was abandoned before its outcome was known.
+    """
+    with self._lock:
+      circuit = self._circuits.get(backend)
+      if circuit is None:
+        if not failed:
+          return
+        circuit = self._circuits[backend] = _Circuit()
+      probing, circuit.probing = circuit.probing, False
+      if failed is None:
+        return
+      if not failed:
+        circuit.failures = 0
+        circuit.open_until = None
+        return
+      circuit.failures += 1
+      if probing or circuit.failures >= self._threshold:
+        circuit.open_until = self._clock() + self._reset_timeout
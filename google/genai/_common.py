@@ -20,9 +20,11 @@ import collections.abc
 import datetime
 import enum
 import functools
+import inspect
 import logging
 import re
 import sys
+import time
 import typing
 from typing import Any, Callable, FrozenSet, Optional, Union, get_args, get_origin
 import uuid
@@ -31,6 +33,8 @@ import pydantic
 from pydantic import alias_generators
 from typing_extensions import TypeAlias
 
+from . import instrumentation
+
 logger = logging.getLogger('google_genai._common')
 
 StringDict: TypeAlias = dict[str, Any]
@@ -51,50 +55,102 @@ class ExperimentalWarning(Warning):
   """Warning for experimental features."""
 
 
-def set_value_by_path(
-    data: Optional[dict[Any, Any]], keys: list[str], value: Any
-) -> None:
-  """Examples:
+_MISSING = object()
 
-  set_value_by_path({}, ['a', 'b'], v)
-    -> {'a': {'b': v}}
-  set_value_by_path({}, ['a', 'b[]', c], [v1, v2])
-    -> {'a': {'b': [{'c': v1}, {'c': v2}]}}
-  set_value_by_path({'a': {'b': [{'c': v1}, {'c': v2}]}}, ['a', 'b[]', 'd'], v3)
-    -> {'a': {'b': [{'c': v1, 'd': v3}, {'c': v2, 'd': v3}]}}
+# Kinds of key path segments: `key`, `key[]` and `key[0]`.
+_KEY = 0
+_EACH = 1
+_FIRST = 2
+
+_MAX_KEY_PATHS = 8192
+_KEY_PATHS: dict[tuple[str, ...], '_KeyPath'] = {}
+
+# A segment is its kind, name, original key and the path after it, if any.
+_Segment: TypeAlias = tuple[int, str, str, Optional['_KeyPath']]
+
+
+class _KeyPath:
+  """A key path parsed once into segments.
+
+  The generated converters address fields with short literal key paths such as
+  `['contents']` or `['config', 'tools[]', 'name']`. Parsing a path splits off
+  the `[]` and `[0]` suffixes once, so walking it afterwards is only dict or
+  attribute lookups.
   """
-  if value is None:
-    return
-  for i, key in enumerate(keys[:-1]):
-    if key.endswith('[]'):
-      key_name = key[:-2]
-      if data is not None and key_name not in data:
+
+  __slots__ = ('_keys', '_is_self', '_segments', '_parent_segments')
+
+  def __init__(self, keys: tuple[str, ...]):
+    self._keys = keys
+    self._is_self = keys == ('_self',)
+    segments: list[_Segment] = []
+    for i, key in enumerate(keys):
+      if key.endswith('[]'):
+        segments.append((_EACH, key[:-2], key, _key_path(keys[i + 1 :])))
+      elif key.endswith('[0]'):
+        segments.append((_FIRST, key[:-3], key, _key_path(keys[i + 1 :])))
+      else:
+        segments.append((_KEY, key, key, None))
+    self._segments = tuple(segments)
+    # Setting a value treats the last key as a plain key.
+    self._parent_segments = self._segments[:-1]
+
+  def get(self, data: Any, default_value: Any) -> Any:
+    if self._is_self:
+      return data
+    for kind, name, _, sub_path in self._segments:
+      if not data:
+        return default_value
+      if kind == _KEY:
+        data = _get_key(data, name)
+        if data is _MISSING:
+          return default_value
+      elif kind == _EACH:
+        assert sub_path is not None
+        if name in data:
+          return [sub_path.get(d, default_value) for d in data[name]]
+        return default_value
+      else:
+        assert sub_path is not None
+        if name in data and data[name]:
+          return sub_path.get(data[name][0], default_value)
+        return default_value
+    return data
+
+  def set(self, data: Any, value: Any) -> None:
+    if value is None:
+      return
+    for kind, name, key, sub_path in self._parent_segments:
+      if data is None:
+        return
+      if kind == _KEY:
+        data = data.setdefault(name, {})
+      elif kind == _EACH:
+        assert sub_path is not None
+        if name not in data:
+          if isinstance(value, list):
+            data[name] = [{} for _ in range(len(value))]
+          else:
+            raise ValueError(
+                f'value {value} must be a list given an array path {key}'
+            )
         if isinstance(value, list):
-          data[key_name] = [{} for _ in range(len(value))]
+          for j, d in enumerate(data[name]):
+            sub_path.set(d, value[j])
         else:
-          raise ValueError(
-              f'value {value} must be a list given an array path {key}'
-          )
-      if isinstance(value, list) and data is not None:
-        for j, d in enumerate(data[key_name]):
-          set_value_by_path(d, keys[i + 1 :], value[j])
+          for d in data[name]:
+            sub_path.set(d, value)
+        return
       else:
-        if data is not None:
-          for d in data[key_name]:
-            set_value_by_path(d, keys[i + 1 :], value)
-      return
-    elif key.endswith('[0]'):
-      key_name = key[:-3]
-      if data is not None and key_name not in data:
-        data[key_name] = [{}]
-      if data is not None:
-        set_value_by_path(data[key_name][0], keys[i + 1 :], value)
+        assert sub_path is not None
+        if name not in data:
+          data[name] = [{}]
+        sub_path.set(data[name][0], value)
+        return
+    if data is None:
       return
-    if data is not None:
-      data = data.setdefault(key, {})
-
-  if data is not None:
-    existing_data = data.get(keys[-1])
+    last = self._keys[-1]
+    existing_data = data.get(last)
     # If there is an existing value, merge, not overwrite.
     if existing_data is not None:
       # Don't overwrite existing non-empty value with new empty value.
@@ -111,18 +167,54 @@ def set_value_by_path(
         existing_data.update(value)
       else:
         raise ValueError(
-            f'Cannot set value for an existing key. Key: {keys[-1]};'
+            f'Cannot set value for an existing key. Key: {last};'
             f' Existing value: {existing_data}; New value: {value}.'
         )
     else:
-      if (
-          keys[-1] == '_self'
-          and isinstance(data, dict)
-          and isinstance(value, dict)
-      ):
+      if last == '_self' and isinstance(data, dict) and isinstance(value, dict):
         data.update(value)
       else:
-        data[keys[-1]] = value
+        data[last] = value
+
+
+def _get_key(data: Any, key: str) -> Any:
+  if type(data) is dict:
+    return data.get(key, _MISSING)
+  if isinstance(data, BaseModel):
+    # Pydantic models iterate over (field, value) pairs, so a membership test
+    # on one scans every field and never matches. Go straight to getattr.
+    return getattr(data, key, _MISSING)
+  if key in data:
+    return data[key]
+  return _MISSING
+
+
+def _key_path(keys: Union[list[str], tuple[str, ...]]) -> _KeyPath:
+  """Returns the parsed key path for `keys`, parsing it on first use."""
+  keys = tuple(keys)
+  key_path = _KEY_PATHS.get(keys)
+  if key_path is None:
+    if len(_KEY_PATHS) >= _MAX_KEY_PATHS:
+      _KEY_PATHS.clear()
+    key_path = _KEY_PATHS[keys] = _KeyPath(keys)
+  return key_path
+
+
+def set_value_by_path(
+    data: Optional[dict[Any, Any]], keys: list[str], value: Any
+) -> None:
+  """Examples:
+
+  set_value_by_path({}, ['a', 'b'], v)
+    -> {'a': {'b': v}}
+  set_value_by_path({}, ['a', 'b[]', c], [v1, v2])
+    -> {'a': {'b': [{'c': v1}, {'c': v2}]}}
+  set_value_by_path({'a': {'b': [{'c': v1}, {'c': v2}]}}, ['a', 'b[]', 'd'], v3)
+    -> {'a': {'b': [{'c': v1, 'd': v3}, {'c': v2, 'd': v3}]}}
+  """
+  if value is None:
+    return
+  _key_path(keys).set(data, value)
 
 
 def get_value_by_path(
@@ -135,36 +227,7 @@ def get_value_by_path(
   get_value_by_path({'a': {'b': [{'c': v1}, {'c': v2}]}}, ['a', 'b[]', 'c'])
     -> [v1, v2]
   """
-  if keys == ['_self']:
-    return data
-  for i, key in enumerate(keys):
-    if not data:
-      return default_value
-    if key.endswith('[]'):
-      key_name = key[:-2]
-      if key_name in data:
-        return [
-            get_value_by_path(d, keys[i + 1 :], default_value=default_value)
-            for d in data[key_name]
-        ]
-      else:
-        return default_value
-    elif key.endswith('[0]'):
-      key_name = key[:-3]
-      if key_name in data and data[key_name]:
-        return get_value_by_path(
-            data[key_name][0], keys[i + 1 :], default_value=default_value
-        )
-      else:
-        return default_value
-    else:
-      if key in data:
-        data = data[key]
-      elif isinstance(data, BaseModel) and hasattr(data, key):
-        data = getattr(data, key)
-      else:
-        return default_value
-  return data
+  return _key_path(keys).get(data, default_value)
 
 
 def move_value_by_path(data: Any, paths: dict[str, str]) -> None:
@@ -367,6 +430,145 @@ def _remove_extra_fields(model: Any, response: dict[str, object]) -> None:
           _remove_extra_fields(typing.get_args(annotation)[0], item)
 
 
+_IMMUTABLE_DEFAULT_TYPES = (type(None), str, int, float, bool, enum.Enum)
+
+
+class _ConstructPlan:
+  """How to construct a model from a trusted response dict.
+
+  `fields` maps each field name and alias to the field name and the converter
+  for its value. `defaults` holds the value of every field, if all of them
+  have immutable defaults and the model needs no post-init; the instance dict
+  is then built directly, instead of by `model_construct` resolving each
+  default for every instance.
+  """
+
+  __slots__ = ('fields', 'defaults')
+
+  def __init__(
+      self,
+      fields: dict[str, tuple[str, Optional[Callable[[Any], Any]]]],
+      defaults: Optional[dict[str, Any]],
+  ):
+    self.fields = fields
+    self.defaults = defaults
+
+
+# Construction plans keyed by model class. None if the model must be validated.
+_CONSTRUCT_PLANS: dict[type, Optional[_ConstructPlan]] = {}
+
+_LEAF_CONFIG = pydantic.ConfigDict(
+    arbitrary_types_allowed=True,
+    val_json_bytes='base64',
+)
+
+
+def _leaf_converter(annotation: Any) -> Callable[[Any], Any]:
+  """Returns a converter validating only values not already of their type."""
+  validate = pydantic.TypeAdapter(
+      annotation, config=_LEAF_CONFIG
+  ).validate_python
+  if annotation in (str, int, float, bool):
+
+    def convert(value: Any) -> Any:
+      return value if type(value) is annotation else validate(value)
+
+    return convert
+  return validate
+
+
+def _field_converter(annotation: Any) -> Optional[Callable[[Any], Any]]:
+  """Returns the converter for a field value, or None to keep it as is."""
+  if get_origin(annotation) is Union:
+    args = [arg for arg in get_args(annotation) if arg is not type(None)]
+    if len(args) == 1:
+      annotation = args[0]
+  if annotation is Any:
+    return None
+  if inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+    return functools.partial(_construct_model, annotation)
+  if get_origin(annotation) is list:
+    item_annotation = get_args(annotation)[0]
+    if inspect.isclass(item_annotation) and issubclass(
+        item_annotation, BaseModel
+    ):
+      return functools.partial(_construct_models, item_annotation)
+  if _is_struct_type(annotation):
+    return None
+  return _leaf_converter(annotation)
+
+
+def _construct_plan(model: type['BaseModel']) -> Optional[_ConstructPlan]:
+  plan = _CONSTRUCT_PLANS.get(model, _MISSING)
+  if plan is not _MISSING:
+    return plan  # type: ignore[return-value]
+  decorators = model.__pydantic_decorators__
+  if decorators.field_validators or set(decorators.model_validators) - {
+      '_check_field_type_mismatches'
+  }:
+    # The model rewrites or checks its input, so it has to be validated.
+    plan = None
+  else:
+    fields: dict[str, tuple[str, Optional[Callable[[Any], Any]]]] = {}
+    defaults: Optional[dict[str, Any]] = {}
+    for name, field_info in model.model_fields.items():
+      converter = _field_converter(field_info.annotation)
+      fields[name] = (name, converter)
+      if field_info.alias:
+        fields[field_info.alias] = (name, converter)
+      if (
+          defaults is not None
+          and field_info.default_factory is None
+          and isinstance(field_info.default, _IMMUTABLE_DEFAULT_TYPES)
+      ):
+        defaults[name] = field_info.default
+      else:
+        defaults = None
+    if model.__pydantic_post_init__ or model.__private_attributes__:
+      defaults = None
+    plan = _ConstructPlan(fields, defaults)
+  _CONSTRUCT_PLANS[model] = plan
+  return plan
+
+
+def _construct_model(model: type['BaseModel'], value: Any) -> Any:
+  if isinstance(value, model):
+    return value
+  if not isinstance(value, dict):
+    return model.model_validate(value)
+  plan = _construct_plan(model)
+  if plan is None:
+    _remove_extra_fields(model, value)
+    return model.model_validate(value)
+  plan_fields = plan.fields
+  fields = {}
+  for key, field_value in value.items():
+    entry = plan_fields.get(key)
+    # Fields the model does not know are dropped, as in validation.
+    if entry is None:
+      continue
+    name, converter = entry
+    if field_value is not None and converter is not None:
+      field_value = converter(field_value)
+    fields[name] = field_value
+  if plan.defaults is None:
+    return model.model_construct(_fields_set=set(fields), **fields)
+  instance = model.__new__(model)
+  instance_dict = plan.defaults.copy()
+  instance_dict.update(fields)
+  object.__setattr__(instance, '__dict__', instance_dict)
+  object.__setattr__(instance, '__pydantic_fields_set__', set(fields))
+  object.__setattr__(instance, '__pydantic_extra__', None)
+  object.__setattr__(instance, '__pydantic_private__', None)
+  return instance
+
+
+def _construct_models(model: type['BaseModel'], value: Any) -> Any:
+  if not isinstance(value, list):
+    return pydantic.TypeAdapter(list[model]).validate_python(value)  # type: ignore[valid-type]
+  return [_construct_model(model, item) for item in value]
+
+
 T = typing.TypeVar('T', bound='BaseModel')
 
 
@@ -628,7 +830,18 @@ class BaseModel(pydantic.BaseModel):
       *,
       response: dict[str, object],
       kwargs: dict[str, object],
+      skip_validation: bool = False,
   ) -> T:
+    """Builds the model from a response dict.
+
+    Args:
+      response: The response dict, already converted to the SDK field names.
+      kwargs: The parameters of the request.
+      skip_validation: Whether to trust the response and construct the model
+        without validating it. Values that are not yet of their field's type,
+        such as enums, timestamps and base64 encoded bytes, are still
+        converted, and models with their own validators are still validated.
+    """
     # To maintain forward compatibility, we need to remove extra fields from
     # the response.
     # We will provide another mechanism to allow users to access these fields.
@@ -645,9 +858,15 @@ class BaseModel(pydantic.BaseModel):
         and kwargs['config']['include_all_fields']
     )
 
+    start = time.perf_counter()
+    if skip_validation and not should_skip_removing_fields:
+      constructed = _construct_model(cls, response)
+      instrumentation.record_validation(start)
+      return constructed  # type: ignore[no-any-return]
     if not should_skip_removing_fields:
       _remove_extra_fields(cls, response)
     validated_response = cls.model_validate(response)
+    instrumentation.record_validation(start)
     return validated_response
 
   def to_json_dict(self) -> dict[str, object]:
@@ -688,7 +907,9 @@ def timestamped_unique_name() -> str:
   return f'{timestamp}_{unique_id}'
 
 
-def encode_unserializable_types(data: dict[str, object]) -> dict[str, object]:
+def encode_unserializable_types(
+    data: dict[str, object], keep_bytes: bool = False
+) -> dict[str, object]:
   """Converts unserializable types in dict to json.dumps() compatible types.
 
   This function is called in models.py after calling convert_to_dict(). The
@@ -698,6 +919,11 @@ def encode_unserializable_types(data: dict[str, object]) -> dict[str, object]:
   `ser_json_bytes` control in model_dump(mode='json') called in
   `convert_to_dict`, as well as datetime deserialization in Pydantic json mode.
 
+  Args:
+    data: The dictionary to convert.
+    keep_bytes: Whether to leave bytes values as they are, so that the API
+      client can stream their base64 encoding into the request body.
+
   Returns:
     A dictionary with json.dumps() incompatible type (e.g. bytes datetime)
     to compatible type (e.g. base64 encoded string, isoformat date string).
@@ -707,20 +933,26 @@ def encode_unserializable_types(data: dict[str, object]) -> dict[str, object]:
     return data
   for key, value in data.items():
     if isinstance(value, bytes):
-      processed_data[key] = base64.urlsafe_b64encode(value).decode('ascii')
+      processed_data[key] = (
+          value
+          if keep_bytes
+          else base64.urlsafe_b64encode(value).decode('ascii')
+      )
     elif isinstance(value, datetime.datetime):
       processed_data[key] = value.isoformat()
     elif isinstance(value, dict):
-      processed_data[key] = encode_unserializable_types(value)
+      processed_data[key] = encode_unserializable_types(value, keep_bytes)
     elif isinstance(value, list):
-      if all(isinstance(v, bytes) for v in value):
+      if not keep_bytes and all(isinstance(v, bytes) for v in value):
         processed_data[key] = [
             base64.urlsafe_b64encode(v).decode('ascii') for v in value
         ]
-      if all(isinstance(v, datetime.datetime) for v in value):
+      elif all(isinstance(v, datetime.datetime) for v in value):
         processed_data[key] = [v.isoformat() for v in value]
       else:
-        processed_data[key] = [encode_unserializable_types(v) for v in value]
+        processed_data[key] = [
+            encode_unserializable_types(v, keep_bytes) for v in value
+        ]
     else:
       processed_data[key] = value
   return processed_data
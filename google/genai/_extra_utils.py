@@ -16,14 +16,18 @@
 """Extra utils depending on types that are shared between sync and async modules."""
 
 import asyncio
+import concurrent.futures
+import functools
 import inspect
 import io
 import logging
+import math
 import mimetypes
 import os
 import sys
+import time
 import typing
-from typing import Any, Callable, Dict, Optional, Type, TypeVar, Union, get_args, get_origin
+from typing import Any, Awaitable, Callable, Dict, Optional, Type, TypeVar, Union, get_args, get_origin
 
 import pydantic
 
@@ -352,96 +356,223 @@ async def invoke_function_from_dict_args_async(
     )
 
 
-def get_function_response_parts(
+def _function_calls(
     response: types.GenerateContentResponse,
-    function_map: dict[str, Union[Callable[..., Any], McpToGenAiToolAdapter]],
-) -> list[types.Part]:
-  """Returns the function response parts from the response."""
-  func_response_parts = []
+) -> list[types.FunctionCall]:
+  """Returns the function calls in the first candidate of the response."""
   if (
       response.candidates is not None
       and isinstance(response.candidates[0].content, types.Content)
       and response.candidates[0].content.parts is not None
   ):
-    for part in response.candidates[0].content.parts:
-      if not part.function_call:
-        continue
-      func_name = part.function_call.name
-      if func_name is not None and part.function_call.args is not None:
-        func = function_map[func_name]
-        args = convert_number_values_for_dict_function_call_args(
-            part.function_call.args
+    return [
+        part.function_call
+        for part in response.candidates[0].content.parts
+        if part.function_call and part.function_call.name is not None
+    ]
+  return []
+
+
+def _function_call_timeout_response(
+    func_name: str, timeout: float
+) -> _common.StringDict:
+  return {
+      'error': f'Function {func_name} timed out after {timeout} seconds.'
+  }
+
+
+def _call_function(
+    func_name: str,
+    func: Union[Callable[..., Any], McpToGenAiToolAdapter],
+    args: dict[str, Any],
+) -> _common.StringDict:
+  func_response: _common.StringDict
+  try:
+    if not isinstance(func, McpToGenAiToolAdapter):
+      func_response = {'result': invoke_function_from_dict_args(args, func)}
+  except Exception as e:  # pylint: disable=broad-except
+    func_response = {'error': str(e)}
+  return func_response
+
+
+def _call_functions_in_threads(
+    calls: list[tuple[str, Callable[[], _common.StringDict]]],
+    max_concurrency: int,
+    timeout: Optional[float],
+) -> list[_common.StringDict]:
+  """Runs the calls in a thread pool and returns their responses in order.
+
+  At most `max_concurrency` calls run at once. A call still running after
+  `timeout` seconds gets an error response. Its thread cannot be interrupted,
+  so it keeps running in the background but no longer counts towards
+  `max_concurrency`.
+  """
+  func_responses: list[_common.StringDict] = [{} for _ in calls]
+  pending = iter(enumerate(calls))
+  # Future -> (index of the call, deadline of the call).
+  running: dict[concurrent.futures.Future[Any], tuple[int, float]] = {}
+  executor = concurrent.futures.ThreadPoolExecutor(
+      max_workers=len(calls), thread_name_prefix='google-genai-afc'
+  )
+  try:
+    while True:
+      while len(running) < max_concurrency:
+        next_call = next(pending, None)
+        if next_call is None:
+          break
+        index, (_, call) = next_call
+        deadline = (
+            time.monotonic() + timeout if timeout is not None else math.inf
         )
-        func_response: _common.StringDict
-        try:
-          if not isinstance(func, McpToGenAiToolAdapter):
-            func_response = {
-                'result': invoke_function_from_dict_args(args, func)
-            }
-        except Exception as e:  # pylint: disable=broad-except
-          func_response = {'error': str(e)}
-        func_response_part = types.Part.from_function_response(
-            name=func_name, response=func_response
+        running[executor.submit(call)] = (index, deadline)
+      if not running:
+        break
+      wait_timeout = None
+      if timeout is not None:
+        wait_timeout = max(
+            0.0,
+            min(deadline for _, deadline in running.values())
+            - time.monotonic(),
         )
-        func_response_parts.append(func_response_part)
-  return func_response_parts
+      done, _ = concurrent.futures.wait(
+          running,
+          timeout=wait_timeout,
+          return_when=concurrent.futures.FIRST_COMPLETED,
+      )
+      now = time.monotonic()
+      for future, (index, deadline) in list(running.items()):
+        if future in done:
+          func_responses[index] = future.result()
+        elif deadline <= now and timeout is not None:
+          func_responses[index] = _function_call_timeout_response(
+              calls[index][0], timeout
+          )
+        else:
+          continue
+        del running[future]
+  finally:
+    executor.shutdown(wait=False)
+  return func_responses
+
+
+def get_function_response_parts(
+    response: types.GenerateContentResponse,
+    function_map: dict[str, Union[Callable[..., Any], McpToGenAiToolAdapter]],
+    afc_config: Optional[types.AutomaticFunctionCallingConfig] = None,
+) -> list[types.Part]:
+  """Returns the function response parts from the response.
+
+  The function calls run one after another, unless `afc_config` sets
+  `max_concurrent_function_calls` or `function_call_timeout`; they then run in
+  a thread pool. Either way, the parts follow the order of the function calls.
+  """
+  calls: list[tuple[str, Callable[[], _common.StringDict]]] = []
+  for function_call in _function_calls(response):
+    func_name = function_call.name
+    if func_name is not None and function_call.args is not None:
+      func = function_map[func_name]
+      args = convert_number_values_for_dict_function_call_args(
+          function_call.args
+      )
+      calls.append(
+          (func_name, functools.partial(_call_function, func_name, func, args))
+      )
+  max_concurrency, timeout = get_function_call_options_afc(afc_config)
+  if calls and (max_concurrency > 1 or timeout is not None):
+    func_responses = _call_functions_in_threads(
+        calls, max_concurrency, timeout
+    )
+  else:
+    func_responses = [call() for _, call in calls]
+  return [
+      types.Part.from_function_response(name=func_name, response=func_response)
+      for (func_name, _), func_response in zip(calls, func_responses)
+  ]
+
+
+async def _call_function_async(
+    func_name: str,
+    func: Union[Callable[..., Any], McpToGenAiToolAdapter],
+    args: dict[str, Any],
+) -> _common.StringDict:
+  func_response: _common.StringDict
+  try:
+    if isinstance(func, McpToGenAiToolAdapter):
+      mcp_tool_response = await func.call_tool(
+          types.FunctionCall(name=func_name, args=args)
+      )
+      is_error = getattr(
+          mcp_tool_response,
+          'is_error',
+          getattr(mcp_tool_response, 'isError', False),
+      )
+      if is_error:
+        func_response = {'error': mcp_tool_response}
+      else:
+        func_response = {'result': mcp_tool_response}
+    elif inspect.iscoroutinefunction(func):
+      func_response = {
+          'result': await invoke_function_from_dict_args_async(args, func)
+      }
+    else:
+      func_response = {
+          'result': await asyncio.to_thread(
+              invoke_function_from_dict_args, args, func
+          )
+      }
+  except Exception as e:  # pylint: disable=broad-except
+    func_response = {'error': str(e)}
+  return func_response
 
 
 async def get_function_response_parts_async(
     response: types.GenerateContentResponse,
     function_map: dict[str, Union[Callable[..., Any], McpToGenAiToolAdapter]],
+    afc_config: Optional[types.AutomaticFunctionCallingConfig] = None,
 ) -> list[types.Part]:
-  """Returns the function response parts from the response."""
-  func_response_parts = []
-  if (
-      response.candidates is not None
-      and isinstance(response.candidates[0].content, types.Content)
-      and response.candidates[0].content.parts is not None
-  ):
-    for part in response.candidates[0].content.parts:
-      if not part.function_call:
-        continue
-      func_name = part.function_call.name
-      if func_name is not None:
-        func = function_map[func_name]
-        # Treat None as an empty dictionary for execution
-        raw_args = (
-            part.function_call.args
-            if part.function_call.args is not None
-            else {}
-        )
-        args = convert_number_values_for_dict_function_call_args(raw_args)
+  """Returns the function response parts from the response.
+
+  The function calls run one after another, unless `afc_config` sets
+  `max_concurrent_function_calls` or `function_call_timeout`; they then run
+  with `asyncio.gather`. Either way, the parts follow the order of the function
+  calls.
+  """
+  calls: list[tuple[str, Callable[[], Awaitable[_common.StringDict]]]] = []
+  for function_call in _function_calls(response):
+    func_name = function_call.name
+    if func_name is not None:
+      func = function_map[func_name]
+      # Treat None as an empty dictionary for execution
+      raw_args = function_call.args if function_call.args is not None else {}
+      args = convert_number_values_for_dict_function_call_args(raw_args)
+      calls.append((
+          func_name,
+          functools.partial(_call_function_async, func_name, func, args),
+      ))
+  max_concurrency, timeout = get_function_call_options_afc(afc_config)
+  if max_concurrency <= 1 and timeout is None:
+    func_responses = [await call() for _, call in calls]
+  else:
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(
+        func_name: str, call: Callable[[], Awaitable[_common.StringDict]]
+    ) -> _common.StringDict:
+      async with semaphore:
+        if timeout is None:
+          return await call()
         try:
-          if isinstance(func, McpToGenAiToolAdapter):
-            mcp_tool_response = await func.call_tool(
-                types.FunctionCall(name=func_name, args=args)
-            )
-            is_error = getattr(
-                mcp_tool_response,
-                'is_error',
-                getattr(mcp_tool_response, 'isError', False),
-            )
-            if is_error:
-              func_response = {'error': mcp_tool_response}
-            else:
-              func_response = {'result': mcp_tool_response}
-          elif inspect.iscoroutinefunction(func):
-            func_response = {
-                'result': await invoke_function_from_dict_args_async(args, func)
-            }
-          else:
-            func_response = {
-                'result': await asyncio.to_thread(
-                    invoke_function_from_dict_args, args, func
-                )
-            }
-        except Exception as e:  # pylint: disable=broad-except
-          func_response = {'error': str(e)}  # type: ignore[dict-item]
-        func_response_part = types.Part.from_function_response(
-            name=func_name, response=func_response
-        )
-        func_response_parts.append(func_response_part)
-  return func_response_parts
+          return await asyncio.wait_for(call(), timeout)
+        except asyncio.TimeoutError:
+          return _function_call_timeout_response(func_name, timeout)
+
+    func_responses = await asyncio.gather(
+        *(run(func_name, call) for func_name, call in calls)
+    )
+  return [
+      types.Part.from_function_response(name=func_name, response=func_response)
+      for (func_name, _), func_response in zip(calls, func_responses)
+  ]
 
 
 def should_disable_afc(
@@ -519,6 +650,38 @@ def get_max_remote_calls_afc(
   return int(config_model.automatic_function_calling.maximum_remote_calls)
 
 
+def get_afc_config(
+    config: Optional[types.GenerateContentConfigOrDict] = None,
+) -> Optional[types.AutomaticFunctionCallingConfig]:
+  """Returns the automatic function calling config, if any."""
+  if not config:
+    return None
+  return _create_generate_content_config_model(
+      config
+  ).automatic_function_calling
+
+
+def get_function_call_options_afc(
+    afc_config: Optional[types.AutomaticFunctionCallingConfig] = None,
+) -> tuple[int, Optional[float]]:
+  """Returns the max concurrent function calls and the per call timeout."""
+  if not afc_config:
+    return 1, None
+  max_concurrency = afc_config.max_concurrent_function_calls or 1
+  if max_concurrency < 1:
+    raise ValueError(
+        'max_concurrent_function_calls in automatic_function_calling_config'
+        f' must be a positive integer, got {max_concurrency}.'
+    )
+  timeout = afc_config.function_call_timeout
+  if timeout is not None and timeout <= 0:
+    raise ValueError(
+        'function_call_timeout in automatic_function_calling_config'
+        f' must be positive, got {timeout}.'
+    )
+  return max_concurrency, timeout
+
+
 def raise_error_for_afc_incompatible_config(config: Optional[types.GenerateContentConfig]
 ) -> None:
   """Raises an error if the config is not compatible with AFC."""
@@ -733,6 +896,29 @@ def has_agent_platform_mcp_servers(
     return False
 
 
+def get_afc_config_to_call(
+    api_client: Any,
+    config: Optional[types.GenerateContentConfig],
+    function_map: dict[str, Union[Callable[..., Any], McpToGenAiToolAdapter]],
+) -> Optional[types.GenerateContentConfig]:
+  """Returns the config to send on every remote call of an AFC loop.
+
+  The config and its tools do not change between remote calls, so it is
+  copied, tagged with the usage header and has its tools transformed once for
+  the whole loop. Transforming a Python function into a function declaration
+  inspects its signature and builds its schema.
+  """
+  config_to_call = config.model_copy(deep=True) if config else None
+  if not function_map:
+    return config_to_call
+  config_to_call = get_usage_header(
+      config_to_call, types.GenerateContentConfig, 'afc'
+  )
+  if config_to_call.tools:
+    config_to_call.tools = t.t_tools(api_client, config_to_call.tools)  # type: ignore[assignment]
+  return config_to_call
+
+
 def get_usage_header(
     config: Optional[Union[dict[str, Any], C]], config_cls: Type[C], usage: str
 ) -> C:
@@ -0,0 +1,282 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Hedging of requests against slow backends.
+
+A hedged request that is still in flight after the hedging delay is sent a
+second time, and the first successful response is used. The delay is fixed, or
+a percentile of the latencies observed for the same method once there are
+enough of them.
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import dataclasses
+import math
+import threading
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+from urllib.parse import urlparse
+
+from .types import HedgingOptions
+
+
+T = TypeVar('T')
+
+_DEFAULT_METHODS = (
+    'countTokens',
+    'computeTokens',
+    'embedContent',
+    'batchEmbedContents',
+    'generateContent',
+)
+# Latencies kept per method, and needed before the percentile is used.
+_LATENCY_WINDOW = 200
+_MIN_LATENCY_SAMPLES = 20
+_MAX_WORKERS = 32
+
+
+@dataclasses.dataclass
+class HedgingStats:
+  """Counters of the hedged requests of a client."""
+
+  requests: int = 0
+  """Requests that could be hedged."""
+
+  hedges_sent: int = 0
+  """Duplicate requests sent after the hedging delay."""
+
+  hedges_won: int = 0
+  """Duplicate requests whose response was used."""
+
+  hedges_skipped: int = 0
+  """Requests not hedged because all the hedging threads were busy."""
+
+
+class Hedger:
+  """Sends hedged requests and keeps their latencies and counters."""
+
+  def __init__(
+      self,
+      options: HedgingOptions,
+      clock: Callable[[], float] = time.monotonic,
+  ):
+    if options.delay is None and options.latency_percentile is None:
+      raise ValueError(
+          'hedging_options requires a delay or a latency_percentile.'
+      )
+    if options.delay is not None and options.delay < 0:
+      raise ValueError(f'delay must not be negative, got {options.delay}.')
+    if options.latency_percentile is not None and not (
+        0 < options.latency_percentile <= 100
+    ):
+      raise ValueError(
+          'latency_percentile must be in (0, 100], got'
+          f' {options.latency_percentile}.'
+      )
+    self._delay = options.delay
+    self._percentile = options.latency_percentile
+    self._methods = frozenset(options.methods or _DEFAULT_METHODS)
+    self._clock = clock
+    self._lock = threading.Lock()
+    self._latencies: dict[str, collections.deque[float]] = {}
+    self._stats = HedgingStats()
+    self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+    # Requests running in the executor, so that none waits in its queue.
+    self._busy_workers = 0
+
+  @property
+  def stats(self) -> HedgingStats:
+    with self._lock:
+      return dataclasses.replace(self._stats)
+
+  def key_of(self, url: str) -> Optional[str]:
+    """Returns the latency key of a request, or None if it is not hedged."""
+    path = urlparse(url).path
+    _, _, method = path.rpartition(':')
+    return path if method in self._methods else None
+
+  def hedging_delay(self, key: str) -> Optional[float]:
+    """Returns the seconds after which a duplicate request is sent."""
+    with self._lock:
+      latencies = self._latencies.get(key)
+      if (
+          self._percentile is None
+          or latencies is None
+          or len(latencies) < _MIN_LATENCY_SAMPLES
+      ):
+        return self._delay
+      ordered = sorted(latencies)
+    rank = math.ceil(self._percentile / 100 * len(ordered)) - 1
+    return ordered[max(rank, 0)]
+
+  def _record_latency(self, key: str, latency: float) -> None:
+    with self._lock:
+      latencies = self._latencies.get(key)
+      if latencies is None:
+        latencies = self._latencies[key] = collections.deque(
+            maxlen=_LATENCY_WINDOW
+        )
+      latencies.append(latency)
+
+  def _count(
+      self,
+      requests: int = 0,
+      hedges_sent: int = 0,
+      hedges_won: int = 0,
+      hedges_skipped: int = 0,
+  ) -> None:
+    with self._lock:
+      self._stats.requests += requests
+      self._stats.hedges_sent += hedges_sent
+      self._stats.hedges_won += hedges_won
+      self._stats.hedges_skipped += hedges_skipped
+
+  def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+    with self._lock:
+      if self._executor is None:
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=_MAX_WORKERS, thread_name_prefix='genai-hedging'
+        )
+      return self._executor
+
+  def _timed(self, key: str, send: Callable[[], T]) -> T:
+    start = self._clock()
+    result = send()
+    self._record_latency(key, self._clock() - start)
+    return result
+
+  def _reserve_worker(self) -> bool:
+    """Reserves a thread of the executor, unless they are all busy."""
+    with self._lock:
+      if self._busy_workers >= _MAX_WORKERS:
+        return False
+      self._busy_workers += 1
+      return True
+
+  def _submit(
+      self,
+      executor: concurrent.futures.ThreadPoolExecutor,
+      key: str,
+      send: Callable[[], T],
+  ) -> tuple['concurrent.futures.Future[T]', threading.Event]:
+    """Runs a request on a reserved thread.
+
+    Returns:
+      The future of the response, and an event set once the request starts.
+    """
+    started = threading.Event()
+
+    def run() -> T:
+      started.set()
+      try:
+        return self._timed(key, send)
+      finally:
+        with self._lock:
+          self._busy_workers -= 1
+
+    return executor.submit(run), started
+
+  def run(self, key: str, send: Callable[[], T]) -> T:
+    """Sends a request, and a duplicate of it if it is slow.
+
+    Requests only run in the executor on a reserved thread, so they never
+    wait in its queue, and the hedging delay starts when the request does.
+    When all the threads are busy, the request is sent from the calling
+    thread, or the duplicate isn't sent, rather than adding to the load of a
+    saturated client. The slower request cannot be interrupted, so it
+    completes in the background and its response is discarded.
+    """
+    self._count(requests=1)
+    delay = self.hedging_delay(key)
+    if delay is None:
+      return self._timed(key, send)
+    if not self._reserve_worker():
+      self._count(hedges_skipped=1)
+      return self._timed(key, send)
+    executor = self._get_executor()
+    primary, started = self._submit(executor, key, send)
+    started.wait()
+    try:
+      return primary.result(timeout=delay)
+    except concurrent.futures.TimeoutError:
+      pass
+    if not self._reserve_worker():
+      self._count(hedges_skipped=1)
+      return primary.result()
+    hedge, _ = self._submit(executor, key, send)
+    self._count(hedges_sent=1)
+    first_error: Optional[BaseException] = None
+    for future in concurrent.futures.as_completed((primary, hedge)):
+      error = future.exception()
+      if error is not None:
+        first_error = first_error or error
+        continue
+      if future is hedge:
+        self._count(hedges_won=1)
+      return future.result()
+    assert first_error is not None
+    raise first_error
+
+  async def async_run(
+      self, key: str, send: Callable[[], Awaitable[T]]
+  ) -> T:
+    """Sends a request, and a duplicate of it if it is slow.
+
+    The slower request is cancelled once the other one succeeds.
+    """
+    self._count(requests=1)
+    delay = self.hedging_delay(key)
+
+    async def timed() -> T:
+      start = self._clock()
+      result = await send()
+      self._record_latency(key, self._clock() - start)
+      return result
+
+    if delay is None:
+      return await timed()
+    primary = asyncio.ensure_future(timed())
+    pending = {primary}
+    try:
+      done, pending = await asyncio.wait(pending, timeout=delay)
+      if done:
+        return primary.result()
+      hedge = asyncio.ensure_future(timed())
+      pending.add(hedge)
+      self._count(hedges_sent=1)
+      first_error: Optional[BaseException] = None
+      while pending:
+        done, pending = await asyncio.wait(
+            pending, return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in (primary, hedge):
+          if task not in done:
+            continue
+          error = task.exception()
+          if error is not None:
+            first_error = first_error or error
+            continue
+          if task is hedge:
+            self._count(hedges_won=1)
+          return task.result()
+      assert first_error is not None
+      raise first_error
+    finally:
+      for task in pending:
+        task.cancel()
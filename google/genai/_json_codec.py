@@ -0,0 +1,131 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""JSON codecs used to encode request bodies and decode response bodies.
+
+The codecs always encode to bytes so request bodies can be handed to the
+transport without another copy, and raise `json.JSONDecodeError` on malformed
+input regardless of the underlying library.
+"""
+
+import functools
+import json
+from typing import Any, Optional, Union
+
+from .types import JsonCodec
+
+
+
+class Codec:
+  """Standard library JSON codec."""
+
+  name = JsonCodec.JSON
+
+  def dumps(self, obj: Any) -> bytes:
+    # The output is ASCII because json.dumps escapes non-ASCII characters.
+    return json.dumps(obj).encode('ascii')
+
+  def loads(self, data: Union[str, bytes]) -> Any:
+    return json.loads(data)
+
+
+class _OrjsonCodec(Codec):
+  """orjson codec, falling back to the standard library for unsupported data."""
+
+  name = JsonCodec.ORJSON
+
+  def __init__(self) -> None:
+    import orjson  # pylint: disable=g-import-not-at-top
+
+    self._dumps = orjson.dumps
+    self._loads = orjson.loads
+
+  def dumps(self, obj: Any) -> bytes:
+    try:
+      return self._dumps(obj)  # type: ignore[no-any-return]
+    except TypeError:
+      # e.g. integers wider than 64 bits or non-string keys.
+      return super().dumps(obj)
+
+  def loads(self, data: Union[str, bytes]) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+    return self._loads(data)
+
+
+class _MsgspecCodec(Codec):
+  """msgspec codec, falling back to the standard library for unsupported data."""
+
+  name = JsonCodec.MSGSPEC
+
+  def __init__(self) -> None:
+    import msgspec  # pylint: disable=g-import-not-at-top
+
+    self._decode_error = msgspec.DecodeError
+    self._encoder = msgspec.json.Encoder()
+    self._decoder = msgspec.json.Decoder()
+
+  def dumps(self, obj: Any) -> bytes:
+    try:
+      return self._encoder.encode(obj)  # type: ignore[no-any-return]
+    except (TypeError, OverflowError):
+      return super().dumps(obj)
+
+  def loads(self, data: Union[str, bytes]) -> Any:
+    try:
+      return self._decoder.decode(data)
+    except self._decode_error as e:
+      doc = data if isinstance(data, str) else data.decode('utf-8', 'replace')
+      raise json.JSONDecodeError(str(e), doc, 0) from e
+
+
+_CODECS = {
+    JsonCodec.ORJSON: (_OrjsonCodec, 'orjson'),
+    JsonCodec.MSGSPEC: (_MsgspecCodec, 'msgspec'),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def get_codec(codec: Optional[JsonCodec] = None) -> Codec:
+  """Returns the codec for the given option.
+
+  Args:
+    codec: The requested codec. If None or AUTO, orjson or msgspec is used when
+      installed, otherwise the standard library.
+
+  Returns:
+    The JSON codec.
+
+  Raises:
+    ImportError: If an explicitly requested codec is not installed.
+  """
+  if codec == JsonCodec.JSON:
+    return Codec()
+  if codec is None or codec == JsonCodec.AUTO:
+    for codec_class, _ in _CODECS.values():
+      try:
+        return codec_class()
+      except ImportError:
+        continue
+    return Codec()
+
+  codec_class, package = _CODECS[codec]
+  try:
+    return codec_class()
+  except ImportError as e:
+    raise ImportError(
+        f'The {package} package is required to use the {codec.value} JSON'
+        f' codec. Please install it with `pip install {package}`.'
+    ) from e
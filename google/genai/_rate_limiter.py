@@ -0,0 +1,214 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Client-side rate limiting of the requests to each model.
+
+Each model has a token bucket for requests and one for prompt tokens, refilled
+at the configured rate per minute. A request takes its cost from the buckets
+when it is about to be sent and waits until the buckets are no longer in debt,
+so that callers over the limit queue in the order they arrived.
+
+After a 429 response the refill rate of the model is halved and its requests
+pause for the delay the server asked for. Each successful request then
+restores part of the rate.
+"""
+
+import asyncio
+import re
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from .types import RateLimitOptions
+
+
+# Characters of text per token used to estimate the tokens of a request.
+_CHARS_PER_TOKEN = 4
+# Tokens counted for each media part, which is an image's count.
+_MEDIA_PART_TOKENS = 258
+_MEDIA_PART_KEYS = frozenset(('inlineData', 'fileData'))
+_MIN_RATE_FACTOR = 1 / 16
+_RATE_FACTOR_RECOVERY = 1 / 32
+_MODEL_PATH = re.compile(r'(?:^|/)models/([^/:?]+):')
+_PROMPT_TOKEN_COUNT = re.compile(r'"promptTokenCount":\s*(\d+)')
+
+
+def model_of(path: str) -> Optional[str]:
+  """Returns the model whose method a request path calls, if there is one."""
+  match = _MODEL_PATH.search(path)
+  return match.group(1) if match else None
+
+
+def estimate_tokens(request_dict: Any) -> int:
+  """Estimates the prompt tokens of a request body.
+
+  Text counts one token per four characters and each media part counts a
+  fixed number of tokens.
+  """
+  characters = 0
+  media_parts = 0
+  stack = [request_dict]
+  while stack:
+    value = stack.pop()
+    if isinstance(value, str):
+      characters += len(value)
+    elif isinstance(value, dict):
+      for key, item in value.items():
+        if key in _MEDIA_PART_KEYS:
+          media_parts += 1
+        else:
+          stack.append(item)
+    elif isinstance(value, list):
+      stack.extend(value)
+  return -(-characters // _CHARS_PER_TOKEN) + media_parts * _MEDIA_PART_TOKENS
+
+
+def prompt_token_count(response_body: str) -> Optional[int]:
+  """Returns the prompt token count of a response body, if it has one."""
+  match = _PROMPT_TOKEN_COUNT.search(response_body)
+  return int(match.group(1)) if match else None
+
+
+class _Bucket:
+  """A token bucket holding up to a minute of its rate."""
+
+  __slots__ = ('capacity', 'rate', 'level', 'updated')
+
+  def __init__(self, per_minute: int, now: float):
+    self.capacity = float(per_minute)
+    self.rate = per_minute / 60.0
+    self.level = self.capacity
+    self.updated = now
+
+  def refill(self, now: float, rate_factor: float) -> None:
+    self.level = min(
+        self.capacity,
+        self.level + (now - self.updated) * self.rate * rate_factor,
+    )
+    self.updated = now
+
+  def take(self, cost: float, now: float, rate_factor: float) -> float:
+    """Takes `cost` from the bucket and returns the seconds until it is paid."""
+    self.refill(now, rate_factor)
+    self.level -= min(cost, self.capacity)
+    return max(-self.level / (self.rate * rate_factor), 0.0)
+
+
+class _ModelLimits:
+  """The buckets and adaptation state of one model."""
+
+  __slots__ = ('requests', 'tokens', 'rate_factor', 'paused_until')
+
+  def __init__(self, requests: Optional[_Bucket], tokens: Optional[_Bucket]):
+    self.requests = requests
+    self.tokens = tokens
+    self.rate_factor = 1.0
+    self.paused_until = 0.0
+
+
+class RateLimiter:
+  """Limits the rate of the requests and prompt tokens sent to each model."""
+
+  def __init__(
+      self,
+      options: RateLimitOptions,
+      clock: Callable[[], float] = time.monotonic,
+  ):
+    for name in ('requests_per_minute', 'tokens_per_minute'):
+      value = getattr(options, name)
+      if value is not None and value <= 0:
+        raise ValueError(f'{name} must be positive, got {value}.')
+    self._requests_per_minute = options.requests_per_minute
+    self._tokens_per_minute = options.tokens_per_minute
+    self._clock = clock
+    self._lock = threading.Lock()
+    self._models: dict[str, _ModelLimits] = {}
+
+  def _limits(self, model: str, now: float) -> _ModelLimits:
+    limits = self._models.get(model)
+    if limits is None:
+      limits = _ModelLimits(
+          _Bucket(self._requests_per_minute, now)
+          if self._requests_per_minute
+          else None,
+          _Bucket(self._tokens_per_minute, now)
+          if self._tokens_per_minute
+          else None,
+      )
+      self._models[model] = limits
+    return limits
+
+  def reserve(self, model: str, tokens: int) -> float:
+    """Takes a request from the model's limits.
+
+    Returns:
+      The seconds to wait before sending the request.
+    """
+    with self._lock:
+      now = self._clock()
+      limits = self._limits(model, now)
+      delay = limits.paused_until - now
+      if limits.requests is not None:
+        delay = max(delay, limits.requests.take(1, now, limits.rate_factor))
+      if limits.tokens is not None:
+        delay = max(delay, limits.tokens.take(tokens, now, limits.rate_factor))
+      return max(delay, 0.0)
+
+  def acquire(self, model: str, tokens: int) -> None:
+    """Waits until a request may be sent to the model."""
+    delay = self.reserve(model, tokens)
+    if delay:
+      time.sleep(delay)
+
+  async def async_acquire(self, model: str, tokens: int) -> None:
+    """Waits asynchronously until a request may be sent to the model."""
+    delay = self.reserve(model, tokens)
+    if delay:
+      await asyncio.sleep(delay)
+
+  def record_success(
+      self,
+      model: str,
+      estimated_tokens: int,
+      prompt_tokens: Optional[int] = None,
+  ) -> None:
+    """Records a successful request and corrects its token estimate."""
+    with self._lock:
+      now = self._clock()
+      limits = self._limits(model, now)
+      for bucket in (limits.requests, limits.tokens):
+        if bucket is not None:
+          bucket.refill(now, limits.rate_factor)
+      limits.rate_factor = min(limits.rate_factor + _RATE_FACTOR_RECOVERY, 1.0)
+      if limits.tokens is not None and prompt_tokens is not None:
+        limits.tokens.level -= prompt_tokens - estimated_tokens
+
+  def record_throttled(
+      self, model: str, retry_after: Optional[float] = None
+  ) -> None:
+    """Records a 429 response, lowering the model's rate."""
+    with self._lock:
+      now = self._clock()
+      limits = self._limits(model, now)
+      # The quota is used up, whatever the buckets hold.
+      for bucket in (limits.requests, limits.tokens):
+        if bucket is not None:
+          bucket.refill(now, limits.rate_factor)
+          bucket.level = min(bucket.level, 0.0)
+      limits.rate_factor = max(limits.rate_factor / 2, _MIN_RATE_FACTOR)
+      if retry_after:
+        limits.paused_until = max(limits.paused_until, now + retry_after)
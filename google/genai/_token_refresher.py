@@ -0,0 +1,108 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Background refresh of access tokens ahead of their expiry.
+
+A request that finds its access token expired refreshes it inline, and every
+request arriving meanwhile waits for that refresh. The refresher renews the
+token on a background thread a margin before it expires instead, so requests
+keep using the current token until the new one replaces it.
+"""
+
+import datetime
+import logging
+import threading
+from typing import Callable, Optional
+
+import google.auth.credentials
+
+
+logger = logging.getLogger('google_genai._token_refresher')
+
+# Seconds between attempts after a failed refresh, at most.
+_MAX_RETRY_DELAY = 60.0
+# Seconds between refreshes, at least, should tokens expire sooner than
+# expected.
+_MIN_REFRESH_INTERVAL = 1.0
+
+
+def _utcnow() -> datetime.datetime:
+  # google-auth keeps expiries as naive UTC datetimes.
+  return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+class TokenRefresher:
+  """Refreshes credentials on a daemon thread ahead of their expiry.
+
+  The refresh does not hold the client's auth lock, so that requests reading
+  the current token are not blocked by it. Credentials without an expiry are
+  not refreshed.
+  """
+
+  def __init__(
+      self,
+      credentials: google.auth.credentials.Credentials,
+      refresh: Callable[[google.auth.credentials.Credentials], object],
+      margin: float,
+      now: Callable[[], datetime.datetime] = _utcnow,
+  ):
+    self._credentials = credentials
+    self._refresh = refresh
+    self._margin = margin
+    self._now = now
+    self._stopped = threading.Event()
+    self._thread = threading.Thread(
+        target=self._run, name='genai-token-refresher', daemon=True
+    )
+    self._thread.start()
+
+  def _seconds_until_refresh(self, refreshed: bool = False) -> Optional[float]:
+    expiry: Optional[datetime.datetime] = self._credentials.expiry
+    if expiry is None:
+      return None
+    remaining = (expiry - self._now()).total_seconds()
+    delay = remaining - self._margin
+    if refreshed and delay < remaining / 2:
+      # Fresh tokens that live less than twice the margin are refreshed half
+      # way through their lifetime.
+      delay = remaining / 2
+    return max(delay, _MIN_REFRESH_INTERVAL)
+
+  def _run(self) -> None:
+    failures = 0
+    refreshed = False
+    while True:
+      if failures:
+        delay: Optional[float] = min(2.0**failures, _MAX_RETRY_DELAY)
+      else:
+        delay = self._seconds_until_refresh(refreshed)
+      if delay is None or self._stopped.wait(delay):
+        return
+      try:
+        self._refresh(self._credentials)
+        failures = 0
+        refreshed = True
+      except Exception as e:  # pylint: disable=broad-except
+        failures += 1
+        logger.warning('Failed to refresh the access token: %s', e)
+
+  def stop(self) -> None:
+    """Stops refreshing the credentials."""
+    self._stopped.set()
+
+  def is_alive(self) -> bool:
+    return self._thread.is_alive()
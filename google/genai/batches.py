@@ -15,11 +15,16 @@
 
 # Code generated by the Google Gen AI SDK generator DO NOT EDIT.
 
-import json
+import asyncio
+import concurrent.futures
 import logging
-from typing import Any, Optional, Union
+import os
+import tempfile
+from typing import IO, TYPE_CHECKING, Any, AsyncGenerator, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Optional, Sequence, TypeVar, Union
 from urllib.parse import urlencode
 
+import anyio
+
 from . import _api_module
 from . import _common
 from . import _extra_utils
@@ -31,8 +36,20 @@ from ._common import move_value_by_path as movev
 from ._common import set_value_by_path as setv
 from .pagers import AsyncPager, Pager
 
+if TYPE_CHECKING:
+  from .deferred import AsyncDeferredModels
+
 logger = logging.getLogger('google_genai.batches')
 
+_DEFAULT_MAX_REQUESTS_PER_SHARD = 10_000
+# Inlined requests are sent in the request that creates the batch job.
+_DEFAULT_MAX_INLINED_BYTES_PER_SHARD = 10_000_000
+_DEFAULT_SHARD_CONCURRENCY = 4
+
+_Shard = TypeVar('_Shard')
+# A result yielded by `iter_results`.
+_BatchResult = Union[types.InlinedResponse, types.InlinedEmbedContentResponse]
+
 
 def _AuthConfig_to_mldev(
     from_object: Union[dict[str, Any], object],
@@ -1793,6 +1810,250 @@ def _VertexMultimodalDatasetDestination_to_vertex(
   return to_object
 
 
+def _write_batch_input(
+    api_client: BaseApiClient,
+    requests: Iterable[types.InlinedRequestOrDict],
+    file: IO[bytes],
+) -> int:
+  """Writes requests to a JSONL batch input file, one line at a time.
+
+  Each line holds the `key` of the request, which defaults to
+  `request-<index>` unless the metadata of the request has a `key`, and the
+  request in the format of the Gemini Developer API.
+
+  Returns:
+    The number of requests written.
+  """
+  count = 0
+  for index, request in enumerate(requests):
+    file.write(_batch_input_line(api_client, request, index))
+    count += 1
+  return count
+
+
+def _batch_input_line(
+    api_client: BaseApiClient,
+    request: types.InlinedRequestOrDict,
+    index: int,
+) -> bytes:
+  """Returns the line of a request in a JSONL batch input file."""
+  if isinstance(request, dict):
+    request = types.InlinedRequest(**request)
+  line = _InlinedRequest_to_mldev(api_client, request)
+  line['key'] = (request.metadata or {}).get('key', f'request-{index}')
+  line = _common.encode_unserializable_types(_common.convert_to_dict(line))
+  return api_client._json_codec.dumps(line) + b'\n'
+
+
+def _write_batch_input_shards(
+    api_client: BaseApiClient,
+    requests: Iterable[types.InlinedRequestOrDict],
+    directory: str,
+    max_requests: int,
+    max_bytes: Optional[int],
+) -> Iterator[tuple[str, int]]:
+  """Writes requests to JSONL batch input files, one shard at a time.
+
+  Each file holds at most `max_requests` requests and `max_bytes` bytes,
+  unless a single request is larger than `max_bytes`. The keys of the
+  requests default to `request-<index>` with indices counted across all the
+  shards, so that they identify the responses of the whole sharded job.
+
+  Yields:
+    The path and the number of requests of each file once it's complete.
+  """
+  file: Optional[IO[bytes]] = None
+  path = ''
+  count = size = shard = 0
+  try:
+    for index, request in enumerate(requests):
+      line = _batch_input_line(api_client, request, index)
+      if file is not None and (
+          count >= max_requests
+          or (max_bytes is not None and size + len(line) > max_bytes)
+      ):
+        file.close()
+        file = None
+        yield path, count
+      if file is None:
+        path = os.path.join(directory, f'batch_input_{shard}.jsonl')
+        file = open(path, 'wb')
+        count = size = 0
+        shard += 1
+      file.write(line)
+      count += 1
+      size += len(line)
+    if file is not None:
+      file.close()
+      file = None
+      yield path, count
+  finally:
+    if file is not None:
+      file.close()
+
+
+def _sharded_batch_job_config(
+    config: Optional[types.CreateShardedBatchJobConfigOrDict],
+) -> types.CreateShardedBatchJobConfig:
+  if isinstance(config, dict):
+    config = types.CreateShardedBatchJobConfig(**config)
+  config = config or types.CreateShardedBatchJobConfig()
+  for name in ('max_requests_per_shard', 'max_bytes_per_shard'):
+    value = getattr(config, name)
+    if value is not None and value < 1:
+      raise ValueError(f'{name} must be positive, got {value}.')
+  if config.max_concurrency is not None and config.max_concurrency < 1:
+    raise ValueError(
+        f'max_concurrency must be positive, got {config.max_concurrency}.'
+    )
+  return config
+
+
+def _embedding_shards(
+    contents: Iterable[types.ContentUnionDict],
+    max_requests: int,
+    max_bytes: int,
+) -> Iterator[tuple[list[types.Content], int]]:
+  """Groups contents to embed into shards of inlined requests.
+
+  Each shard holds at most `max_requests` contents and about `max_bytes`
+  bytes of them, unless a single content is larger than `max_bytes`.
+
+  Yields:
+    The contents and the number of contents of each shard once it's complete.
+  """
+  shard: list[types.Content] = []
+  size = 0
+  for item in contents:
+    content = t.t_content(item)  # type: ignore[arg-type]
+    content_size = len(content.model_dump_json(exclude_none=True))
+    if shard and (
+        len(shard) >= max_requests or size + content_size > max_bytes
+    ):
+      yield shard, len(shard)
+      shard, size = [], 0
+    shard.append(content)
+    size += content_size
+  if shard:
+    yield shard, len(shard)
+
+
+def _shard_display_name(
+    config: types.CreateShardedBatchJobConfig, shard: int
+) -> Optional[str]:
+  if config.display_name:
+    return f'{config.display_name}-shard-{shard}'
+  return None
+
+
+def _embeddings_shard_job(
+    config: types.CreateShardedBatchJobConfig,
+    embed_config: Optional[types.EmbedContentConfigOrDict],
+    contents: list[types.Content],
+    shard: int,
+) -> tuple[
+    types.EmbeddingsBatchJobSource, types.CreateEmbeddingsBatchJobConfig
+]:
+  """Returns the source and config of the embedding batch job of a shard."""
+  return (
+      types.EmbeddingsBatchJobSource(
+          inlined_requests=types.EmbedContentBatch(
+              contents=contents,  # type: ignore[arg-type]
+              config=embed_config,  # type: ignore[arg-type]
+          )
+      ),
+      types.CreateEmbeddingsBatchJobConfig(
+          display_name=_shard_display_name(config, shard),
+          http_options=config.http_options,
+      ),
+  )
+
+
+def _shard_config(
+    config: types.CreateShardedBatchJobConfig, shard: int
+) -> tuple[types.UploadFileConfig, types.CreateBatchJobConfig]:
+  """Returns the configs of the upload and batch job of a shard."""
+  display_name = _shard_display_name(config, shard)
+  return (
+      types.UploadFileConfig(
+          mime_type='jsonl',
+          display_name=display_name,
+          http_options=config.http_options,
+      ),
+      types.CreateBatchJobConfig(
+          display_name=display_name, http_options=config.http_options
+      ),
+  )
+
+
+def _log_orphaned_shards(jobs: Iterable[types.BatchJob]) -> None:
+  names = [job.name for job in jobs]
+  if names:
+    logger.warning(
+        'Creating a sharded batch job failed after the batch jobs %s were'
+        ' created. They keep running unless they are cancelled.',
+        ', '.join(str(name) for name in names),
+    )
+
+
+def _batch_input_upload_config(
+    config: Optional[types.UploadFileConfigOrDict],
+) -> types.UploadFileConfig:
+  if isinstance(config, dict):
+    config = types.UploadFileConfig(**config)
+  config = config.model_copy() if config else types.UploadFileConfig()
+  if config.mime_type is None:
+    config.mime_type = 'jsonl'
+  return config
+
+
+def _inlined_results(job: types.BatchJob) -> Optional[Sequence[_BatchResult]]:
+  """Returns the results inlined in a job, or None if they are in a file."""
+  dest = job.dest
+  if dest is None:
+    return None
+  if dest.inlined_responses is not None:
+    return dest.inlined_responses
+  return dest.inlined_embed_content_responses
+
+
+def _batch_results_path(
+    job: types.BatchJob,
+    config: Optional[types.DownloadFileConfigOrDict],
+) -> tuple[Optional[str], Optional[types.HttpOptionsOrDict]]:
+  """Returns the download path and http options of the results of a job.
+
+  The path is None if the results are inlined in the job.
+  """
+  dest = job.dest
+  if _inlined_results(job) is not None:
+    return None, None
+  if dest is None or dest.file_name is None:
+    raise ValueError(
+        f'Batch job {job.name} has no inlined or file results to read. Its'
+        f' state is {job.state}.'
+    )
+  if isinstance(config, dict):
+    config = types.DownloadFileConfig(**config)
+  path = f'files/{t.t_file_name(dest.file_name)}:download?alt=media'
+  return path, config.http_options if config else None
+
+
+def _inlined_result_key(response: _BatchResult, index: int) -> str:
+  return (response.metadata or {}).get('key', f'request-{index}')
+
+
+def _batch_result_from_line(
+    api_client: BaseApiClient, line: bytes, index: int
+) -> tuple[str, types.InlinedResponse]:
+  """Parses a line of a batch results file into its key and response."""
+  line_dict = api_client._json_codec.loads(line)
+  response = types.InlinedResponse._from_response(
+      response=_InlinedResponse_from_mldev(line_dict), kwargs={}
+  )
+  return line_dict.get('key', f'request-{index}'), response
+
+
 class Batches(_api_module.BaseModule):
 
   def _create(
@@ -1842,13 +2103,19 @@ class Batches(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _BatchJob_from_vertex(response_dict)
@@ -1921,13 +2188,19 @@ class Batches(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _BatchJob_from_mldev(response_dict)
@@ -2016,11 +2289,17 @@ class Batches(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request('get', path, request_dict, http_options)
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _BatchJob_from_vertex(response_dict)
@@ -2112,7 +2391,9 @@ class Batches(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     self._api_client.request('post', path, request_dict, http_options)
 
@@ -2153,11 +2434,17 @@ class Batches(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request('get', path, request_dict, http_options)
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _ListBatchJobsResponse_from_vertex(response_dict)
@@ -2251,13 +2538,19 @@ class Batches(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request(
         'delete', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _DeleteResourceJob_from_vertex(response_dict)
@@ -2335,6 +2628,361 @@ class Batches(_api_module.BaseModule):
     else:
       return self._create(model=model, src=src, config=config)
 
+  def upload_input_file(
+      self,
+      *,
+      requests: Iterable[types.InlinedRequestOrDict],
+      config: Optional[types.UploadFileConfigOrDict] = None,
+  ) -> types.BatchJobSource:
+    """Uploads requests as a JSONL input file for a batch job.
+
+    The requests are serialized one at a time to a temporary file, which is
+    then uploaded with the resumable protocol of `files.upload`. Memory use
+    doesn't grow with the number of requests, so `requests` can be a
+    generator. Only supported in the Gemini Developer API.
+
+    Args:
+      requests: The requests of the batch job. The `key` of each request in
+        the file, which identifies its response, is taken from its metadata
+        or defaults to `request-<index>`.
+      config: Optional parameters of the uploaded file, such as its
+        `display_name`.
+
+    Returns:
+      The source to pass to `batches.create`.
+
+    Usage:
+
+    .. code-block:: python
+
+      src = client.batches.upload_input_file(
+          requests=(
+              {'contents': f'Summarize document {i}.'} for i in range(100_000)
+          ),
+      )
+      batch_job = client.batches.create(model='gemini-2.5-flash', src=src)
+    """
+    if self._api_client.vertexai:
+      raise ValueError(
+          'This method is only supported in the Gemini Developer client.'
+      )
+    from .files import Files  # pylint: disable=g-import-not-at-top
+
+    with tempfile.TemporaryDirectory() as directory:
+      path = os.path.join(directory, 'batch_input.jsonl')
+      with open(path, 'wb') as file:
+        count = _write_batch_input(self._api_client, requests, file)
+      if not count:
+        raise ValueError('At least one request is required.')
+      uploaded = Files(self._api_client).upload(
+          file=path, config=_batch_input_upload_config(config)
+      )
+    return types.BatchJobSource(file_name=uploaded.name)
+
+  def create_sharded(
+      self,
+      *,
+      model: str,
+      requests: Iterable[types.InlinedRequestOrDict],
+      config: Optional[types.CreateShardedBatchJobConfigOrDict] = None,
+  ) -> types.ShardedBatchJob:
+    """Splits requests across several batch jobs and submits them.
+
+    The requests are written to JSONL input files of at most
+    `max_requests_per_shard` requests and `max_bytes_per_shard` bytes, one
+    shard at a time, so `requests` can be a generator. Up to
+    `max_concurrency` shards are uploaded and submitted with `batches.create`
+    at once, and the next shard is only written once one of them has been
+    submitted, so no more than `max_concurrency` input files are on disk at a
+    time. Each shard is a batch job of its own, so a failed job only affects
+    its share of the requests. Embedding requests are sharded by
+    `create_embeddings_sharded`. Only supported in the Gemini Developer API.
+
+    Args:
+      model: The model to use for the batch jobs.
+      requests: The requests to run. The `key` of each request, which
+        identifies its response, is taken from its metadata or defaults to
+        `request-<index>`, counted across all the shards.
+      config: Optional configuration of the sharding and of the batch jobs.
+
+    Returns:
+      The sharded job, which `get_sharded` refreshes and `iter_results` reads
+      the results of in the order of the requests.
+
+    Usage:
+
+    .. code-block:: python
+
+      job = client.batches.create_sharded(
+          model='gemini-2.5-flash',
+          requests=(
+              {'contents': f'Summarize document {i}.'} for i in range(100_000)
+          ),
+          config={'max_requests_per_shard': 20_000},
+      )
+      while not job.done:
+        time.sleep(60)
+        job = client.batches.get_sharded(job)
+      for key, result in client.batches.iter_results(job):
+        print(key, result.response.text)
+    """
+    if self._api_client.vertexai:
+      raise ValueError(
+          'This method is only supported in the Gemini Developer client.'
+      )
+    from .files import Files  # pylint: disable=g-import-not-at-top
+
+    config = _sharded_batch_job_config(config)
+    files = Files(self._api_client)
+
+    def submit(path: str, shard: int) -> types.BatchJob:
+      upload_config, job_config = _shard_config(config, shard)
+      uploaded = files.upload(file=path, config=upload_config)
+      os.remove(path)
+      return self.create(
+          model=model,
+          src=types.BatchJobSource(file_name=uploaded.name),
+          config=job_config,
+      )
+
+    with tempfile.TemporaryDirectory() as directory:
+      return self._create_shards(
+          _write_batch_input_shards(
+              self._api_client,
+              requests,
+              directory,
+              config.max_requests_per_shard or _DEFAULT_MAX_REQUESTS_PER_SHARD,
+              config.max_bytes_per_shard,
+          ),
+          submit,
+          config,
+      )
+
+  def _create_shards(
+      self,
+      shards: Iterator[tuple[_Shard, int]],
+      submit: Callable[[_Shard, int], types.BatchJob],
+      config: types.CreateShardedBatchJobConfig,
+  ) -> types.ShardedBatchJob:
+    """Submits each shard as it's yielded, `max_concurrency` at a time.
+
+    The next shard is only pulled from `shards` once fewer than
+    `max_concurrency` shards are being submitted, so that the shards waiting
+    for a slot don't pile up in memory or on disk. If a shard fails to be
+    submitted, the batch jobs created so far are logged.
+    """
+    max_concurrency = config.max_concurrency or _DEFAULT_SHARD_CONCURRENCY
+    futures: list[concurrent.futures.Future[types.BatchJob]] = []
+    in_flight: set[concurrent.futures.Future[types.BatchJob]] = set()
+    request_counts = []
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_concurrency,
+        thread_name_prefix='google-genai-batches',
+    ) as executor:
+      try:
+        while True:
+          if len(in_flight) >= max_concurrency:
+            done, in_flight = concurrent.futures.wait(
+                in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+              future.result()
+          next_shard = next(shards, None)
+          if next_shard is None:
+            break
+          shard, count = next_shard
+          future = executor.submit(submit, shard, len(futures))
+          futures.append(future)
+          in_flight.add(future)
+          request_counts.append(count)
+          # Don't keep the last shard alive while waiting for a slot.
+          del shard, next_shard
+        if not futures:
+          raise ValueError('At least one request is required.')
+        jobs = [future.result() for future in futures]
+      except BaseException:
+        for future in futures:
+          future.cancel()
+        concurrent.futures.wait(futures)
+        _log_orphaned_shards(
+            future.result()
+            for future in futures
+            if not future.cancelled() and future.exception() is None
+        )
+        raise
+    return types.ShardedBatchJob(
+        display_name=config.display_name,
+        jobs=jobs,
+        request_counts=request_counts,
+    )
+
+  def get_sharded(
+      self,
+      job: types.ShardedBatchJob,
+      *,
+      config: Optional[types.GetBatchJobConfigOrDict] = None,
+  ) -> types.ShardedBatchJob:
+    """Gets the latest state of the batch jobs of a sharded job.
+
+    Args:
+      job: The sharded job returned by `create_sharded`.
+      config: Optional configuration of the `batches.get` requests.
+
+    Returns:
+      A copy of the sharded job with the batch jobs of its shards refreshed
+      with `batches.get`.
+    """
+    jobs = [
+        self.get(name=shard.name, config=config)  # type: ignore[arg-type]
+        for shard in job.jobs or []
+    ]
+    return job.model_copy(update={'jobs': jobs})
+
+  def create_embeddings_sharded(
+      self,
+      *,
+      model: str,
+      contents: Iterable[types.ContentUnionDict],
+      embed_config: Optional[types.EmbedContentConfigOrDict] = None,
+      config: Optional[types.CreateShardedBatchJobConfigOrDict] = None,
+  ) -> types.ShardedBatchJob:
+    """**Experimental** Splits contents to embed across embedding batch jobs.
+
+    The embedding counterpart of `create_sharded`. Each content is an
+    embedding request, and the contents are grouped into shards of at most
+    `max_requests_per_shard` contents and `max_bytes_per_shard` bytes, which
+    defaults to 10,000,000 here as the shards are sent inlined with
+    `batches.create_embeddings`. The next shard is only read from `contents`
+    once one of the `max_concurrency` shards being submitted is done, so at
+    most that many shards are held in memory. Only supported in the Gemini
+    Developer API.
+
+    Args:
+      model: The embedding model to use for the batch jobs.
+      contents: The contents to embed, one embedding per content.
+      embed_config: Optional configuration of the embeddings, shared by all
+        the contents.
+      config: Optional configuration of the sharding and of the batch jobs.
+
+    Returns:
+      The sharded job, which `get_sharded` refreshes and `iter_results` reads
+      the embeddings of in the order of the contents.
+
+    Usage:
+
+    .. code-block:: python
+
+      job = client.batches.create_embeddings_sharded(
+          model='gemini-embedding-001',
+          contents=(document.text for document in documents),
+          config={'max_requests_per_shard': 5_000},
+      )
+      [job] = client.waiters.wait([job])
+      for key, result in client.batches.iter_results(job):
+        print(key, result.response.embedding.values[:3])
+    """
+    import warnings
+
+    warnings.warn(
+        'batches.create_embeddings_sharded() is experimental and may change'
+        ' without notice.',
+        category=_common.ExperimentalWarning,
+        stacklevel=2,
+    )
+    if self._api_client.vertexai:
+      raise ValueError(
+          'This method is only supported in the Gemini Developer client.'
+      )
+    config = _sharded_batch_job_config(config)
+
+    def submit(shard: list[types.Content], index: int) -> types.BatchJob:
+      src, job_config = _embeddings_shard_job(
+          config, embed_config, shard, index
+      )
+      return self._create_embeddings(model=model, src=src, config=job_config)
+
+    return self._create_shards(
+        _embedding_shards(
+            contents,
+            config.max_requests_per_shard or _DEFAULT_MAX_REQUESTS_PER_SHARD,
+            config.max_bytes_per_shard or _DEFAULT_MAX_INLINED_BYTES_PER_SHARD,
+        ),
+        submit,
+        config,
+    )
+
+  def iter_results(
+      self,
+      job: Union[str, types.BatchJob, types.ShardedBatchJob],
+      *,
+      config: Optional[types.DownloadFileConfigOrDict] = None,
+  ) -> Iterator[tuple[str, _BatchResult]]:
+    """Yields the results of a finished batch job with their request keys.
+
+    Results written to a file are downloaded and parsed one line at a time,
+    so that the file is never held in memory as a whole. Only supported in the
+    Gemini Developer API.
+
+    Args:
+      job: The batch job, or its name. The results of a sharded job are
+        yielded one shard after the other, in the order of its requests.
+      config: Optional configuration of the download of a results file.
+
+    Yields:
+      The key of each request and its response or error, which is an
+      `InlinedEmbedContentResponse` for embedding batch jobs. Keys of inlined
+      results are taken from the metadata of the request, or default to
+      `request-<index>` as in `upload_input_file`, counted across the shards
+      of a sharded job.
+
+    Usage:
+
+    .. code-block:: python
+
+      for key, result in client.batches.iter_results(batch_job):
+        if result.error:
+          print(key, result.error.message)
+        else:
+          print(key, result.response.text)
+    """
+    if not isinstance(job, types.ShardedBatchJob):
+      yield from self._iter_results(job, config, 0)
+      return
+    request_counts = job.request_counts or []
+    first_index = 0
+    for shard_index, shard in enumerate(job.jobs or []):
+      count = 0
+      for result in self._iter_results(shard, config, first_index):
+        yield result
+        count += 1
+      if shard_index < len(request_counts):
+        count = request_counts[shard_index]
+      first_index += count
+
+  def _iter_results(
+      self,
+      job: Union[str, types.BatchJob],
+      config: Optional[types.DownloadFileConfigOrDict],
+      first_index: int,
+  ) -> Iterator[tuple[str, _BatchResult]]:
+    """Yields the results of a batch job, indexed from `first_index`."""
+    if isinstance(job, str):
+      job = self.get(name=job)
+    path, http_options = _batch_results_path(job, config)
+    if path is None:
+      for index, response in enumerate(
+          _inlined_results(job) or [], first_index
+      ):
+        yield _inlined_result_key(response, index), response
+      return
+    index = first_index
+    for line in self._api_client.iter_download_lines(
+        path, http_options=http_options
+    ):
+      if line.strip():
+        yield _batch_result_from_line(self._api_client, line, index)
+        index += 1
+
   def create_embeddings(
       self,
       *,
@@ -2466,13 +3114,19 @@ class AsyncBatches(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _BatchJob_from_vertex(response_dict)
@@ -2545,13 +3199,19 @@ class AsyncBatches(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _BatchJob_from_mldev(response_dict)
@@ -2640,13 +3300,19 @@ class AsyncBatches(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'get', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _BatchJob_from_vertex(response_dict)
@@ -2738,7 +3404,9 @@ class AsyncBatches(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     await self._api_client.async_request(
         'post', path, request_dict, http_options
@@ -2781,13 +3449,19 @@ class AsyncBatches(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'get', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _ListBatchJobsResponse_from_vertex(response_dict)
@@ -2881,13 +3555,19 @@ class AsyncBatches(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'delete', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _DeleteResourceJob_from_vertex(response_dict)
@@ -2964,6 +3644,410 @@ class AsyncBatches(_api_module.BaseModule):
     else:
       return await self._create(model=model, src=src, config=config)
 
+  async def upload_input_file(
+      self,
+      *,
+      requests: Iterable[types.InlinedRequestOrDict],
+      config: Optional[types.UploadFileConfigOrDict] = None,
+  ) -> types.BatchJobSource:
+    """Uploads requests as a JSONL input file for a batch job.
+
+    The requests are serialized one at a time to a temporary file in a worker
+    thread, which is then uploaded with the resumable protocol of
+    `files.upload`. Memory use doesn't grow with the number of requests, so
+    `requests` can be a generator. Only supported in the Gemini Developer API.
+
+    Args:
+      requests: The requests of the batch job. The `key` of each request in
+        the file, which identifies its response, is taken from its metadata
+        or defaults to `request-<index>`.
+      config: Optional parameters of the uploaded file, such as its
+        `display_name`.
+
+    Returns:
+      The source to pass to `batches.create`.
+
+    Usage:
+
+    .. code-block:: python
+
+      src = await client.aio.batches.upload_input_file(
+          requests=(
+              {'contents': f'Summarize document {i}.'} for i in range(100_000)
+          ),
+      )
+      batch_job = await client.aio.batches.create(
+          model='gemini-2.5-flash', src=src
+      )
+    """
+    if self._api_client.vertexai:
+      raise ValueError(
+          'This method is only supported in the Gemini Developer client.'
+      )
+    from .files import AsyncFiles  # pylint: disable=g-import-not-at-top
+
+    with tempfile.TemporaryDirectory() as directory:
+      path = os.path.join(directory, 'batch_input.jsonl')
+      with open(path, 'wb') as file:
+        count = await anyio.to_thread.run_sync(
+            _write_batch_input, self._api_client, requests, file
+        )
+      if not count:
+        raise ValueError('At least one request is required.')
+      uploaded = await AsyncFiles(self._api_client).upload(
+          file=path, config=_batch_input_upload_config(config)
+      )
+    return types.BatchJobSource(file_name=uploaded.name)
+
+  async def create_sharded(
+      self,
+      *,
+      model: str,
+      requests: Iterable[types.InlinedRequestOrDict],
+      config: Optional[types.CreateShardedBatchJobConfigOrDict] = None,
+  ) -> types.ShardedBatchJob:
+    """Splits requests across several batch jobs and submits them.
+
+    The requests are written to JSONL input files of at most
+    `max_requests_per_shard` requests and `max_bytes_per_shard` bytes, one
+    shard at a time in a worker thread, so `requests` can be a generator. Up
+    to `max_concurrency` shards are uploaded and submitted with
+    `batches.create` at once, and the next shard is only written once one of
+    them has been submitted, so no more than `max_concurrency` input files are
+    on disk at a time. Each shard is a batch job of its own, so a failed job only affects
+    its share of the requests. Embedding requests are sharded by
+    `create_embeddings_sharded`. Only supported in the Gemini Developer API.
+
+    Args:
+      model: The model to use for the batch jobs.
+      requests: The requests to run. The `key` of each request, which
+        identifies its response, is taken from its metadata or defaults to
+        `request-<index>`, counted across all the shards.
+      config: Optional configuration of the sharding and of the batch jobs.
+
+    Returns:
+      The sharded job, which `get_sharded` refreshes and `iter_results` reads
+      the results of in the order of the requests.
+
+    Usage:
+
+    .. code-block:: python
+
+      job = await client.aio.batches.create_sharded(
+          model='gemini-2.5-flash',
+          requests=(
+              {'contents': f'Summarize document {i}.'} for i in range(100_000)
+          ),
+          config={'max_requests_per_shard': 20_000},
+      )
+      while not job.done:
+        await asyncio.sleep(60)
+        job = await client.aio.batches.get_sharded(job)
+    """
+    if self._api_client.vertexai:
+      raise ValueError(
+          'This method is only supported in the Gemini Developer client.'
+      )
+    from .files import AsyncFiles  # pylint: disable=g-import-not-at-top
+
+    config = _sharded_batch_job_config(config)
+    files = AsyncFiles(self._api_client)
+
+    async def submit(path: str, shard: int) -> types.BatchJob:
+      upload_config, job_config = _shard_config(config, shard)
+      uploaded = await files.upload(file=path, config=upload_config)
+      os.remove(path)
+      return await self.create(
+          model=model,
+          src=types.BatchJobSource(file_name=uploaded.name),
+          config=job_config,
+      )
+
+    with tempfile.TemporaryDirectory() as directory:
+      return await self._create_shards(
+          _write_batch_input_shards(
+              self._api_client,
+              requests,
+              directory,
+              config.max_requests_per_shard or _DEFAULT_MAX_REQUESTS_PER_SHARD,
+              config.max_bytes_per_shard,
+          ),
+          submit,
+          config,
+      )
+
+  async def _create_shards(
+      self,
+      shards: Iterator[tuple[_Shard, int]],
+      submit: Callable[[_Shard, int], Awaitable[types.BatchJob]],
+      config: types.CreateShardedBatchJobConfig,
+  ) -> types.ShardedBatchJob:
+    """Submits each shard as it's yielded, `max_concurrency` at a time.
+
+    The shards are produced in a worker thread, and the next one is only
+    pulled once fewer than `max_concurrency` shards are being submitted. If a
+    shard fails to be submitted, the other shards are cancelled, and the batch
+    jobs created so far are logged.
+    """
+    max_concurrency = config.max_concurrency or _DEFAULT_SHARD_CONCURRENCY
+    tasks: list[asyncio.Future[types.BatchJob]] = []
+    in_flight: set[asyncio.Future[types.BatchJob]] = set()
+    request_counts = []
+    try:
+      while True:
+        if len(in_flight) >= max_concurrency:
+          done, in_flight = await asyncio.wait(
+              in_flight, return_when=asyncio.FIRST_COMPLETED
+          )
+          for task in done:
+            task.result()
+        next_shard = await anyio.to_thread.run_sync(next, shards, None)
+        if next_shard is None:
+          break
+        shard, count = next_shard
+        task = asyncio.ensure_future(submit(shard, len(tasks)))
+        tasks.append(task)
+        in_flight.add(task)
+        request_counts.append(count)
+        # Don't keep the last shard alive while waiting for a slot.
+        del shard, next_shard
+      if not tasks:
+        raise ValueError('At least one request is required.')
+      jobs = await asyncio.gather(*tasks)
+    except BaseException:
+      for task in tasks:
+        task.cancel()
+      await asyncio.gather(*tasks, return_exceptions=True)
+      _log_orphaned_shards(
+          task.result()
+          for task in tasks
+          if not task.cancelled() and task.exception() is None
+      )
+      raise
+    finally:
+      shards.close()  # type: ignore[attr-defined]
+    return types.ShardedBatchJob(
+        display_name=config.display_name,
+        jobs=jobs,
+        request_counts=request_counts,
+    )
+
+  async def get_sharded(
+      self,
+      job: types.ShardedBatchJob,
+      *,
+      config: Optional[types.GetBatchJobConfigOrDict] = None,
+  ) -> types.ShardedBatchJob:
+    """Gets the latest state of the batch jobs of a sharded job.
+
+    Args:
+      job: The sharded job returned by `create_sharded`.
+      config: Optional configuration of the `batches.get` requests.
+
+    Returns:
+      A copy of the sharded job with the batch jobs of its shards refreshed
+      with `batches.get`, which are requested concurrently.
+    """
+    jobs = await asyncio.gather(
+        *(
+            self.get(name=shard.name, config=config)  # type: ignore[arg-type]
+            for shard in job.jobs or []
+        )
+    )
+    return job.model_copy(update={'jobs': list(jobs)})
+
+  async def create_embeddings_sharded(
+      self,
+      *,
+      model: str,
+      contents: Iterable[types.ContentUnionDict],
+      embed_config: Optional[types.EmbedContentConfigOrDict] = None,
+      config: Optional[types.CreateShardedBatchJobConfigOrDict] = None,
+  ) -> types.ShardedBatchJob:
+    """**Experimental** Splits contents to embed across embedding batch jobs.
+
+    The embedding counterpart of `create_sharded`. Each content is an
+    embedding request, and the contents are grouped into shards of at most
+    `max_requests_per_shard` contents and `max_bytes_per_shard` bytes, which
+    defaults to 10,000,000 here as the shards are sent inlined with
+    `batches.create_embeddings`. The contents are read in a worker thread,
+    and the next shard is only read once one of the `max_concurrency` shards
+    being submitted is done. Only supported in the Gemini Developer API.
+
+    Args:
+      model: The embedding model to use for the batch jobs.
+      contents: The contents to embed, one embedding per content.
+      embed_config: Optional configuration of the embeddings, shared by all
+        the contents.
+      config: Optional configuration of the sharding and of the batch jobs.
+
+    Returns:
+      The sharded job, which `get_sharded` refreshes and `iter_results` reads
+      the embeddings of in the order of the contents.
+
+    Usage:
+
+    .. code-block:: python
+
+      job = await client.aio.batches.create_embeddings_sharded(
+          model='gemini-embedding-001',
+          contents=(document.text for document in documents),
+      )
+    """
+    import warnings
+
+    warnings.warn(
+        'batches.create_embeddings_sharded() is experimental and may change'
+        ' without notice.',
+        category=_common.ExperimentalWarning,
+        stacklevel=2,
+    )
+    if self._api_client.vertexai:
+      raise ValueError(
+          'This method is only supported in the Gemini Developer client.'
+      )
+    config = _sharded_batch_job_config(config)
+
+    async def submit(shard: list[types.Content], index: int) -> types.BatchJob:
+      src, job_config = _embeddings_shard_job(
+          config, embed_config, shard, index
+      )
+      return await self._create_embeddings(
+          model=model, src=src, config=job_config
+      )
+
+    return await self._create_shards(
+        _embedding_shards(
+            contents,
+            config.max_requests_per_shard or _DEFAULT_MAX_REQUESTS_PER_SHARD,
+            config.max_bytes_per_shard or _DEFAULT_MAX_INLINED_BYTES_PER_SHARD,
+        ),
+        submit,
+        config,
+    )
+
+  async def iter_results(
+      self,
+      job: Union[str, types.BatchJob, types.ShardedBatchJob],
+      *,
+      config: Optional[types.DownloadFileConfigOrDict] = None,
+  ) -> AsyncIterator[tuple[str, _BatchResult]]:
+    """Yields the results of a finished batch job with their request keys.
+
+    Results written to a file are downloaded and parsed one line at a time,
+    so that the file is never held in memory as a whole. Only supported in the
+    Gemini Developer API.
+
+    Args:
+      job: The batch job, or its name. The results of a sharded job are
+        yielded one shard after the other, in the order of its requests.
+      config: Optional configuration of the download of a results file.
+
+    Yields:
+      The key of each request and its response or error, which is an
+      `InlinedEmbedContentResponse` for embedding batch jobs. Keys of inlined
+      results are taken from the metadata of the request, or default to
+      `request-<index>` as in `upload_input_file`, counted across the shards
+      of a sharded job.
+
+    Usage:
+
+    .. code-block:: python
+
+      async for key, result in client.aio.batches.iter_results(batch_job):
+        print(key, result.response.text)
+    """
+    if not isinstance(job, types.ShardedBatchJob):
+      results = self._iter_results(job, config, 0)
+      try:
+        async for result in results:
+          yield result
+      finally:
+        await results.aclose()
+      return
+    request_counts = job.request_counts or []
+    first_index = 0
+    for shard_index, shard in enumerate(job.jobs or []):
+      count = 0
+      results = self._iter_results(shard, config, first_index)
+      try:
+        async for result in results:
+          yield result
+          count += 1
+      finally:
+        await results.aclose()
+      if shard_index < len(request_counts):
+        count = request_counts[shard_index]
+      first_index += count
+
+  async def _iter_results(
+      self,
+      job: Union[str, types.BatchJob],
+      config: Optional[types.DownloadFileConfigOrDict],
+      first_index: int,
+  ) -> AsyncGenerator[tuple[str, _BatchResult], None]:
+    """Yields the results of a batch job, indexed from `first_index`."""
+    if isinstance(job, str):
+      job = await self.get(name=job)
+    path, http_options = _batch_results_path(job, config)
+    if path is None:
+      for index, response in enumerate(
+          _inlined_results(job) or [], first_index
+      ):
+        yield _inlined_result_key(response, index), response
+      return
+    index = first_index
+    lines = self._api_client.async_iter_download_lines(
+        path, http_options=http_options
+    )
+    try:
+      async for line in lines:
+        if line.strip():
+          yield _batch_result_from_line(self._api_client, line, index)
+          index += 1
+    finally:
+      await lines.aclose()
+
+  def deferred_models(
+      self, *, config: Optional[types.DeferredBatchConfigOrDict] = None
+  ) -> 'AsyncDeferredModels':
+    """Returns a front-end that runs generate_content requests as batch jobs.
+
+    Requests that don't need an answer for minutes can take the price and
+    throughput of batch jobs without being restructured: each call of its
+    `generate_content` returns a future of the response right away, and the
+    requests are grouped into inlined batch jobs by size and by time window.
+    Only supported in the Gemini Developer API.
+
+    Args:
+      config: Optional configuration of the grouping of the requests into
+        batch jobs, and of the polling of the jobs.
+
+    Returns:
+      The front-end, to be closed with `aclose` or an `async with` block.
+
+    Usage:
+
+    .. code-block:: python
+
+      async with client.aio.batches.deferred_models(
+          config={'max_wait_seconds': 300}
+      ) as models:
+        responses = await asyncio.gather(*(
+            models.generate_content(model='gemini-2.5-flash', contents=text)
+            for text in documents
+        ))
+    """
+    if self._api_client.vertexai:
+      raise ValueError(
+          'This method is only supported in the Gemini Developer client.'
+      )
+    from .deferred import AsyncDeferredModels  # pylint: disable=g-import-not-at-top
+
+    if isinstance(config, dict):
+      config = types.DeferredBatchConfig(**config)
+    return AsyncDeferredModels(self, config or types.DeferredBatchConfig())
+
   async def create_embeddings(
       self,
       *,
@@ -15,7 +15,6 @@
 
 # Code generated by the Google Gen AI SDK generator DO NOT EDIT.
 
-import json
 import logging
 from typing import Any, Optional, Union
 from urllib.parse import urlencode
@@ -1194,13 +1193,19 @@ class Caches(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     return_value = types.CachedContent._from_response(
         response=response_dict,
@@ -1276,11 +1281,17 @@ class Caches(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request('get', path, request_dict, http_options)
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     return_value = types.CachedContent._from_response(
         response=response_dict,
@@ -1358,13 +1369,19 @@ class Caches(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request(
         'delete', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _DeleteCachedContentResponse_from_vertex(response_dict)
@@ -1453,13 +1470,19 @@ class Caches(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request(
         'patch', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     return_value = types.CachedContent._from_response(
         response=response_dict,
@@ -1520,11 +1543,17 @@ class Caches(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request('get', path, request_dict, http_options)
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _ListCachedContentsResponse_from_vertex(response_dict)
@@ -1651,13 +1680,19 @@ class AsyncCaches(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     return_value = types.CachedContent._from_response(
         response=response_dict,
@@ -1734,13 +1769,19 @@ class AsyncCaches(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'get', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     return_value = types.CachedContent._from_response(
         response=response_dict,
@@ -1819,13 +1860,19 @@ class AsyncCaches(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'delete', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _DeleteCachedContentResponse_from_vertex(response_dict)
@@ -1914,13 +1961,19 @@ class AsyncCaches(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'patch', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     return_value = types.CachedContent._from_response(
         response=response_dict,
@@ -1981,13 +2034,19 @@ class AsyncCaches(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'get', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _ListCachedContentsResponse_from_vertex(response_dict)
@@ -311,6 +311,7 @@ class Chat(_BaseChat):
     remaining_remote_calls_afc = _extra_utils.get_max_remote_calls_afc(
         parsed_config
     )
+    afc_config = _extra_utils.get_afc_config(parsed_config)
     # Because we cannot remove automatic_function_calling from the
     # GenerateContentConfig, we set it to None to disable it
     if parsed_config:
@@ -343,7 +344,7 @@ class Chat(_BaseChat):
         break
 
       func_response_parts = _extra_utils.get_function_response_parts(
-          response, function_map
+          response, function_map, afc_config
       )
       if not func_response_parts:
         break
@@ -467,6 +468,7 @@ class Chat(_BaseChat):
     remaining_remote_calls_afc = _extra_utils.get_max_remote_calls_afc(
         parsed_config
     )
+    afc_config = _extra_utils.get_afc_config(parsed_config)
     # Because we cannot remove automatic_function_calling from the
     # GenerateContentConfig, we set it to None to disable it
     if parsed_config:
@@ -507,7 +509,9 @@ class Chat(_BaseChat):
               and chunk.candidates[0].content.parts
           ):
             chunk_func_response_parts = (
-                _extra_utils.get_function_response_parts(chunk, function_map)
+                _extra_utils.get_function_response_parts(
+                    chunk, function_map, afc_config
+                )
             )
             if chunk_func_response_parts:
               func_response_parts.extend(chunk_func_response_parts)
@@ -767,6 +771,7 @@ class AsyncChat(_BaseChat):
       remaining_remote_calls_afc = _extra_utils.get_max_remote_calls_afc(
           final_parsed_config
       )
+      afc_config = _extra_utils.get_afc_config(final_parsed_config)
       if final_parsed_config:
         final_parsed_config.automatic_function_calling = (
             types.AutomaticFunctionCallingConfig(
@@ -804,7 +809,7 @@ class AsyncChat(_BaseChat):
 
         func_response_parts = (
             await _extra_utils.get_function_response_parts_async(
-                response, function_map
+                response, function_map, afc_config
             )
         )
         if not func_response_parts:
@@ -1004,6 +1009,7 @@ class AsyncChat(_BaseChat):
         remaining_remote_calls_afc = _extra_utils.get_max_remote_calls_afc(
             final_parsed_config
         )
+        afc_config = _extra_utils.get_afc_config(final_parsed_config)
         if final_parsed_config:
           final_parsed_config.automatic_function_calling = (
               types.AutomaticFunctionCallingConfig(
@@ -1053,7 +1059,7 @@ class AsyncChat(_BaseChat):
             ):
               chunk_func_response_parts = (
                   await _extra_utils.get_function_response_parts_async(
-                      chunk, function_map
+                      chunk, function_map, afc_config
                   )
               )
               if chunk_func_response_parts:
@@ -17,7 +17,7 @@ from __future__ import annotations
 
 import asyncio
 import os
-from typing import Any, Optional, TYPE_CHECKING, Union
+from typing import Any, Optional, Sequence, TYPE_CHECKING, Union
 import warnings
 
 import google.auth
@@ -26,20 +26,22 @@ import pydantic
 from . import _common
 from ._api_client import BaseApiClient
 from ._base_url import get_base_url
-from ._replay_api_client import ReplayApiClient
-from .batches import AsyncBatches, Batches
-from .caches import AsyncCaches, Caches
-from .chats import AsyncChats, Chats
-from .file_search_stores import AsyncFileSearchStores, FileSearchStores
-from .files import AsyncFiles, Files
-from .live import AsyncLive
-from .models import AsyncModels, Models
-from .operations import AsyncOperations, Operations
-from .tokens import AsyncTokens, Tokens
-from .tunings import AsyncTunings, Tunings
-from .types import HttpOptions, HttpOptionsDict, HttpRetryOptions
+from .types import HttpOptions, HttpOptionsDict, HttpRetryOptions, WarmupResult
 
 if TYPE_CHECKING:
+  # The modules of the resources are imported on first access, so that
+  # importing the package doesn't pay for the resources a caller never uses.
+  from .batches import AsyncBatches, Batches
+  from .caches import AsyncCaches, Caches
+  from .chats import AsyncChats, Chats
+  from .file_search_stores import AsyncFileSearchStores, FileSearchStores
+  from .files import AsyncFiles, Files
+  from .live import AsyncLive
+  from .models import AsyncModels, Models
+  from .operations import AsyncOperations, Operations
+  from .tokens import AsyncTokens, Tokens
+  from .tunings import AsyncTunings, Tunings
+  from .waiters import AsyncWaiters, Waiters
   from ._gaos.google_genai import (
       AsyncGeminiNextGenAgents,
       AsyncGeminiNextGenEnvironments,
@@ -66,15 +68,16 @@ class AsyncClient:
   def __init__(self, api_client: BaseApiClient):
 
     self._api_client = api_client
-    self._models = AsyncModels(self._api_client)
-    self._tunings = AsyncTunings(self._api_client)
-    self._caches = AsyncCaches(self._api_client)
-    self._batches = AsyncBatches(self._api_client)
-    self._files = AsyncFiles(self._api_client)
-    self._file_search_stores = AsyncFileSearchStores(self._api_client)
-    self._live = AsyncLive(self._api_client)
-    self._tokens = AsyncTokens(self._api_client)
-    self._operations = AsyncOperations(self._api_client)
+    self._models: Optional[AsyncModels] = None
+    self._tunings: Optional[AsyncTunings] = None
+    self._caches: Optional[AsyncCaches] = None
+    self._batches: Optional[AsyncBatches] = None
+    self._files: Optional[AsyncFiles] = None
+    self._file_search_stores: Optional[AsyncFileSearchStores] = None
+    self._live: Optional[AsyncLive] = None
+    self._tokens: Optional[AsyncTokens] = None
+    self._operations: Optional[AsyncOperations] = None
+    self._waiters: Optional[AsyncWaiters] = None
     self._nextgen_client_instance: Optional[AsyncGeminiNextGenAPI] = None
     self._agents: Optional[AsyncGeminiNextGenAgents] = None
     self._interactions: Optional[AsyncGeminiNextGenInteractions] = None
@@ -159,44 +162,116 @@ class AsyncClient:
 
   @property
   def models(self) -> AsyncModels:
+    if self._models is None:
+      from .models import AsyncModels
+
+      self._models = AsyncModels(self._api_client)
     return self._models
 
   @property
   def tunings(self) -> AsyncTunings:
+    if self._tunings is None:
+      from .tunings import AsyncTunings
+
+      self._tunings = AsyncTunings(self._api_client)
     return self._tunings
 
   @property
   def caches(self) -> AsyncCaches:
+    if self._caches is None:
+      from .caches import AsyncCaches
+
+      self._caches = AsyncCaches(self._api_client)
     return self._caches
 
   @property
   def file_search_stores(self) -> AsyncFileSearchStores:
+    if self._file_search_stores is None:
+      from .file_search_stores import AsyncFileSearchStores
+
+      self._file_search_stores = AsyncFileSearchStores(self._api_client)
     return self._file_search_stores
 
   @property
   def batches(self) -> AsyncBatches:
+    if self._batches is None:
+      from .batches import AsyncBatches
+
+      self._batches = AsyncBatches(self._api_client)
     return self._batches
 
   @property
   def chats(self) -> AsyncChats:
+    from .chats import AsyncChats
+
     return AsyncChats(modules=self.models)
 
   @property
   def files(self) -> AsyncFiles:
+    if self._files is None:
+      from .files import AsyncFiles
+
+      self._files = AsyncFiles(self._api_client)
     return self._files
 
   @property
   def live(self) -> AsyncLive:
+    if self._live is None:
+      from .live import AsyncLive
+
+      self._live = AsyncLive(self._api_client)
     return self._live
 
   @property
   def auth_tokens(self) -> AsyncTokens:
+    if self._tokens is None:
+      from .tokens import AsyncTokens
+
+      self._tokens = AsyncTokens(self._api_client)
     return self._tokens
 
   @property
   def operations(self) -> AsyncOperations:
+    if self._operations is None:
+      from .operations import AsyncOperations
+
+      self._operations = AsyncOperations(self._api_client)
     return self._operations
 
+  @property
+  def waiters(self) -> AsyncWaiters:
+    if self._waiters is None:
+      from .waiters import AsyncWaiters
+
+      self._waiters = AsyncWaiters(self._api_client)
+    return self._waiters
+
+  async def warmup(
+      self,
+      connections: int = 1,
+      model_types: Sequence[type[pydantic.BaseModel]] = (),
+  ) -> WarmupResult:
+    """Pays the costs of the first request ahead of it.
+
+    Resolves the credentials, opens `connections` pooled connections to the
+    base URL and builds the validators of `model_types`.
+
+    Usage:
+    .. code-block:: python
+
+      from google.genai import types
+
+      result = await client.aio.warmup(
+          connections=4,
+          model_types=[types.GenerateContentResponse],
+      )
+      print(result.auth_seconds, result.connect_seconds)
+
+    Returns:
+      The time spent in each phase.
+    """
+    return await self._api_client.async_warmup(connections, model_types)
+
   async def aclose(self) -> None:
     """Closes the async client explicitly.
 
@@ -397,14 +472,15 @@ class Client:
     )
 
     self._aio = AsyncClient(self._api_client)
-    self._models = Models(self._api_client)
-    self._tunings = Tunings(self._api_client)
-    self._caches = Caches(self._api_client)
-    self._file_search_stores = FileSearchStores(self._api_client)
-    self._batches = Batches(self._api_client)
-    self._files = Files(self._api_client)
-    self._tokens = Tokens(self._api_client)
-    self._operations = Operations(self._api_client)
+    self._models: Optional[Models] = None
+    self._tunings: Optional[Tunings] = None
+    self._caches: Optional[Caches] = None
+    self._file_search_stores: Optional[FileSearchStores] = None
+    self._batches: Optional[Batches] = None
+    self._files: Optional[Files] = None
+    self._tokens: Optional[Tokens] = None
+    self._operations: Optional[Operations] = None
+    self._waiters: Optional[Waiters] = None
     self._nextgen_client_instance: Optional[GeminiNextGenAPI] = None
     self._agents: Optional[GeminiNextGenAgents] = None
     self._interactions: Optional[GeminiNextGenInteractions] = None
@@ -427,6 +503,8 @@ class Client:
         'replay',
         'auto',
     ]:
+      from ._replay_api_client import ReplayApiClient
+
       return ReplayApiClient(
           mode=debug_config.client_mode,  # type: ignore[arg-type]
           replay_id=debug_config.replay_id,  # type: ignore[arg-type]
@@ -524,6 +602,8 @@ class Client:
 
   @property
   def chats(self) -> Chats:
+    from .chats import Chats
+
     return Chats(modules=self.models)
 
   @property
@@ -532,41 +612,113 @@ class Client:
 
   @property
   def models(self) -> Models:
+    if self._models is None:
+      from .models import Models
+
+      self._models = Models(self._api_client)
     return self._models
 
   @property
   def tunings(self) -> Tunings:
+    if self._tunings is None:
+      from .tunings import Tunings
+
+      self._tunings = Tunings(self._api_client)
     return self._tunings
 
   @property
   def caches(self) -> Caches:
+    if self._caches is None:
+      from .caches import Caches
+
+      self._caches = Caches(self._api_client)
     return self._caches
 
   @property
   def file_search_stores(self) -> FileSearchStores:
+    if self._file_search_stores is None:
+      from .file_search_stores import FileSearchStores
+
+      self._file_search_stores = FileSearchStores(self._api_client)
     return self._file_search_stores
 
   @property
   def batches(self) -> Batches:
+    if self._batches is None:
+      from .batches import Batches
+
+      self._batches = Batches(self._api_client)
     return self._batches
 
   @property
   def files(self) -> Files:
+    if self._files is None:
+      from .files import Files
+
+      self._files = Files(self._api_client)
     return self._files
 
   @property
   def auth_tokens(self) -> Tokens:
+    if self._tokens is None:
+      from .tokens import Tokens
+
+      self._tokens = Tokens(self._api_client)
     return self._tokens
 
   @property
   def operations(self) -> Operations:
+    if self._operations is None:
+      from .operations import Operations
+
+      self._operations = Operations(self._api_client)
     return self._operations
 
+  @property
+  def waiters(self) -> Waiters:
+    if self._waiters is None:
+      from .waiters import Waiters
+
+      self._waiters = Waiters(self._api_client)
+    return self._waiters
+
   @property
   def vertexai(self) -> bool:
     """Returns whether the client is using the Vertex AI API."""
     return self._api_client.vertexai or False
 
+  def warmup(
+      self,
+      connections: int = 1,
+      model_types: Sequence[type[pydantic.BaseModel]] = (),
+  ) -> WarmupResult:
+    """Pays the costs of the first request ahead of it.
+
+    Resolves the credentials and fetches an access token, opens `connections`
+    pooled connections to the base URL and builds the validators of
+    `model_types`, which are otherwise built on first use. The connections are
+    kept while the pool keeps idle connections alive, see
+    `types.ConnectionPoolOptions`.
+
+    Usage:
+    .. code-block:: python
+
+      from google.genai import types
+
+      client = Client(
+          vertexai=True, project='my-project-id', location='us-central1'
+      )
+      result = client.warmup(
+          connections=4,
+          model_types=[types.GenerateContentResponse],
+      )
+      print(result.auth_seconds, result.connect_seconds)
+
+    Returns:
+      The time spent in each phase.
+    """
+    return self._api_client.warmup(connections, model_types)
+
   def close(self) -> None:
     """Closes the synchronous client explicitly.
 
@@ -0,0 +1,255 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Routes generate_content requests that can wait to the Batch API."""
+
+import asyncio
+import dataclasses
+import logging
+from typing import TYPE_CHECKING, Optional
+
+from . import errors
+from . import types
+from .batches import _batch_input_line
+
+if TYPE_CHECKING:
+  from .batches import AsyncBatches
+
+logger = logging.getLogger('google_genai.deferred')
+
+_DEFAULT_MAX_REQUESTS_PER_JOB = 1_000
+_DEFAULT_MAX_BYTES_PER_JOB = 10_000_000
+_DEFAULT_MAX_WAIT_SECONDS = 60.0
+
+
+@dataclasses.dataclass
+class _PendingJob:
+  """The requests of a batch job that hasn't been submitted yet."""
+
+  requests: list[types.InlinedRequest] = dataclasses.field(
+      default_factory=list
+  )
+  futures: dict[str, 'asyncio.Future[types.GenerateContentResponse]'] = (
+      dataclasses.field(default_factory=dict)
+  )
+  size: int = 0
+  timer: Optional[asyncio.TimerHandle] = None
+
+
+def _result_error(error: types.JobError) -> errors.APIError:
+  return errors.APIError(
+      error.code or 0,
+      {
+          'error': {
+              'code': error.code,
+              'message': error.message,
+              'details': error.details,
+          }
+      },
+  )
+
+
+def _log_unread_job(job: types.BatchJob, reason: str) -> None:
+  logger.warning(
+      'The results of batch job %s could not be read, as %s. The job keeps'
+      ' running unless it is cancelled, and its results can be read with'
+      ' batches.iter_results.',
+      job.name,
+      reason,
+  )
+
+
+class AsyncDeferredModels:
+  """Runs generate_content requests as inlined batch jobs.
+
+  Each call of `generate_content` returns a future right away. The requests
+  are grouped by model into a batch job, which is submitted once it holds
+  `max_requests_per_job` requests or `max_bytes_per_job` bytes, or once its
+  first request has waited for `max_wait_seconds`. The jobs are then polled
+  with `waiters.wait`, and the future of each request is resolved with its
+  response, or with the error of the request or of its job.
+
+  Create it with `client.aio.batches.deferred_models`, and close it with
+  `aclose` or an `async with` block to submit the last requests and wait for
+  all of them.
+  """
+
+  def __init__(
+      self, batches: 'AsyncBatches', config: types.DeferredBatchConfig
+  ):
+    self._batches = batches
+    self._config = config
+    self._pending: dict[str, _PendingJob] = {}
+    self._running: set['asyncio.Task[None]'] = set()
+    self._submitted_jobs = 0
+    self._closed = False
+
+  def generate_content(
+      self,
+      *,
+      model: str,
+      contents: types.ContentListUnionDict,
+      config: Optional[types.GenerateContentConfigOrDict] = None,
+  ) -> 'asyncio.Future[types.GenerateContentResponse]':
+    """Adds a request to the next batch job of its model.
+
+    Must be called from a running event loop. The request is converted when
+    it is added, so that invalid requests fail here rather than in the job.
+
+    Args:
+      model: The model to use.
+      contents: The input contents, as in `models.generate_content`.
+      config: Optional configuration of the request, as in
+        `models.generate_content`. Automatic function calling isn't run.
+
+    Returns:
+      A future of the response. It fails with an `APIError` if the request
+      fails, and with a `RuntimeError` if its batch job doesn't succeed.
+
+    Usage:
+
+    .. code-block:: python
+
+      async with client.aio.batches.deferred_models() as models:
+        response = await models.generate_content(
+            model='gemini-2.5-flash', contents='Summarize this document.'
+        )
+    """
+    if self._closed:
+      raise RuntimeError('Requests cannot be added after aclose.')
+    loop = asyncio.get_running_loop()
+    request = types.InlinedRequest(
+        contents=contents,  # type: ignore[arg-type]
+        config=config,  # type: ignore[arg-type]
+    )
+    size = len(_batch_input_line(self._batches._api_client, request, 0))
+    pending = self._pending.get(model)
+    if pending and pending.size + size > (
+        self._config.max_bytes_per_job or _DEFAULT_MAX_BYTES_PER_JOB
+    ):
+      self._submit(model)
+      pending = None
+    if pending is None:
+      pending = self._pending[model] = _PendingJob()
+      pending.timer = loop.call_later(
+          (
+              self._config.max_wait_seconds
+              if self._config.max_wait_seconds is not None
+              else _DEFAULT_MAX_WAIT_SECONDS
+          ),
+          self._submit,
+          model,
+      )
+    future: asyncio.Future[types.GenerateContentResponse] = (
+        loop.create_future()
+    )
+    # The key is the index of the request in its job, which is also the key
+    # of its result if the metadata doesn't come back with it.
+    key = f'request-{len(pending.requests)}'
+    request.metadata = {'key': key}
+    pending.requests.append(request)
+    pending.futures[key] = future
+    pending.size += size
+    if len(pending.requests) >= (
+        self._config.max_requests_per_job or _DEFAULT_MAX_REQUESTS_PER_JOB
+    ):
+      self._submit(model)
+    return future
+
+  def _submit(self, model: str) -> None:
+    """Submits the pending batch job of a model in the background."""
+    pending = self._pending.pop(model, None)
+    if pending is None:
+      return
+    if pending.timer is not None:
+      pending.timer.cancel()
+    task = asyncio.ensure_future(self._run(model, pending))
+    self._running.add(task)
+    task.add_done_callback(self._running.discard)
+
+  async def _run(self, model: str, pending: _PendingJob) -> None:
+    """Runs a batch job and resolves the futures of its requests."""
+    from .waiters import AsyncWaiters  # pylint: disable=g-import-not-at-top
+
+    display_name = None
+    if self._config.display_name:
+      display_name = f'{self._config.display_name}-{self._submitted_jobs}'
+    self._submitted_jobs += 1
+    job: Optional[types.BatchJob] = None
+    try:
+      job = await self._batches.create(
+          model=model,
+          src=pending.requests,  # type: ignore[arg-type]
+          config=types.CreateBatchJobConfig(
+              display_name=display_name,
+              http_options=self._config.http_options,
+          ),
+      )
+      [job] = await AsyncWaiters(self._batches._api_client).wait(
+          [job], config=self._config.wait_config
+      )
+      error: BaseException
+      if job.state != types.JobState.JOB_STATE_SUCCEEDED:
+        error = RuntimeError(
+            f'Batch job {job.name} ended in state {job.state}: {job.error}'
+        )
+      else:
+        async for key, result in self._batches.iter_results(job):
+          future = pending.futures.pop(key, None)
+          if future is None or future.done():
+            continue
+          if result.error is not None:
+            future.set_exception(_result_error(result.error))
+          else:
+            future.set_result(result.response)  # type: ignore[arg-type]
+        error = RuntimeError(
+            f'Batch job {job.name} has no result for the request.'
+        )
+    except asyncio.CancelledError:
+      if job is not None and not job.done:
+        _log_unread_job(job, 'the waiting was cancelled')
+      for future in pending.futures.values():
+        future.cancel()
+      raise
+    except Exception as e:  # pylint: disable=broad-exception-caught
+      error = e
+      if job is not None:
+        # The job was created, so name it for its results to be reachable.
+        _log_unread_job(job, repr(e))
+        error = RuntimeError(
+            f'Reading the results of batch job {job.name} failed: {e!r}'
+        )
+        error.__cause__ = e
+    for future in pending.futures.values():
+      if not future.done():
+        future.set_exception(error)
+
+  def flush(self) -> None:
+    """Submits the pending batch jobs without waiting for more requests."""
+    for model in list(self._pending):
+      self._submit(model)
+
+  async def aclose(self) -> None:
+    """Submits the pending batch jobs and waits for all the jobs to end."""
+    self._closed = True
+    self.flush()
+    await asyncio.gather(*self._running, return_exceptions=True)
+
+  async def __aenter__(self) -> 'AsyncDeferredModels':
+    return self
+
+  async def __aexit__(self, *exc_info: object) -> None:
+    await self.aclose()
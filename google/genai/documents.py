@@ -16,7 +16,6 @@
 # Code generated by the Google Gen AI SDK generator DO NOT EDIT.
 
 from functools import partial
-import json
 import logging
 from typing import Any, Optional, Union
 from urllib.parse import urlencode
@@ -175,11 +174,17 @@ class Documents(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request('get', path, request_dict, http_options)
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     return_value = types.Document._from_response(
         response=response_dict,
@@ -253,7 +258,9 @@ class Documents(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     self._api_client.request('delete', path, request_dict, http_options)
 
@@ -296,11 +303,17 @@ class Documents(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request('get', path, request_dict, http_options)
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _ListDocumentsResponse_from_mldev(response_dict)
@@ -406,13 +419,19 @@ class AsyncDocuments(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'get', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     return_value = types.Document._from_response(
         response=response_dict,
@@ -486,7 +505,9 @@ class AsyncDocuments(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     await self._api_client.async_request(
         'delete', path, request_dict, http_options
@@ -531,13 +552,19 @@ class AsyncDocuments(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'get', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _ListDocumentsResponse_from_mldev(response_dict)
@@ -15,9 +15,12 @@
 
 """Error classes for the GenAI SDK."""
 
+import email.utils
 from typing import Any, Callable, Optional, TYPE_CHECKING, Union
 import httpx
 import json
+import re
+import time
 
 try:
   import httpx2
@@ -42,6 +45,9 @@ _HTTPX_RESPONSE_TYPES = (
     (httpx.Response,) if httpx2 is None else (httpx.Response, httpx2.Response)
 )
 
+# A google.protobuf.Duration in its JSON form, such as "1.5s".
+_DURATION = re.compile(r'(\d+(?:\.\d+)?)s')
+
 
 class APIError(Exception):
   """General errors raised by the GenAI API."""
@@ -122,6 +128,47 @@ class APIError(Exception):
         'code', response_json.get('error', {}).get('code', None)
     )
 
+  @property
+  def retry_after(self) -> Optional[float]:
+    """The seconds the server asked to wait before retrying, if it did.
+
+    Read from the `retry-after-ms` or `Retry-After` header, or else from a
+    `google.rpc.RetryInfo` error detail.
+    """
+    headers = getattr(self.response, 'headers', None)
+    value = headers.get('retry-after-ms') if headers else None
+    if value:
+      try:
+        return max(float(value) / 1000, 0.0)
+      except ValueError:
+        pass
+    value = headers.get('retry-after') if headers else None
+    if value:
+      try:
+        return max(float(value), 0.0)
+      except ValueError:
+        pass
+      try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+      except (TypeError, ValueError):
+        retry_at = None
+      if retry_at is not None:
+        return max(retry_at.timestamp() - time.time(), 0.0)
+
+    try:
+      details = self.details.get('error', self.details).get('details') or []
+    except AttributeError:
+      return None
+    for detail in details:
+      if not isinstance(detail, dict) or not str(
+          detail.get('@type', '')
+      ).endswith('google.rpc.RetryInfo'):
+        continue
+      match = _DURATION.fullmatch(str(detail.get('retryDelay', '')))
+      if match:
+        return float(match.group(1))
+    return None
+
   def _to_replay_record(self) -> _common.StringDict:
     """Returns a dictionary representation of the error for replay recording.
 
@@ -301,6 +348,33 @@ class ServerError(APIError):
   pass
 
 
+class CircuitOpenError(ServerError):
+  """Raised without a request while a backend's circuit breaker is open.
+
+  `retry_after` is the number of seconds until a probe request is let through.
+  """
+
+  def __init__(self, backend: str, retry_after: float):
+    super().__init__(
+        503,
+        {
+            'error': {
+                'code': 503,
+                'status': 'UNAVAILABLE',
+                'message': (
+                    f'The circuit breaker of {backend} is open after repeated'
+                    ' failures.'
+                ),
+                'details': [{
+                    '@type': 'type.googleapis.com/google.rpc.RetryInfo',
+                    'retryDelay': f'{retry_after:.3f}s',
+                }],
+            }
+        },
+    )
+    self.backend = backend
+
+
 class UnknownFunctionCallArgumentError(ValueError):
   """Raised when the function call argument cannot be converted to the parameter annotation."""
   pass
@@ -17,12 +17,13 @@
 
 from functools import cached_property
 import io
-import json
 import logging
 import os
 from typing import Any, Optional, Union
 from urllib.parse import urlencode
 
+import anyio
+
 from . import _api_module
 from . import _common
 from . import _extra_utils
@@ -375,13 +376,19 @@ class FileSearchStores(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     return_value = types.FileSearchStore._from_response(
         response=response_dict,
@@ -456,11 +463,17 @@ class FileSearchStores(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request('get', path, request_dict, http_options)
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     return_value = types.FileSearchStore._from_response(
         response=response_dict,
@@ -535,7 +548,9 @@ class FileSearchStores(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     self._api_client.request('delete', path, request_dict, http_options)
 
@@ -574,11 +589,17 @@ class FileSearchStores(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request('get', path, request_dict, http_options)
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _ListFileSearchStoresResponse_from_mldev(response_dict)
@@ -649,7 +670,9 @@ class FileSearchStores(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
@@ -664,7 +687,11 @@ class FileSearchStores(_api_module.BaseModule):
       self._api_client._verify_response(return_value)
       return return_value
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _UploadToFileSearchStoreResumableResponse_from_mldev(
@@ -753,13 +780,19 @@ class FileSearchStores(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _ImportFileOperation_from_mldev(response_dict)
@@ -915,6 +948,58 @@ class FileSearchStores(_api_module.BaseModule):
     )
     return data
 
+  def download_media_to_file(
+      self,
+      *,
+      media_id: str,
+      destination: Union[str, os.PathLike[str], io.IOBase],
+      config: Optional[types.DownloadMediaConfigOrDict] = None,
+  ) -> int:
+    """Downloads media using a Media ID into a destination in chunks.
+
+    Unlike `download_media`, the data is never held in memory as a whole. The
+    chunking is configured with the `download_*` fields of `HttpOptions`.
+
+    Args:
+      media_id: The Media ID from grounding metadata.
+      destination: The path of the file to write, or a file like object opened
+        for writing in binary mode.
+      config: Optional configuration for the download.
+
+    Returns:
+      int: The number of bytes written.
+    """
+    if self._api_client.vertexai:
+      raise ValueError(
+          'This method is only supported in the Gemini Developer client.'
+      )
+
+    clean_id = media_id.lstrip('/')
+    if '/media/' not in clean_id:
+      raise ValueError(
+          f'Invalid media_id format: {media_id!r}. '
+          'Expected format: fileSearchStores/<store>/media/<blob_id>'
+      )
+
+    path = f'{clean_id}?alt=media'
+
+    config_model = None
+    if config:
+      if isinstance(config, dict):
+        config_model = types.DownloadMediaConfig(**config)
+      else:
+        config_model = config
+
+    http_options = None
+    if config_model and getv(config_model, ['http_options']) is not None:
+      http_options = getv(config_model, ['http_options'])
+
+    return self._api_client.download_file_to(
+        path,
+        destination,
+        http_options=http_options,
+    )
+
   def list(
       self, *, config: Optional[types.ListFileSearchStoresConfigOrDict] = None
   ) -> Pager[types.FileSearchStore]:
@@ -999,13 +1084,19 @@ class AsyncFileSearchStores(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     return_value = types.FileSearchStore._from_response(
         response=response_dict,
@@ -1080,13 +1171,19 @@ class AsyncFileSearchStores(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'get', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     return_value = types.FileSearchStore._from_response(
         response=response_dict,
@@ -1161,7 +1258,9 @@ class AsyncFileSearchStores(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     await self._api_client.async_request(
         'delete', path, request_dict, http_options
@@ -1202,13 +1301,19 @@ class AsyncFileSearchStores(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'get', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _ListFileSearchStoresResponse_from_mldev(response_dict)
@@ -1279,7 +1384,9 @@ class AsyncFileSearchStores(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
@@ -1294,7 +1401,11 @@ class AsyncFileSearchStores(_api_module.BaseModule):
       self._api_client._verify_response(return_value)
       return return_value
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _UploadToFileSearchStoreResumableResponse_from_mldev(
@@ -1383,13 +1494,19 @@ class AsyncFileSearchStores(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _ImportFileOperation_from_mldev(response_dict)
@@ -1544,6 +1661,59 @@ class AsyncFileSearchStores(_api_module.BaseModule):
     )
     return data
 
+  async def download_media_to_file(
+      self,
+      *,
+      media_id: str,
+      destination: Union[str, os.PathLike[str], io.IOBase, anyio.AsyncFile[Any]],
+      config: Optional[types.DownloadMediaConfigOrDict] = None,
+  ) -> int:
+    """Downloads media using a Media ID into a destination in chunks.
+
+    Unlike `download_media`, the data is never held in memory as a whole. The
+    chunking is configured with the `download_*` fields of `HttpOptions`.
+
+    Args:
+      media_id: The Media ID from grounding metadata.
+      destination: The path of the file to write, or a file like object opened
+        for writing in binary mode. Its methods may be coroutines, as those of
+        `anyio.AsyncFile`.
+      config: Optional configuration for the download.
+
+    Returns:
+      int: The number of bytes written.
+    """
+    if self._api_client.vertexai:
+      raise ValueError(
+          'This method is only supported in the Gemini Developer client.'
+      )
+
+    clean_id = media_id.lstrip('/')
+    if '/media/' not in clean_id:
+      raise ValueError(
+          f'Invalid media_id format: {media_id!r}. '
+          'Expected format: fileSearchStores/<store>/media/<blob_id>'
+      )
+
+    path = f'{clean_id}?alt=media'
+
+    config_model = None
+    if config:
+      if isinstance(config, dict):
+        config_model = types.DownloadMediaConfig(**config)
+      else:
+        config_model = config
+
+    http_options = None
+    if config_model and getv(config_model, ['http_options']) is not None:
+      http_options = getv(config_model, ['http_options'])
+
+    return await self._api_client.async_download_file_to(
+        path,
+        destination,
+        http_options=http_options,
+    )
+
   async def list(
       self, *, config: Optional[types.ListFileSearchStoresConfigOrDict] = None
   ) -> AsyncPager[types.FileSearchStore]:
@@ -17,12 +17,12 @@
 
 import builtins
 import io
-import json
 import logging
 import os
 from typing import Any, Optional, Union
 from urllib.parse import urlencode
 
+import anyio
 import google.auth
 
 from . import _api_client
@@ -216,11 +216,17 @@ class Files(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request('get', path, request_dict, http_options)
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _ListFilesResponse_from_mldev(response_dict)
@@ -288,7 +294,9 @@ class Files(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
@@ -301,7 +309,11 @@ class Files(_api_module.BaseModule):
       self._api_client._verify_response(return_value)
       return return_value
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _CreateFileResponse_from_mldev(response_dict)
@@ -381,11 +393,17 @@ class Files(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request('get', path, request_dict, http_options)
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     return_value = types.File._from_response(
         response=response_dict,
@@ -461,13 +479,19 @@ class Files(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request(
         'delete', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _DeleteFileResponse_from_mldev(response_dict)
@@ -535,7 +559,9 @@ class Files(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
@@ -548,7 +574,11 @@ class Files(_api_module.BaseModule):
       self._api_client._verify_response(return_value)
       return return_value
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _RegisterFilesResponse_from_mldev(response_dict)
@@ -733,6 +763,70 @@ class Files(_api_module.BaseModule):
 
     return data
 
+  def download_to_file(
+      self,
+      *,
+      file: Union[str, types.File, types.Video, types.GeneratedVideo],
+      destination: Union[str, os.PathLike[str], io.IOBase],
+      config: Optional[types.DownloadFileConfigOrDict] = None,
+  ) -> int:
+    """Downloads a file's data from storage into a destination in chunks.
+
+    Unlike `download`, the data is never held in memory as a whole, which
+    suits large files such as generated videos. The chunking is configured
+    with the `download_*` fields of `HttpOptions`.
+
+    Args:
+      file (str): A file name, uri, or file object. Identifying which file to
+        download.
+      destination: The path of the file to write, or a file like object opened
+        for writing in binary mode.
+      config (DownloadFileConfigOrDict): Optional, configuration for the get
+        method.
+
+    Returns:
+      int: The number of bytes written.
+
+    Usage:
+
+    .. code-block:: python
+
+      client.files.download_to_file(file=video, destination='video.mp4')
+    """
+    if self._api_client.vertexai:
+      raise ValueError(
+          'This method is only supported in the Gemini Developer client.'
+      )
+
+    config_model = None
+    if config:
+      if isinstance(config, dict):
+        config_model = types.DownloadFileConfig(**config)
+      else:
+        config_model = config
+
+    if isinstance(file, types.File) and file.download_uri is None:
+      raise ValueError(
+          "Only generated files can be downloaded, uploaded files can't be "
+          'downloaded. You can tell which files are downloadable by checking '
+          'the `source` or `download_uri` property.'
+      )
+    name = t.t_file_name(file)
+
+    path = f'files/{name}:download'
+
+    query_params = {'alt': 'media'}
+    path = f'{path}?{urlencode(query_params)}'
+    http_options = None
+    if getv(config_model, ['http_options']) is not None:
+      http_options = getv(config_model, ['http_options'])
+
+    return self._api_client.download_file_to(
+        path,
+        destination,
+        http_options=http_options,
+    )
+
   def register_files(
       self,
       *,
@@ -832,13 +926,19 @@ class AsyncFiles(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'get', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _ListFilesResponse_from_mldev(response_dict)
@@ -906,7 +1006,9 @@ class AsyncFiles(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
@@ -919,7 +1021,11 @@ class AsyncFiles(_api_module.BaseModule):
       self._api_client._verify_response(return_value)
       return return_value
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _CreateFileResponse_from_mldev(response_dict)
@@ -999,13 +1105,19 @@ class AsyncFiles(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'get', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     return_value = types.File._from_response(
         response=response_dict,
@@ -1081,13 +1193,19 @@ class AsyncFiles(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'delete', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _DeleteFileResponse_from_mldev(response_dict)
@@ -1155,7 +1273,9 @@ class AsyncFiles(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
@@ -1168,7 +1288,11 @@ class AsyncFiles(_api_module.BaseModule):
       self._api_client._verify_response(return_value)
       return return_value
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _RegisterFilesResponse_from_mldev(response_dict)
@@ -1344,6 +1468,68 @@ class AsyncFiles(_api_module.BaseModule):
 
     return data
 
+  async def download_to_file(
+      self,
+      *,
+      file: Union[str, types.File],
+      destination: Union[str, os.PathLike[str], io.IOBase, anyio.AsyncFile[Any]],
+      config: Optional[types.DownloadFileConfigOrDict] = None,
+  ) -> int:
+    """Downloads a file's data from the file service into a destination in chunks.
+
+    Unlike `download`, the data is never held in memory as a whole, which
+    suits large files such as generated videos. The chunking is configured
+    with the `download_*` fields of `HttpOptions`.
+
+    Args:
+      File (str): A file name, uri, or file object. Identifying which file to
+        download.
+      destination: The path of the file to write, or a file like object opened
+        for writing in binary mode. Its methods may be coroutines, as those of
+        `anyio.AsyncFile`.
+      config (DownloadFileConfigOrDict): Optional, configuration for the get
+        method.
+
+    Returns:
+      int: The number of bytes written.
+
+    Usage:
+
+    .. code-block:: python
+
+      await client.aio.files.download_to_file(
+          file=file, destination='video.mp4'
+      )
+    """
+    if self._api_client.vertexai:
+      raise ValueError(
+          'This method is only supported in the Gemini Developer client.'
+      )
+
+    config_model = None
+    if config:
+      if isinstance(config, dict):
+        config_model = types.DownloadFileConfig(**config)
+      else:
+        config_model = config
+
+    name = t.t_file_name(file)
+
+    path = f'files/{name}:download'
+
+    http_options = None
+    if getv(config_model, ['http_options']) is not None:
+      http_options = getv(config_model, ['http_options'])
+
+    query_params = {'alt': 'media'}
+    path = f'{path}?{urlencode(query_params)}'
+
+    return await self._api_client.async_download_file_to(
+        path,
+        destination,
+        http_options=http_options,
+    )
+
   async def register_files(
       self,
       *,
@@ -0,0 +1,284 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Instrumentation of the requests sent by a client.
+
+Hooks set in `HttpOptions.instrumentation_hooks` are called with an
+`InstrumentationEvent` at the end of each phase of a request:
+
+* `request.build`: building the URL, headers and body of the request.
+* `request.auth`: fetching the access token, for each attempt.
+* `request.encode`: encoding the JSON body, for each attempt.
+* `request.connect`, `request.tls`: opening a new connection, httpx only.
+* `request.ttfb`: from sending the request to receiving the response headers,
+  httpx only.
+* `request.read`: reading the response body, httpx only.
+* `request.attempt`: each attempt, including retries. A failed attempt that is
+  retried has the seconds waited before the next attempt in `retry_delay`, and
+  the delay the server asked for, if any, in `retry_after`.
+* `stream.chunk`: the wait for each chunk of a streamed response.
+* `request`: the whole request, emitted last.
+* `response.decode`, `response.convert`, `response.validate`: decoding the JSON
+  response, converting it to the SDK field names and validating it into a
+  model.
+
+When no hooks are set, requests are not instrumented.
+
+Usage:
+
+.. code-block:: python
+
+  from google.genai import Client, instrumentation, types
+
+  client = Client(
+      http_options=types.HttpOptions(
+          instrumentation_hooks=[instrumentation.OpenTelemetryHook()]
+      )
+  )
+"""
+
+import contextvars
+import dataclasses
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Callable, Iterable, Mapping, Optional
+
+
+logger = logging.getLogger('google_genai.instrumentation')
+
+
+@dataclasses.dataclass(frozen=True)
+class InstrumentationEvent:
+  """A phase of a request and the time it took."""
+
+  name: str
+  """The name of the phase, such as `request.ttfb`."""
+
+  start_time: float
+  """When the phase started, in seconds since the epoch."""
+
+  duration: float
+  """How long the phase took, in seconds."""
+
+  request_id: Optional[int] = None
+  """Identifies the request of the phase within the client."""
+
+  attributes: Mapping[str, Any] = dataclasses.field(default_factory=dict)
+  """Details of the phase, such as the attempt number or the status code."""
+
+
+InstrumentationHook = Callable[[InstrumentationEvent], None]
+
+
+class _ResponseContext:
+  """Tracks the response of the last request made in the current context.
+
+  The response is decoded, converted and validated by the caller of the
+  request, after the client returns it.
+  """
+
+  __slots__ = ('recorder', 'request_id', 'decoded_at')
+
+  def __init__(self, recorder: '_Recorder', request_id: int):
+    self.recorder = recorder
+    self.request_id = request_id
+    self.decoded_at: Optional[float] = None
+
+
+_response_context: contextvars.ContextVar[Optional[_ResponseContext]] = (
+    contextvars.ContextVar('google_genai_response_context', default=None)
+)
+
+
+class _Recorder:
+  """Emits the events of the requests of a client to its hooks."""
+
+  def __init__(self, hooks: Iterable[InstrumentationHook]):
+    self._hooks = tuple(hooks)
+    self._request_ids = itertools.count(1)
+
+  def new_request_id(self) -> int:
+    return next(self._request_ids)
+
+  def emit(
+      self,
+      name: str,
+      start: float,
+      end: Optional[float] = None,
+      request_id: Optional[int] = None,
+      **attributes: Any,
+  ) -> None:
+    """Emits a phase that started and ended at `time.perf_counter` times."""
+    now = time.perf_counter()
+    end = now if end is None else end
+    event = InstrumentationEvent(
+        name=name,
+        start_time=time.time() - (now - start),
+        duration=end - start,
+        request_id=request_id,
+        attributes=attributes,
+    )
+    for hook in self._hooks:
+      try:
+        hook(event)
+      except Exception:  # pylint: disable=broad-except
+        logger.warning('Instrumentation hook %r failed.', hook, exc_info=True)
+
+  def track_response(self, request_id: int) -> None:
+    """Attributes the decoding of the response to the request."""
+    _response_context.set(_ResponseContext(self, request_id))
+
+  def httpx_trace(self, request_id: int) -> '_HttpxTrace':
+    return _HttpxTrace(self, request_id)
+
+  def async_httpx_trace(self, request_id: int) -> '_AsyncHttpxTrace':
+    return _AsyncHttpxTrace(self, request_id)
+
+
+class _HttpxTrace:
+  """Emits the connection and response phases traced by httpx."""
+
+  # Trace names of httpcore, without their HTTP version prefix, and the
+  # phases they start or complete.
+  _PHASES = {
+      'connection.connect_tcp': 'request.connect',
+      'connection.connect_unix_socket': 'request.connect',
+      'connection.start_tls': 'request.tls',
+      'receive_response_body': 'request.read',
+  }
+
+  def __init__(self, recorder: _Recorder, request_id: int):
+    self._recorder = recorder
+    self._request_id = request_id
+    self._started: dict[str, float] = {}
+
+  def _record(self, name: str) -> None:
+    base, _, stage = name.rpartition('.')
+    if not base.startswith('connection.'):
+      # http11.send_request_headers, http2.receive_response_body, ...
+      base = base.partition('.')[2]
+    if base == 'send_request_headers':
+      if stage == 'started':
+        self._started['request.ttfb'] = time.perf_counter()
+      return
+    if base == 'receive_response_headers':
+      phase = 'request.ttfb'
+      if stage != 'complete':
+        return
+    else:
+      phase = self._PHASES.get(base, '')
+      if not phase:
+        return
+      if stage == 'started':
+        self._started[phase] = time.perf_counter()
+        return
+    start = self._started.pop(phase, None)
+    if start is not None:
+      self._recorder.emit(phase, start, request_id=self._request_id)
+
+  def __call__(self, name: str, info: Mapping[str, Any]) -> None:
+    self._record(name)
+
+
+class _AsyncHttpxTrace(_HttpxTrace):
+
+  async def __call__(self, name: str, info: Mapping[str, Any]) -> None:  # type: ignore[override]
+    self._record(name)
+
+
+def record_decode(start: float, end: float) -> None:
+  """Emits the decoding of a response, if it is tracked."""
+  context = _response_context.get()
+  if context is None:
+    return
+  context.decoded_at = end
+  context.recorder.emit(
+      'response.decode', start, end, request_id=context.request_id
+  )
+
+
+def record_validation(start: float) -> None:
+  """Emits the conversion and validation of a decoded response.
+
+  The conversion is the time from the end of the decoding to `start`, when
+  the validation started.
+  """
+  context = _response_context.get()
+  if context is None or context.decoded_at is None:
+    return
+  decoded_at, context.decoded_at = context.decoded_at, None
+  context.recorder.emit(
+      'response.convert', decoded_at, start, request_id=context.request_id
+  )
+  context.recorder.emit(
+      'response.validate', start, request_id=context.request_id
+  )
+
+
+class OpenTelemetryHook:
+  """Records the events of the requests as OpenTelemetry spans.
+
+  The phases of a request are children of its `request` span. The decoding,
+  conversion and validation of the response, which happen after the request,
+  are recorded in the current context instead.
+
+  Requires the `opentelemetry-api` package.
+  """
+
+  def __init__(self, tracer: Optional[Any] = None):
+    try:
+      from opentelemetry import trace  # pylint: disable=g-import-not-at-top
+    except ImportError as e:
+      raise ImportError(
+          'OpenTelemetryHook requires the opentelemetry-api package. Install'
+          ' it with `pip install google-genai[opentelemetry]`.'
+      ) from e
+    self._trace = trace
+    self._tracer = tracer or trace.get_tracer('google.genai')
+    self._lock = threading.Lock()
+    self._pending: dict[int, list[InstrumentationEvent]] = {}
+
+  def _span(self, event: InstrumentationEvent, context: Any = None) -> Any:
+    attributes = {
+        f'genai.{key}': value for key, value in event.attributes.items()
+    }
+    if event.request_id is not None:
+      attributes['genai.request_id'] = event.request_id
+    span = self._tracer.start_span(
+        f'genai.{event.name}',
+        context=context,
+        start_time=int(event.start_time * 1e9),
+        attributes=attributes,
+    )
+    span.end(end_time=int((event.start_time + event.duration) * 1e9))
+    return span
+
+  def __call__(self, event: InstrumentationEvent) -> None:
+    if event.request_id is None or event.name.startswith('response.'):
+      self._span(event)
+      return
+    with self._lock:
+      if event.name != 'request':
+        self._pending.setdefault(event.request_id, []).append(event)
+        return
+      children = self._pending.pop(event.request_id, [])
+    parent = self._span(event)
+    context = self._trace.set_span_in_context(parent)
+    for child in children:
+      self._span(child, context)
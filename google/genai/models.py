@@ -17,8 +17,8 @@
 
 import builtins
 import contextlib
-import json
 import logging
+import time
 from typing import Any, AsyncIterator, Awaitable, Iterator, Optional, Union
 from urllib.parse import urlencode
 import warnings
@@ -4692,7 +4692,9 @@ class Models(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
@@ -4705,7 +4707,11 @@ class Models(_api_module.BaseModule):
       self._api_client._verify_response(return_value)
       return return_value
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _GenerateContentResponse_from_vertex(
@@ -4734,6 +4740,7 @@ class Models(_api_module.BaseModule):
         }
         if getattr(parameter_model, 'config', None)
         else {},
+        skip_validation=self._api_client._skip_response_validation,
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -4792,7 +4799,9 @@ class Models(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     if config is not None and getattr(
         config, 'should_return_http_response', None
@@ -4802,11 +4811,18 @@ class Models(_api_module.BaseModule):
           ' methods.'
       )
 
+    streaming_stats = types.StreamingStats(request_start_time=time.time())
     for response in self._api_client.request_streamed(
         'post', path, request_dict, http_options
     ):
+      received_at = time.time()
+      parse_start = time.perf_counter()
 
-      response_dict = {} if not response.body else json.loads(response.body)
+      response_dict = (
+          {}
+          if not response.body
+          else self._api_client._json_codec.loads(response.body)
+      )
 
       if self._api_client.vertexai:
         response_dict = _GenerateContentResponse_from_vertex(
@@ -4835,10 +4851,14 @@ class Models(_api_module.BaseModule):
           }
           if getattr(parameter_model, 'config', None)
           else {},
+          skip_validation=self._api_client._skip_response_validation,
       )
       return_value.sdk_http_response = types.HttpResponse(
           headers=response.headers
       )
+      streaming_stats._record_chunk(
+          received_at, time.perf_counter() - parse_start, return_value
+      )
       self._api_client._verify_response(return_value)
       yield return_value
 
@@ -4921,13 +4941,19 @@ class Models(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _EmbedContentResponse_from_vertex(
@@ -5008,13 +5034,19 @@ class Models(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _GenerateImagesResponse_from_vertex(
@@ -5092,13 +5124,19 @@ class Models(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _EditImageResponse_from_vertex(
@@ -5176,13 +5214,19 @@ class Models(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _UpscaleImageResponse_from_vertex(
@@ -5288,13 +5332,19 @@ class Models(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _RecontextImageResponse_from_vertex(
@@ -5391,13 +5441,19 @@ class Models(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _SegmentImageResponse_from_vertex(
@@ -5468,11 +5524,17 @@ class Models(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request('get', path, request_dict, http_options)
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _Model_from_vertex(response_dict, None, parameter_model)
@@ -5548,11 +5610,17 @@ class Models(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request('get', path, request_dict, http_options)
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _ListModelsResponse_from_vertex(
@@ -5633,13 +5701,19 @@ class Models(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request(
         'patch', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _Model_from_vertex(response_dict, None, parameter_model)
@@ -5714,13 +5788,19 @@ class Models(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request(
         'delete', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _DeleteModelResponse_from_vertex(
@@ -5824,13 +5904,19 @@ class Models(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _CountTokensResponse_from_vertex(
@@ -5932,13 +6018,19 @@ class Models(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _ComputeTokensResponse_from_vertex(
@@ -6024,13 +6116,19 @@ class Models(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _GenerateVideosOperation_from_vertex(
@@ -6230,6 +6328,7 @@ class Models(_api_module.BaseModule):
     remaining_remote_calls_afc = _extra_utils.get_max_remote_calls_afc(
         parsed_config
     )
+    afc_config = _extra_utils.get_afc_config(parsed_config)
     logger.info(
         f'AFC is enabled with max remote calls: {remaining_remote_calls_afc}.'
     )
@@ -6244,18 +6343,12 @@ class Models(_api_module.BaseModule):
       Models._logged_afc_warning = True
     automatic_function_calling_history: list[types.Content] = []
     response = types.GenerateContentResponse()
+    function_map = _extra_utils.get_function_map(parsed_config)
+    parsed_config_to_call = _extra_utils.get_afc_config_to_call(
+        self._api_client, parsed_config, function_map
+    )
     i = 0
     while remaining_remote_calls_afc > 0:
-      parsed_config_to_call = (
-          parsed_config.model_copy(deep=True) if parsed_config else None
-      )
-      function_map = _extra_utils.get_function_map(parsed_config)
-      if function_map:
-        parsed_config_to_call = _extra_utils.get_usage_header(
-            parsed_config_to_call,
-            types.GenerateContentConfig,
-            'afc',
-        )
       i += 1
       response = self._generate_content(
           model=model, contents=contents, config=parsed_config_to_call
@@ -6272,7 +6365,7 @@ class Models(_api_module.BaseModule):
       ):
         break
       func_response_parts = _extra_utils.get_function_response_parts(
-          response, function_map
+          response, function_map, afc_config
       )
       if not func_response_parts:
         break
@@ -6286,8 +6379,8 @@ class Models(_api_module.BaseModule):
           role='user',
           parts=func_response_parts,
       )
-      contents = t.t_contents(contents)  # type: ignore[assignment]
       if not automatic_function_calling_history:
+        contents = t.t_contents(contents)  # type: ignore[assignment]
         automatic_function_calling_history.extend(contents)  # type: ignore[arg-type]
       if isinstance(contents, list):
         contents.append(func_call_content)  # type: ignore[arg-type]
@@ -6403,6 +6496,7 @@ class Models(_api_module.BaseModule):
     remaining_remote_calls_afc = _extra_utils.get_max_remote_calls_afc(
         parsed_config
     )
+    afc_config = _extra_utils.get_afc_config(parsed_config)
     logger.info(
         f'AFC is enabled with max remote calls: {remaining_remote_calls_afc}.'
     )
@@ -6416,16 +6510,12 @@ class Models(_api_module.BaseModule):
       )
       Models._logged_afc_warning = True
     automatic_function_calling_history: list[types.Content] = []
+    function_map = _extra_utils.get_function_map(parsed_config)
+    parsed_config_to_call = _extra_utils.get_afc_config_to_call(
+        self._api_client, parsed_config, function_map
+    )
     i = 0
     while remaining_remote_calls_afc > 0:
-      parsed_config_to_call = (
-          parsed_config.model_copy(deep=True) if parsed_config else None
-      )
-      function_map = _extra_utils.get_function_map(parsed_config)
-      if function_map:
-        parsed_config_to_call = _extra_utils.get_usage_header(
-            parsed_config_to_call, types.GenerateContentConfig, 'afc'
-        )
       i += 1
       response = self._generate_content_stream(
           model=model, contents=contents, config=parsed_config_to_call
@@ -6451,7 +6541,7 @@ class Models(_api_module.BaseModule):
             and chunk.candidates[0].content.parts
         ):
           chunk_func_response_parts = _extra_utils.get_function_response_parts(
-              chunk, function_map
+              chunk, function_map, afc_config
           )
           if chunk_func_response_parts:
             func_response_parts.extend(chunk_func_response_parts)
@@ -6474,8 +6564,8 @@ class Models(_api_module.BaseModule):
           role='user',
           parts=func_response_parts,
       )
-      contents = t.t_contents(contents)  # type: ignore[assignment]
       if not automatic_function_calling_history:
+        contents = t.t_contents(contents)  # type: ignore[assignment]
         automatic_function_calling_history.extend(contents)  # type: ignore[arg-type]
       if isinstance(contents, list):
         contents.extend(model_output)  # type: ignore[arg-type]
@@ -6890,7 +6980,9 @@ class AsyncModels(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
@@ -6903,7 +6995,11 @@ class AsyncModels(_api_module.BaseModule):
       self._api_client._verify_response(return_value)
       return return_value
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _GenerateContentResponse_from_vertex(
@@ -6932,6 +7028,7 @@ class AsyncModels(_api_module.BaseModule):
         }
         if getattr(parameter_model, 'config', None)
         else {},
+        skip_validation=self._api_client._skip_response_validation,
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -6990,7 +7087,9 @@ class AsyncModels(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     if config is not None and getattr(
         config, 'should_return_http_response', None
@@ -7000,14 +7099,21 @@ class AsyncModels(_api_module.BaseModule):
           ' methods.'
       )
 
+    streaming_stats = types.StreamingStats(request_start_time=time.time())
     response_stream = await self._api_client.async_request_streamed(
         'post', path, request_dict, http_options
     )
 
     async def async_generator():  # type: ignore[no-untyped-def]
       async for response in response_stream:
+        received_at = time.time()
+        parse_start = time.perf_counter()
 
-        response_dict = {} if not response.body else json.loads(response.body)
+        response_dict = (
+            {}
+            if not response.body
+            else self._api_client._json_codec.loads(response.body)
+        )
 
         if self._api_client.vertexai:
           response_dict = _GenerateContentResponse_from_vertex(
@@ -7036,10 +7142,14 @@ class AsyncModels(_api_module.BaseModule):
             }
             if getattr(parameter_model, 'config', None)
             else {},
+            skip_validation=self._api_client._skip_response_validation,
         )
         return_value.sdk_http_response = types.HttpResponse(
             headers=response.headers
         )
+        streaming_stats._record_chunk(
+            received_at, time.perf_counter() - parse_start, return_value
+        )
         self._api_client._verify_response(return_value)
         yield return_value
 
@@ -7124,13 +7234,19 @@ class AsyncModels(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _EmbedContentResponse_from_vertex(
@@ -7211,13 +7327,19 @@ class AsyncModels(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _GenerateImagesResponse_from_vertex(
@@ -7295,13 +7417,19 @@ class AsyncModels(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _EditImageResponse_from_vertex(
@@ -7379,13 +7507,19 @@ class AsyncModels(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _UpscaleImageResponse_from_vertex(
@@ -7491,13 +7625,19 @@ class AsyncModels(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _RecontextImageResponse_from_vertex(
@@ -7597,13 +7737,19 @@ class AsyncModels(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _SegmentImageResponse_from_vertex(
@@ -7674,13 +7820,19 @@ class AsyncModels(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'get', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _Model_from_vertex(response_dict, None, parameter_model)
@@ -7756,13 +7908,19 @@ class AsyncModels(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'get', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _ListModelsResponse_from_vertex(
@@ -7843,13 +8001,19 @@ class AsyncModels(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'patch', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _Model_from_vertex(response_dict, None, parameter_model)
@@ -7924,13 +8088,19 @@ class AsyncModels(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'delete', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _DeleteModelResponse_from_vertex(
@@ -8034,13 +8204,19 @@ class AsyncModels(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _CountTokensResponse_from_vertex(
@@ -8141,13 +8317,19 @@ class AsyncModels(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _ComputeTokensResponse_from_vertex(
@@ -8233,13 +8415,19 @@ class AsyncModels(_api_module.BaseModule):
       http_options = parameter_model.config.http_options
 
     request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.encode_unserializable_types(
+        request_dict, self._api_client._stream_inline_data
+    )
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {}
+        if not response.body
+        else self._api_client._json_codec.loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _GenerateVideosOperation_from_vertex(
@@ -8405,6 +8593,7 @@ class AsyncModels(_api_module.BaseModule):
       remaining_remote_calls_afc = _extra_utils.get_max_remote_calls_afc(
           final_parsed_config
       )
+      afc_config = _extra_utils.get_afc_config(final_parsed_config)
       logger.info(
           f'AFC is enabled with max remote calls: {remaining_remote_calls_afc}.'
       )
@@ -8421,23 +8610,15 @@ class AsyncModels(_api_module.BaseModule):
       automatic_function_calling_history: list[types.Content] = []
       response = types.GenerateContentResponse()
 
+      function_map = _extra_utils.get_function_map(
+          final_parsed_config,
+          mcp_to_genai_tool_adapters,
+          is_caller_method_async=True,
+      )
+      final_parsed_config_to_call = _extra_utils.get_afc_config_to_call(
+          self._api_client, final_parsed_config, function_map
+      )
       while remaining_remote_calls_afc > 0:
-        function_map = _extra_utils.get_function_map(
-            final_parsed_config,
-            mcp_to_genai_tool_adapters,
-            is_caller_method_async=True,
-        )
-        final_parsed_config_to_call = (
-            final_parsed_config.model_copy(deep=True)
-            if final_parsed_config
-            else None
-        )
-        if function_map:
-          final_parsed_config_to_call = _extra_utils.get_usage_header(
-              final_parsed_config_to_call,
-              types.GenerateContentConfig,
-              usage='afc',
-          )
         response = await self._generate_content(
             model=model, contents=contents, config=final_parsed_config_to_call
         )
@@ -8459,7 +8640,7 @@ class AsyncModels(_api_module.BaseModule):
           break
         func_response_parts = (
             await _extra_utils.get_function_response_parts_async(
-                response, function_map
+                response, function_map, afc_config
             )
         )
         if not func_response_parts:
@@ -8469,8 +8650,8 @@ class AsyncModels(_api_module.BaseModule):
             role='user',
             parts=func_response_parts,
         )
-        contents = t.t_contents(contents)  # type: ignore[assignment]
         if not automatic_function_calling_history:
+          contents = t.t_contents(contents)  # type: ignore[assignment]
           automatic_function_calling_history.extend(contents)  # type: ignore[arg-type]
         if isinstance(contents, list):
           contents.append(func_call_content)  # type: ignore[arg-type]
@@ -8650,6 +8831,7 @@ class AsyncModels(_api_module.BaseModule):
         remaining_remote_calls_afc = _extra_utils.get_max_remote_calls_afc(
             final_parsed_config
         )
+        afc_config = _extra_utils.get_afc_config(final_parsed_config)
         logger.info(
             'AFC is enabled with max remote calls:'
             f' {remaining_remote_calls_afc}.'
@@ -8667,27 +8849,16 @@ class AsyncModels(_api_module.BaseModule):
         automatic_function_calling_history: list[types.Content] = []
         i = 0
         loop_contents = contents
+        function_map = _extra_utils.get_function_map(
+            final_parsed_config,
+            mcp_to_genai_tool_adapters,
+            is_caller_method_async=True,
+        )
+        final_parsed_config_to_call = _extra_utils.get_afc_config_to_call(
+            self._api_client, final_parsed_config, function_map
+        )
 
         while remaining_remote_calls_afc > 0:
-
-          function_map = _extra_utils.get_function_map(
-              final_parsed_config,
-              mcp_to_genai_tool_adapters,
-              is_caller_method_async=True,
-          )
-
-          final_parsed_config_to_call = (
-              final_parsed_config.model_copy(deep=True)
-              if final_parsed_config
-              else None
-          )
-          if function_map:
-            final_parsed_config_to_call = _extra_utils.get_usage_header(
-                final_parsed_config_to_call,
-                types.GenerateContentConfig,
-                usage='afc',
-            )
-
           i += 1
 
           response = await self._generate_content_stream(
@@ -8717,7 +8888,7 @@ class AsyncModels(_api_module.BaseModule):
             ):
               chunk_func_response_parts = (
                   await _extra_utils.get_function_response_parts_async(
-                      chunk, function_map
+                      chunk, function_map, afc_config
                   )
               )
               if chunk_func_response_parts:
@@ -8743,8 +8914,8 @@ class AsyncModels(_api_module.BaseModule):
               role='user',
               parts=func_response_parts,
           )
-          loop_contents = t.t_contents(loop_contents)  # type: ignore[assignment]
           if not automatic_function_calling_history:
+            loop_contents = t.t_contents(loop_contents)  # type: ignore[assignment]
             automatic_function_calling_history.extend(loop_contents)  # type: ignore[arg-type]
           if isinstance(loop_contents, list):
             loop_contents.extend(model_output)  # type: ignore[arg-type]
@@ -16,7 +16,6 @@ from unittest import mock
 import pytest
 from ... import _api_client
 from ... import _extra_utils
-from ... import client
 from ... import models
 from ... import types
 
@@ -105,7 +104,7 @@ def get_aqi_from_city(location: str) -> str:
 
 @pytest.fixture
 def mock_api_client(vertexai=False):
-  api_client = mock.MagicMock(spec=client.ApiClient)
+  api_client = mock.MagicMock(spec=_api_client.BaseApiClient)
   api_client.api_key = 'TEST_API_KEY'
   api_client._host = lambda: 'test_host'
   api_client._http_options = {'headers': {}}  # Ensure headers exist
@@ -229,6 +228,7 @@ def mock_generate_content_stream_with_afc_async():
 
 
 def test_generate_content_stream_no_function_map(
+    mock_api_client,
     mock_generate_content_stream_no_afc,
     mock_get_function_response_parts_none,
 ):
@@ -248,6 +248,7 @@ def test_generate_content_stream_no_function_map(
 
 
 def test_generate_content_stream_afc_disabled(
+    mock_api_client,
     mock_generate_content_stream_with_afc,
     mock_get_function_response_parts_none,
 ):
@@ -275,6 +276,7 @@ def test_generate_content_stream_afc_disabled(
 
 
 def test_generate_content_stream_no_function_response(
+    mock_api_client,
     mock_generate_content_stream_no_afc,
     mock_get_function_response_parts_none,
 ):
@@ -297,6 +299,7 @@ def test_generate_content_stream_no_function_response(
 
 
 def test_generate_content_stream_with_function_tools_used(
+    mock_api_client,
     mock_generate_content_stream_with_afc,
     mock_get_function_response_parts,
 ):
@@ -330,6 +333,7 @@ def test_generate_content_stream_with_function_tools_used(
 
 
 def test_generate_content_stream_with_thought_summaries(
+    mock_api_client,
     mock_generate_content_stream_with_afc,
     mock_get_function_response_parts,
 ):
@@ -367,6 +371,7 @@ def test_generate_content_stream_with_thought_summaries(
 
 @pytest.mark.asyncio
 async def test_generate_content_stream_no_function_map_async(
+    mock_api_client,
     mock_generate_content_stream_no_afc,
     mock_get_function_response_parts_none,
 ):
@@ -387,6 +392,7 @@ async def test_generate_content_stream_no_function_map_async(
 
 @pytest.mark.asyncio
 async def test_generate_content_stream_afc_disabled_async(
+    mock_api_client,
     mock_generate_content_stream_with_afc_async,
     mock_get_function_response_parts_none,
 ):
@@ -415,6 +421,7 @@ async def test_generate_content_stream_afc_disabled_async(
 
 @pytest.mark.asyncio
 async def test_generate_content_stream_no_function_response_async(
+    mock_api_client,
     mock_generate_content_stream_no_afc_async,
     mock_get_function_response_parts_none_async,
 ):
@@ -439,6 +446,7 @@ async def test_generate_content_stream_no_function_response_async(
 
 @pytest.mark.asyncio
 async def test_generate_content_stream_with_function_tools_used_async(
+    mock_api_client,
     mock_generate_content_stream_with_afc_async,
     mock_get_function_response_parts_async,
 ):
@@ -475,6 +483,7 @@ async def test_generate_content_stream_with_function_tools_used_async(
 
 @pytest.mark.asyncio
 async def test_generate_content_stream_with_function_async_function_used_async(
+    mock_api_client,
     mock_generate_content_stream_with_afc_async,
     mock_get_function_response_parts_async,
 ):
@@ -511,6 +520,7 @@ async def test_generate_content_stream_with_function_async_function_used_async(
 
 @pytest.mark.asyncio
 async def test_generate_content_stream_with_thought_summaries_async(
+    mock_api_client,
     mock_generate_content_stream_with_afc_async,
     mock_get_function_response_parts_async,
 ):
@@ -0,0 +1,82 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Unit tests for _extra_utils.get_afc_config_to_call."""
+
+from ... import _api_client
+from ... import _extra_utils
+from ... import types
+from ... import version as public_version
+
+
+def get_current_weather(location: str) -> str:
+  """Returns the current weather.
+
+  Args:
+    location: The location of a city and state, e.g. "San Francisco, CA".
+  """
+  return 'windy'
+
+
+def _api_client_for_test() -> _api_client.BaseApiClient:
+  return _api_client.BaseApiClient(api_key='test-api-key')
+
+
+def test_transforms_function_tools_once():
+  config = types.GenerateContentConfig(
+      tools=[
+          get_current_weather,
+          types.Tool(google_search=types.GoogleSearch()),
+      ],
+      temperature=0.5,
+  )
+  function_map = _extra_utils.get_function_map(config)
+
+  config_to_call = _extra_utils.get_afc_config_to_call(
+      _api_client_for_test(), config, function_map
+  )
+
+  assert config_to_call is not config
+  assert config_to_call.temperature == 0.5
+  assert config.tools[0] is get_current_weather
+  assert config.http_options is None
+  assert config_to_call.tools[0].google_search is not None
+  assert [
+      declaration.name
+      for declaration in config_to_call.tools[1].function_declarations
+  ] == ['get_current_weather']
+  expected_header = f'google-genai-sdk/{public_version.__version__}+afc'
+  assert config_to_call.http_options.headers['user-agent'] == expected_header
+
+
+def test_without_function_map_only_copies_config():
+  config = types.GenerateContentConfig(
+      tools=[types.Tool(google_search=types.GoogleSearch())]
+  )
+
+  config_to_call = _extra_utils.get_afc_config_to_call(
+      _api_client_for_test(), config, {}
+  )
+
+  assert config_to_call == config
+  assert config_to_call is not config
+  assert config_to_call.http_options is None
+
+
+def test_none_config():
+  assert (
+      _extra_utils.get_afc_config_to_call(_api_client_for_test(), None, {})
+      is None
+  )
@@ -16,11 +16,15 @@
 
 """Tests for get_function_response_parts."""
 
+import asyncio
+import threading
+import time
 import typing
 from typing import Any
 import pytest
 from ..._extra_utils import get_function_response_parts, get_function_response_parts_async
 from ...errors import UnsupportedFunctionError
+from ...types import AutomaticFunctionCallingConfig
 from ...types import Candidate
 from ...types import Content
 from ...types import FunctionCall
@@ -270,3 +274,152 @@ async def test_mcp_tool_error():
       ),
   )
   assert is_error == True
+
+
+def _parallel_calls_response(num_calls: int) -> GenerateContentResponse:
+  return GenerateContentResponse(
+      candidates=[
+          Candidate(
+              content=Content(
+                  role='model',
+                  parts=[
+                      Part(
+                          function_call=FunctionCall(
+                              name='lookup', args={'index': i}
+                          )
+                      )
+                      for i in range(num_calls)
+                  ],
+              )
+          )
+      ]
+  )
+
+
+def test_concurrent_function_calls_keep_order():
+  # Every call waits for all others, so this only passes if they overlap.
+  barrier = threading.Barrier(3, timeout=5)
+
+  def lookup(index: int) -> int:
+    barrier.wait()
+    time.sleep(0.01 * (3 - index))
+    return index
+
+  parts = get_function_response_parts(
+      _parallel_calls_response(3),
+      {'lookup': lookup},
+      AutomaticFunctionCallingConfig(max_concurrent_function_calls=3),
+  )
+
+  assert [part.function_response.response for part in parts] == [
+      {'result': 0},
+      {'result': 1},
+      {'result': 2},
+  ]
+
+
+def test_concurrent_function_calls_limit():
+  lock = threading.Lock()
+  running = 0
+  max_running = 0
+
+  def lookup(index: int) -> int:
+    nonlocal running, max_running
+    with lock:
+      running += 1
+      max_running = max(max_running, running)
+    time.sleep(0.02)
+    with lock:
+      running -= 1
+    return index
+
+  parts = get_function_response_parts(
+      _parallel_calls_response(6),
+      {'lookup': lookup},
+      AutomaticFunctionCallingConfig(max_concurrent_function_calls=2),
+  )
+
+  assert [part.function_response.response['result'] for part in parts] == [
+      0, 1, 2, 3, 4, 5
+  ]
+  assert max_running == 2
+
+
+def test_function_call_timeout():
+  release = threading.Event()
+
+  def lookup(index: int) -> int:
+    if index == 1:
+      release.wait(5)
+    return index
+
+  try:
+    parts = get_function_response_parts(
+        _parallel_calls_response(3),
+        {'lookup': lookup},
+        AutomaticFunctionCallingConfig(function_call_timeout=0.05),
+    )
+  finally:
+    release.set()
+
+  assert [part.function_response.response for part in parts] == [
+      {'result': 0},
+      {'error': 'Function lookup timed out after 0.05 seconds.'},
+      {'result': 2},
+  ]
+
+
+def test_invalid_max_concurrent_function_calls():
+  with pytest.raises(ValueError, match='max_concurrent_function_calls'):
+    get_function_response_parts(
+        _parallel_calls_response(2),
+        {'lookup': lambda index: index},
+        AutomaticFunctionCallingConfig(max_concurrent_function_calls=-1),
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_function_calls_async_limit_and_order():
+  running = 0
+  max_running = 0
+
+  async def lookup(index: int) -> int:
+    nonlocal running, max_running
+    running += 1
+    max_running = max(max_running, running)
+    await asyncio.sleep(0.01 * (6 - index))
+    running -= 1
+    return index
+
+  parts = await get_function_response_parts_async(
+      _parallel_calls_response(6),
+      {'lookup': lookup},
+      AutomaticFunctionCallingConfig(max_concurrent_function_calls=3),
+  )
+
+  assert [part.function_response.response['result'] for part in parts] == [
+      0, 1, 2, 3, 4, 5
+  ]
+  assert max_running == 3
+
+
+@pytest.mark.asyncio
+async def test_function_call_timeout_async():
+  async def lookup(index: int) -> int:
+    if index == 1:
+      await asyncio.sleep(5)
+    return index
+
+  parts = await get_function_response_parts_async(
+      _parallel_calls_response(3),
+      {'lookup': lookup},
+      AutomaticFunctionCallingConfig(
+          max_concurrent_function_calls=3, function_call_timeout=0.05
+      ),
+  )
+
+  assert [part.function_response.response for part in parts] == [
+      {'result': 0},
+      {'error': 'Function lookup timed out after 0.05 seconds.'},
+      {'result': 2},
+  ]
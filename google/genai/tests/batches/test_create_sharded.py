@@ -0,0 +1,485 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Tests for batches.create_sharded()."""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from ... import _common
+from ... import Client
+from ... import files
+from ... import types
+
+
+_MODEL = 'gemini-2.5-flash'
+
+
+def _requests(count):
+  return ({'contents': f'Question {i}?'} for i in range(count))
+
+
+class _FakeBackend:
+  """Records the uploaded input files and the batch jobs created from them."""
+
+  def __init__(self, fail_shard=None):
+    self.fail_shard = fail_shard
+    self.uploads = {}
+    self.created = []
+    self._lock = threading.Lock()
+
+  def upload(self, file, config):
+    with open(file, 'rb') as f:
+      lines = [json.loads(line) for line in f.read().splitlines()]
+    name = f'files/{config.display_name or len(self.uploads)}'
+    with self._lock:
+      self.uploads[name] = lines
+    return types.File(name=name)
+
+  def create(self, model, src, config):
+    if self.fail_shard is not None and src.file_name.endswith(
+        f'shard-{self.fail_shard}'
+    ):
+      raise ValueError('Quota exceeded.')
+    job = types.BatchJob(
+        name=f'batches/{config.display_name}',
+        display_name=config.display_name,
+        model=model,
+        state=types.JobState.JOB_STATE_PENDING,
+    )
+    with self._lock:
+      self.created.append(job)
+    return job
+
+  async def async_upload(self, file, config):
+    return self.upload(file, config)
+
+  async def async_create(self, model, src, config):
+    return self.create(model, src, config)
+
+  def keys(self, job):
+    return [
+        [line['key'] for line in self.uploads[f'files/{shard.display_name}']]
+        for shard in job.jobs
+    ]
+
+
+def _patch(client, backend):
+  patches = (
+      mock.patch.object(files.Files, 'upload', side_effect=backend.upload),
+      mock.patch.object(
+          client.batches, 'create', side_effect=backend.create
+      ),
+      mock.patch.object(
+          files.AsyncFiles, 'upload', side_effect=backend.async_upload
+      ),
+      mock.patch.object(
+          client.aio.batches, 'create', side_effect=backend.async_create
+      ),
+  )
+  for patch in patches:
+    patch.start()
+  return patches
+
+
+@pytest.fixture
+def client():
+  return Client(api_key='test_api_key')
+
+
+@pytest.fixture
+def backend(client):
+  backend = _FakeBackend()
+  patches = _patch(client, backend)
+  yield backend
+  for patch in patches:
+    patch.stop()
+
+
+def test_create_sharded_splits_by_request_count(client, backend):
+  job = client.batches.create_sharded(
+      model=_MODEL,
+      requests=_requests(5),
+      config={'display_name': 'run', 'max_requests_per_shard': 2},
+  )
+
+  assert [shard.name for shard in job.jobs] == [
+      'batches/run-shard-0',
+      'batches/run-shard-1',
+      'batches/run-shard-2',
+  ]
+  assert job.request_counts == [2, 2, 1]
+  assert job.display_name == 'run'
+  assert backend.keys(job) == [
+      ['request-0', 'request-1'],
+      ['request-2', 'request-3'],
+      ['request-4'],
+  ]
+  assert job.state == types.JobState.JOB_STATE_PENDING
+  assert not job.done
+
+
+def test_create_sharded_splits_by_size(client, backend):
+  requests = [
+      {'contents': 'a'},
+      {'contents': 'b'},
+      {'contents': 'c' * 1000},
+      {'contents': 'd', 'metadata': {'key': 'last'}},
+  ]
+
+  job = client.batches.create_sharded(
+      model=_MODEL,
+      requests=requests,
+      config={'display_name': 'run', 'max_bytes_per_shard': 200},
+  )
+
+  assert job.request_counts == [2, 1, 1]
+  assert backend.keys(job) == [
+      ['request-0', 'request-1'],
+      ['request-2'],
+      ['last'],
+  ]
+
+
+def test_create_sharded_without_requests(client, backend):
+  with pytest.raises(ValueError, match='At least one request'):
+    client.batches.create_sharded(model=_MODEL, requests=[])
+
+  assert not backend.created
+
+
+def test_create_sharded_with_invalid_shard_size(client, backend):
+  with pytest.raises(ValueError, match='max_requests_per_shard'):
+    client.batches.create_sharded(
+        model=_MODEL,
+        requests=_requests(1),
+        config={'max_requests_per_shard': 0},
+    )
+
+
+def test_create_sharded_logs_created_jobs_on_failure(client, caplog):
+  backend = _FakeBackend(fail_shard=1)
+  patches = _patch(client, backend)
+  try:
+    with caplog.at_level(logging.WARNING, logger='google_genai.batches'):
+      with pytest.raises(ValueError, match='Quota exceeded.'):
+        client.batches.create_sharded(
+            model=_MODEL,
+            requests=_requests(3),
+            config={
+                'display_name': 'run',
+                'max_requests_per_shard': 1,
+                'max_concurrency': 1,
+            },
+        )
+  finally:
+    for patch in patches:
+      patch.stop()
+
+  created = ', '.join(job.name for job in backend.created)
+  assert 'batches/run-shard-0' in created
+  assert created in caplog.text
+
+
+def test_async_create_sharded(client, backend):
+  job = asyncio.run(
+      client.aio.batches.create_sharded(
+          model=_MODEL,
+          requests=_requests(3),
+          config={'display_name': 'run', 'max_requests_per_shard': 2},
+      )
+  )
+
+  assert [shard.name for shard in job.jobs] == [
+      'batches/run-shard-0',
+      'batches/run-shard-1',
+  ]
+  assert job.request_counts == [2, 1]
+  assert backend.keys(job) == [['request-0', 'request-1'], ['request-2']]
+
+
+def test_create_sharded_is_not_supported_in_vertexai():
+  client = Client(vertexai=True, project='project', location='us-central1')
+
+  with pytest.raises(ValueError, match='Gemini Developer client'):
+    client.batches.create_sharded(model=_MODEL, requests=_requests(1))
+
+
+def _sharded_job(*states):
+  return types.ShardedBatchJob(
+      jobs=[
+          types.BatchJob(name=f'batches/{i}', state=state)
+          for i, state in enumerate(states)
+      ],
+      request_counts=[1] * len(states),
+  )
+
+
+@pytest.mark.parametrize(
+    'states, state',
+    [
+        (['JOB_STATE_SUCCEEDED', 'JOB_STATE_SUCCEEDED'], 'JOB_STATE_SUCCEEDED'),
+        (['JOB_STATE_QUEUED', 'JOB_STATE_PENDING'], 'JOB_STATE_PENDING'),
+        (['JOB_STATE_SUCCEEDED', 'JOB_STATE_PENDING'], 'JOB_STATE_RUNNING'),
+        (
+            ['JOB_STATE_SUCCEEDED', 'JOB_STATE_FAILED'],
+            'JOB_STATE_PARTIALLY_SUCCEEDED',
+        ),
+        (['JOB_STATE_CANCELLED', 'JOB_STATE_FAILED'], 'JOB_STATE_FAILED'),
+    ],
+)
+def test_sharded_batch_job_state(states, state):
+  assert _sharded_job(*states).state == state
+
+
+def test_get_sharded(client):
+  job = _sharded_job('JOB_STATE_PENDING', 'JOB_STATE_RUNNING')
+
+  def get(name, config):
+    return types.BatchJob(name=name, state='JOB_STATE_SUCCEEDED')
+
+  with mock.patch.object(client.batches, 'get', side_effect=get):
+    refreshed = client.batches.get_sharded(job)
+
+  assert [shard.name for shard in refreshed.jobs] == ['batches/0', 'batches/1']
+  assert refreshed.done
+  assert refreshed.state == types.JobState.JOB_STATE_SUCCEEDED
+  assert refreshed.request_counts == job.request_counts
+  assert not job.done
+
+
+def test_iter_results_of_sharded_job(client):
+  job = types.ShardedBatchJob(
+      jobs=[
+          types.BatchJob(
+              name=f'batches/{i}',
+              state='JOB_STATE_SUCCEEDED',
+              dest=types.BatchJobDestination(
+                  inlined_responses=[
+                      types.InlinedResponse(metadata={'key': key})
+                      for key in keys
+                  ]
+              ),
+          )
+          for i, keys in enumerate([['a', 'b'], ['c']])
+      ]
+  )
+
+  async def async_keys():
+    return [key async for key, _ in client.aio.batches.iter_results(job)]
+
+  assert [key for key, _ in client.batches.iter_results(job)] == ['a', 'b', 'c']
+  assert asyncio.run(async_keys()) == ['a', 'b', 'c']
+
+
+def test_iter_results_of_sharded_embedding_job(client):
+  job = types.ShardedBatchJob(
+      jobs=[
+          types.BatchJob(
+              name=f'batches/{i}',
+              state='JOB_STATE_SUCCEEDED',
+              dest=types.BatchJobDestination(
+                  inlined_embed_content_responses=[
+                      types.InlinedEmbedContentResponse(
+                          response=types.SingleEmbedContentResponse(
+                              embedding=types.ContentEmbedding(values=[value])
+                          )
+                      )
+                      for value in values
+                  ]
+              ),
+          )
+          for i, values in enumerate([[0.0, 1.0], [2.0]])
+      ],
+      request_counts=[2, 1],
+  )
+
+  async def async_results():
+    return [
+        (key, result.response.embedding.values)
+        async for key, result in client.aio.batches.iter_results(job)
+    ]
+
+  expected = [
+      ('request-0', [0.0]),
+      ('request-1', [1.0]),
+      ('request-2', [2.0]),
+  ]
+  assert [
+      (key, result.response.embedding.values)
+      for key, result in client.batches.iter_results(job)
+  ] == expected
+  assert asyncio.run(async_results()) == expected
+
+
+def _embedding_jobs():
+  created = {}
+
+  def create_embeddings(model, src, config):
+    created[config.display_name] = src
+    return types.BatchJob(
+        name=f'batches/{config.display_name}',
+        display_name=config.display_name,
+        model=model,
+        state=types.JobState.JOB_STATE_PENDING,
+    )
+
+  async def async_create_embeddings(model, src, config):
+    return create_embeddings(model, src, config)
+
+  return created, create_embeddings, async_create_embeddings
+
+
+def _embedded_texts(src):
+  return [content.parts[0].text for content in src.inlined_requests.contents]
+
+
+def test_create_embeddings_sharded(client):
+  created, create_embeddings, _ = _embedding_jobs()
+
+  with mock.patch.object(
+      client.batches, '_create_embeddings', side_effect=create_embeddings
+  ):
+    with pytest.warns(_common.ExperimentalWarning):
+      job = client.batches.create_embeddings_sharded(
+          model='gemini-embedding-001',
+          contents=(f'Document {i}' for i in range(5)),
+          embed_config={'task_type': 'RETRIEVAL_DOCUMENT'},
+          config={'display_name': 'embed', 'max_requests_per_shard': 2},
+      )
+
+  assert [shard.name for shard in job.jobs] == [
+      'batches/embed-shard-0',
+      'batches/embed-shard-1',
+      'batches/embed-shard-2',
+  ]
+  assert job.request_counts == [2, 2, 1]
+  texts = [_embedded_texts(created[shard.display_name]) for shard in job.jobs]
+  assert texts == [
+      ['Document 0', 'Document 1'],
+      ['Document 2', 'Document 3'],
+      ['Document 4'],
+  ]
+  assert all(
+      src.inlined_requests.config.task_type == 'RETRIEVAL_DOCUMENT'
+      for src in created.values()
+  )
+
+
+def _counted(count, pulled):
+  for i in range(count):
+    pulled.append(i)
+    yield f'Document {i}'
+
+
+def test_create_embeddings_sharded_waits_for_a_slot(client):
+  pulled = []
+  pulled_when_submitted = []
+
+  def create_embeddings(model, src, config):
+    time.sleep(0.05)
+    pulled_when_submitted.append(len(pulled))
+    return types.BatchJob(name=f'batches/{config.display_name}')
+
+  with mock.patch.object(
+      client.batches, '_create_embeddings', side_effect=create_embeddings
+  ):
+    job = client.batches.create_embeddings_sharded(
+        model='gemini-embedding-001',
+        contents=_counted(5, pulled),
+        config={'max_requests_per_shard': 1, 'max_concurrency': 1},
+    )
+
+  assert job.request_counts == [1] * 5
+  # Completing a shard reads the first content of the next one.
+  assert pulled_when_submitted == [2, 3, 4, 5, 5]
+
+
+def test_async_create_embeddings_sharded_waits_for_a_slot(client):
+  pulled = []
+  pulled_when_submitted = []
+
+  async def create_embeddings(model, src, config):
+    await asyncio.sleep(0.05)
+    pulled_when_submitted.append(len(pulled))
+    return types.BatchJob(name=f'batches/{config.display_name}')
+
+  with mock.patch.object(
+      client.aio.batches,
+      '_create_embeddings',
+      side_effect=create_embeddings,
+  ):
+    job = asyncio.run(
+        client.aio.batches.create_embeddings_sharded(
+            model='gemini-embedding-001',
+            contents=_counted(5, pulled),
+            config={'max_requests_per_shard': 1, 'max_concurrency': 2},
+        )
+    )
+
+  assert job.request_counts == [1] * 5
+  # While the first two shards are submitted, only the first content of the
+  # third one is read, which completes the second shard.
+  assert pulled_when_submitted[0] <= 3
+
+
+def test_create_embeddings_sharded_splits_by_size(client):
+  created, create_embeddings, _ = _embedding_jobs()
+
+  with mock.patch.object(
+      client.batches, '_create_embeddings', side_effect=create_embeddings
+  ):
+    job = client.batches.create_embeddings_sharded(
+        model='gemini-embedding-001',
+        contents=['a', 'b', 'c' * 500],
+        config={'display_name': 'embed', 'max_bytes_per_shard': 200},
+    )
+
+  assert job.request_counts == [2, 1]
+  assert [_embedded_texts(created[f'embed-shard-{i}']) for i in range(2)] == [
+      ['a', 'b'],
+      ['c' * 500],
+  ]
+
+
+def test_async_create_embeddings_sharded(client):
+  created, _, async_create_embeddings = _embedding_jobs()
+
+  with mock.patch.object(
+      client.aio.batches,
+      '_create_embeddings',
+      side_effect=async_create_embeddings,
+  ):
+    job = asyncio.run(
+        client.aio.batches.create_embeddings_sharded(
+            model='gemini-embedding-001',
+            contents=['a', 'b', 'c'],
+            config={'display_name': 'embed', 'max_requests_per_shard': 2},
+        )
+    )
+
+  assert job.request_counts == [2, 1]
+  assert [_embedded_texts(created[f'embed-shard-{i}']) for i in range(2)] == [
+      ['a', 'b'],
+      ['c'],
+  ]
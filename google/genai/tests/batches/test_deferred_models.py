@@ -0,0 +1,258 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests for batches.deferred_models()."""
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+from ... import Client
+from ... import errors
+from ... import types
+from ... import waiters
+
+
+_MODEL = 'gemini-2.5-flash'
+
+
+class _FakeBatches:
+  """Creates batch jobs that have ended, with a response per request."""
+
+  def __init__(self, state='JOB_STATE_SUCCEEDED', failing_text=None):
+    self.state = state
+    self.failing_text = failing_text
+    self.created = []
+
+  def _result(self, request):
+    text = request.contents
+    if text == self.failing_text:
+      return types.InlinedResponse(
+          metadata=request.metadata,
+          error=types.JobError(code=3, message=f'Cannot answer {text}.'),
+      )
+    return types.InlinedResponse(
+        metadata=request.metadata,
+        response=types.GenerateContentResponse(
+            candidates=[
+                types.Candidate(
+                    content=types.Content(
+                        role='model', parts=[types.Part(text=f'{text}!')]
+                    )
+                )
+            ]
+        ),
+    )
+
+  async def create(self, *, model, src, config):
+    self.created.append((model, [request.contents for request in src], config))
+    return types.BatchJob(
+        name=f'batches/{len(self.created)}',
+        state=self.state,
+        dest=types.BatchJobDestination(
+            inlined_responses=[self._result(request) for request in src]
+        ),
+    )
+
+
+@pytest.fixture
+def client():
+  return Client(api_key='test_api_key')
+
+
+def _run(client, fake, scenario, **config):
+  async def run():
+    with mock.patch.object(
+        client.aio.batches, 'create', side_effect=fake.create
+    ):
+      models = client.aio.batches.deferred_models(
+          config={'max_wait_seconds': 30, **config}
+      )
+      async with models:
+        return await scenario(models)
+
+  return asyncio.run(run())
+
+
+def test_requests_share_a_job_up_to_max_requests(client):
+  fake = _FakeBatches()
+
+  async def scenario(models):
+    futures = [
+        models.generate_content(model=_MODEL, contents=text)
+        for text in ['a', 'b', 'c']
+    ]
+    await asyncio.sleep(0)
+    assert [contents for _, contents, _ in fake.created] == [['a', 'b']]
+    models.flush()
+    return await asyncio.gather(*futures)
+
+  responses = _run(client, fake, scenario, max_requests_per_job=2)
+
+  assert [response.text for response in responses] == ['a!', 'b!', 'c!']
+  assert [contents for _, contents, _ in fake.created] == [['a', 'b'], ['c']]
+
+
+def test_job_is_submitted_after_max_wait_seconds(client):
+  fake = _FakeBatches()
+
+  async def scenario(models):
+    response = await asyncio.wait_for(
+        models.generate_content(model=_MODEL, contents='a'), timeout=5
+    )
+    return response, list(fake.created)
+
+  response, created = _run(client, fake, scenario, max_wait_seconds=0.01)
+
+  assert response.text == 'a!'
+  assert [contents for _, contents, _ in created] == [['a']]
+
+
+def test_requests_are_grouped_by_model_and_size(client):
+  fake = _FakeBatches()
+
+  async def scenario(models):
+    futures = [
+        models.generate_content(model=_MODEL, contents='a'),
+        models.generate_content(model='gemini-2.5-pro', contents='b'),
+        models.generate_content(model=_MODEL, contents='c' * 500),
+    ]
+    models.flush()
+    return await asyncio.gather(*futures)
+
+  _run(
+      client,
+      fake,
+      scenario,
+      max_bytes_per_job=400,
+      display_name='deferred',
+  )
+
+  assert [(model, contents) for model, contents, _ in fake.created] == [
+      (_MODEL, ['a']),
+      ('gemini-2.5-pro', ['b']),
+      (_MODEL, ['c' * 500]),
+  ]
+  assert [config.display_name for _, _, config in fake.created] == [
+      'deferred-0',
+      'deferred-1',
+      'deferred-2',
+  ]
+
+
+def test_failed_request_fails_its_future(client):
+  fake = _FakeBatches(failing_text='b')
+
+  async def scenario(models):
+    futures = [
+        models.generate_content(model=_MODEL, contents='a'),
+        models.generate_content(model=_MODEL, contents='b'),
+    ]
+    models.flush()
+    return await asyncio.gather(*futures, return_exceptions=True)
+
+  ok, failed = _run(client, fake, scenario)
+
+  assert ok.text == 'a!'
+  assert isinstance(failed, errors.APIError)
+  assert failed.message == 'Cannot answer b.'
+
+
+def test_failed_job_fails_all_its_futures(client):
+  fake = _FakeBatches(state='JOB_STATE_FAILED')
+
+  async def scenario(models):
+    futures = [
+        models.generate_content(model=_MODEL, contents='a'),
+        models.generate_content(model=_MODEL, contents='b'),
+    ]
+    models.flush()
+    return await asyncio.gather(*futures, return_exceptions=True)
+
+  results = _run(client, fake, scenario)
+
+  assert all(isinstance(result, RuntimeError) for result in results)
+  assert 'JOB_STATE_FAILED' in str(results[0])
+
+
+def test_requests_are_rejected_after_aclose(client):
+  fake = _FakeBatches()
+
+  async def scenario(models):
+    await models.aclose()
+    models.generate_content(model=_MODEL, contents='a')
+
+  with pytest.raises(RuntimeError, match='after aclose'):
+    _run(client, fake, scenario)
+
+
+def test_deferred_models_is_not_supported_in_vertexai():
+  client = Client(vertexai=True, project='project', location='us-central1')
+
+  with pytest.raises(ValueError, match='Gemini Developer client'):
+    client.aio.batches.deferred_models()
+
+
+def _poll_with(*outcomes):
+  outcomes = list(outcomes)
+
+  async def poll(job, config):
+    outcome = outcomes.pop(0)
+    if isinstance(outcome, Exception):
+      raise outcome
+    return job.model_copy(update={'state': types.JobState(outcome)})
+
+  return poll
+
+
+def _run_polled_job(client, poll, **config):
+  fake = _FakeBatches(state='JOB_STATE_PENDING')
+
+  async def scenario(models):
+    future = models.generate_content(model=_MODEL, contents='a')
+    models.flush()
+    return await asyncio.gather(future, return_exceptions=True)
+
+  with mock.patch.object(waiters.AsyncWaiters, '_poll', side_effect=poll):
+    [result] = _run(
+        client,
+        fake,
+        scenario,
+        wait_config={'initial_delay_seconds': 0.001},
+        **config,
+    )
+  return result
+
+
+def test_job_is_polled_again_after_transient_errors(client):
+  poll = _poll_with(
+      errors.ServerError(503, {'error': {'message': 'Unavailable.'}}),
+      'JOB_STATE_SUCCEEDED',
+  )
+
+  assert _run_polled_job(client, poll).text == 'a!'
+
+
+def test_failure_after_create_names_the_job(client, caplog):
+  poll = _poll_with(errors.ClientError(403, {'error': {'message': 'Denied.'}}))
+
+  error = _run_polled_job(client, poll)
+
+  assert isinstance(error, RuntimeError)
+  assert 'batches/1' in str(error)
+  assert isinstance(error.__cause__, errors.ClientError)
+  assert 'batches/1' in caplog.text
@@ -0,0 +1,132 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Tests for batches.iter_results()."""
+
+import asyncio
+import json
+from unittest import mock
+
+import pytest
+
+from ... import _api_client
+from ... import Client
+from ... import types
+from ..client.range_download_server import RangeDownloadServer
+
+
+_RESULT_LINES = [
+    {
+        'key': 'sum',
+        'response': {
+            'candidates': [
+                {'content': {'parts': [{'text': '4'}], 'role': 'model'}}
+            ]
+        },
+    },
+    {'key': 'request-1', 'error': {'code': 3, 'message': 'Bad request.'}},
+]
+
+
+def _results_file():
+  return b'\n'.join(json.dumps(line).encode() for line in _RESULT_LINES)
+
+
+def _job(**dest):
+  return types.BatchJob(
+      name='batches/123',
+      state=types.JobState.JOB_STATE_SUCCEEDED,
+      dest=types.BatchJobDestination(**dest) if dest else None,
+  )
+
+
+def _client(server):
+  return Client(
+      api_key='test_api_key',
+      http_options=types.HttpOptions(base_url=server.url),
+  )
+
+
+def _check_results(results):
+  assert [key for key, _ in results] == ['sum', 'request-1']
+  assert results[0][1].response.text == '4'
+  assert results[1][1].error.message == 'Bad request.'
+
+
+def test_iter_results_streams_results_file():
+  with RangeDownloadServer(_results_file()) as server:
+    client = _client(server)
+
+    results = list(
+        client.batches.iter_results(_job(file_name='files/results'))
+    )
+
+  _check_results(results)
+  assert server.paths == ['/v1beta/files/results:download?alt=media']
+
+
+def test_async_iter_results_streams_results_file():
+  async def run(client):
+    return [
+        result
+        async for result in client.aio.batches.iter_results(
+            _job(file_name='files/results')
+        )
+    ]
+
+  with RangeDownloadServer(_results_file()) as server:
+    client = _client(server)
+    with mock.patch.object(_api_client, 'has_aiohttp', False):
+      results = asyncio.run(run(client))
+
+  _check_results(results)
+
+
+def test_iter_results_of_inlined_responses():
+  client = Client(api_key='test_api_key')
+  job = _job(
+      inlined_responses=[
+          types.InlinedResponse(metadata={'key': 'first'}),
+          types.InlinedResponse(),
+      ]
+  )
+
+  results = list(client.batches.iter_results(job))
+
+  assert [key for key, _ in results] == ['first', 'request-1']
+  assert results[1][1] is job.dest.inlined_responses[1]
+
+
+def test_iter_results_gets_job_by_name():
+  client = Client(api_key='test_api_key')
+  job = _job(inlined_responses=[types.InlinedResponse()])
+
+  with mock.patch.object(client.batches, 'get', return_value=job) as get:
+    results = list(client.batches.iter_results('batches/123'))
+
+  get.assert_called_once_with(name='batches/123')
+  assert [key for key, _ in results] == ['request-0']
+
+
+def test_iter_results_of_unfinished_job():
+  client = Client(api_key='test_api_key')
+  job = types.BatchJob(
+      name='batches/123', state=types.JobState.JOB_STATE_RUNNING
+  )
+
+  with pytest.raises(ValueError, match='JOB_STATE_RUNNING'):
+    next(client.batches.iter_results(job))
@@ -0,0 +1,132 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Tests for batches.upload_input_file()."""
+
+import asyncio
+import io
+import json
+from unittest import mock
+
+import pytest
+
+from ... import _api_client
+from ... import batches
+from ... import Client
+from ... import types
+from ..client.resumable_upload_server import ResumableUploadServer
+
+
+_REQUESTS = [
+    {'contents': 'What is 1 + 1?'},
+    types.InlinedRequest(
+        contents='What is 2 + 2?',
+        config=types.GenerateContentConfig(temperature=0.5),
+        metadata={'key': 'sum'},
+    ),
+]
+
+
+def _client(server, **kwargs):
+  return Client(
+      api_key='test_api_key',
+      http_options=types.HttpOptions(base_url=server.url),
+      **kwargs,
+  )
+
+
+def _uploaded_lines(server):
+  [upload] = server.uploads.values()
+  return [json.loads(line) for line in upload.data().splitlines()]
+
+
+def _check_lines(lines):
+  assert lines == [
+      {
+          'key': 'request-0',
+          'request': {
+              'contents': [
+                  {'parts': [{'text': 'What is 1 + 1?'}], 'role': 'user'}
+              ]
+          },
+      },
+      {
+          'key': 'sum',
+          'metadata': {'key': 'sum'},
+          'request': {
+              'contents': [
+                  {'parts': [{'text': 'What is 2 + 2?'}], 'role': 'user'}
+              ],
+              'generationConfig': {'temperature': 0.5},
+          },
+      },
+  ]
+
+
+def test_upload_input_file():
+  with ResumableUploadServer() as server:
+    client = _client(server)
+
+    src = client.batches.upload_input_file(
+        requests=iter(_REQUESTS), config={'display_name': 'batch input'}
+    )
+
+    assert src.file_name.startswith('files/')
+    _check_lines(_uploaded_lines(server))
+
+
+def test_async_upload_input_file():
+  with ResumableUploadServer() as server:
+    client = _client(server)
+
+    with mock.patch.object(_api_client, 'has_aiohttp', False):
+      src = asyncio.run(
+          client.aio.batches.upload_input_file(requests=iter(_REQUESTS))
+      )
+
+    assert src.file_name.startswith('files/')
+    _check_lines(_uploaded_lines(server))
+
+
+def test_write_batch_input_consumes_requests_one_at_a_time():
+  client = _api_client.BaseApiClient(vertexai=False, api_key='test_api_key')
+  file = io.BytesIO()
+  sizes = []
+
+  def requests():
+    for i in range(3):
+      sizes.append(file.tell())
+      yield {'contents': f'Request {i}'}
+
+  assert batches._write_batch_input(client, requests(), file) == 3
+  assert sizes[0] == 0 and sizes[0] < sizes[1] < sizes[2]
+
+
+def test_upload_input_file_requires_requests():
+  with ResumableUploadServer() as server:
+    client = _client(server)
+
+    with pytest.raises(ValueError, match='At least one request'):
+      client.batches.upload_input_file(requests=[])
+    assert not server.commands
+
+
+def test_upload_input_file_is_not_supported_in_vertex():
+  client = Client(vertexai=True, project='project', location='us-central1')
+
+  with pytest.raises(ValueError, match='Gemini Developer client'):
+    client.batches.upload_input_file(requests=_REQUESTS)
@@ -0,0 +1,54 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Shared helpers for the SDK benchmarks.
+
+Benchmarks are skipped in regular test runs. Run them with:
+
+  GOOGLE_GENAI_RUN_BENCHMARKS=true pytest -s google/genai/tests/benchmarks
+"""
+
+import os
+import time
+from typing import Any, Callable
+
+import pytest
+
+
+IS_NOT_BENCHMARK_RUN = os.getenv('GOOGLE_GENAI_RUN_BENCHMARKS') != 'true'
+
+requires_benchmarks = pytest.mark.skipif(
+    IS_NOT_BENCHMARK_RUN,
+    reason='Set GOOGLE_GENAI_RUN_BENCHMARKS=true to run benchmarks.',
+)
+
+
+def best_of(fn: Callable[[], Any], *, repeat: int = 5, number: int = 1) -> float:
+  """Returns the best wall-clock seconds per call of `fn` over `repeat` runs."""
+  best = float('inf')
+  for _ in range(repeat):
+    start = time.perf_counter()
+    for _ in range(number):
+      fn()
+    best = min(best, (time.perf_counter() - start) / number)
+  return best
+
+
+def report(name: str, **metrics: float) -> None:
+  """Prints one benchmark result line."""
+  formatted = ', '.join(f'{key}={value:,.2f}' for key, value in metrics.items())
+  print(f'\n[benchmark] {name}: {formatted}')
@@ -0,0 +1,86 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Benchmarks the client side cost of automatic function calling turns."""
+
+import json
+from unittest import mock
+
+import pytest
+
+from ... import _api_client as api_client
+from ... import Client
+from ... import types
+from .benchmark_helper import best_of
+from .benchmark_helper import report
+from .benchmark_helper import requires_benchmarks
+
+
+_TOOL_OUTPUT = 'Lorem ipsum dolor sit amet. ' * 1000
+
+
+def lookup(query: str, limit: int) -> str:
+  """Looks up a query."""
+  return _TOOL_OUTPUT
+
+
+def search(query: str) -> list[str]:
+  """Searches for a query."""
+  return [query]
+
+
+def _response_body(turn: int, num_turns: int) -> str:
+  if turn < num_turns:
+    part = {'functionCall': {'name': 'lookup', 'args': {'query': f'q{turn}', 'limit': 3}}}
+  else:
+    part = {'text': 'Done.'}
+  return json.dumps({
+      'candidates': [{'content': {'role': 'model', 'parts': [part]}}],
+  })
+
+
+@requires_benchmarks
+@pytest.mark.parametrize('num_turns', [1, 5, 10, 20])
+def test_afc_turns(num_turns):
+  client = Client(api_key='test-api-key')
+  config = types.GenerateContentConfig(
+      tools=[lookup, search],
+      automatic_function_calling=types.AutomaticFunctionCallingConfig(
+          maximum_remote_calls=num_turns + 1
+      ),
+  )
+
+  def run():
+    bodies = iter(
+        types.HttpResponse(headers={}, body=_response_body(turn, num_turns))
+        for turn in range(num_turns + 1)
+    )
+    with mock.patch.object(
+        api_client.BaseApiClient,
+        'request',
+        side_effect=lambda *args, **kwargs: next(bodies),
+    ):
+      response = client.models.generate_content(
+          model='gemini-2.5-flash', contents='Look things up.', config=config
+      )
+    assert len(response.automatic_function_calling_history) == 1 + 2 * num_turns
+
+  seconds = best_of(run)
+  report(
+      f'AFC loop ({num_turns} turns)',
+      total_ms=seconds * 1e3,
+      ms_per_turn=seconds * 1e3 / num_turns,
+  )
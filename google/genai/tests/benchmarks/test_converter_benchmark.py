@@ -0,0 +1,217 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Benchmarks the generated converters against interpreted key paths."""
+
+import copy
+from unittest import mock
+
+from ... import _api_client as api_client
+from ... import models
+from ... import types
+from .benchmark_helper import best_of
+from .benchmark_helper import report
+from .benchmark_helper import requires_benchmarks
+
+
+_NUM_CONTENTS = 200
+_NUM_CANDIDATES = 200
+
+
+def _interpreted_set_value_by_path(data, keys, value):
+  """The per-call key path interpreter the compiled key paths replaced."""
+  if value is None:
+    return
+  for i, key in enumerate(keys[:-1]):
+    if key.endswith('[]'):
+      key_name = key[:-2]
+      if data is not None and key_name not in data:
+        data[key_name] = [{} for _ in range(len(value))]
+      if isinstance(value, list) and data is not None:
+        for j, d in enumerate(data[key_name]):
+          _interpreted_set_value_by_path(d, keys[i + 1 :], value[j])
+      elif data is not None:
+        for d in data[key_name]:
+          _interpreted_set_value_by_path(d, keys[i + 1 :], value)
+      return
+    elif key.endswith('[0]'):
+      key_name = key[:-3]
+      if data is not None and key_name not in data:
+        data[key_name] = [{}]
+      if data is not None:
+        _interpreted_set_value_by_path(data[key_name][0], keys[i + 1 :], value)
+      return
+    if data is not None:
+      data = data.setdefault(key, {})
+  if data is not None:
+    existing_data = data.get(keys[-1])
+    if existing_data is not None:
+      if not value or value == existing_data:
+        pass
+      elif isinstance(existing_data, dict) and isinstance(value, dict):
+        existing_data.update(value)
+      else:
+        raise ValueError(keys[-1])
+    elif (
+        keys[-1] == '_self'
+        and isinstance(data, dict)
+        and isinstance(value, dict)
+    ):
+      data.update(value)
+    else:
+      data[keys[-1]] = value
+
+
+def _interpreted_get_value_by_path(data, keys, *, default_value=None):
+  """The per-call key path interpreter the compiled key paths replaced."""
+  if keys == ['_self']:
+    return data
+  for i, key in enumerate(keys):
+    if not data:
+      return default_value
+    if key.endswith('[]'):
+      key_name = key[:-2]
+      if key_name in data:
+        return [
+            _interpreted_get_value_by_path(
+                d, keys[i + 1 :], default_value=default_value
+            )
+            for d in data[key_name]
+        ]
+      return default_value
+    elif key.endswith('[0]'):
+      key_name = key[:-3]
+      if key_name in data and data[key_name]:
+        return _interpreted_get_value_by_path(
+            data[key_name][0], keys[i + 1 :], default_value=default_value
+        )
+      return default_value
+    elif key in data:
+      data = data[key]
+    elif isinstance(data, types._common.BaseModel) and hasattr(data, key):
+      data = getattr(data, key)
+    else:
+      return default_value
+  return data
+
+
+def _parameters() -> types._GenerateContentParameters:
+  contents = [
+      types.Content(
+          role='user' if i % 2 == 0 else 'model',
+          parts=[
+              types.Part(text=f'Message {i}. ' * 20),
+              types.Part(
+                  function_call=types.FunctionCall(
+                      name='lookup', args={'query': f'q{i}', 'limit': 10}
+                  )
+              ),
+          ],
+      )
+      for i in range(_NUM_CONTENTS)
+  ]
+  return types._GenerateContentParameters(
+      model='gemini-2.5-flash',
+      contents=contents,
+      config=types.GenerateContentConfig(
+          system_instruction='Be brief.',
+          temperature=0.2,
+          max_output_tokens=1024,
+          safety_settings=[
+              types.SafetySetting(
+                  category='HARM_CATEGORY_HATE_SPEECH',
+                  threshold='BLOCK_ONLY_HIGH',
+              )
+          ],
+          tools=[
+              types.Tool(
+                  function_declarations=[
+                      types.FunctionDeclaration(
+                          name='lookup',
+                          description='Looks up a query.',
+                          parameters=types.Schema(
+                              type='OBJECT',
+                              properties={
+                                  'query': types.Schema(type='STRING'),
+                                  'limit': types.Schema(type='INTEGER'),
+                              },
+                          ),
+                      )
+                  ]
+              )
+          ],
+      ),
+  )
+
+
+def _vertex_response() -> dict[str, object]:
+  return {
+      'candidates': [
+          {
+              'content': {
+                  'parts': [{'text': f'Answer {i}. ' * 20}],
+                  'role': 'model',
+              },
+              'finishReason': 'STOP',
+              'index': i,
+              'safetyRatings': [
+                  {'category': 'HARM_CATEGORY_HATE_SPEECH', 'probability': 'NEGLIGIBLE'}
+              ],
+          }
+          for i in range(_NUM_CANDIDATES)
+      ],
+      'createTime': '2026-01-01T00:00:00Z',
+      'modelVersion': 'gemini-2.5-flash',
+      'responseId': 'response-id',
+      'usageMetadata': {'promptTokenCount': 12, 'totalTokenCount': 400},
+  }
+
+
+def _compare(name, convert):
+  expected = convert()
+  with mock.patch.object(
+      models, 'getv', _interpreted_get_value_by_path
+  ), mock.patch.object(models, 'setv', _interpreted_set_value_by_path):
+    assert convert() == expected
+    interpreted = best_of(convert, repeat=5, number=20)
+  compiled = best_of(convert, repeat=5, number=20)
+  report(
+      name,
+      interpreted_us=interpreted * 1e6,
+      compiled_us=compiled * 1e6,
+      speedup=interpreted / compiled,
+  )
+
+
+@requires_benchmarks
+def test_generate_content_parameters_to_mldev():
+  client = api_client.BaseApiClient(api_key='test-api-key')
+  parameters = _parameters()
+  _compare(
+      '_GenerateContentParameters_to_mldev',
+      lambda: models._GenerateContentParameters_to_mldev(client, parameters),
+  )
+
+
+@requires_benchmarks
+def test_generate_content_response_from_vertex():
+  response = _vertex_response()
+  _compare(
+      '_GenerateContentResponse_from_vertex',
+      lambda: models._GenerateContentResponse_from_vertex(
+          copy.copy(response)
+      ),
+  )
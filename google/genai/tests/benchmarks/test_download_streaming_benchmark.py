@@ -0,0 +1,89 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+
+"""Benchmarks streaming file downloads.
+
+The downloads come from a local stand-in server that limits the bandwidth of
+each connection, which is what parallel range requests work around.
+"""
+
+import os
+import tracemalloc
+
+from ... import _api_client
+from ... import types
+from ..client.range_download_server import RangeDownloadServer
+from .benchmark_helper import best_of
+from .benchmark_helper import report
+from .benchmark_helper import requires_benchmarks
+
+
+_MB = 1024 * 1024
+_PATH = 'files/abc:download?alt=media'
+
+
+def _client(server, **options):
+  return _api_client.BaseApiClient(
+      vertexai=False,
+      api_key='test_api_key',
+      http_options=types.HttpOptions(base_url=server.url, **options),
+  )
+
+
+@requires_benchmarks
+def test_download_peak_memory(tmp_path):
+  data = os.urandom(256 * _MB)
+  path = str(tmp_path / 'download.bin')
+  with RangeDownloadServer(data) as server:
+    client = _client(server)
+    tracemalloc.start()
+    client.download_file_to(_PATH, path)
+    _, streamed_peak = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    client.download_file(_PATH)
+    _, buffered_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+  report(
+      'download 256 MiB',
+      buffered_peak_mb=buffered_peak / _MB,
+      streamed_peak_mb=streamed_peak / _MB,
+  )
+  assert streamed_peak < buffered_peak / 10
+
+
+@requires_benchmarks
+def test_parallel_segment_download_throughput(tmp_path):
+  data = os.urandom(64 * _MB)
+  path = str(tmp_path / 'download.bin')
+  with RangeDownloadServer(data, bytes_per_second=100 * _MB) as server:
+    sequential = best_of(
+        lambda: _client(server).download_file_to(_PATH, path), repeat=3
+    )
+    for segments in (2, 4, 8):
+      client = _client(server, download_parallel_segments=segments)
+      parallel = best_of(
+          lambda: client.download_file_to(_PATH, path), repeat=3
+      )
+      report(
+          f'download 64 MiB at 100 MiB/s per connection, segments={segments}',
+          sequential_mb_per_s=len(data) / _MB / sequential,
+          parallel_mb_per_s=len(data) / _MB / parallel,
+          speedup=sequential / parallel,
+      )
+      assert parallel < sequential
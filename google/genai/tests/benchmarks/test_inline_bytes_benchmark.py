@@ -0,0 +1,75 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Benchmarks the peak memory of requests carrying inline bytes."""
+
+import os
+import tracemalloc
+from unittest import mock
+
+import httpx
+
+from ... import Client
+from ... import types
+from .benchmark_helper import report
+from .benchmark_helper import requires_benchmarks
+
+
+_IMAGE_SIZE = 15 * 1024 * 1024
+_MB = 1024 * 1024
+
+
+def _peak_request_memory(stream_inline_data: bool, image: bytes) -> int:
+  client = Client(
+      api_key='test_api_key',
+      http_options=types.HttpOptions(stream_inline_data=stream_inline_data),
+  )
+
+  def send(request, **kwargs):
+    # Drain the body like a transport would, without keeping it around.
+    for _ in request.stream:
+      pass
+    return httpx.Response(200, content=b'{"candidates": []}')
+
+  with mock.patch.object(httpx.Client, 'send', side_effect=send):
+    tracemalloc.start()
+    try:
+      client.models.generate_content(
+          model='gemini-2.5-flash',
+          contents=[
+              types.Part.from_bytes(data=image, mime_type='image/png'),
+              'Describe this image.',
+          ],
+      )
+      _, peak = tracemalloc.get_traced_memory()
+    finally:
+      tracemalloc.stop()
+  return peak
+
+
+@requires_benchmarks
+def test_part_from_bytes_peak_memory():
+  image = os.urandom(_IMAGE_SIZE)
+
+  buffered = _peak_request_memory(False, image)
+  streamed = _peak_request_memory(True, image)
+  report(
+      'Part.from_bytes request peak memory (15 MB image)',
+      buffered_mb=buffered / _MB,
+      streamed_mb=streamed / _MB,
+      reduction=buffered / streamed,
+  )
@@ -0,0 +1,92 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Benchmarks building responses with and without validation."""
+
+import pytest
+
+from ... import types
+from .benchmark_helper import best_of
+from .benchmark_helper import report
+from .benchmark_helper import requires_benchmarks
+
+
+def _candidate(index: int, num_parts: int) -> dict[str, object]:
+  return {
+      'content': {
+          'parts': [
+              {'text': f'Part {i} of candidate {index}. ' * 10}
+              for i in range(num_parts)
+          ],
+          'role': 'model',
+      },
+      'finishReason': 'STOP',
+      'index': index,
+      'avgLogprobs': -0.25,
+      'safetyRatings': [
+          {'category': category, 'probability': 'NEGLIGIBLE'}
+          for category in (
+              'HARM_CATEGORY_HATE_SPEECH',
+              'HARM_CATEGORY_DANGEROUS_CONTENT',
+              'HARM_CATEGORY_HARASSMENT',
+              'HARM_CATEGORY_SEXUALLY_EXPLICIT',
+          )
+      ],
+  }
+
+
+def _response(num_candidates: int, num_parts: int) -> dict[str, object]:
+  return {
+      'candidates': [
+          _candidate(i, num_parts) for i in range(num_candidates)
+      ],
+      'createTime': '2026-01-01T00:00:00Z',
+      'modelVersion': 'gemini-2.5-flash',
+      'responseId': 'response-id',
+      'usageMetadata': {
+          'promptTokenCount': 12,
+          'candidatesTokenCount': 388,
+          'totalTokenCount': 400,
+          'promptTokensDetails': [{'modality': 'TEXT', 'tokenCount': 12}],
+      },
+  }
+
+
+@requires_benchmarks
+@pytest.mark.parametrize(
+    'name, num_candidates, num_parts',
+    [('typical', 1, 2), ('large', 64, 8)],
+)
+def test_response_construction_us_per_response(
+    name, num_candidates, num_parts
+):
+  response = _response(num_candidates, num_parts)
+
+  def build(skip_validation):
+    return types.GenerateContentResponse._from_response(
+        response=response, kwargs={}, skip_validation=skip_validation
+    )
+
+  assert build(True) == build(False)
+  number = 2000 // num_candidates
+  validated = best_of(lambda: build(False), number=number)
+  constructed = best_of(lambda: build(True), number=number)
+  report(
+      f'GenerateContentResponse._from_response ({name})',
+      validated_us=validated * 1e6,
+      skip_validation_us=constructed * 1e6,
+      speedup=validated / constructed,
+  )
@@ -0,0 +1,121 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Benchmarks the streaming response framer against line-based parsing."""
+
+import json
+
+import httpx
+import pytest
+
+from ... import _api_client as api_client
+from .benchmark_helper import best_of
+from .benchmark_helper import report
+from .benchmark_helper import requires_benchmarks
+
+
+_NUM_CHUNKS = 2_000
+_READ_SIZE = 16 * 1024
+
+
+def _chunk() -> dict[str, object]:
+  return {
+      'candidates': [{
+          'content': {
+              'parts': [{'text': 'Lorem ipsum dolor sit amet. ' * 40}],
+              'role': 'model',
+          },
+          'index': 0,
+      }],
+      'usageMetadata': {'promptTokenCount': 12, 'totalTokenCount': 400},
+      'modelVersion': 'gemini-2.5-flash',
+  }
+
+
+def _sse_payload() -> bytes:
+  event = b'data: ' + json.dumps(_chunk()).encode('utf-8') + b'\r\n\r\n'
+  return event * _NUM_CHUNKS
+
+
+def _json_lines_payload() -> bytes:
+  """Unprefixed, pretty-printed JSON objects, as sent for error payloads."""
+  return (json.dumps(_chunk(), indent=2).encode('utf-8') + b'\n') * _NUM_CHUNKS
+
+
+def _reads(payload: bytes) -> list[bytes]:
+  return [
+      payload[i : i + _READ_SIZE] for i in range(0, len(payload), _READ_SIZE)
+  ]
+
+
+def _line_based_chunks(response: httpx.Response) -> list[str]:
+  """The line-by-line, per-character parser the framer replaced."""
+  chunks = []
+  chunk = ''
+  balance = 0
+  data_buffer: list[str] = []
+  for line in response.iter_lines():
+    if not line:
+      if data_buffer:
+        chunks.append('\n'.join(data_buffer))
+        data_buffer = []
+      continue
+    if line.startswith('data: '):
+      data_buffer.append(line[len('data: ') :])
+      continue
+    for c in line:
+      if c == '{':
+        balance += 1
+      elif c == '}':
+        balance -= 1
+    chunk += line
+    if balance == 0:
+      chunks.append(chunk)
+      chunk = ''
+  if chunk:
+    chunks.append(chunk)
+  if data_buffer:
+    chunks.append('\n'.join(data_buffer))
+  return chunks
+
+
+def _framed_chunks(response: httpx.Response) -> list[str]:
+  http_response = api_client.HttpResponse(headers={}, response_stream=response)
+  return list(http_response._iter_response_stream())
+
+
+@requires_benchmarks
+@pytest.mark.parametrize(
+    'name, payload',
+    [('sse', _sse_payload()), ('json lines', _json_lines_payload())],
+)
+def test_stream_framer_chunks_per_second(name, payload):
+  reads = _reads(payload)
+
+  def run(parse):
+    return parse(httpx.Response(200, content=iter(reads)))
+
+  assert run(_framed_chunks) == run(_line_based_chunks)
+
+  line_based = best_of(lambda: run(_line_based_chunks))
+  framed = best_of(lambda: run(_framed_chunks))
+  report(
+      f'stream framer ({name})',
+      line_based_chunks_per_sec=_NUM_CHUNKS / line_based,
+      framed_chunks_per_sec=_NUM_CHUNKS / framed,
+      speedup=line_based / framed,
+  )
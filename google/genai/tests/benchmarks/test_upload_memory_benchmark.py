@@ -0,0 +1,105 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+
+"""Benchmarks the peak resident memory of uploading a file from a path.
+
+Each upload runs in a fresh process, so that its peak RSS is its own. The
+stand-in upload server runs in the benchmark process and discards the data.
+Set GOOGLE_GENAI_UPLOAD_BENCHMARK_MB to change the size of the file.
+"""
+
+import os
+import subprocess
+import sys
+
+from ..client.resumable_upload_server import ResumableUploadServer
+from .benchmark_helper import report
+from .benchmark_helper import requires_benchmarks
+
+
+_MB = 1024 * 1024
+_SIZE = int(os.getenv('GOOGLE_GENAI_UPLOAD_BENCHMARK_MB', '2048')) * _MB
+_ROOT = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+)
+
+# Uploads a path through the memory map, or an opened file through reads.
+_UPLOAD = """
+import resource, sys, time
+from google.genai import _api_client, types
+
+base_url, upload_url, path, mode, size = sys.argv[1:]
+client = _api_client.BaseApiClient(vertexai=False, api_key='test_api_key')
+http_options = types.HttpOptions(base_url=base_url)
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+if mode == 'mmap':
+  client.upload_file(path, upload_url, int(size), http_options=http_options)
+else:
+  with open(path, 'rb') as file:
+    client.upload_file(file, upload_url, int(size), http_options=http_options)
+seconds = time.perf_counter() - start
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(before, after, seconds)
+"""
+
+
+def _upload(server: ResumableUploadServer, path: str, mode: str):
+  result = subprocess.run(
+      [
+          sys.executable,
+          '-c',
+          _UPLOAD,
+          server.url,
+          server.create_upload(_SIZE),
+          path,
+          mode,
+          str(_SIZE),
+      ],
+      env={**os.environ, 'PYTHONPATH': _ROOT},
+      capture_output=True,
+      check=True,
+      text=True,
+  )
+  before, after, seconds = result.stdout.split()
+  # ru_maxrss is in kilobytes on Linux.
+  return int(before) * 1024 / _MB, int(after) * 1024 / _MB, float(seconds)
+
+
+@requires_benchmarks
+def test_upload_peak_rss(tmp_path):
+  path = str(tmp_path / 'upload.bin')
+  with open(path, 'wb') as file:
+    block = os.urandom(_MB)
+    for _ in range(_SIZE // _MB):
+      file.write(block)
+
+  with ResumableUploadServer(store_data=False) as server:
+    read_before, read_peak, read_seconds = _upload(server, path, 'read')
+    mmap_before, mmap_peak, mmap_seconds = _upload(server, path, 'mmap')
+
+  report(
+      f'upload {_SIZE // _MB} MiB from a path',
+      read_peak_rss_mb=read_peak,
+      read_upload_rss_mb=read_peak - read_before,
+      mmap_peak_rss_mb=mmap_peak,
+      mmap_upload_rss_mb=mmap_peak - mmap_before,
+      read_seconds=read_seconds,
+      mmap_seconds=mmap_seconds,
+  )
+  assert mmap_peak - mmap_before <= read_peak - read_before
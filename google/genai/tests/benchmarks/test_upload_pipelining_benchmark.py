@@ -0,0 +1,73 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+
+"""Benchmarks the throughput of pipelined resumable uploads.
+
+The uploads go to a local stand-in for the upload service that adds a fixed
+latency to every chunk, which is what bounds a sequential upload.
+"""
+
+import io
+import os
+
+from ... import _api_client
+from ... import types
+from ..client.resumable_upload_server import ResumableUploadServer
+from .benchmark_helper import best_of
+from .benchmark_helper import report
+from .benchmark_helper import requires_benchmarks
+
+
+_MB = 1024 * 1024
+_DATA = os.urandom(64 * _MB)
+_CHUNK_SIZE = 2 * _MB
+_LATENCY = 0.02  # seconds
+
+
+def _upload_seconds(max_in_flight: int) -> float:
+  client = _api_client.BaseApiClient(vertexai=False, api_key='test_api_key')
+  with ResumableUploadServer(latency=_LATENCY) as server:
+    http_options = types.HttpOptions(
+        base_url=server.url,
+        upload_chunk_size=_CHUNK_SIZE,
+        upload_max_in_flight_chunks=max_in_flight,
+    )
+
+    def upload():
+      client.upload_file(
+          io.BytesIO(_DATA),
+          server.create_upload(len(_DATA)),
+          len(_DATA),
+          http_options=http_options,
+      )
+
+    return best_of(upload, repeat=3)
+
+
+@requires_benchmarks
+def test_pipelined_upload_throughput():
+  sequential = _upload_seconds(1)
+  for max_in_flight in (2, 4, 8):
+    pipelined = _upload_seconds(max_in_flight)
+    report(
+        f'upload 64 MiB, in flight={max_in_flight}',
+        sequential_mb_per_s=len(_DATA) / _MB / sequential,
+        pipelined_mb_per_s=len(_DATA) / _MB / pipelined,
+        speedup=sequential / pipelined,
+    )
+    assert pipelined < sequential
@@ -0,0 +1,160 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""A local stand-in for file downloads that supports range requests."""
+
+import http.server
+import re
+import socket
+import threading
+import time
+from typing import Optional
+
+
+class RangeDownloadServer:
+  """Serves `data` for every GET request, honoring `Range` headers.
+
+  The server can limit the bytes per second of each connection, ignore
+  ranges, and drop the connection of the first `drops` responses after
+  `drop_after` bytes of their body.
+
+  Usage:
+
+    with RangeDownloadServer(b'data') as server:
+      client = Client(api_key='key', http_options={'base_url': server.url})
+      client.files.download_to_file(file='files/abc', destination=path)
+  """
+
+  def __init__(
+      self,
+      data: bytes,
+      *,
+      accept_ranges: bool = True,
+      bytes_per_second: Optional[int] = None,
+      drop_after: Optional[int] = None,
+      drops: int = 0,
+      status_code: int = 200,
+  ):
+    self.data = data
+    self.accept_ranges = accept_ranges
+    self.bytes_per_second = bytes_per_second
+    self.drop_after = drop_after
+    self.drops = drops
+    self.status_code = status_code
+    self.paths: list[str] = []
+    self.ranges: list[Optional[str]] = []
+    self.max_in_flight = 0
+    self._in_flight = 0
+    self._lock = threading.Lock()
+    self._httpd: Optional[http.server.ThreadingHTTPServer] = None
+    self._thread: Optional[threading.Thread] = None
+
+  @property
+  def url(self) -> str:
+    assert self._httpd is not None, 'The server is not started.'
+    host, port = self._httpd.server_address[:2]
+    return f'http://{host}:{port}'
+
+  def __enter__(self) -> 'RangeDownloadServer':
+    server = self
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+      protocol_version = 'HTTP/1.1'
+      disable_nagle_algorithm = True
+
+      def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+      def do_GET(self):  # pylint: disable=invalid-name
+        with server._lock:
+          server.paths.append(self.path)
+          server.ranges.append(self.headers.get('Range'))
+          server._in_flight += 1
+          server.max_in_flight = max(server.max_in_flight, server._in_flight)
+          drop = server.drops > 0
+          server.drops -= drop
+        try:
+          server._respond(self, drop)
+        except (BrokenPipeError, ConnectionResetError):
+          # The client stopped reading, e.g. at the end of its range.
+          self.close_connection = True
+        finally:
+          with server._lock:
+            server._in_flight -= 1
+
+    self._httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    self._httpd.daemon_threads = True
+    self._thread = threading.Thread(
+        target=self._httpd.serve_forever,
+        kwargs={'poll_interval': 0.01},
+        daemon=True,
+    )
+    self._thread.start()
+    return self
+
+  def __exit__(self, *exc_info) -> None:
+    assert self._httpd is not None and self._thread is not None
+    self._httpd.shutdown()
+    self._httpd.server_close()
+    self._thread.join()
+
+  def _respond(self, handler, drop: bool) -> None:
+    if self.status_code != 200:
+      content = (
+          b'{"error": {"code": %d, "message": "Download failed.", "status":'
+          b' "NOT_FOUND"}}' % self.status_code
+      )
+      handler.send_response(self.status_code)
+      handler.send_header('Content-Type', 'application/json')
+      handler.send_header('Content-Length', str(len(content)))
+      handler.end_headers()
+      handler.wfile.write(content)
+      return
+
+    total = len(self.data)
+    start, end = 0, total
+    match = re.fullmatch(r'bytes=(\d+)-(\d*)', handler.headers.get('Range', ''))
+    if self.accept_ranges and match and int(match.group(1)) >= total:
+      handler.send_response(416)
+      handler.send_header('Content-Range', f'bytes */{total}')
+      handler.send_header('Content-Length', '0')
+      handler.end_headers()
+      return
+    if self.accept_ranges and match:
+      start = int(match.group(1))
+      end = min(int(match.group(2)) + 1, total) if match.group(2) else total
+      handler.send_response(206)
+      handler.send_header('Content-Range', f'bytes {start}-{end - 1}/{total}')
+    else:
+      handler.send_response(200)
+    if self.accept_ranges:
+      handler.send_header('Accept-Ranges', 'bytes')
+    handler.send_header('Content-Type', 'application/octet-stream')
+    handler.send_header('Content-Length', str(end - start))
+    handler.end_headers()
+
+    body = memoryview(self.data)[start:end]
+    if drop and self.drop_after is not None:
+      body = body[: self.drop_after]
+    piece_size = 64 * 1024
+    for offset in range(0, len(body), piece_size):
+      handler.wfile.write(body[offset : offset + piece_size])
+      if self.bytes_per_second:
+        time.sleep(piece_size / self.bytes_per_second)
+    if drop:
+      handler.close_connection = True
+      handler.connection.shutdown(socket.SHUT_RDWR)
@@ -0,0 +1,225 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""A local stand-in for the resumable upload protocol of the Files API."""
+
+import http.server
+import json
+import threading
+import time
+from typing import Optional
+import uuid
+
+
+class _Upload:
+  """The state of one resumable upload session."""
+
+  def __init__(self, size: int, store_data: bool):
+    self.size = size
+    self.store_data = store_data
+    self.chunks: dict[int, bytes] = {}
+    self.chunk_sizes: dict[int, int] = {}
+    self.received = 0
+    self.final = False
+
+  def commit(self, offset: int, chunk: bytes) -> None:
+    self.chunk_sizes[offset] = len(chunk)
+    if self.store_data:
+      self.chunks[offset] = chunk
+    while self.chunk_sizes.get(self.received):
+      self.received += self.chunk_sizes[self.received]
+
+  def data(self) -> bytes:
+    return b''.join(self.chunks[offset] for offset in sorted(self.chunks))
+
+
+class ResumableUploadServer:
+  """Serves the `start`, `upload`, `finalize` and `query` upload commands.
+
+  Chunks are committed after `latency` seconds, standing in for the round trip
+  to the real service. With `accept_out_of_order=False`, a chunk whose offset
+  is not the number of bytes committed so far is rejected while the upload
+  stays active. With `store_data=False`, only the size of each chunk is kept.
+
+  Usage:
+
+    with ResumableUploadServer() as server:
+      client = Client(api_key='key', http_options={'base_url': server.url})
+      client.files.upload(file=path)
+  """
+
+  def __init__(
+      self,
+      *,
+      latency: float = 0.0,
+      accept_out_of_order: bool = True,
+      store_data: bool = True,
+  ):
+    self.latency = latency
+    self.accept_out_of_order = accept_out_of_order
+    self.store_data = store_data
+    self.uploads: dict[str, _Upload] = {}
+    self.commands: list[str] = []
+    self.max_in_flight = 0
+    self._in_flight = 0
+    self._lock = threading.Lock()
+    self._httpd: Optional[http.server.ThreadingHTTPServer] = None
+    self._thread: Optional[threading.Thread] = None
+
+  @property
+  def url(self) -> str:
+    assert self._httpd is not None, 'The server is not started.'
+    host, port = self._httpd.server_address[:2]
+    return f'http://{host}:{port}'
+
+  def create_upload(self, size: int) -> str:
+    """Starts an upload session and returns its upload URL."""
+    upload_id = uuid.uuid4().hex
+    with self._lock:
+      self.uploads[upload_id] = _Upload(size, self.store_data)
+    return f'{self.url}/upload/sessions/{upload_id}'
+
+  def data(self, upload_url: str) -> bytes:
+    """Returns the bytes committed to the upload session at `upload_url`."""
+    return self.uploads[upload_url.rsplit('/', 1)[-1]].data()
+
+  def __enter__(self) -> 'ResumableUploadServer':
+    server = self
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+      protocol_version = 'HTTP/1.1'
+      disable_nagle_algorithm = True
+
+      def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+      def do_POST(self):  # pylint: disable=invalid-name
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        with server._lock:
+          server._in_flight += 1
+          server.max_in_flight = max(server.max_in_flight, server._in_flight)
+        try:
+          status, headers, payload = server._handle(
+              self.path, self.headers, body
+          )
+        finally:
+          with server._lock:
+            server._in_flight -= 1
+        content = json.dumps(payload).encode()
+        self.send_response(status)
+        for key, value in headers.items():
+          self.send_header(key, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    self._httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    self._httpd.daemon_threads = True
+    self._thread = threading.Thread(
+        target=self._httpd.serve_forever,
+        kwargs={'poll_interval': 0.01},
+        daemon=True,
+    )
+    self._thread.start()
+    return self
+
+  def __exit__(self, *exc_info) -> None:
+    assert self._httpd is not None and self._thread is not None
+    self._httpd.shutdown()
+    self._httpd.server_close()
+    self._thread.join()
+
+  def _handle(self, path, headers, body):
+    command = headers.get('X-Goog-Upload-Command', '')
+    with self._lock:
+      self.commands.append(command)
+    if command == 'start':
+      size = int(headers['X-Goog-Upload-Header-Content-Length'])
+      return (
+          200,
+          {
+              'X-Goog-Upload-Status': 'active',
+              'X-Goog-Upload-URL': self.create_upload(size),
+          },
+          {},
+      )
+
+    upload = self.uploads.get(path.rsplit('/', 1)[-1])
+    if upload is None or upload.final:
+      return (
+          404,
+          {'X-Goog-Upload-Status': 'final'},
+          _error(404, 'Upload session not found.'),
+      )
+    if command == 'query':
+      with self._lock:
+        received = upload.received
+      return (
+          200,
+          {
+              'X-Goog-Upload-Status': 'active',
+              'X-Goog-Upload-Size-Received': str(received),
+          },
+          {},
+      )
+
+    offset = int(headers['X-Goog-Upload-Offset'])
+    with self._lock:
+      out_of_order = offset != upload.received
+    if out_of_order and not self.accept_out_of_order:
+      return (
+          400,
+          {'X-Goog-Upload-Status': 'active'},
+          _error(400, f'Expected offset {upload.received}, got {offset}.'),
+      )
+    time.sleep(self.latency)
+    with self._lock:
+      upload.commit(offset, body)
+      if 'finalize' not in command:
+        return 200, {'X-Goog-Upload-Status': 'active'}, {}
+      upload.final = True
+      if upload.received != upload.size:
+        return (
+            400,
+            {'X-Goog-Upload-Status': 'final'},
+            _error(
+                400,
+                f'Received {upload.received} of {upload.size} bytes.',
+            ),
+        )
+      return (
+          200,
+          {'X-Goog-Upload-Status': 'final'},
+          {
+              'file': {
+                  'name': f'files/{uuid.uuid4().hex[:12]}',
+                  'sizeBytes': str(upload.size),
+                  'state': 'ACTIVE',
+              }
+          },
+      )
+
+
+def _error(code: int, message: str) -> dict[str, object]:
+  return {
+      'error': {
+          'code': code,
+          'message': message,
+          'status': 'INVALID_ARGUMENT' if code == 400 else 'NOT_FOUND',
+      }
+  }
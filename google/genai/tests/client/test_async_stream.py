@@ -50,42 +50,43 @@ EVENT_STREAM_DATA_WITH_ERROR = [
 class MockHTTPXResponse(httpx.Response):
   """Mock httpx.Response class for testing."""
 
-  def __init__(self, lines: List[str]):
-    self.aiter_lines = MagicMock()
-    self.aiter_lines.return_value.__aiter__ = MagicMock(
-        return_value=self._async_line_iterator(lines)
+  def __init__(self, lines: List[str], read_size: int = 7):
+    # Deliver the body in small reads so that lines and multi-byte characters
+    # straddle read boundaries, like they do on the wire.
+    data = "\n".join(lines).encode("utf-8")
+    self._reads = [
+        data[i : i + read_size] for i in range(0, len(data), read_size)
+    ]
+    self.aiter_bytes = MagicMock()
+    self.aiter_bytes.return_value.__aiter__ = MagicMock(
+        return_value=self._async_byte_iterator()
     )
     self.aclose = AsyncMock()
 
-  async def _async_line_iterator(self, lines: List[str]):
-    for line in lines:
-      yield line
+  async def _async_byte_iterator(self):
+    for data in self._reads:
+      yield data
 
 
 class MockAIOHTTPResponse(aiohttp.ClientResponse):
 
-  def __init__(self, lines: List[str]):
+  def __init__(self, lines: List[str], read_size: int = 7):
     self.content = MagicMock()
-    self.content.readline = AsyncMock()
-    # Simulate reading lines, each ending with newline bytes for readline behavior
+    self.content.readany = AsyncMock()
+    # Simulate the bytes arriving in small reads, ending with a newline.
     self._read_data = b"\n".join(line.encode("utf-8") for line in lines) + b"\n"
     self._read_pos = 0
-    self.content.readline.side_effect = self._async_read_line
+    self._read_size = read_size
+    self.content.readany.side_effect = self._async_readany
     self.release = MagicMock()
 
-  async def _async_read_line(self, **kwargs) -> bytes:
+  async def _async_readany(self) -> bytes:
     if self._read_pos >= len(self._read_data):
       return b""  # End of stream
 
-    newline_pos = self._read_data.find(b"\n", self._read_pos)
-    if newline_pos == -1:  # Should not happen with the appended '\n'
-      line = self._read_data[self._read_pos :]
-      self._read_pos = len(self._read_data)
-      return line
-    else:
-      line = self._read_data[self._read_pos : newline_pos + 1]
-      self._read_pos = newline_pos + 1
-      return line
+    data = self._read_data[self._read_pos : self._read_pos + self._read_size]
+    self._read_pos += len(data)
+    return data
 
 
 @pytest.fixture
@@ -131,7 +132,7 @@ async def test_httpx_simple_lines(responses: api_client.HttpResponse):
   results = [line async for line in responses._aiter_response_stream()]
 
   assert results == lines
-  mock_response.aiter_lines.assert_called_once()
+  mock_response.aiter_bytes.assert_called_once()
   mock_response.aclose.assert_called_once()
 
 
@@ -144,7 +145,7 @@ async def test_httpx_data_prefix(responses: api_client.HttpResponse):
   results = [line async for line in responses._aiter_response_stream()]
 
   assert results == ["{ 'message': 'hello' }", "{ 'status': 'ok' }"]
-  mock_response.aiter_lines.assert_called_once()
+  mock_response.aiter_bytes.assert_called_once()
   mock_response.aclose.assert_called_once()
 
 @pytest.mark.asyncio
@@ -161,7 +162,7 @@ async def test_httpx_multiline_data(responses: api_client.HttpResponse) -> None:
   results = [line async for line in responses._aiter_response_stream()]
 
   assert results == ["{\n  'message': 'hello'\n}"]
-  mock_response.aiter_lines.assert_called_once()
+  mock_response.aiter_bytes.assert_called_once()
   mock_response.aclose.assert_called_once()
 
 
@@ -173,7 +174,9 @@ def test_httpx_multiline_data_sync(responses: api_client.HttpResponse) -> None:
       "",
   ]
   mock_response = MagicMock(spec=httpx.Response)
-  mock_response.iter_lines.return_value = iter(lines)
+  mock_response.iter_bytes.return_value = iter(
+      [line.encode("utf-8") + b"\n" for line in lines]
+  )
   responses.response_stream = mock_response
 
   results = list(responses._iter_response_stream())
@@ -196,7 +199,7 @@ async def test_httpx_multiple_json_chunk(responses: api_client.HttpResponse):
   results = [line async for line in responses._aiter_response_stream()]
 
   assert results == ['{ "id": 1 }', '{ "id": 2 }', '{ "id": 3 }']
-  mock_response.aiter_lines.assert_called_once()
+  mock_response.aiter_bytes.assert_called_once()
   mock_response.aclose.assert_called_once()
 
 
@@ -210,7 +213,7 @@ async def test_httpx_incomplete_json_at_end(responses: api_client.HttpResponse):
 
   # The remaining chunk is yielded
   assert results == ['{ "partial": "data"']
-  mock_response.aiter_lines.assert_called_once()
+  mock_response.aiter_bytes.assert_called_once()
   mock_response.aclose.assert_called_once()
 
 
@@ -223,10 +226,48 @@ async def test_httpx_empty_stream(responses: api_client.HttpResponse):
   results = [line async for line in responses._aiter_response_stream()]
 
   assert results == []
-  mock_response.aiter_lines.assert_called_once()
+  mock_response.aiter_bytes.assert_called_once()
   mock_response.aclose.assert_called_once()
 
 
+def test_framer_crlf_events_split_across_reads():
+  framer = api_client._ResponseStreamFramer()
+  data = b'data: {"id": 1}\r\n\r\ndata: {"id": 2}\r\n\r\n'
+
+  results = []
+  for i in range(len(data)):
+    results.extend(framer.feed(data[i : i + 1]))
+  results.extend(framer.close())
+
+  assert results == ['{"id": 1}', '{"id": 2}']
+
+
+def test_framer_multibyte_character_split_across_reads():
+  framer = api_client._ResponseStreamFramer()
+  data = 'data: {"text": "héllo 👋"}\n\n'.encode("utf-8")
+  split = data.index("👋".encode("utf-8")) + 1
+
+  results = framer.feed(data[:split]) + framer.feed(data[split:])
+
+  assert results == ['{"text": "héllo 👋"}']
+  assert framer.close() == []
+
+
+def test_framer_multiline_error_payload():
+  framer = api_client._ResponseStreamFramer()
+  data = (
+      b'data: {"id": 1}\n\n'
+      b'{\n  "error": {\n    "code": 500,\n    "status": "INTERNAL"\n  }\n}\n'
+  )
+
+  results = framer.feed(data) + framer.close()
+
+  assert results == [
+      '{"id": 1}',
+      '{  "error": {    "code": 500,    "status": "INTERNAL"  }}',
+  ]
+
+
 # Async aiohttp
 @requires_aiohttp
 @pytest.mark.asyncio
@@ -240,7 +281,7 @@ async def test_aiohttp_simple_lines(responses: api_client.HttpResponse):
   results = [line async for line in responses._aiter_response_stream()]
 
   assert results == lines
-  mock_response.content.readline.assert_called()
+  mock_response.content.readany.assert_called()
   mock_response.release.assert_called_once()
 
 
@@ -256,7 +297,7 @@ async def test_aiohttp_data_prefix(responses: api_client.HttpResponse):
   results = [line async for line in responses._aiter_response_stream()]
 
   assert results == ["{ 'message': 'hello' }", "{ 'status': 'ok' }"]
-  mock_response.content.readline.assert_called()
+  mock_response.content.readany.assert_called()
   mock_response.release.assert_called_once()
 
 
@@ -278,7 +319,7 @@ async def test_aiohttp_multiple_json_chunks(responses: api_client.HttpResponse):
   results = [line async for line in responses._aiter_response_stream()]
 
   assert results == ['{ "id": 1 }', '{ "id": 2 }', '{ "id": 3 }']
-  mock_response.content.readline.assert_called()
+  mock_response.content.readany.assert_called()
   mock_response.release.assert_called_once()
 
 
@@ -296,49 +337,37 @@ async def test_aiohttp_incomplete_json_at_end(
   results = [line async for line in responses._aiter_response_stream()]
 
   assert results == ['{ "partial": "data"']
-  mock_response.content.readline.assert_called()
+  mock_response.content.readany.assert_called()
   mock_response.release.assert_called_once()
 
 
-class MockAIOHTTPResponseWithLineLimits(aiohttp.ClientResponse):
-  """Mock that enforces aiohttp's real readline limits.
+class MockAIOHTTPResponseWithReadLimits(aiohttp.ClientResponse):
+  """Mock that enforces aiohttp's real read limits.
 
-  Real aiohttp StreamReader raises LineTooLong when a line exceeds
-  `_high_water` (= limit * 2) bytes. The default limit is 2**16, so lines
-  over 131072 bytes fail unless `max_line_length` is explicitly passed.
+  Real aiohttp StreamReader buffers at most `_high_water` (= limit * 2) bytes,
+  so a line longer than that can only be observed across several reads. The
+  default limit is 2**16, so any SSE line over 131072 bytes is split.
   """
 
   DEFAULT_HIGH_WATER = 2**16 * 2  # 131072, same as aiohttp default
 
   def __init__(self, lines: List[str]):
     self.content = MagicMock()
-    self.content.readline = AsyncMock()
+    self.content.readany = AsyncMock()
     self._read_data = b"\n".join(line.encode("utf-8") for line in lines) + b"\n"
     self._read_pos = 0
-    self.content.readline.side_effect = self._async_read_line
+    self.content.readany.side_effect = self._async_readany
     self.release = MagicMock()
 
-  async def _async_read_line(
-      self, *, max_line_length=None
-  ) -> bytes:
+  async def _async_readany(self) -> bytes:
     if self._read_pos >= len(self._read_data):
       return b""
 
-    newline_pos = self._read_data.find(b"\n", self._read_pos)
-    if newline_pos == -1:
-      line = self._read_data[self._read_pos:]
-      self._read_pos = len(self._read_data)
-    else:
-      line = self._read_data[self._read_pos:newline_pos + 1]
-      self._read_pos = newline_pos + 1
-
-    # Enforce limit like real aiohttp StreamReader.readuntil does
-    limit = max_line_length or self.DEFAULT_HIGH_WATER
-    if len(line) > limit:
-      from aiohttp.http_exceptions import LineTooLong
-      raise LineTooLong(line[:100] + b"...", limit)
-
-    return line
+    data = self._read_data[
+        self._read_pos : self._read_pos + self.DEFAULT_HIGH_WATER
+    ]
+    self._read_pos += len(data)
+    return data
 
 
 @requires_aiohttp
@@ -346,19 +375,15 @@ class MockAIOHTTPResponseWithLineLimits(aiohttp.ClientResponse):
 async def test_aiohttp_large_sse_line_with_thought_signature(
     responses: api_client.HttpResponse,
 ):
-  """Verifies large SSE lines (e.g. thoughtSignature) don't hit LineTooLong.
-
-  aiohttp's StreamReader.readline() enforces a maximum line length based on
-  the session's read_bufsize (default: 2**16), which gives a _high_water limit
-  of 131072 bytes. Thinking models can return a thoughtSignature field large
-  enough to push a single SSE data: line past this limit, causing LineTooLong.
+  """Verifies large SSE lines (e.g. thoughtSignature) are streamed intact.
 
-  The fix passes max_line_length=READ_BUFFER_SIZE (4MB) explicitly on the
-  readline() call in _aiter_response_stream(), overriding the limit at the
-  call site regardless of how the underlying aiohttp session was configured.
+  Thinking models can return a thoughtSignature field large enough to push a
+  single SSE data: line past aiohttp's read buffer, so the line only arrives
+  across several reads. _aiter_response_stream() frames the raw bytes itself
+  instead of calling readline(), so no line length limit applies.
 
-  This test verifies the fix by using a mock that enforces the real aiohttp
-  readline limit and confirms a 150KB line is streamed successfully.
+  This test uses a mock that enforces the real aiohttp read limit and confirms
+  a 150KB line is streamed successfully.
   """
   api_client.has_aiohttp = True
 
@@ -370,7 +395,7 @@ async def test_aiohttp_large_sse_line_with_thought_signature(
   )
   lines = [f"data: {large_sse_payload}", ""]
 
-  mock_response = MockAIOHTTPResponseWithLineLimits(lines)
+  mock_response = MockAIOHTTPResponseWithReadLimits(lines)
   responses.response_stream = mock_response
 
   results = [line async for line in responses._aiter_response_stream()]
@@ -378,6 +403,7 @@ async def test_aiohttp_large_sse_line_with_thought_signature(
   assert len(results) == 1
   assert "thoughtSignature" in results[0]
   assert large_thought_sig in results[0]
+  assert mock_response.content.readany.call_count > 2
   mock_response.release.assert_called_once()
 
 
@@ -0,0 +1,236 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Tests for the retry budget and circuit breaker."""
+
+import asyncio
+from unittest import mock
+
+import httpx
+import pytest
+import tenacity
+
+from ... import _api_client
+from ... import _circuit_breaker
+from ... import errors
+from ... import types
+
+
+class _Clock:
+
+  def __init__(self):
+    self.now = 100.0
+
+  def __call__(self):
+    return self.now
+
+
+def test_retry_budget_has_a_reserve():
+  budget = _circuit_breaker.RetryBudget(0.5)
+
+  assert [budget.try_spend() for _ in range(11)] == [True] * 10 + [False]
+
+
+def test_retry_budget_earns_retries_from_successes():
+  budget = _circuit_breaker.RetryBudget(0.5)
+  for _ in range(10):
+    budget.try_spend()
+
+  budget.record_success()
+  assert not budget.try_spend()
+  budget.record_success()
+  assert budget.try_spend()
+
+
+def test_retry_budget_is_capped_at_the_reserve():
+  budget = _circuit_breaker.RetryBudget(1)
+  for _ in range(100):
+    budget.record_success()
+
+  assert sum(budget.try_spend() for _ in range(20)) == 10
+
+
+def test_retry_budget_rejects_negative_ratio():
+  with pytest.raises(ValueError, match='retry_budget_ratio'):
+    _circuit_breaker.RetryBudget(-0.1)
+
+
+def test_circuit_breaker_opens_after_consecutive_failures():
+  clock = _Clock()
+  breaker = _circuit_breaker.CircuitBreaker(3, 10, clock)
+
+  for failed in (True, True, False, True, True):
+    breaker.before_request('a')
+    breaker.record('a', failed)
+  breaker.before_request('a')
+  breaker.record('a', True)
+
+  with pytest.raises(errors.CircuitOpenError) as e:
+    breaker.before_request('a')
+  assert e.value.code == 503
+  assert e.value.backend == 'a'
+  assert e.value.retry_after == 10.0
+  breaker.before_request('b')
+
+
+def test_circuit_breaker_probes_when_half_open():
+  clock = _Clock()
+  breaker = _circuit_breaker.CircuitBreaker(1, 10, clock)
+  breaker.record('a', True)
+
+  clock.now += 10
+  breaker.before_request('a')
+  # Only one probe is in flight at a time.
+  with pytest.raises(errors.CircuitOpenError):
+    breaker.before_request('a')
+
+  breaker.record('a', False)
+  breaker.before_request('a')
+  breaker.before_request('a')
+
+
+def test_circuit_breaker_reopens_when_probe_fails():
+  clock = _Clock()
+  breaker = _circuit_breaker.CircuitBreaker(5, 10, clock)
+  for _ in range(5):
+    breaker.record('a', True)
+  clock.now += 10
+  breaker.before_request('a')
+
+  breaker.record('a', True)
+
+  with pytest.raises(errors.CircuitOpenError) as e:
+    breaker.before_request('a')
+  assert e.value.retry_after == 10.0
+
+
+def test_circuit_breaker_abandoned_probe_allows_another():
+  clock = _Clock()
+  breaker = _circuit_breaker.CircuitBreaker(1, 10, clock)
+  breaker.record('a', True)
+  clock.now += 10
+  breaker.before_request('a')
+
+  breaker.record('a', None)
+
+  breaker.before_request('a')
+
+
+def test_circuit_open_error_is_not_retried():
+  retry = _api_client.retry_args(types.HttpRetryOptions())['retry']
+
+  assert not retry.predicate(errors.CircuitOpenError('a', 1.0))
+
+
+def test_retry_args_stop_when_budget_is_spent():
+  budget = _circuit_breaker.RetryBudget(0)
+  calls = []
+
+  def fn():
+    calls.append(1)
+    errors.APIError.raise_for_response(httpx.Response(503, content=b''))
+
+  retrying = tenacity.Retrying(
+      sleep=lambda _: None,
+      **_api_client.retry_args(types.HttpRetryOptions(attempts=8), budget),
+  )
+  for _ in range(2):
+    with pytest.raises(errors.ServerError):
+      retrying(fn)
+
+  # 7 retries, then the 3 left in the reserve.
+  assert len(calls) == 8 + 4
+
+
+def _unavailable(request=None):
+  return httpx.Response(503, headers={'Retry-After': '0'}, content=b'')
+
+
+def _client(transport=None, async_transport=None, **retry_options):
+  return _api_client.BaseApiClient(
+      vertexai=False,
+      api_key='test_api_key',
+      http_options=types.HttpOptions(
+          retry_options=types.HttpRetryOptions(**retry_options),
+          client_args={'transport': transport},
+          async_client_args={'transport': async_transport},
+      ),
+  )
+
+
+def test_client_fails_fast_when_circuit_is_open():
+  transport = mock.Mock(spec=httpx.BaseTransport)
+  transport.handle_request.side_effect = _unavailable
+  client = _client(transport, attempts=5, circuit_breaker_threshold=2)
+
+  with pytest.raises(errors.CircuitOpenError):
+    client.request('post', 'models/a:generateContent', {})
+  with pytest.raises(errors.CircuitOpenError):
+    client.request('post', 'models/a:generateContent', {})
+  assert transport.handle_request.call_count == 2
+
+  # Other models have their own circuits.
+  with pytest.raises(errors.CircuitOpenError):
+    client.request('post', 'models/b:generateContent', {})
+  assert transport.handle_request.call_count == 4
+
+
+def test_client_retries_within_budget():
+  transport = mock.Mock(spec=httpx.BaseTransport)
+  transport.handle_request.side_effect = _unavailable
+  client = _client(transport, attempts=5, retry_budget_ratio=0)
+
+  for _ in range(3):
+    with pytest.raises(errors.ServerError):
+      client.request('post', 'models/a:generateContent', {})
+
+  assert transport.handle_request.call_count == 5 + 5 + 3
+
+
+def test_client_successes_close_the_circuit():
+  transport = mock.Mock(spec=httpx.BaseTransport)
+  transport.handle_request.side_effect = [
+      _unavailable(),
+      httpx.Response(200, content=b'{}'),
+      _unavailable(),
+      httpx.Response(200, content=b'{}'),
+  ]
+  client = _client(transport, attempts=2, circuit_breaker_threshold=2)
+
+  for _ in range(2):
+    client.request('post', 'models/a:generateContent', {})
+
+  assert transport.handle_request.call_count == 4
+
+
+def test_async_client_fails_fast_when_circuit_is_open():
+  transport = mock.Mock(spec=httpx.AsyncBaseTransport)
+  transport.handle_async_request.side_effect = _unavailable
+  client = _client(
+      async_transport=transport,
+      attempts=5,
+      circuit_breaker_threshold=2,
+      retry_budget_ratio=0.1,
+  )
+
+  async def run():
+    with pytest.raises(errors.CircuitOpenError):
+      await client.async_request('post', 'models/a:generateContent', {})
+
+  with mock.patch.object(_api_client, 'has_aiohttp', False):
+    asyncio.run(run())
+  assert transport.handle_async_request.call_count == 2
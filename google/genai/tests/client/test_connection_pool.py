@@ -0,0 +1,148 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Tests for the connection pool options of the default HTTP clients."""
+
+import asyncio
+from unittest import mock
+
+import httpx
+import pytest
+
+from ... import _api_client
+from ... import types
+
+
+def _pool_args(base_url='https://generativelanguage.googleapis.com/', **pool):
+  return _api_client._httpx_pool_args(
+      types.HttpOptions(
+          base_url=base_url,
+          connection_pool_options=types.ConnectionPoolOptions(**pool),
+      )
+  )
+
+
+def _patch_h2(installed):
+  return mock.patch.object(
+      _api_client.importlib.util,
+      'find_spec',
+      return_value=mock.Mock() if installed else None,
+  )
+
+
+def test_httpx_pool_args_default_to_httpx_defaults():
+  with _patch_h2(False):
+    assert _pool_args() == {}
+
+
+def test_httpx_pool_args_fill_unset_limits():
+  with _patch_h2(False):
+    args = _pool_args(max_connections=500)
+
+  assert args == {
+      'limits': httpx.Limits(
+          max_connections=500, max_keepalive_connections=20, keepalive_expiry=5
+      )
+  }
+
+
+@pytest.mark.parametrize(
+    'base_url, http2',
+    [
+        ('https://generativelanguage.googleapis.com/', True),
+        ('https://us-central1-aiplatform.googleapis.com/', True),
+        ('https://example.com/', False),
+        ('https://googleapis.com.example.com/', False),
+    ],
+)
+def test_httpx_pool_args_default_to_http2_for_googleapis(base_url, http2):
+  with _patch_h2(True):
+    assert _pool_args(base_url).get('http2', False) == http2
+  with _patch_h2(False):
+    assert 'http2' not in _pool_args(base_url)
+
+
+def test_httpx_pool_args_http2_can_be_disabled():
+  with _patch_h2(True):
+    assert 'http2' not in _pool_args(http2=False)
+
+
+def test_aiohttp_connector_args():
+  assert _api_client._aiohttp_connector_args(types.HttpOptions()) == {
+      'limit': 0
+  }
+  assert _api_client._aiohttp_connector_args(
+      types.HttpOptions(
+          connection_pool_options=types.ConnectionPoolOptions(
+              max_connections=300,
+              max_connections_per_host=50,
+              keepalive_expiry=30,
+          )
+      )
+  ) == {'limit': 300, 'limit_per_host': 50, 'keepalive_timeout': 30}
+
+
+def _client(**http_options):
+  return _api_client.BaseApiClient(
+      vertexai=False,
+      api_key='test_api_key',
+      http_options=types.HttpOptions(**http_options),
+  )
+
+
+def test_client_pools_use_the_options():
+  client = _client(
+      connection_pool_options=types.ConnectionPoolOptions(
+          max_connections=300, max_keepalive_connections=50, keepalive_expiry=9
+      )
+  )
+
+  for httpx_client in (client._httpx_client, client._async_httpx_client):
+    pool = httpx_client._transport._pool
+    assert pool._max_connections == 300
+    assert pool._max_keepalive_connections == 50
+    assert pool._keepalive_expiry == 9
+
+
+def test_client_args_take_precedence_over_pool_options():
+  client = _client(
+      client_args={'limits': httpx.Limits(max_connections=3)},
+      connection_pool_options=types.ConnectionPoolOptions(max_connections=300),
+  )
+
+  assert client._httpx_client._transport._pool._max_connections == 3
+  assert client._async_httpx_client._transport._pool._max_connections == 300
+
+
+@pytest.mark.skipif(
+    not _api_client.has_aiohttp, reason='aiohttp is not installed.'
+)
+def test_aiohttp_session_uses_the_options():
+  client = _client(
+      connection_pool_options=types.ConnectionPoolOptions(
+          max_connections=300, max_connections_per_host=50
+      )
+  )
+
+  async def run():
+    session = await client._get_aiohttp_session()
+    try:
+      return session.connector.limit, session.connector.limit_per_host
+    finally:
+      await session.close()
+
+  assert asyncio.run(run()) == (300, 50)
@@ -0,0 +1,311 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Tests for streaming file downloads in the api client layer."""
+
+import io
+import os
+from unittest import mock
+
+import anyio
+import httpx
+import pytest
+
+from ... import _api_client as api_client
+from ... import Client
+from ... import errors
+from ... import types
+from .range_download_server import RangeDownloadServer
+
+try:
+  import aiohttp  # pylint: disable=unused-import
+  AIOHTTP_NOT_INSTALLED = False
+except ImportError:
+  AIOHTTP_NOT_INSTALLED = True
+
+
+_CHUNK = 64 * 1024
+_DATA = os.urandom(20 * _CHUNK + 77)
+_PATH = 'files/abc:download?alt=media'
+
+
+class _WriteOnlySink:
+
+  def __init__(self):
+    self.chunks = []
+
+  def write(self, data):
+    self.chunks.append(bytes(data))
+
+
+def _client(server, **options):
+  return api_client.BaseApiClient(
+      vertexai=False,
+      api_key='test_api_key',
+      http_options=types.HttpOptions(
+          base_url=server.url, download_chunk_size=_CHUNK, **options
+      ),
+  )
+
+
+def test_download_to_path(tmp_path):
+  path = tmp_path / 'data.bin'
+  with RangeDownloadServer(_DATA) as server:
+    size = _client(server).download_file_to(_PATH, str(path))
+
+  assert size == len(_DATA)
+  assert path.read_bytes() == _DATA
+  assert server.ranges == [None]
+  assert server.paths == [f'/v1beta/{_PATH}']
+
+
+def test_download_fetches_segments_in_parallel():
+  sink = io.BytesIO(b'head')
+  sink.seek(4)
+  with RangeDownloadServer(_DATA, bytes_per_second=10_000_000) as server:
+    size = _client(server, download_parallel_segments=4).download_file_to(
+        _PATH, sink
+    )
+
+  assert size == len(_DATA)
+  assert sink.getvalue() == b'head' + _DATA
+  assert sink.tell() == 4 + len(_DATA)
+  assert server.ranges[0] == 'bytes=0-'
+  assert len(server.ranges) == 4
+  assert server.max_in_flight > 1
+
+
+def test_download_empty_file_in_parallel(tmp_path):
+  path = tmp_path / 'data.bin'
+  with RangeDownloadServer(b'') as server:
+    size = _client(server, download_parallel_segments=4).download_file_to(
+        _PATH, str(path)
+    )
+
+  assert size == 0
+  assert path.read_bytes() == b''
+  assert server.ranges == ['bytes=0-']
+
+
+def test_download_to_write_only_sink_is_sequential():
+  sink = _WriteOnlySink()
+  with RangeDownloadServer(_DATA) as server:
+    _client(server, download_parallel_segments=4).download_file_to(_PATH, sink)
+
+  assert b''.join(sink.chunks) == _DATA
+  assert all(len(chunk) <= _CHUNK for chunk in sink.chunks)
+  assert server.ranges == [None]
+
+
+def test_download_without_range_support_is_sequential():
+  sink = io.BytesIO()
+  with RangeDownloadServer(_DATA, accept_ranges=False) as server:
+    _client(server, download_parallel_segments=4).download_file_to(_PATH, sink)
+
+  assert sink.getvalue() == _DATA
+  assert len(server.ranges) == 1
+
+
+@pytest.mark.parametrize('accept_ranges', [True, False])
+def test_download_resumes_after_dropped_connection(accept_ranges):
+  sink = io.BytesIO()
+  with RangeDownloadServer(
+      _DATA, accept_ranges=accept_ranges, drop_after=3 * _CHUNK, drops=1
+  ) as server:
+    _client(server, download_max_resumes=1).download_file_to(_PATH, sink)
+
+  assert sink.getvalue() == _DATA
+  assert server.ranges == [None, f'bytes={3 * _CHUNK}-']
+
+
+_LINES = [
+    f'{{"line": {i}, "pad": "{"x" * (i * 997 % 5000)}"}}'.encode()
+    for i in range(200)
+]
+
+
+def test_iter_download_lines_resumes_after_dropped_connection():
+  data = b'\r\n'.join(_LINES) + b'\n'
+  with RangeDownloadServer(data, drop_after=2 * _CHUNK, drops=1) as server:
+    lines = list(
+        _client(server, download_max_resumes=1).iter_download_lines(_PATH)
+    )
+
+  assert lines == _LINES
+  assert server.ranges == ['bytes=0-', f'bytes={2 * _CHUNK}-']
+
+
+def test_download_resumes_dropped_segment():
+  sink = io.BytesIO()
+  with RangeDownloadServer(_DATA, drop_after=_CHUNK, drops=1) as server:
+    _client(
+        server, download_parallel_segments=2, download_max_resumes=1
+    ).download_file_to(_PATH, sink)
+
+  assert sink.getvalue() == _DATA
+  assert len(server.ranges) == 3
+
+
+def test_download_raises_dropped_connection_without_resumes():
+  with RangeDownloadServer(_DATA, drop_after=_CHUNK, drops=1) as server:
+    with pytest.raises(httpx.TransportError):
+      _client(server).download_file_to(_PATH, io.BytesIO())
+
+
+def test_download_raises_api_error():
+  with RangeDownloadServer(_DATA, status_code=404) as server:
+    with pytest.raises(errors.ClientError, match='Download failed'):
+      _client(server).download_file_to(_PATH, io.BytesIO())
+
+
+@pytest.mark.parametrize(
+    'options',
+    [
+        {'download_chunk_size': 0},
+        {'download_parallel_segments': 0},
+        {'download_max_resumes': -1},
+    ],
+)
+def test_download_rejects_invalid_options(options):
+  client = api_client.BaseApiClient(vertexai=False, api_key='test_api_key')
+  with pytest.raises(ValueError, match=next(iter(options))):
+    client.download_file_to(
+        _PATH, io.BytesIO(), http_options=types.HttpOptions(**options)
+    )
+
+
+def test_download_rejects_option_of_wrong_type():
+  client = api_client.BaseApiClient(vertexai=False, api_key='test_api_key')
+  with pytest.raises(TypeError, match='download_chunk_size'):
+    client.download_file_to(
+        _PATH, io.BytesIO(), http_options={'download_chunk_size': '64'}
+    )
+
+
+def test_files_download_to_file(tmp_path):
+  path = tmp_path / 'video.mp4'
+  with RangeDownloadServer(_DATA) as server:
+    client = Client(
+        api_key='test_api_key',
+        http_options=types.HttpOptions(base_url=server.url),
+    )
+    size = client.files.download_to_file(file='files/abc', destination=path)
+
+  assert size == len(_DATA)
+  assert path.read_bytes() == _DATA
+  assert server.paths == ['/v1beta/files/abc:download?alt=media']
+
+
+def test_file_search_stores_download_media_to_file():
+  sink = io.BytesIO()
+  with RangeDownloadServer(_DATA) as server:
+    client = Client(
+        api_key='test_api_key',
+        http_options=types.HttpOptions(base_url=server.url),
+    )
+    client.file_search_stores.download_media_to_file(
+        media_id='fileSearchStores/store/media/blob', destination=sink
+    )
+
+  assert sink.getvalue() == _DATA
+  assert server.paths == ['/v1beta/fileSearchStores/store/media/blob?alt=media']
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('use_aiohttp', [False, True])
+async def test_async_download_fetches_segments_and_resumes(
+    tmp_path, use_aiohttp
+):
+  if use_aiohttp and AIOHTTP_NOT_INSTALLED:
+    pytest.skip('aiohttp is not installed.')
+  path = tmp_path / 'data.bin'
+  with RangeDownloadServer(
+      _DATA, bytes_per_second=10_000_000, drop_after=_CHUNK, drops=1
+  ) as server:
+    client = _client(
+        server, download_parallel_segments=4, download_max_resumes=1
+    )
+    with mock.patch.object(client, '_use_aiohttp', return_value=use_aiohttp):
+      size = await client.async_download_file_to(_PATH, str(path))
+
+  assert size == len(_DATA)
+  assert path.read_bytes() == _DATA
+  assert len(server.ranges) == 5
+  assert server.max_in_flight > 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('use_aiohttp', [False, True])
+async def test_async_download_empty_file_in_parallel(use_aiohttp):
+  if use_aiohttp and AIOHTTP_NOT_INSTALLED:
+    pytest.skip('aiohttp is not installed.')
+  sink = io.BytesIO()
+  with RangeDownloadServer(b'') as server:
+    client = _client(server, download_parallel_segments=4)
+    with mock.patch.object(client, '_use_aiohttp', return_value=use_aiohttp):
+      size = await client.async_download_file_to(_PATH, sink)
+
+  assert size == 0
+  assert sink.getvalue() == b''
+  assert server.ranges == ['bytes=0-']
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('use_aiohttp', [False, True])
+async def test_async_iter_download_lines(use_aiohttp):
+  if use_aiohttp and AIOHTTP_NOT_INSTALLED:
+    pytest.skip('aiohttp is not installed.')
+  data = b'\n'.join(_LINES)
+  with RangeDownloadServer(data, drop_after=_CHUNK, drops=1) as server:
+    client = _client(server, download_max_resumes=1)
+    with mock.patch.object(client, '_use_aiohttp', return_value=use_aiohttp):
+      lines = [
+          line async for line in client.async_iter_download_lines(_PATH)
+      ]
+
+  assert lines == _LINES
+
+
+@pytest.mark.asyncio
+async def test_async_download_to_async_file(tmp_path):
+  path = tmp_path / 'data.bin'
+  with RangeDownloadServer(_DATA) as server:
+    client = _client(server)
+    with mock.patch.object(client, '_use_aiohttp', return_value=False):
+      async with await anyio.open_file(path, 'wb') as file:
+        await client.async_download_file_to(_PATH, file)
+
+  assert path.read_bytes() == _DATA
+
+
+@pytest.mark.asyncio
+async def test_async_files_download_to_file():
+  sink = io.BytesIO()
+  with RangeDownloadServer(_DATA) as server:
+    client = Client(
+        api_key='test_api_key',
+        http_options=types.HttpOptions(base_url=server.url),
+    )
+    with mock.patch.object(
+        client._api_client, '_use_aiohttp', return_value=False
+    ):
+      size = await client.aio.files.download_to_file(
+          file='files/abc', destination=sink
+      )
+
+  assert size == len(_DATA)
+  assert sink.getvalue() == _DATA
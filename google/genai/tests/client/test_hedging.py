@@ -0,0 +1,315 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Tests for hedged requests."""
+
+import asyncio
+import threading
+import time
+from unittest import mock
+
+import httpx
+import pytest
+
+from ... import _api_client
+from ... import _hedging
+from ... import types
+
+
+def _hedger(**options):
+  return _hedging.Hedger(types.HedgingOptions(**options))
+
+
+@pytest.mark.parametrize(
+    'options, message',
+    [
+        ({}, 'delay or a latency_percentile'),
+        ({'delay': -1}, 'delay'),
+        ({'latency_percentile': 0}, 'latency_percentile'),
+        ({'latency_percentile': 101}, 'latency_percentile'),
+    ],
+)
+def test_rejects_invalid_options(options, message):
+  with pytest.raises(ValueError, match=message):
+    _hedger(**options)
+
+
+@pytest.mark.parametrize(
+    'url, key',
+    [
+        (
+            'https://host/v1beta/models/gemini:countTokens',
+            '/v1beta/models/gemini:countTokens',
+        ),
+        (
+            'https://host/v1beta/models/gemini:generateContent?key=k',
+            '/v1beta/models/gemini:generateContent',
+        ),
+        ('https://host/v1beta/models/gemini:streamGenerateContent', None),
+        ('https://host/v1beta/files/abc', None),
+    ],
+)
+def test_key_of(url, key):
+  assert _hedger(delay=1).key_of(url) == key
+
+
+def test_key_of_custom_methods():
+  hedger = _hedger(delay=1, methods=['embedContent'])
+
+  assert hedger.key_of('https://host/models/m:embedContent')
+  assert hedger.key_of('https://host/models/m:countTokens') is None
+
+
+def test_hedging_delay_uses_percentile_once_there_are_samples():
+  hedger = _hedger(delay=5, latency_percentile=90)
+  for latency in range(1, 20):
+    hedger._record_latency('k', latency)
+  assert hedger.hedging_delay('k') == 5
+
+  hedger._record_latency('k', 20)
+  assert hedger.hedging_delay('k') == 18
+  assert hedger.hedging_delay('other') == 5
+
+
+def test_hedging_delay_without_fallback():
+  hedger = _hedger(latency_percentile=50)
+
+  assert hedger.hedging_delay('k') is None
+  assert hedger.run('k', lambda: 'response') == 'response'
+  assert hedger.stats == _hedging.HedgingStats(requests=1)
+
+
+def test_run_fast_request_is_not_hedged():
+  hedger = _hedger(delay=1)
+  send = mock.Mock(return_value='response')
+
+  assert hedger.run('k', send) == 'response'
+  send.assert_called_once()
+  assert hedger.stats == _hedging.HedgingStats(requests=1)
+
+
+def test_run_hedge_wins_over_slow_request():
+  hedger = _hedger(delay=0.01)
+  release = threading.Event()
+  calls = []
+
+  def send():
+    calls.append(1)
+    if len(calls) == 1:
+      release.wait(5)
+      return 'slow'
+    return 'fast'
+
+  assert hedger.run('k', send) == 'fast'
+  release.set()
+  assert hedger.stats == _hedging.HedgingStats(
+      requests=1, hedges_sent=1, hedges_won=1
+  )
+
+
+def test_run_failed_hedge_waits_for_request():
+  hedger = _hedger(delay=0.01)
+  calls = []
+
+  def send():
+    calls.append(1)
+    if len(calls) == 1:
+      time.sleep(0.1)
+      return 'slow'
+    raise ValueError('hedge failed')
+
+  assert hedger.run('k', send) == 'slow'
+  assert hedger.stats == _hedging.HedgingStats(requests=1, hedges_sent=1)
+
+
+def test_run_fast_failure_is_not_hedged():
+  hedger = _hedger(delay=1)
+  send = mock.Mock(side_effect=ValueError('failed'))
+
+  with pytest.raises(ValueError, match='failed'):
+    hedger.run('k', send)
+  send.assert_called_once()
+
+
+def test_run_raises_first_error_when_both_fail():
+  hedger = _hedger(delay=0.01)
+  calls = []
+
+  def send():
+    calls.append(1)
+    if len(calls) == 1:
+      time.sleep(0.05)
+      raise ValueError('request failed')
+    raise KeyError('hedge failed')
+
+  with pytest.raises(KeyError):
+    hedger.run('k', send)
+
+
+def test_run_does_not_queue_more_callers_than_workers():
+  hedger = _hedger(delay=0.05)
+  callers = 2 * _hedging._MAX_WORKERS + 16
+  lock = threading.Lock()
+  in_flight = []
+  max_in_flight = []
+
+  def send():
+    with lock:
+      in_flight.append(1)
+      max_in_flight.append(len(in_flight))
+    time.sleep(0.3)
+    with lock:
+      in_flight.pop()
+    return 'response'
+
+  threads = [
+      threading.Thread(target=hedger.run, args=('k', send))
+      for _ in range(callers)
+  ]
+  start = time.monotonic()
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+  elapsed = time.monotonic() - start
+
+  stats = hedger.stats
+  assert elapsed < 0.9
+  assert max(max_in_flight) > _hedging._MAX_WORKERS
+  assert stats.requests == callers
+  assert stats.hedges_skipped >= callers - _hedging._MAX_WORKERS
+  assert stats.hedges_sent + stats.hedges_skipped == callers
+  assert hedger._busy_workers == 0
+
+
+def test_async_run_cancels_slow_request():
+  hedger = _hedger(delay=0.01)
+  cancelled = []
+
+  async def run():
+    calls = []
+
+    async def send():
+      calls.append(1)
+      if len(calls) == 1:
+        try:
+          await asyncio.sleep(5)
+        except asyncio.CancelledError:
+          cancelled.append(1)
+          raise
+        return 'slow'
+      return 'fast'
+
+    response = await hedger.async_run('k', send)
+    await asyncio.sleep(0)
+    return response
+
+  assert asyncio.run(run()) == 'fast'
+  assert cancelled == [1]
+  assert hedger.stats == _hedging.HedgingStats(
+      requests=1, hedges_sent=1, hedges_won=1
+  )
+
+
+def test_async_run_fast_request_is_not_hedged():
+  hedger = _hedger(delay=1)
+  send = mock.AsyncMock(return_value='response')
+
+  assert asyncio.run(hedger.async_run('k', send)) == 'response'
+  send.assert_awaited_once()
+
+
+def _client(transport=None, async_transport=None, **options):
+  return _api_client.BaseApiClient(
+      vertexai=False,
+      api_key='test_api_key',
+      http_options=types.HttpOptions(
+          hedging_options=types.HedgingOptions(**options),
+          client_args={'transport': transport},
+          async_client_args={'transport': async_transport},
+      ),
+  )
+
+
+def test_client_hedges_slow_requests():
+  release = threading.Event()
+  calls = []
+
+  def handle_request(request):
+    calls.append(request.url.path)
+    if len(calls) == 1:
+      release.wait(5)
+      return httpx.Response(200, content=b'{"slow": true}')
+    return httpx.Response(200, content=b'{"slow": false}')
+
+  transport = mock.Mock(spec=httpx.BaseTransport)
+  transport.handle_request.side_effect = handle_request
+  client = _client(transport, delay=0.01)
+
+  response = client.request('post', 'models/gemini:countTokens', {})
+  release.set()
+
+  assert response.body == '{"slow": false}'
+  assert calls == ['/v1beta/models/gemini:countTokens'] * 2
+  assert client.hedging_stats == _hedging.HedgingStats(
+      requests=1, hedges_sent=1, hedges_won=1
+  )
+
+
+def test_client_does_not_hedge_other_methods():
+  transport = mock.Mock(spec=httpx.BaseTransport)
+  transport.handle_request.return_value = httpx.Response(200, content=b'{}')
+  client = _client(transport, delay=0)
+
+  client.request('get', 'files/abc', {})
+
+  transport.handle_request.assert_called_once()
+  assert client.hedging_stats == _hedging.HedgingStats()
+
+
+def test_client_without_hedging():
+  client = _api_client.BaseApiClient(vertexai=False, api_key='test_api_key')
+
+  assert client.hedging_stats is None
+
+
+def test_async_client_hedges_slow_requests():
+  calls = []
+
+  async def handle_async_request(request):
+    calls.append(1)
+    if len(calls) == 1:
+      await asyncio.sleep(5)
+    return httpx.Response(200, content=b'{}')
+
+  transport = mock.Mock(spec=httpx.AsyncBaseTransport)
+  transport.handle_async_request.side_effect = handle_async_request
+  client = _client(async_transport=transport, delay=0.01)
+
+  async def run():
+    return await client.async_request(
+        'post', 'models/gemini:embedContent', {}
+    )
+
+  start = time.monotonic()
+  with mock.patch.object(_api_client, 'has_aiohttp', False):
+    asyncio.run(run())
+
+  assert time.monotonic() - start < 5
+  assert client.hedging_stats == _hedging.HedgingStats(
+      requests=1, hedges_sent=1, hedges_won=1
+  )
@@ -33,6 +33,19 @@ def test_patch_http_options_with_copies_all_fields():
       extra_body={'key': 'value'},
       retry_options=types.HttpRetryOptions(attempts=10),
       base_url_resource_scope=types.ResourceScope.COLLECTION,
+      json_codec=types.JsonCodec.JSON,
+      stream_inline_data=True,
+      skip_response_validation=True,
+      upload_chunk_size=256 * 1024,
+      upload_max_in_flight_chunks=4,
+      download_chunk_size=1024,
+      download_parallel_segments=4,
+      download_max_resumes=2,
+      rate_limit_options=types.RateLimitOptions(requests_per_minute=60),
+      hedging_options=types.HedgingOptions(delay=0.5),
+      connection_pool_options=types.ConnectionPoolOptions(max_connections=10),
+      token_refresh_margin=60,
+      instrumentation_hooks=[print],
   )
   options = types.HttpOptions()
   patched = _api_client.patch_http_options(options, patch_options)
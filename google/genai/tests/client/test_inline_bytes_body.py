@@ -0,0 +1,170 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Tests for streaming inline bytes into the request body."""
+
+import base64
+import json
+import os
+from unittest import mock
+
+import httpx
+import pytest
+
+from ... import _api_client as api_client
+from ... import _json_codec
+from ... import Client
+from ... import types
+
+
+_IMAGE_BYTES = os.urandom(2 * api_client._InlineBytesBody._BASE64_SLICE_SIZE + 7)
+
+_GENERATE_CONTENT_RESPONSE = httpx.Response(
+    200,
+    content=json.dumps({
+        'candidates': [
+            {'content': {'parts': [{'text': 'a cat'}], 'role': 'model'}}
+        ]
+    }).encode('utf-8'),
+)
+
+
+def _expected_request_body(data):
+  return {
+      'contents': [{
+          'parts': [
+              {
+                  'inlineData': {
+                      'data': base64.urlsafe_b64encode(data).decode('ascii'),
+                      'mimeType': 'image/png',
+                  }
+              },
+              {'text': 'What is this?'},
+          ],
+          'role': 'user',
+      }]
+  }
+
+
+def test_inline_bytes_body_matches_json_encoding():
+  data = {
+      'contents': [{'parts': [{'inlineData': {'data': _IMAGE_BYTES}}]}],
+      'list': [b'', b'a', b'ab', b'abc'],
+  }
+  codec = _json_codec.get_codec(types.JsonCodec.JSON)
+
+  body = api_client._InlineBytesBody.encode(data, codec)
+
+  content = b''.join(body.iter_bytes())
+  assert len(content) == body.content_length
+  assert json.loads(content) == {
+      'contents': [{
+          'parts': [{
+              'inlineData': {
+                  'data': base64.urlsafe_b64encode(_IMAGE_BYTES).decode('ascii')
+              }
+          }]
+      }],
+      'list': ['', 'YQ==', 'YWI=', 'YWJj'],
+  }
+
+
+def test_inline_bytes_body_without_bytes_is_plain_json():
+  codec = _json_codec.get_codec(types.JsonCodec.JSON)
+
+  assert api_client._InlineBytesBody.encode({'a': 1}, codec) == b'{"a": 1}'
+
+
+def test_generate_content_streams_inline_bytes():
+  client = Client(
+      api_key='test_api_key',
+      http_options=types.HttpOptions(stream_inline_data=True),
+  )
+  sent = {}
+
+  def send(request, **kwargs):
+    # The body is a generator until httpx reads it.
+    assert isinstance(request.stream, httpx.SyncByteStream)
+    sent['headers'] = request.headers
+    sent['content'] = b''.join(request.stream)
+    return _GENERATE_CONTENT_RESPONSE
+
+  with mock.patch.object(httpx.Client, 'send', side_effect=send):
+    response = client.models.generate_content(
+        model='gemini-2.5-flash',
+        contents=[
+            types.Part.from_bytes(data=_IMAGE_BYTES, mime_type='image/png'),
+            'What is this?',
+        ],
+    )
+
+  assert response.text == 'a cat'
+  assert int(sent['headers']['content-length']) == len(sent['content'])
+  assert 'transfer-encoding' not in sent['headers']
+  assert json.loads(sent['content']) == _expected_request_body(_IMAGE_BYTES)
+  # The shared client headers are not modified.
+  assert 'Content-Length' not in client._api_client._http_options.headers
+
+
+@pytest.mark.asyncio
+async def test_generate_content_streams_inline_bytes_async():
+  sent = {}
+
+  async def handle_async_request(request):
+    sent['headers'] = request.headers
+    sent['content'] = b''.join([chunk async for chunk in request.stream])
+    return _GENERATE_CONTENT_RESPONSE
+
+  transport = mock.Mock(spec=httpx.AsyncBaseTransport)
+  transport.handle_async_request = handle_async_request
+  client = Client(
+      api_key='test_api_key',
+      http_options=types.HttpOptions(
+          stream_inline_data=True,
+          async_client_args={'transport': transport},
+      ),
+  )
+
+  response = await client.aio.models.generate_content(
+      model='gemini-2.5-flash',
+      contents=[
+          types.Part.from_bytes(data=_IMAGE_BYTES, mime_type='image/png'),
+          'What is this?',
+      ],
+  )
+
+  assert response.text == 'a cat'
+  assert int(sent['headers']['content-length']) == len(sent['content'])
+  assert json.loads(sent['content']) == _expected_request_body(_IMAGE_BYTES)
+
+
+def test_inline_bytes_are_base64_encoded_by_default():
+  client = Client(api_key='test_api_key')
+
+  with mock.patch.object(
+      httpx.Client, 'send', return_value=_GENERATE_CONTENT_RESPONSE
+  ) as mock_send:
+    client.models.generate_content(
+        model='gemini-2.5-flash',
+        contents=[
+            types.Part.from_bytes(data=b'image', mime_type='image/png'),
+            'What is this?',
+        ],
+    )
+
+  sent_request = mock_send.call_args.args[0]
+  assert json.loads(sent_request.content) == _expected_request_body(b'image')
@@ -0,0 +1,386 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Tests for the instrumentation of requests."""
+
+import asyncio
+from unittest import mock
+
+import httpx
+import pytest
+
+from ... import _api_client
+from ... import errors
+from ... import instrumentation
+from ... import types
+
+
+def _client(events, transport=None, async_transport=None, **options):
+  return _api_client.BaseApiClient(
+      vertexai=False,
+      api_key='test_api_key',
+      http_options=types.HttpOptions(
+          instrumentation_hooks=[events.append],
+          client_args={'transport': transport},
+          async_client_args={'transport': async_transport},
+          **options,
+      ),
+  )
+
+
+def _names(events):
+  return [event.name for event in events]
+
+
+def test_request_events():
+  events = []
+  transport = httpx.MockTransport(
+      lambda request: httpx.Response(200, content=b'{"a": 1}')
+  )
+  client = _client(events, transport)
+
+  client.request('post', 'models/gemini:countTokens', {'contents': []})
+
+  assert _names(events) == [
+      'request.build',
+      'request.encode',
+      'request.attempt',
+      'request',
+  ]
+  assert {event.request_id for event in events} == {1}
+  assert events[2].attributes == {'attempt': 1}
+  assert events[-1].attributes == {
+      'method': 'POST',
+      'url': (
+          'https://generativelanguage.googleapis.com/v1beta/models/'
+          'gemini:countTokens'
+      ),
+      'attempts': 1,
+  }
+  assert all(event.duration >= 0 for event in events)
+  assert events[-1].start_time <= events[0].start_time + 1e-3
+
+
+def test_requests_have_distinct_ids():
+  events = []
+  transport = httpx.MockTransport(lambda request: httpx.Response(200))
+  client = _client(events, transport)
+
+  client.request('get', 'files/a', {})
+  client.request('get', 'files/b', {})
+
+  assert [e.request_id for e in events if e.name == 'request'] == [1, 2]
+
+
+def test_retried_request_events():
+  events = []
+  responses = iter([
+      httpx.Response(503, headers={'retry-after': '0'}, json={}),
+      httpx.Response(200, content=b'{}'),
+  ])
+  transport = httpx.MockTransport(lambda request: next(responses))
+  client = _client(
+      events,
+      transport,
+      retry_options=types.HttpRetryOptions(attempts=2, initial_delay=0),
+  )
+
+  client.request('get', 'files/a', {})
+
+  attempts = [e.attributes for e in events if e.name == 'request.attempt']
+  assert attempts == [
+      {
+          'attempt': 1,
+          'error': 'ServerError',
+          'status_code': 503,
+          'retry_delay': 0.0,
+          'retry_after': 0.0,
+      },
+      {'attempt': 2},
+  ]
+  assert events[-1].attributes['attempts'] == 2
+
+
+def test_retried_request_event_without_server_hint():
+  events = []
+  responses = iter([
+      httpx.Response(503, json={}),
+      httpx.Response(503, json={}),
+  ])
+  transport = httpx.MockTransport(lambda request: next(responses))
+  client = _client(
+      events,
+      transport,
+      retry_options=types.HttpRetryOptions(
+          attempts=2, initial_delay=0.01, max_delay=0.01, jitter=0
+      ),
+  )
+
+  with pytest.raises(errors.ServerError):
+    client.request('get', 'files/a', {})
+
+  assert _names(events)[-3:] == [
+      'request.attempt',
+      'request.attempt',
+      'request',
+  ]
+  attempts = [e.attributes for e in events if e.name == 'request.attempt']
+  assert attempts[0]['retry_delay'] == pytest.approx(0.01)
+  assert attempts[0]['retry_after'] is None
+  # The last attempt is not retried.
+  assert attempts[1] == {
+      'attempt': 2,
+      'error': 'ServerError',
+      'status_code': 503,
+  }
+
+
+def test_async_retried_request_events():
+  events = []
+  responses = iter([
+      httpx.Response(429, headers={'retry-after': '0'}, json={}),
+      httpx.Response(200, content=b'{}'),
+  ])
+  transport = httpx.MockTransport(lambda request: next(responses))
+  client = _client(
+      events,
+      async_transport=transport,
+      retry_options=types.HttpRetryOptions(attempts=2, initial_delay=0),
+  )
+
+  with mock.patch.object(_api_client, 'has_aiohttp', False):
+    asyncio.run(client.async_request('get', 'files/a', {}))
+
+  attempts = [e.attributes for e in events if e.name == 'request.attempt']
+  assert attempts == [
+      {
+          'attempt': 1,
+          'error': 'ClientError',
+          'status_code': 429,
+          'retry_delay': 0.0,
+          'retry_after': 0.0,
+      },
+      {'attempt': 2},
+  ]
+
+
+def test_failed_request_event():
+  events = []
+  transport = httpx.MockTransport(lambda request: httpx.Response(404, json={}))
+  client = _client(events, transport)
+
+  with pytest.raises(errors.ClientError):
+    client.request('get', 'files/a', {})
+
+  assert events[-1].name == 'request'
+  assert events[-1].attributes['error'] == 'ClientError'
+  assert events[-1].attributes['status_code'] == 404
+
+
+def test_streamed_request_events():
+  events = []
+  transport = httpx.MockTransport(
+      lambda request: httpx.Response(
+          200, content=b'data: {"a": 1}\n\ndata: {"a": 2}\n\n'
+      )
+  )
+  client = _client(events, transport)
+
+  chunks = list(
+      client.request_streamed('post', 'models/gemini:streamGenerateContent', {})
+  )
+
+  assert len(chunks) == 2
+  assert _names(events) == [
+      'request.build',
+      'request.attempt',
+      'response.decode',
+      'stream.chunk',
+      'response.decode',
+      'stream.chunk',
+      'request',
+  ]
+  assert [e.attributes for e in events if e.name == 'stream.chunk'] == [
+      {'index': 0},
+      {'index': 1},
+  ]
+
+
+def test_async_request_events():
+  events = []
+  transport = httpx.MockTransport(
+      lambda request: httpx.Response(200, content=b'{}')
+  )
+  client = _client(events, async_transport=transport)
+
+  with mock.patch.object(_api_client, 'has_aiohttp', False):
+    asyncio.run(
+        client.async_request(
+            'post', 'models/gemini:countTokens', {'contents': []}
+        )
+    )
+
+  assert _names(events) == [
+      'request.build',
+      'request.encode',
+      'request.attempt',
+      'request',
+  ]
+
+
+def test_async_streamed_request_events():
+  events = []
+  transport = httpx.MockTransport(
+      lambda request: httpx.Response(200, content=b'data: {"a": 1}\n\n')
+  )
+  client = _client(events, async_transport=transport)
+
+  async def run():
+    stream = await client.async_request_streamed(
+        'post', 'models/gemini:streamGenerateContent', {}
+    )
+    return [chunk async for chunk in stream]
+
+  with mock.patch.object(_api_client, 'has_aiohttp', False):
+    assert len(asyncio.run(run())) == 1
+
+  names = _names(events)
+  assert names[0] == 'request.build'
+  assert 'stream.chunk' in names
+  assert names[-1] == 'request'
+
+
+def test_response_decode_convert_and_validate_events():
+  events = []
+  transport = httpx.MockTransport(
+      lambda request: httpx.Response(200, content=b'{"totalTokens": 3}')
+  )
+  client = _client(events, transport)
+
+  response = client.request('post', 'models/gemini:countTokens', {})
+  client._json_codec.loads(response.body)
+  types.CountTokensResponse._from_response(
+      response={'total_tokens': 3}, kwargs={}
+  )
+
+  assert _names(events)[-3:] == [
+      'response.decode',
+      'response.convert',
+      'response.validate',
+  ]
+  assert {e.request_id for e in events} == {1}
+
+
+def test_failing_hook_is_ignored():
+  events = []
+
+  def failing_hook(event):
+    raise ValueError('hook failed')
+
+  transport = httpx.MockTransport(lambda request: httpx.Response(200))
+  client = _api_client.BaseApiClient(
+      vertexai=False,
+      api_key='test_api_key',
+      http_options=types.HttpOptions(
+          instrumentation_hooks=[failing_hook, events.append],
+          client_args={'transport': transport},
+      ),
+  )
+
+  client.request('get', 'files/a', {})
+
+  assert events[-1].name == 'request'
+
+
+def test_client_without_hooks_is_not_instrumented():
+  transport = httpx.MockTransport(lambda request: httpx.Response(200))
+  client = _api_client.BaseApiClient(
+      vertexai=False,
+      api_key='test_api_key',
+      http_options=types.HttpOptions(client_args={'transport': transport}),
+  )
+
+  client.request('get', 'files/a', {})
+
+  assert client._instrumentation is None
+  assert not isinstance(client._json_codec, _api_client._TimedCodec)
+
+
+def test_httpx_trace_events():
+  events = []
+  trace = instrumentation._Recorder([events.append]).httpx_trace(7)
+
+  for name in [
+      'connection.connect_tcp.started',
+      'connection.connect_tcp.complete',
+      'connection.start_tls.started',
+      'connection.start_tls.complete',
+      'http11.send_request_headers.started',
+      'http11.send_request_headers.complete',
+      'http11.send_request_body.started',
+      'http11.send_request_body.complete',
+      'http11.receive_response_headers.started',
+      'http11.receive_response_headers.complete',
+      'http11.receive_response_body.started',
+      'http11.receive_response_body.complete',
+      'http11.response_closed.started',
+      'http11.response_closed.complete',
+  ]:
+    trace(name, {})
+
+  assert _names(events) == [
+      'request.connect',
+      'request.tls',
+      'request.ttfb',
+      'request.read',
+  ]
+  assert {e.request_id for e in events} == {7}
+
+
+def test_opentelemetry_hook_nests_phases_in_request_span():
+  trace = pytest.importorskip('opentelemetry.trace')
+  spans = []
+
+  class Span(trace.NonRecordingSpan):
+
+    def __init__(self, name, context):
+      super().__init__(trace.INVALID_SPAN_CONTEXT)
+      self.name = name
+      self.parent_context = context
+
+  class Tracer:
+
+    def start_span(self, name, context=None, **kwargs):
+      span = Span(name, context)
+      spans.append(span)
+      return span
+
+  hook = instrumentation.OpenTelemetryHook(Tracer())
+  recorder = instrumentation._Recorder([hook])
+  recorder.emit('request.build', 0, request_id=1)
+  recorder.emit('request.attempt', 0, request_id=1)
+  assert not spans
+
+  recorder.emit('request', 0, request_id=1)
+
+  assert [span.name for span in spans] == [
+      'genai.request',
+      'genai.request.build',
+      'genai.request.attempt',
+  ]
+  for child in spans[1:]:
+    assert trace.get_current_span(child.parent_context) is spans[0]
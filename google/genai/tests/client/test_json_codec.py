@@ -0,0 +1,147 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Tests for the pluggable JSON codecs."""
+
+import json
+import sys
+from unittest import mock
+
+import httpx
+import pytest
+
+from ... import _api_client as api_client
+from ... import _json_codec
+from ... import types
+
+
+try:
+  import orjson  # pylint: disable=unused-import
+
+  ORJSON_NOT_INSTALLED = False
+except ImportError:
+  ORJSON_NOT_INSTALLED = True
+
+try:
+  import msgspec  # pylint: disable=unused-import
+
+  MSGSPEC_NOT_INSTALLED = False
+except ImportError:
+  MSGSPEC_NOT_INSTALLED = True
+
+requires_orjson = pytest.mark.skipif(
+    ORJSON_NOT_INSTALLED, reason='orjson is not installed, skipping test.'
+)
+requires_msgspec = pytest.mark.skipif(
+    MSGSPEC_NOT_INSTALLED, reason='msgspec is not installed, skipping test.'
+)
+
+_PAYLOAD = {
+    'contents': [{'parts': [{'text': 'héllo'}], 'role': 'user'}],
+    'generationConfig': {'temperature': 0.5, 'candidateCount': 1},
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_codec_cache():
+  _json_codec.get_codec.cache_clear()
+  yield
+  _json_codec.get_codec.cache_clear()
+
+
+def test_stdlib_codec_encodes_to_bytes():
+  codec = _json_codec.get_codec(types.JsonCodec.JSON)
+
+  assert codec.name == types.JsonCodec.JSON
+  assert codec.dumps(_PAYLOAD) == json.dumps(_PAYLOAD).encode('utf-8')
+  assert codec.loads(codec.dumps(_PAYLOAD)) == _PAYLOAD
+
+
+@pytest.mark.parametrize(
+    'codec',
+    [
+        pytest.param(types.JsonCodec.ORJSON, marks=requires_orjson),
+        pytest.param(types.JsonCodec.MSGSPEC, marks=requires_msgspec),
+    ],
+)
+def test_fast_codecs_round_trip(codec):
+  json_codec = _json_codec.get_codec(codec)
+
+  assert json_codec.name == codec
+  encoded = json_codec.dumps(_PAYLOAD)
+  assert isinstance(encoded, bytes)
+  assert json.loads(encoded) == _PAYLOAD
+  assert json_codec.loads(encoded) == _PAYLOAD
+  assert json_codec.loads(encoded.decode('utf-8')) == _PAYLOAD
+
+
+@pytest.mark.parametrize(
+    'codec',
+    [
+        types.JsonCodec.JSON,
+        pytest.param(types.JsonCodec.ORJSON, marks=requires_orjson),
+        pytest.param(types.JsonCodec.MSGSPEC, marks=requires_msgspec),
+    ],
+)
+def test_codecs_raise_json_decode_error(codec):
+  with pytest.raises(json.JSONDecodeError):
+    _json_codec.get_codec(codec).loads('{"error": bad_json}')
+
+
+@pytest.mark.parametrize(
+    'codec',
+    [
+        pytest.param(types.JsonCodec.ORJSON, marks=requires_orjson),
+        pytest.param(types.JsonCodec.MSGSPEC, marks=requires_msgspec),
+    ],
+)
+def test_fast_codecs_fall_back_for_unsupported_values(codec):
+  payload = {'count': 2**70}
+
+  assert json.loads(_json_codec.get_codec(codec).dumps(payload)) == payload
+
+
+def test_auto_codec_falls_back_to_stdlib():
+  with mock.patch.dict(sys.modules, {'orjson': None, 'msgspec': None}):
+    codec = _json_codec.get_codec(types.JsonCodec.AUTO)
+
+  assert codec.name == types.JsonCodec.JSON
+
+
+def test_missing_codec_raises_import_error():
+  with mock.patch.dict(sys.modules, {'orjson': None}):
+    with pytest.raises(ImportError, match='pip install orjson'):
+      _json_codec.get_codec(types.JsonCodec.ORJSON)
+
+
+def test_client_encodes_request_with_configured_codec():
+  client = api_client.BaseApiClient(
+      api_key='test_api_key',
+      http_options=types.HttpOptions(json_codec='json'),
+  )
+  assert client._json_codec.name == types.JsonCodec.JSON
+
+  with mock.patch.object(
+      httpx.Client,
+      'send',
+      return_value=httpx.Response(200, content=b'{"ok": true}'),
+  ) as mock_send:
+    response = client.request('post', 'models/gemini-2.5-flash', _PAYLOAD)
+
+  sent_request = mock_send.call_args.args[0]
+  assert sent_request.content == json.dumps(_PAYLOAD).encode('utf-8')
+  assert response.body == '{"ok": true}'
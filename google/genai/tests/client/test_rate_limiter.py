@@ -0,0 +1,257 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Tests for the client-side rate limiter."""
+
+from unittest import mock
+
+import httpx
+import pytest
+
+from ... import _api_client
+from ... import _rate_limiter
+from ... import errors
+from ... import types
+
+
+class _Clock:
+
+  def __init__(self):
+    self.now = 100.0
+
+  def __call__(self):
+    return self.now
+
+
+def _limiter(clock, **options):
+  return _rate_limiter.RateLimiter(types.RateLimitOptions(**options), clock)
+
+
+def test_requests_wait_after_a_minute_of_burst():
+  clock = _Clock()
+  limiter = _limiter(clock, requests_per_minute=60)
+
+  assert [limiter.reserve('m', 0) for _ in range(60)] == [0.0] * 60
+  assert limiter.reserve('m', 0) == pytest.approx(1.0)
+  # Callers queue: the next one waits behind the previous one.
+  assert limiter.reserve('m', 0) == pytest.approx(2.0)
+  clock.now += 2
+  assert limiter.reserve('m', 0) == pytest.approx(1.0)
+
+
+def test_tokens_are_limited():
+  clock = _Clock()
+  limiter = _limiter(clock, tokens_per_minute=600)
+
+  assert limiter.reserve('m', 500) == 0.0
+  assert limiter.reserve('m', 200) == pytest.approx(10.0)
+
+
+def test_tokens_over_the_limit_wait_a_minute_at_most():
+  clock = _Clock()
+  limiter = _limiter(clock, tokens_per_minute=600)
+
+  assert limiter.reserve('m', 600) == 0.0
+  assert limiter.reserve('m', 10_000) == pytest.approx(60.0)
+
+
+def test_models_have_separate_limits():
+  clock = _Clock()
+  limiter = _limiter(clock, requests_per_minute=1)
+
+  assert limiter.reserve('a', 0) == 0.0
+  assert limiter.reserve('b', 0) == 0.0
+  assert limiter.reserve('a', 0) == pytest.approx(60.0)
+
+
+def test_throttled_model_pauses_and_slows_down():
+  clock = _Clock()
+  limiter = _limiter(clock, requests_per_minute=60)
+
+  limiter.record_throttled('m', retry_after=5.0)
+
+  assert limiter.reserve('m', 0) == pytest.approx(5.0)
+  # The bucket was emptied and refills at half the rate.
+  clock.now += 5
+  assert limiter.reserve('m', 0) == 0.0
+  assert limiter.reserve('m', 0) == pytest.approx(1.0)
+  assert limiter.reserve('other', 0) == 0.0
+
+
+def test_successes_restore_the_rate():
+  clock = _Clock()
+  limiter = _limiter(clock, requests_per_minute=60)
+  limiter.record_throttled('m')
+  limiter.record_throttled('m')
+
+  assert limiter.reserve('m', 0) == pytest.approx(4.0)
+  for _ in range(100):
+    limiter.record_success('m', 0)
+  clock.now += 10
+  assert limiter.reserve('m', 0) == 0.0
+  assert limiter._models['m'].rate_factor == 1.0
+
+
+def test_success_corrects_the_token_estimate():
+  clock = _Clock()
+  limiter = _limiter(clock, tokens_per_minute=600)
+
+  limiter.reserve('m', 100)
+  limiter.record_success('m', estimated_tokens=100, prompt_tokens=700)
+
+  # 100 tokens past the limit at 10 tokens per second.
+  assert limiter.reserve('m', 0) == pytest.approx(10.0)
+
+
+@pytest.mark.parametrize(
+    'options', [{'requests_per_minute': 0}, {'tokens_per_minute': -1}]
+)
+def test_rejects_invalid_limits(options):
+  with pytest.raises(ValueError, match=next(iter(options))):
+    _rate_limiter.RateLimiter(types.RateLimitOptions(**options))
+
+
+def test_estimate_tokens():
+  request = {
+      'contents': [{
+          'role': 'user',
+          'parts': [
+              {'text': 'x' * 400},
+              {'inlineData': {'data': 'a' * 10_000, 'mimeType': 'image/png'}},
+          ],
+      }],
+      'systemInstruction': {'parts': [{'text': 'y' * 40}]},
+  }
+
+  assert _rate_limiter.estimate_tokens(request) == 1 + 100 + 10 + 258
+
+
+@pytest.mark.parametrize(
+    'path, model',
+    [
+        ('models/gemini-2.5-flash:generateContent', 'gemini-2.5-flash'),
+        (
+            'projects/p/locations/l/publishers/google/models/gemini:countTokens',
+            'gemini',
+        ),
+        ('tunedModels/abc:generateContent', None),
+        ('models/gemini-2.5-flash', None),
+        ('files/abc', None),
+    ],
+)
+def test_model_of(path, model):
+  assert _rate_limiter.model_of(path) == model
+
+
+def test_prompt_token_count():
+  body = '{"usageMetadata": {"promptTokenCount": 12, "totalTokenCount": 20}}'
+
+  assert _rate_limiter.prompt_token_count(body) == 12
+  assert _rate_limiter.prompt_token_count('{}') is None
+
+
+def _client(**options):
+  return _api_client.BaseApiClient(
+      vertexai=False,
+      api_key='test_api_key',
+      http_options=types.HttpOptions(
+          rate_limit_options=types.RateLimitOptions(**options)
+      ),
+  )
+
+
+def _throttled():
+  return errors.ClientError(
+      429,
+      {'error': {'code': 429, 'status': 'RESOURCE_EXHAUSTED'}},
+      httpx.Response(429, headers={'Retry-After': '7'}),
+  )
+
+
+def test_client_waits_for_the_rate_limit():
+  client = _client(requests_per_minute=1)
+  response = _api_client.HttpResponse(
+      {}, ['{"usageMetadata": {"promptTokenCount": 3}}']
+  )
+  with mock.patch.object(
+      client, '_request_once', return_value=response
+  ), mock.patch.object(_rate_limiter.time, 'sleep') as sleep:
+    for _ in range(2):
+      client.request('post', 'models/gemini:generateContent', {})
+    client.request('get', 'files/abc', {})
+
+  sleep.assert_called_once()
+  assert sleep.call_args[0][0] == pytest.approx(60.0, abs=1)
+
+
+def test_client_records_throttling():
+  client = _client(requests_per_minute=600)
+  with mock.patch.object(
+      client, '_request_once', side_effect=_throttled()
+  ), pytest.raises(errors.ClientError):
+    client.request('post', 'models/gemini:generateContent', {})
+
+  assert client._rate_limiter.reserve('gemini', 0) == pytest.approx(7.0, abs=1)
+
+
+def test_client_corrects_tokens_from_stream_usage():
+  client = _client(tokens_per_minute=600)
+  response = _api_client.HttpResponse(
+      {},
+      [
+          '{"candidates": []}',
+          '{"usageMetadata": {"promptTokenCount": 300}}',
+      ],
+  )
+  with mock.patch.object(client, '_request_once', return_value=response):
+    list(
+        client.request_streamed(
+            'post',
+            'models/gemini:streamGenerateContent',
+            {'contents': [{'parts': [{'text': 'x' * 400}]}]},
+        )
+    )
+
+  # 300 prompt tokens were used, not the 101 estimated.
+  assert client._rate_limiter._models['gemini'].tokens.level == pytest.approx(
+      300, abs=1
+  )
+
+
+def test_client_without_rate_limits():
+  client = _api_client.BaseApiClient(vertexai=False, api_key='test_api_key')
+  request = client._build_request('post', 'models/gemini:generateContent', {})
+
+  assert client._rate_limiter is None
+  assert request.rate_limited_model is None
+
+
+@pytest.mark.asyncio
+async def test_async_client_waits_for_the_rate_limit():
+  client = _client(requests_per_minute=600)
+  response = _api_client.HttpResponse({}, ['{}'])
+  with mock.patch.object(
+      client, '_async_request_once', side_effect=[_throttled(), response]
+  ), mock.patch.object(
+      _rate_limiter.asyncio, 'sleep', new=mock.AsyncMock()
+  ) as sleep:
+    with pytest.raises(errors.ClientError):
+      await client.async_request('post', 'models/gemini:generateContent', {})
+    await client.async_request('post', 'models/gemini:generateContent', {})
+
+  sleep.assert_awaited_once()
+  assert sleep.call_args[0][0] == pytest.approx(7.0, abs=1)
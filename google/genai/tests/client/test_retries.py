@@ -204,6 +204,90 @@ def test_retry_args_retries_httpx_transport_errors():
   assert not retry.predicate(ValueError('not a transport error'))
 
 
+def _retry_sleeps(options, response):
+  sleeps = []
+
+  def fn():
+    errors.APIError.raise_for_response(response)
+
+  retrying = tenacity.Retrying(
+      sleep=sleeps.append, **api_client.retry_args(options)
+  )
+  with pytest.raises(errors.APIError):
+    retrying(fn)
+  return sleeps
+
+
+def test_retry_wait_honors_retry_after_header():
+  response = httpx.Response(429, headers={'Retry-After': '3'}, content=b'')
+
+  sleeps = _retry_sleeps(types.HttpRetryOptions(attempts=3), response)
+
+  assert sleeps == [3.0, 3.0]
+
+
+def test_retry_wait_honors_retry_after_ms_header():
+  response = httpx.Response(
+      503, headers={'retry-after-ms': '250', 'Retry-After': '1'}, content=b''
+  )
+
+  sleeps = _retry_sleeps(types.HttpRetryOptions(attempts=2), response)
+
+  assert sleeps == [0.25]
+
+
+def test_retry_wait_honors_retry_info():
+  response = httpx.Response(
+      429,
+      json={
+          'error': {
+              'code': 429,
+              'status': 'RESOURCE_EXHAUSTED',
+              'details': [{
+                  '@type': 'type.googleapis.com/google.rpc.RetryInfo',
+                  'retryDelay': '12s',
+              }],
+          }
+      },
+  )
+
+  sleeps = _retry_sleeps(types.HttpRetryOptions(attempts=2), response)
+
+  assert sleeps == [12.0]
+
+
+def test_retry_wait_caps_retry_after_at_max_delay():
+  response = httpx.Response(429, headers={'Retry-After': '300'}, content=b'')
+
+  sleeps = _retry_sleeps(
+      types.HttpRetryOptions(attempts=2, max_delay=5), response
+  )
+
+  assert sleeps == [5.0]
+
+
+def test_retry_wait_without_hint_backs_off():
+  sleeps = _retry_sleeps(
+      types.HttpRetryOptions(attempts=3, initial_delay=1, jitter=0.5),
+      _httpx_response(429),
+  )
+
+  assert 1 <= sleeps[0] <= 1.5
+  assert 2 <= sleeps[1] <= 2.5
+
+
+def test_retry_logs_the_chosen_delay(caplog):
+  response = httpx.Response(429, headers={'Retry-After': '4'}, content=b'')
+
+  with caplog.at_level('INFO', logger='google_genai._api_client'):
+    _retry_sleeps(types.HttpRetryOptions(attempts=2), response)
+
+  [record] = [r for r in caplog.records if hasattr(r, 'retry_delay')]
+  assert record.retry_delay == 4.0
+  assert record.retry_after == 4.0
+  assert record.retry_attempt == 1
+
+
 def _patch_auth_default():
   return mock.patch(
       'google.auth.default',
@@ -648,7 +732,7 @@ async def _aiohttp_async_response(status: int, streamable: bool = False):
   response.text.return_value = 'test'
   if streamable:
     response.content = mock.Mock()
-    response.content.readline = mock.AsyncMock(return_value=b'')
+    response.content.readany = mock.AsyncMock(return_value=b'')
     response.release = mock.MagicMock()
   return response
 
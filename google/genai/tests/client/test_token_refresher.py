@@ -0,0 +1,201 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Tests for the background refresh of access tokens."""
+
+import asyncio
+import datetime
+import threading
+from unittest import mock
+
+from google.oauth2 import credentials as oauth2_credentials
+import httpx
+import pytest
+
+from ... import _api_client
+from ... import _token_refresher
+from ... import types
+
+
+_NOW = datetime.datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _credentials(expires_in=3600.0, now=None):
+  expiry = (now or _token_refresher._utcnow()) + datetime.timedelta(
+      seconds=expires_in
+  )
+  return oauth2_credentials.Credentials(token='token', expiry=expiry)
+
+
+class _Refresh:
+
+  def __init__(self, errors=0):
+    self.calls = 0
+    self.errors = errors
+    self.refreshed = threading.Event()
+
+  def __call__(self, credentials):
+    self.calls += 1
+    if self.calls <= self.errors:
+      raise RuntimeError('metadata server unavailable')
+    credentials.token = f'token-{self.calls}'
+    credentials.expiry = _token_refresher._utcnow() + datetime.timedelta(
+        hours=1
+    )
+    self.refreshed.set()
+
+
+@pytest.fixture(autouse=True)
+def fast_intervals():
+  with mock.patch.object(
+      _token_refresher, '_MIN_REFRESH_INTERVAL', 0.01
+  ), mock.patch.object(_token_refresher, '_MAX_RETRY_DELAY', 0.01):
+    yield
+
+
+@pytest.mark.parametrize(
+    'expires_in, refreshed, delay',
+    [
+        (3600, False, 3300),
+        (3600, True, 3300),
+        (400, False, 100),
+        (400, True, 200),
+        (100, False, 0.01),
+        (-10, False, 0.01),
+    ],
+)
+def test_seconds_until_refresh(expires_in, refreshed, delay):
+  refresher = _token_refresher.TokenRefresher(
+      _credentials(expires_in, _NOW), mock.Mock(), 300, now=lambda: _NOW
+  )
+  refresher.stop()
+
+  assert refresher._seconds_until_refresh(refreshed) == pytest.approx(delay)
+
+
+def test_refreshes_before_expiry():
+  refresh = _Refresh()
+  credentials = _credentials(expires_in=300.05)
+
+  refresher = _token_refresher.TokenRefresher(credentials, refresh, 300)
+  try:
+    assert refresh.refreshed.wait(5)
+    assert credentials.token == 'token-1'
+    assert not credentials.expired
+  finally:
+    refresher.stop()
+
+
+def test_retries_failed_refresh():
+  refresh = _Refresh(errors=2)
+  credentials = _credentials(expires_in=0)
+
+  refresher = _token_refresher.TokenRefresher(credentials, refresh, 300)
+  try:
+    assert refresh.refreshed.wait(5)
+    assert refresh.calls == 3
+  finally:
+    refresher.stop()
+
+
+def test_stop_ends_the_thread():
+  refresher = _token_refresher.TokenRefresher(_credentials(), _Refresh(), 300)
+
+  refresher.stop()
+  refresher._thread.join(5)
+
+  assert not refresher.is_alive()
+
+
+def test_credentials_without_expiry_are_not_refreshed():
+  credentials = oauth2_credentials.Credentials(token='token')
+  refresh = _Refresh()
+
+  refresher = _token_refresher.TokenRefresher(credentials, refresh, 300)
+  refresher._thread.join(5)
+
+  assert not refresher.is_alive()
+  assert refresh.calls == 0
+
+
+def _client(credentials, **http_options):
+  return _api_client.BaseApiClient(
+      vertexai=True,
+      project='test_project',
+      location='us-central1',
+      credentials=credentials,
+      http_options=types.HttpOptions(**http_options),
+  )
+
+
+def test_client_starts_refresher_with_first_token():
+  client = _client(_credentials())
+  assert client._token_refresher is None
+
+  assert client._access_token() == 'token'
+  refresher = client._token_refresher
+  assert refresher.is_alive()
+  client._access_token()
+  assert client._token_refresher is refresher
+
+  client.close()
+  assert client._token_refresher is None
+  refresher._thread.join(5)
+  assert not refresher.is_alive()
+
+
+def test_deleting_client_with_custom_httpx_client_stops_refresher():
+  with httpx.Client() as httpx_client:
+    client = _client(_credentials(), httpx_client=httpx_client)
+    client._access_token()
+    refresher = client._token_refresher
+
+    client.__del__()
+
+    refresher._thread.join(5)
+    assert not refresher.is_alive()
+    assert not httpx_client.is_closed
+
+
+def test_client_refreshes_token_in_background():
+  refresh = _Refresh()
+  credentials = _credentials(expires_in=60.05)
+  with mock.patch.object(_api_client, 'refresh_auth', refresh):
+    client = _client(credentials, token_refresh_margin=60)
+    client._access_token()
+
+    assert refresh.refreshed.wait(5)
+    assert client._access_token() == 'token-1'
+    client.close()
+
+
+def test_client_refresher_can_be_disabled():
+  client = _client(_credentials(), token_refresh_margin=0)
+
+  client._access_token()
+
+  assert client._token_refresher is None
+
+
+def test_async_client_starts_refresher():
+  client = _client(_credentials())
+
+  assert asyncio.run(client._async_access_token()) == 'token'
+
+  assert client._token_refresher.is_alive()
+  asyncio.run(client.aclose())
+  assert client._token_refresher is None
@@ -0,0 +1,140 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Tests for uploading files from a path through a memory map."""
+
+import io
+import os
+from unittest import mock
+
+import pytest
+
+from ... import _api_client as api_client
+from ... import types
+from .resumable_upload_server import ResumableUploadServer
+
+
+_CHUNK = api_client.UPLOAD_CHUNK_GRANULARITY
+_DATA = os.urandom(5 * _CHUNK + 321)
+
+
+@pytest.fixture
+def client():
+  return api_client.BaseApiClient(vertexai=False, api_key='test_api_key')
+
+
+@pytest.fixture
+def path(tmp_path):
+  path = tmp_path / 'data.bin'
+  path.write_bytes(_DATA)
+  return str(path)
+
+
+@pytest.mark.parametrize('max_in_flight', [1, 3])
+def test_upload_of_a_path_sends_memory_mapped_chunks(
+    client, path, max_in_flight
+):
+  mapped_files = []
+
+  def memory_map(file):
+    mapped_files.append(api_client._MemoryMappedFile(file))
+    return mapped_files[-1]
+
+  with ResumableUploadServer() as server, mock.patch.object(
+      api_client, '_memory_map', side_effect=memory_map
+  ):
+    upload_url = server.create_upload(len(_DATA))
+    client.upload_file(
+        path,
+        upload_url,
+        len(_DATA),
+        http_options=types.HttpOptions(
+            base_url=server.url,
+            upload_chunk_size=_CHUNK,
+            upload_max_in_flight_chunks=max_in_flight,
+        ),
+    )
+
+  assert len(mapped_files) == 1
+  assert mapped_files[0].closed
+  assert server.data(upload_url) == _DATA
+
+
+def test_upload_of_an_empty_path_falls_back_to_reads(client, tmp_path):
+  path = tmp_path / 'empty.bin'
+  path.write_bytes(b'')
+  with ResumableUploadServer() as server:
+    upload_url = server.create_upload(0)
+    response = client.upload_file(
+        str(path),
+        upload_url,
+        0,
+        http_options=types.HttpOptions(base_url=server.url),
+    )
+
+  assert response.json['file']['sizeBytes'] == '0'
+
+
+def test_memory_mapped_file_reads_views(path):
+  with open(path, 'rb') as file, api_client._MemoryMappedFile(file) as mapped:
+    first = mapped.read(_CHUNK)
+    second = mapped.read(_CHUNK)
+
+    assert isinstance(first, memoryview)
+    assert bytes(first) == _DATA[:_CHUNK]
+    assert bytes(second) == _DATA[_CHUNK : 2 * _CHUNK]
+    assert mapped.tell() == 2 * _CHUNK
+    assert mapped._released == _CHUNK
+
+    mapped.seek(10)
+    assert bytes(mapped.read(5)) == _DATA[10:15]
+    mapped.seek(-5, os.SEEK_END)
+    assert bytes(mapped.read()) == _DATA[-5:]
+    assert bytes(mapped.read(5)) == b''
+
+
+def test_memory_mapped_file_closes_with_chunks_referenced(path):
+  with open(path, 'rb') as file:
+    mapped = api_client._memory_map(file)
+    chunk = mapped.read(_CHUNK)
+    mapped.close()
+
+  assert mapped.closed
+  assert bytes(chunk) == _DATA[:_CHUNK]
+
+
+def test_upload_content_passes_views_without_copy():
+  view = memoryview(b'data')
+
+  assert api_client._upload_content(view) == [view]
+  assert api_client._upload_content(b'data') == b'data'
+
+
+def test_upload_of_a_file_object_is_not_memory_mapped(client):
+  with ResumableUploadServer() as server, mock.patch.object(
+      api_client, '_memory_map'
+  ) as memory_map:
+    upload_url = server.create_upload(len(_DATA))
+    client.upload_file(
+        io.BytesIO(_DATA),
+        upload_url,
+        len(_DATA),
+        http_options=types.HttpOptions(base_url=server.url),
+    )
+
+  memory_map.assert_not_called()
+  assert server.data(upload_url) == _DATA
@@ -0,0 +1,220 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Tests for pipelined resumable uploads in the api client layer."""
+
+import io
+import os
+from unittest import mock
+
+import pytest
+
+from ... import _api_client as api_client
+from ... import Client
+from ... import errors
+from ... import types
+from .resumable_upload_server import ResumableUploadServer
+
+try:
+  import aiohttp  # pylint: disable=unused-import
+  AIOHTTP_NOT_INSTALLED = False
+except ImportError:
+  AIOHTTP_NOT_INSTALLED = True
+
+
+_CHUNK = api_client.UPLOAD_CHUNK_GRANULARITY
+_DATA = os.urandom(10 * _CHUNK + 123)
+
+
+def _http_options(server, **kwargs):
+  return types.HttpOptions(
+      base_url=server.url, upload_chunk_size=_CHUNK, **kwargs
+  )
+
+
+@pytest.fixture
+def client():
+  return api_client.BaseApiClient(vertexai=False, api_key='test_api_key')
+
+
+def test_pipelined_upload_sends_chunks_concurrently(client):
+  with ResumableUploadServer(latency=0.05) as server:
+    upload_url = server.create_upload(len(_DATA))
+    response = client.upload_file(
+        io.BytesIO(_DATA),
+        upload_url,
+        len(_DATA),
+        http_options=_http_options(server, upload_max_in_flight_chunks=4),
+    )
+
+  assert server.data(upload_url) == _DATA
+  assert server.max_in_flight == 4
+  assert server.commands[-1] == 'upload, finalize'
+  assert response.json['file']['sizeBytes'] == str(len(_DATA))
+
+
+def test_upload_is_sequential_by_default(client):
+  with ResumableUploadServer(latency=0.01) as server:
+    upload_url = server.create_upload(len(_DATA))
+    client.upload_file(
+        io.BytesIO(_DATA),
+        upload_url,
+        len(_DATA),
+        http_options=_http_options(server),
+    )
+
+  assert server.data(upload_url) == _DATA
+  assert server.max_in_flight == 1
+  assert len(server.commands) == 11
+
+
+def test_pipelined_upload_resumes_when_out_of_order_is_rejected(client):
+  with ResumableUploadServer(
+      latency=0.1, accept_out_of_order=False
+  ) as server:
+    upload_url = server.create_upload(len(_DATA))
+    response = client.upload_file(
+        io.BytesIO(_DATA),
+        upload_url,
+        len(_DATA),
+        http_options=_http_options(server, upload_max_in_flight_chunks=4),
+    )
+
+  assert server.data(upload_url) == _DATA
+  assert 'query' in server.commands
+  assert response.json['file']['sizeBytes'] == str(len(_DATA))
+
+
+def test_pipelined_upload_of_a_file_path(client, tmp_path):
+  path = tmp_path / 'data.bin'
+  path.write_bytes(_DATA)
+  with ResumableUploadServer() as server:
+    upload_url = server.create_upload(len(_DATA))
+    client.upload_file(
+        str(path),
+        upload_url,
+        len(_DATA),
+        http_options=_http_options(server, upload_max_in_flight_chunks=3),
+    )
+
+  assert server.data(upload_url) == _DATA
+
+
+def test_pipelined_upload_raises_error_of_ended_upload(client):
+  with ResumableUploadServer() as server:
+    with pytest.raises(errors.ClientError, match='Upload session not found'):
+      client.upload_file(
+          io.BytesIO(_DATA),
+          f'{server.url}/upload/sessions/unknown',
+          len(_DATA),
+          http_options=_http_options(server, upload_max_in_flight_chunks=4),
+      )
+
+
+@pytest.mark.parametrize(
+    'options',
+    [
+        {'upload_chunk_size': 1000},
+        {'upload_chunk_size': 0},
+        {'upload_max_in_flight_chunks': 0},
+    ],
+)
+def test_upload_rejects_invalid_chunking(client, options):
+  with pytest.raises(ValueError, match=next(iter(options))):
+    client.upload_file(
+        io.BytesIO(b'test'),
+        'http://fake/upload',
+        4,
+        http_options=types.HttpOptions(**options),
+    )
+
+
+def test_files_upload_uses_client_chunking(tmp_path):
+  path = tmp_path / 'data.bin'
+  path.write_bytes(_DATA)
+  with ResumableUploadServer(latency=0.05) as server:
+    client = Client(
+        api_key='test_api_key',
+        http_options=_http_options(server, upload_max_in_flight_chunks=4),
+    )
+    file = client.files.upload(
+        file=str(path),
+        config=types.UploadFileConfig(
+            mime_type='application/octet-stream',
+            http_options=types.HttpOptions(base_url=server.url),
+        ),
+    )
+
+  assert file.size_bytes == len(_DATA)
+  assert server.max_in_flight == 4
+
+
+@pytest.mark.asyncio
+async def test_async_pipelined_upload_httpx(client):
+  with ResumableUploadServer(
+      latency=0.05
+  ) as server, mock.patch.object(client, '_use_aiohttp', return_value=False):
+    upload_url = server.create_upload(len(_DATA))
+    response = await client.async_upload_file(
+        io.BytesIO(_DATA),
+        upload_url,
+        len(_DATA),
+        http_options=_http_options(server, upload_max_in_flight_chunks=4),
+    )
+
+  assert server.data(upload_url) == _DATA
+  assert server.max_in_flight == 4
+  assert response.json['file']['sizeBytes'] == str(len(_DATA))
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(AIOHTTP_NOT_INSTALLED, reason='aiohttp is not installed.')
+async def test_async_pipelined_upload_aiohttp(client, tmp_path):
+  path = tmp_path / 'data.bin'
+  path.write_bytes(_DATA)
+  with ResumableUploadServer(latency=0.05) as server:
+    upload_url = server.create_upload(len(_DATA))
+    with mock.patch.object(client, '_use_aiohttp', return_value=True):
+      response = await client.async_upload_file(
+          str(path),
+          upload_url,
+          len(_DATA),
+          http_options=_http_options(server, upload_max_in_flight_chunks=4),
+      )
+
+  assert server.data(upload_url) == _DATA
+  assert server.max_in_flight == 4
+  assert response.json['file']['sizeBytes'] == str(len(_DATA))
+
+
+@pytest.mark.asyncio
+async def test_async_pipelined_upload_resumes_when_out_of_order_is_rejected(
+    client,
+):
+  with ResumableUploadServer(
+      latency=0.1, accept_out_of_order=False
+  ) as server, mock.patch.object(client, '_use_aiohttp', return_value=False):
+    upload_url = server.create_upload(len(_DATA))
+    await client.async_upload_file(
+        io.BytesIO(_DATA),
+        upload_url,
+        len(_DATA),
+        http_options=_http_options(server, upload_max_in_flight_chunks=4),
+    )
+
+  assert server.data(upload_url) == _DATA
+  assert 'query' in server.commands
@@ -0,0 +1,216 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Tests for warming up the client."""
+
+import asyncio
+from unittest import mock
+
+import httpx
+import pytest
+
+from ... import _api_client
+from ... import _common
+from ... import Client
+from ... import types
+
+try:
+  import aiohttp  # pylint: disable=unused-import
+
+  AIOHTTP_NOT_INSTALLED = False
+except ImportError:
+  AIOHTTP_NOT_INSTALLED = True
+
+requires_aiohttp = pytest.mark.skipif(
+    AIOHTTP_NOT_INSTALLED, reason='aiohttp is not installed, skipping test.'
+)
+
+
+def _transport():
+  transport = mock.Mock(spec=httpx.BaseTransport)
+  transport.handle_request.return_value = httpx.Response(404)
+  return transport
+
+
+def _async_transport():
+  transport = mock.Mock(spec=httpx.AsyncBaseTransport)
+  transport.handle_async_request.return_value = httpx.Response(404)
+  return transport
+
+
+def _client(transport=None, async_transport=None, **kwargs):
+  kwargs.setdefault('vertexai', False)
+  if not kwargs['vertexai']:
+    kwargs.setdefault('api_key', 'test_api_key')
+  return _api_client.BaseApiClient(
+      http_options=types.HttpOptions(
+          client_args={'transport': transport},
+          async_client_args={'transport': async_transport},
+      ),
+      **kwargs,
+  )
+
+
+def test_warmup_opens_connections():
+  transport = _transport()
+  client = _client(transport)
+
+  result = client.warmup(connections=3)
+
+  assert transport.handle_request.call_count == 3
+  request = transport.handle_request.call_args[0][0]
+  assert request.method == 'HEAD'
+  assert str(request.url) == 'https://generativelanguage.googleapis.com/'
+  assert 'x-goog-api-key' not in request.headers
+  assert result.connections == 3
+  assert result.connect_seconds >= 0
+  assert result.auth_seconds is None
+
+
+def test_warmup_opens_connections_of_custom_httpx_client():
+  transport = _transport()
+  client = _api_client.BaseApiClient(
+      vertexai=False,
+      api_key='test_api_key',
+      http_options=types.HttpOptions(
+          httpx_client=httpx.Client(transport=transport)
+      ),
+  )
+
+  result = client.warmup(connections=2)
+
+  assert transport.handle_request.call_count == 2
+  assert result.connections == 2
+
+
+def test_warmup_without_connections():
+  transport = _transport()
+  client = _client(transport)
+
+  result = client.warmup(connections=0)
+
+  transport.handle_request.assert_not_called()
+  assert result.connections == 0
+
+
+def test_warmup_rejects_negative_connections():
+  with pytest.raises(ValueError, match='connections'):
+    _client(_transport()).warmup(connections=-1)
+
+
+def test_warmup_resolves_access_token():
+  client = _client(
+      _transport(), vertexai=True, project='test_project', location='global'
+  )
+
+  with mock.patch.object(
+      client, '_access_token', return_value='token'
+  ) as access_token:
+    result = client.warmup()
+
+  access_token.assert_called_once()
+  assert result.auth_seconds >= 0
+
+
+def test_warmup_builds_validators():
+
+  class WarmedUp(_common.BaseModel):
+    value: int = 0
+
+  assert not WarmedUp.__pydantic_complete__
+
+  result = _client(_transport()).warmup(model_types=[WarmedUp])
+
+  assert WarmedUp.__pydantic_complete__
+  assert result.validators_seconds >= 0
+
+
+def test_client_warmup():
+  transport = _transport()
+  client = Client(
+      api_key='test_api_key',
+      http_options=types.HttpOptions(client_args={'transport': transport}),
+  )
+
+  result = client.warmup(connections=2)
+
+  assert transport.handle_request.call_count == 2
+  assert result.connections == 2
+
+
+def test_async_warmup_opens_connections():
+  transport = _async_transport()
+  client = _client(async_transport=transport)
+
+  result = asyncio.run(client.async_warmup(connections=3))
+
+  assert transport.handle_async_request.call_count == 3
+  assert transport.handle_async_request.call_args[0][0].method == 'HEAD'
+  assert result.connections == 3
+
+
+def test_async_warmup_resolves_access_token():
+  client = _client(
+      async_transport=_async_transport(),
+      vertexai=True,
+      project='test_project',
+      location='global',
+  )
+
+  with mock.patch.object(
+      client, '_async_access_token', return_value='token'
+  ) as access_token:
+    result = asyncio.run(client.async_warmup())
+
+  access_token.assert_awaited_once()
+  assert result.auth_seconds >= 0
+
+
+@requires_aiohttp
+def test_async_warmup_opens_aiohttp_connections():
+  session = mock.MagicMock()
+
+  async def run():
+    client = _client()
+    with mock.patch.object(
+        client, '_get_aiohttp_session', return_value=session
+    ):
+      return await client.async_warmup(connections=2)
+
+  with mock.patch.object(_api_client, 'has_aiohttp', True):
+    result = asyncio.run(run())
+
+  assert session.head.call_count == 2
+  assert session.head.call_args[0][0] == (
+      'https://generativelanguage.googleapis.com/'
+  )
+  assert result.connections == 2
+
+
+def test_async_client_warmup():
+  transport = _async_transport()
+  client = Client(
+      api_key='test_api_key',
+      http_options=types.HttpOptions(
+          async_client_args={'transport': transport}
+      ),
+  )
+
+  result = asyncio.run(client.aio.warmup(connections=2))
+
+  assert transport.handle_async_request.call_count == 2
+  assert result.connections == 2
@@ -952,3 +952,64 @@ def test_check_field_type_mismatches_generic_type_no_error(caplog):
     TestModel.model_validate(data)
 
   assert len(caplog.records) == 0
+
+
+def test_get_value_by_path():
+  data = {'a': {'b': [{'c': 1}, {'c': 2}], 'd': [{'e': 3}], 'f': 0}}
+
+  assert _common.get_value_by_path(data, ['a', 'b[]', 'c']) == [1, 2]
+  assert _common.get_value_by_path(data, ['a', 'd[0]', 'e']) == 3
+  assert _common.get_value_by_path(data, ['a', 'f']) == 0
+  assert _common.get_value_by_path(data, ['_self']) is data
+  assert _common.get_value_by_path(data, ['a', 'x']) is None
+  assert _common.get_value_by_path(data, ['a', 'x[]', 'c']) is None
+  assert _common.get_value_by_path(data, ['a', 'f', 'g']) is None
+  assert (
+      _common.get_value_by_path(data, ['a', 'x'], default_value='default')
+      == 'default'
+  )
+
+
+def test_get_value_by_path_from_model():
+  content = types.Content(role='user', parts=[types.Part(text='hello')])
+
+  assert _common.get_value_by_path(content, ['role']) == 'user'
+  assert _common.get_value_by_path(content, ['parts'])[0].text == 'hello'
+  assert _common.get_value_by_path(content, ['unknown']) is None
+  assert _common.get_value_by_path({'content': content}, ['content', 'role']) == (
+      'user'
+  )
+
+
+def test_set_value_by_path():
+  data = {}
+  _common.set_value_by_path(data, ['a', 'b[]', 'c'], [1, 2])
+  _common.set_value_by_path(data, ['a', 'b[]', 'd'], 3)
+  _common.set_value_by_path(data, ['a', 'e[0]', 'f'], 4)
+  _common.set_value_by_path(data, ['a', 'g'], None)
+  _common.set_value_by_path(data, ['_self'], {'h': 5})
+
+  assert data == {
+      'a': {'b': [{'c': 1, 'd': 3}, {'c': 2, 'd': 3}], 'e': [{'f': 4}]},
+      'h': 5,
+  }
+
+
+def test_set_value_by_path_merges_existing_values():
+  data = {'a': {'b': 1}}
+  _common.set_value_by_path(data, ['a'], {'c': 2})
+  _common.set_value_by_path(data, ['a', 'b'], 1)
+  _common.set_value_by_path(data, ['a', 'b'], 0)
+
+  assert data == {'a': {'b': 1, 'c': 2}}
+  with pytest.raises(ValueError, match='Cannot set value for an existing key'):
+    _common.set_value_by_path(data, ['a', 'b'], 2)
+  with pytest.raises(ValueError, match='must be a list given an array path'):
+    _common.set_value_by_path({}, ['x[]', 'y'], 1)
+
+
+def test_key_paths_are_parsed_once():
+  keys = ['a', 'b[]', 'c']
+
+  assert _common._key_path(keys) is _common._key_path(list(keys))
+  assert _common._key_path(keys) is not _common._key_path(['a', 'b', 'c'])
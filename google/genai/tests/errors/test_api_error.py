@@ -452,3 +452,36 @@ async def test_raise_for_async_response_code_exist_json_decoder_error():
         'message': '{"data": {"key1": "value1", "key2"}',
         'status': 'Service Unavailable',
     }
+
+
+@pytest.mark.parametrize(
+    'headers, details, retry_after',
+    [
+        ({'Retry-After': '37'}, {}, 37.0),
+        ({'retry-after-ms': '1500', 'Retry-After': '37'}, {}, 1.5),
+        ({'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}, {}, 0.0),
+        (
+            {},
+            {
+                'error': {
+                    'code': 429,
+                    'details': [
+                        {'@type': 'type.googleapis.com/google.rpc.Help'},
+                        {
+                            '@type': 'type.googleapis.com/google.rpc.RetryInfo',
+                            'retryDelay': '2.5s',
+                        },
+                    ],
+                }
+            },
+            2.5,
+        ),
+        ({}, {'error': {'code': 429}}, None),
+    ],
+)
+def test_retry_after(headers, details, retry_after):
+  error = errors.APIError(
+      429, details, httpx.Response(429, headers=headers)
+  )
+
+  assert error.retry_after == retry_after
@@ -0,0 +1,58 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Benchmarks the time to import the package and create a client."""
+
+import subprocess
+import sys
+
+from google.genai.tests.benchmarks.benchmark_helper import best_of
+from google.genai.tests.benchmarks.benchmark_helper import report
+from google.genai.tests.benchmarks.benchmark_helper import requires_benchmarks
+
+
+_CREATE_CLIENT = (
+    "from google import genai; client = genai.Client(api_key='test_api_key')"
+)
+# Touches every resource, as the client did on creation before they were
+# loaded lazily.
+_USE_ALL_RESOURCES = (
+    '; client.models; client.tunings; client.caches; client.batches;'
+    ' client.files; client.file_search_stores; client.auth_tokens;'
+    ' client.operations; client.chats; client.aio.live'
+)
+
+
+def _run(code):
+  subprocess.run([sys.executable, '-c', code], check=True)
+
+
+@requires_benchmarks
+def test_import_and_create_client_ms():
+  baseline = best_of(lambda: _run('pass'), repeat=10)
+  lazy = best_of(lambda: _run(_CREATE_CLIENT), repeat=10) - baseline
+  eager = (
+      best_of(lambda: _run(_CREATE_CLIENT + _USE_ALL_RESOURCES), repeat=10)
+      - baseline
+  )
+  report(
+      'import google.genai and create a client',
+      lazy_ms=lazy * 1e3,
+      all_resources_ms=eager * 1e3,
+      saved_ms=(eager - lazy) * 1e3,
+  )
+  assert lazy < eager
@@ -0,0 +1,77 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Tests that the client imports its resource modules on first use."""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+
+_RESOURCE_MODULES = [
+    'google.genai.batches',
+    'google.genai.caches',
+    'google.genai.chats',
+    'google.genai.file_search_stores',
+    'google.genai.files',
+    'google.genai.live',
+    'google.genai.models',
+    'google.genai.operations',
+    'google.genai.tokens',
+    'google.genai.tunings',
+    'google.genai._replay_api_client',
+    'websockets',
+]
+
+
+def _imported_modules(code):
+  """Runs `code` in a fresh interpreter and returns its resource modules."""
+  env = {
+      key: value
+      for key, value in os.environ.items()
+      if not key.startswith('GOOGLE_GENAI_')
+  }
+  script = textwrap.dedent(f"""
+      import sys
+      from google import genai
+      client = genai.Client(api_key='test_api_key')
+      {code}
+      print(' '.join(m for m in {_RESOURCE_MODULES!r} if m in sys.modules))
+  """)
+  output = subprocess.run(
+      [sys.executable, '-c', script],
+      capture_output=True,
+      check=True,
+      env=env,
+      text=True,
+  ).stdout
+  return set(output.split())
+
+
+def test_client_does_not_import_resource_modules():
+  assert _imported_modules('') == set()
+
+
+def test_resource_property_imports_its_module():
+  assert _imported_modules('client.models') == {'google.genai.models'}
+
+
+def test_live_imports_websockets_on_first_use():
+  assert {'google.genai.live', 'websockets'} <= _imported_modules(
+      'client.aio.live'
+  )
@@ -0,0 +1,133 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+
+"""Tests for the streaming statistics of generate_content_stream."""
+
+import asyncio
+import json
+from unittest import mock
+
+import httpx
+import pytest
+
+from ... import _api_client
+from ... import Client
+from ... import types
+
+
+_CHUNKS = [
+    {'candidates': [{'content': {'role': 'model', 'parts': [{'text': 'a'}]}}]},
+    {
+        'candidates': [{
+            'content': {'role': 'model', 'parts': [{'text': 'b'}]},
+            'finishReason': 'STOP',
+        }],
+        'usageMetadata': {
+            'promptTokenCount': 2,
+            'candidatesTokenCount': 8,
+            'thoughtsTokenCount': 2,
+        },
+    },
+]
+
+
+def _sse_response(request):
+  body = ''.join(f'data: {json.dumps(chunk)}\n\n' for chunk in _CHUNKS)
+  return httpx.Response(200, content=body.encode())
+
+
+def _client():
+  transport = httpx.MockTransport(_sse_response)
+  return Client(
+      api_key='test_api_key',
+      http_options=types.HttpOptions(
+          client_args={'transport': transport},
+          async_client_args={'transport': transport},
+      ),
+  )
+
+
+def _check_stats(chunks):
+  stats = chunks[-1].streaming_stats
+  assert chunks[0].streaming_stats is None
+  assert len(stats.chunk_times) == len(stats.chunk_parse_seconds) == 2
+  assert stats.request_start_time <= stats.chunk_times[0]
+  assert stats.time_to_first_chunk >= 0
+  assert len(stats.inter_chunk_gaps) == 1
+  assert stats.parse_seconds > 0
+  assert stats.usage_metadata.candidates_token_count == 8
+  assert 'streaming_stats' not in chunks[-1].model_dump()
+
+
+def test_generate_content_stream_stats():
+  client = _client()
+
+  chunks = list(
+      client.models.generate_content_stream(
+          model='gemini-2.5-flash', contents='hi'
+      )
+  )
+
+  _check_stats(chunks)
+
+
+def test_async_generate_content_stream_stats():
+  client = _client()
+
+  async def run():
+    stream = await client.aio.models.generate_content_stream(
+        model='gemini-2.5-flash', contents='hi'
+    )
+    return [chunk async for chunk in stream]
+
+  with mock.patch.object(_api_client, 'has_aiohttp', False):
+    chunks = asyncio.run(run())
+
+  _check_stats(chunks)
+
+
+def test_send_message_stream_stats():
+  client = _client()
+  chat = client.chats.create(model='gemini-2.5-flash')
+
+  chunks = list(chat.send_message_stream('hi'))
+
+  _check_stats(chunks)
+
+
+def test_stats_derived_values():
+  stats = types.StreamingStats(
+      request_start_time=10.0,
+      chunk_times=[10.5, 11.0, 12.5],
+      chunk_parse_seconds=[0.1, 0.2, 0.3],
+      usage_metadata=types.GenerateContentResponseUsageMetadata(
+          candidates_token_count=16, thoughts_token_count=4
+      ),
+  )
+
+  assert stats.time_to_first_chunk == 0.5
+  assert stats.inter_chunk_gaps == [0.5, 1.5]
+  assert stats.parse_seconds == pytest.approx(0.6)
+  assert stats.tokens_per_second == 10.0
+
+
+def test_stats_without_chunks():
+  stats = types.StreamingStats(request_start_time=10.0, chunk_times=[10.5])
+
+  assert types.StreamingStats().time_to_first_chunk is None
+  assert stats.inter_chunk_gaps == []
+  assert stats.tokens_per_second is None
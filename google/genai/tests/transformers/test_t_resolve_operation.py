@@ -0,0 +1,54 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests for t_resolve_operation."""
+
+from unittest import mock
+
+import pytest
+
+from ... import _transformers as t
+
+
+def test_resolve_operation_times_out():
+  api_client = mock.Mock()
+  api_client.request.return_value = {'name': 'models/m/operations/1'}
+
+  with mock.patch.object(t.time, 'sleep') as sleep:
+    with pytest.raises(RuntimeError, match='timed out'):
+      t.t_resolve_operation(api_client, {'name': 'models/m/operations/1'})
+
+  slept = sum(call.args[0] for call in sleep.call_args_list)
+  assert t.LRO_POLLING_TIMEOUT_SECONDS < slept
+  assert slept < t.LRO_POLLING_TIMEOUT_SECONDS + 2 * (
+      t.LRO_POLLING_MAXIMUM_DELAY_SECONDS
+  )
+
+
+def test_resolve_operation_returns_response():
+  api_client = mock.Mock()
+  api_client.request.side_effect = [
+      {'name': 'models/m/operations/1'},
+      {'name': 'models/m/operations/1', 'done': True, 'response': {'a': 1}},
+  ]
+
+  with mock.patch.object(t.time, 'sleep'):
+    response = t.t_resolve_operation(
+        api_client, {'name': 'models/m/operations/1'}
+    )
+
+  assert response == {'a': 1}
+  assert api_client.request.call_count == 2
@@ -2970,3 +2970,85 @@ def test_computer_use_types():
   assert len(c.disabled_safety_policies) == 2
   assert types.SafetyPolicy.FINANCIAL_TRANSACTIONS in c.disabled_safety_policies
 
+
+
+def _generate_content_response_dict():
+  return {
+      'candidates': [{
+          'content': {
+              'parts': [
+                  {'text': 'Hello', 'thoughtSignature': 'aGVsbG8='},
+                  {'functionCall': {'name': 'get_weather', 'args': {'a': 1}}},
+              ],
+              'role': 'model',
+          },
+          'finishReason': 'STOP',
+          'avgLogprobs': -1,
+          'citationMetadata': {'citations': [{'uri': 'http://a.com'}]},
+          'safetyRatings': [{'category': 'NEW_CATEGORY'}],
+          'unknownField': 'dropped',
+      }],
+      'createTime': '2026-01-01T00:00:00Z',
+      'usageMetadata': {'promptTokenCount': 12, 'totalTokenCount': 400},
+  }
+
+
+def test_from_response_skip_validation_matches_validation():
+  validated = types.GenerateContentResponse._from_response(
+      response=_generate_content_response_dict(), kwargs={}
+  )
+  constructed = types.GenerateContentResponse._from_response(
+      response=_generate_content_response_dict(),
+      kwargs={},
+      skip_validation=True,
+  )
+
+  assert constructed == validated
+  assert constructed.model_fields_set == validated.model_fields_set
+  candidate = constructed.candidates[0]
+  assert candidate.finish_reason == types.FinishReason.STOP
+  assert candidate.avg_logprobs == -1.0
+  assert candidate.content.parts[0].thought_signature == b'hello'
+  assert candidate.citation_metadata.citations[0].uri == 'http://a.com'
+  assert candidate.safety_ratings[0].category.value == 'NEW_CATEGORY'
+  assert constructed.create_time.year == 2026
+
+
+def test_from_response_skip_validation_parses_response_schema():
+  class Answer(pydantic.BaseModel):
+    answer: int
+
+  response = types.GenerateContentResponse._from_response(
+      response={
+          'candidates': [{'content': {'parts': [{'text': '{"answer": 42}'}]}}]
+      },
+      kwargs={'config': {'response_schema': Answer}},
+      skip_validation=True,
+  )
+
+  assert response.parsed == Answer(answer=42)
+
+
+def test_generate_content_parameters_keeps_content_list_items():
+  contents = [
+      types.UserContent(parts=[types.Part(text='What is the weather?')]),
+      types.ModelContent(parts=[types.Part(text='Sunny.')]),
+      types.Content(role='user', parts=[types.Part(text='Thanks.')]),
+  ]
+
+  parameters = types._GenerateContentParameters(
+      model='gemini-2.5-flash', contents=contents
+  )
+
+  assert parameters.contents == contents
+  assert parameters.contents is not contents
+  assert all(a is b for a, b in zip(parameters.contents, contents))
+
+
+def test_generate_content_parameters_validates_mixed_content_lists():
+  parameters = types._GenerateContentParameters(
+      model='gemini-2.5-flash',
+      contents=[types.Content(role='user', parts=[types.Part(text='Hi')]), 'Hello'],
+  )
+
+  assert parameters.contents[1] == 'Hello'
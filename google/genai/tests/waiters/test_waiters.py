@@ -0,0 +1,356 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests for waiters.as_completed() and waiters.wait()."""
+
+import asyncio
+import threading
+import time
+from unittest import mock
+
+import httpx
+import pytest
+
+from ... import batches
+from ... import Client
+from ... import errors
+from ... import types
+from ... import waiters
+
+
+_FAST = {'initial_delay_seconds': 0.001, 'max_delay_seconds': 0.01}
+
+
+class _FakeApi:
+  """Plays a list of states for each job, one status request at a time."""
+
+  def __init__(self, states, latency=0.0):
+    self.states = {name: list(states) for name, states in states.items()}
+    self.polls = []
+    self.latency = latency
+    self.in_flight = 0
+    self.max_in_flight = 0
+    self._lock = threading.Lock()
+
+  def _next(self, job):
+    with self._lock:
+      self.polls.append(job.name)
+      state = self.states[job.name].pop(0)
+    if isinstance(state, Exception):
+      raise state
+    if isinstance(job, types.Operation):
+      return job.model_copy(update={'done': state})
+    return job.model_copy(update={'state': types.JobState(state)})
+
+  def _enter(self):
+    with self._lock:
+      self.in_flight += 1
+      self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+  def _exit(self):
+    with self._lock:
+      self.in_flight -= 1
+
+  def poll(self, job, config):
+    self._enter()
+    try:
+      time.sleep(self.latency)
+      return self._next(job)
+    finally:
+      self._exit()
+
+  async def async_poll(self, job, config):
+    self._enter()
+    try:
+      await asyncio.sleep(self.latency)
+      return self._next(job)
+    finally:
+      self._exit()
+
+
+@pytest.fixture
+def client():
+  return Client(api_key='test_api_key')
+
+
+def _batch_job(name, state='JOB_STATE_PENDING'):
+  return types.BatchJob(name=name, state=state)
+
+
+def test_as_completed_yields_jobs_as_they_end(client):
+  fake = _FakeApi({
+      'batches/slow': [
+          'JOB_STATE_RUNNING',
+          'JOB_STATE_RUNNING',
+          'JOB_STATE_SUCCEEDED',
+      ],
+      'batches/fast': ['JOB_STATE_FAILED'],
+  })
+  jobs = [
+      _batch_job('batches/slow'),
+      _batch_job('batches/done', 'JOB_STATE_SUCCEEDED'),
+      _batch_job('batches/fast'),
+  ]
+
+  with mock.patch.object(client.waiters, '_poll', side_effect=fake.poll):
+    ended = list(client.waiters.as_completed(jobs, config=_FAST))
+
+  assert [(job.name, job.state) for job in ended] == [
+      ('batches/done', 'JOB_STATE_SUCCEEDED'),
+      ('batches/fast', 'JOB_STATE_FAILED'),
+      ('batches/slow', 'JOB_STATE_SUCCEEDED'),
+  ]
+  assert fake.polls.count('batches/slow') == 3
+  assert 'batches/done' not in fake.polls
+
+
+def test_wait_returns_jobs_in_input_order(client):
+  fake = _FakeApi({
+      'batches/1': ['JOB_STATE_RUNNING', 'JOB_STATE_SUCCEEDED'],
+      'tunedModels/2': ['JOB_STATE_SUCCEEDED'],
+      'models/veo/operations/3': [False, True],
+  })
+  jobs = [
+      _batch_job('batches/1'),
+      types.TuningJob(name='tunedModels/2', state='JOB_STATE_RUNNING'),
+      types.GenerateVideosOperation(name='models/veo/operations/3'),
+  ]
+
+  with mock.patch.object(client.waiters, '_poll', side_effect=fake.poll):
+    ended = client.waiters.wait(jobs, config=_FAST)
+
+  assert [job.name for job in ended] == [job.name for job in jobs]
+  assert ended[0].done
+  assert ended[1].has_ended
+  assert ended[2].done
+
+
+def test_wait_caps_concurrent_status_requests(client):
+  fake = _FakeApi(
+      {f'batches/{i}': ['JOB_STATE_SUCCEEDED'] for i in range(12)},
+      latency=0.02,
+  )
+  jobs = [_batch_job(f'batches/{i}') for i in range(12)]
+
+  with mock.patch.object(client.waiters, '_poll', side_effect=fake.poll):
+    ended = client.waiters.wait(jobs, config={**_FAST, 'max_concurrency': 3})
+
+  assert all(job.done for job in ended)
+  assert fake.max_in_flight == 3
+
+
+def test_wait_times_out(client):
+  fake = _FakeApi({'batches/1': ['JOB_STATE_RUNNING'] * 1000})
+
+  with mock.patch.object(client.waiters, '_poll', side_effect=fake.poll):
+    with pytest.raises(TimeoutError, match='1 of 1 jobs did not end'):
+      client.waiters.wait(
+          [_batch_job('batches/1')],
+          config={**_FAST, 'timeout_seconds': 0.05},
+      )
+
+
+def test_wait_rejects_other_objects(client):
+  with pytest.raises(TypeError, match='File'):
+    client.waiters.wait([types.File(name='files/1')])
+
+
+def test_next_delay_backs_off_until_progress():
+  config = waiters._wait_config({
+      'initial_delay_seconds': 1,
+      'max_delay_seconds': 3,
+      'backoff_multiplier': 2,
+  })
+  running = _batch_job('batches/1', 'JOB_STATE_RUNNING')
+
+  assert waiters._next_delay(config, 1, running, running) == 2
+  assert waiters._next_delay(config, 2, running, running) == 3
+  assert waiters._next_delay(config, 3, _batch_job('batches/1'), running) == 1
+
+
+def test_poll_gets_batch_job(client):
+  job = _batch_job('batches/1')
+  latest = _batch_job('batches/1', 'JOB_STATE_SUCCEEDED')
+  http_options = types.HttpOptions(timeout=1000)
+
+  with mock.patch.object(
+      batches.Batches, 'get', return_value=latest
+  ) as get:
+    ended = client.waiters.wait(
+        [job], config={**_FAST, 'http_options': http_options}
+    )
+
+  assert ended == [latest]
+  get.assert_called_once_with(
+      name='batches/1', config={'http_options': http_options}
+  )
+
+
+def test_async_as_completed(client):
+  fake = _FakeApi({
+      'batches/slow': ['JOB_STATE_RUNNING', 'JOB_STATE_SUCCEEDED'],
+      'batches/fast': ['JOB_STATE_SUCCEEDED'],
+  })
+  jobs = [_batch_job('batches/slow'), _batch_job('batches/fast')]
+
+  async def run():
+    return [
+        job.name
+        async for job in client.aio.waiters.as_completed(jobs, config=_FAST)
+    ]
+
+  with mock.patch.object(
+      client.aio.waiters, '_poll', side_effect=fake.async_poll
+  ):
+    assert asyncio.run(run()) == ['batches/fast', 'batches/slow']
+
+
+def test_async_wait_caps_concurrent_status_requests(client):
+  fake = _FakeApi(
+      {f'batches/{i}': ['JOB_STATE_SUCCEEDED'] for i in range(12)},
+      latency=0.02,
+  )
+  jobs = [_batch_job(f'batches/{i}') for i in range(12)]
+
+  with mock.patch.object(
+      client.aio.waiters, '_poll', side_effect=fake.async_poll
+  ):
+    ended = asyncio.run(
+        client.aio.waiters.wait(jobs, config={**_FAST, 'max_concurrency': 3})
+    )
+
+  assert [job.name for job in ended] == [job.name for job in jobs]
+  assert fake.max_in_flight == 3
+
+
+def test_async_wait_times_out(client):
+  fake = _FakeApi({'batches/1': ['JOB_STATE_RUNNING'] * 1000})
+
+  with mock.patch.object(
+      client.aio.waiters, '_poll', side_effect=fake.async_poll
+  ):
+    with pytest.raises(TimeoutError, match='1 of 1 jobs did not end'):
+      asyncio.run(
+          client.aio.waiters.wait(
+              [_batch_job('batches/1')],
+              config={**_FAST, 'timeout_seconds': 0.05},
+          )
+      )
+
+
+def _transient_errors():
+  return [
+      errors.ServerError(503, {'error': {'message': 'Unavailable.'}}),
+      errors.ClientError(429, {'error': {'message': 'Too many requests.'}}),
+      httpx.ConnectError('Connection refused.'),
+  ]
+
+
+def test_wait_polls_again_after_transient_errors(client):
+  fake = _FakeApi({
+      'batches/1': [*_transient_errors(), 'JOB_STATE_SUCCEEDED'],
+      'batches/2': ['JOB_STATE_SUCCEEDED'],
+  })
+  jobs = [_batch_job('batches/1'), _batch_job('batches/2')]
+
+  with mock.patch.object(client.waiters, '_poll', side_effect=fake.poll):
+    ended = client.waiters.wait(jobs, config=_FAST)
+
+  assert [job.state for job in ended] == ['JOB_STATE_SUCCEEDED'] * 2
+  assert fake.polls.count('batches/1') == 4
+
+
+def test_wait_raises_other_errors_with_the_job_name(client, caplog):
+  fake = _FakeApi({
+      'batches/1': [errors.ClientError(404, {'error': {'message': 'Gone.'}})]
+  })
+
+  with mock.patch.object(client.waiters, '_poll', side_effect=fake.poll):
+    with pytest.raises(errors.ClientError, match='Gone.'):
+      client.waiters.wait([_batch_job('batches/1')], config=_FAST)
+
+  assert 'batches/1' in caplog.text
+
+
+def test_async_wait_polls_again_after_transient_errors(client):
+  fake = _FakeApi({'batches/1': [*_transient_errors(), 'JOB_STATE_SUCCEEDED']})
+
+  with mock.patch.object(
+      client.aio.waiters, '_poll', side_effect=fake.async_poll
+  ):
+    [ended] = asyncio.run(
+        client.aio.waiters.wait([_batch_job('batches/1')], config=_FAST)
+    )
+
+  assert ended.state == 'JOB_STATE_SUCCEEDED'
+  assert fake.polls.count('batches/1') == 4
+
+
+def test_async_wait_raises_other_errors_with_the_job_name(client, caplog):
+  fake = _FakeApi({'batches/1': [ValueError('Unexpected response.')]})
+
+  with mock.patch.object(
+      client.aio.waiters, '_poll', side_effect=fake.async_poll
+  ):
+    with pytest.raises(ValueError, match='Unexpected response.'):
+      asyncio.run(
+          client.aio.waiters.wait([_batch_job('batches/1')], config=_FAST)
+      )
+
+  assert 'batches/1' in caplog.text
+
+
+def _sharded_job(display_name=None):
+  return types.ShardedBatchJob(
+      display_name=display_name,
+      jobs=[
+          types.BatchJob(name='batches/1', state='JOB_STATE_RUNNING'),
+          types.BatchJob(name='batches/2', state='JOB_STATE_RUNNING'),
+      ],
+  )
+
+
+def test_wait_polls_sharded_job_again_after_transient_error(client, caplog):
+  responses = iter([
+      errors.ServerError(503, {'error': {'message': 'Unavailable.'}}),
+      types.BatchJob(name='batches/1', state='JOB_STATE_SUCCEEDED'),
+      types.BatchJob(name='batches/2', state='JOB_STATE_SUCCEEDED'),
+  ])
+
+  def get(name, config):
+    response = next(responses)
+    if isinstance(response, Exception):
+      raise response
+    return response
+
+  with mock.patch.object(batches.Batches, 'get', side_effect=get):
+    [ended] = client.waiters.wait([_sharded_job()], config=_FAST)
+
+  assert ended.state == types.JobState.JOB_STATE_SUCCEEDED
+  assert 'sharded batch job of batches/1, batches/2' in caplog.text
+
+
+def test_async_wait_raises_sharded_job_errors_with_its_name(client, caplog):
+  async def get(name, config):
+    raise errors.ClientError(403, {'error': {'message': 'Denied.'}})
+
+  with mock.patch.object(batches.AsyncBatches, 'get', side_effect=get):
+    with pytest.raises(errors.ClientError, match='Denied.'):
+      asyncio.run(
+          client.aio.waiters.wait([_sharded_job('nightly')], config=_FAST)
+      )
+
+  assert 'sharded batch job nightly' in caplog.text
@@ -1056,6 +1056,19 @@ class ResourceScope(_common.CaseInSensitiveEnum):
       "https://aiplatform.googleapis.com/publishers/google/models/gemini-3-pro-preview"""
 
 
+class JsonCodec(_common.CaseInSensitiveEnum):
+  """JSON codec used to encode request bodies and decode response bodies."""
+
+  AUTO = 'AUTO'
+  """Use orjson or msgspec when installed, otherwise the standard library."""
+  ORJSON = 'ORJSON'
+  """Use orjson. Requires the `orjson` package."""
+  MSGSPEC = 'MSGSPEC'
+  """Use msgspec. Requires the `msgspec` package."""
+  JSON = 'JSON'
+  """Use the standard library json module."""
+
+
 class JSONSchemaType(Enum):
   """The type of the data supported by JSON Schema.
 
@@ -2588,6 +2601,18 @@ class HttpRetryOptions(_common.BaseModel):
       description="""List of HTTP status codes that should trigger a retry.
       If not specified, a default set of retryable codes (408, 429, and 5xx) may be used.""",
   )
+  retry_budget_ratio: Optional[float] = Field(
+      default=None,
+      description="""Maximum number of retries of the client as a fraction of its successful requests, such as 0.1 for 10%. A reserve of 10 retries is always available. Only read from the client's http options. If not specified, retries are not budgeted.""",
+  )
+  circuit_breaker_threshold: Optional[int] = Field(
+      default=None,
+      description="""Number of consecutive failures of a backend, a base URL and model, after which its requests fail fast with `errors.CircuitOpenError`. Only read from the client's http options. If not specified, there is no circuit breaker.""",
+  )
+  circuit_breaker_reset_timeout: Optional[float] = Field(
+      default=None,
+      description="""Seconds a backend fails fast before a single probe request is sent to it. If not specified, default to 30.0 seconds.""",
+  )
 
 
 class HttpRetryOptionsDict(TypedDict, total=False):
@@ -2613,10 +2638,241 @@ class HttpRetryOptionsDict(TypedDict, total=False):
   """List of HTTP status codes that should trigger a retry.
       If not specified, a default set of retryable codes (408, 429, and 5xx) may be used."""
 
+  retry_budget_ratio: Optional[float]
+  """Maximum number of retries of the client as a fraction of its successful requests, such as 0.1 for 10%. A reserve of 10 retries is always available. Only read from the client's http options. If not specified, retries are not budgeted."""
+
+  circuit_breaker_threshold: Optional[int]
+  """Number of consecutive failures of a backend, a base URL and model, after which its requests fail fast with `errors.CircuitOpenError`. Only read from the client's http options. If not specified, there is no circuit breaker."""
+
+  circuit_breaker_reset_timeout: Optional[float]
+  """Seconds a backend fails fast before a single probe request is sent to it. If not specified, default to 30.0 seconds."""
+
 
 HttpRetryOptionsOrDict = Union[HttpRetryOptions, HttpRetryOptionsDict]
 
 
+class RateLimitOptions(_common.BaseModel):
+  """Client-side rate limits on the requests to each model.
+
+  Requests over a limit wait in line instead of failing. The limits adapt to
+  the service: they are lowered after a 429 response, which also pauses the
+  model's requests for the delay the server asks for, and recover gradually
+  as requests succeed.
+  """
+
+  requests_per_minute: Optional[int] = Field(
+      default=None,
+      description="""Maximum number of requests per minute to each model. If not
+      specified, requests are not limited.""",
+  )
+  tokens_per_minute: Optional[int] = Field(
+      default=None,
+      description="""Maximum number of prompt tokens per minute to each model.
+      The tokens of a request are estimated locally before it is sent and
+      corrected with the prompt token count of its usage metadata. If not
+      specified, tokens are not limited.""",
+  )
+
+
+class RateLimitOptionsDict(TypedDict, total=False):
+  """Client-side rate limits on the requests to each model.
+
+  Requests over a limit wait in line instead of failing. The limits adapt to
+  the service: they are lowered after a 429 response, which also pauses the
+  model's requests for the delay the server asks for, and recover gradually
+  as requests succeed.
+  """
+
+  requests_per_minute: Optional[int]
+  """Maximum number of requests per minute to each model. If not
+      specified, requests are not limited."""
+
+  tokens_per_minute: Optional[int]
+  """Maximum number of prompt tokens per minute to each model.
+      The tokens of a request are estimated locally before it is sent and
+      corrected with the prompt token count of its usage metadata. If not
+      specified, tokens are not limited."""
+
+
+RateLimitOptionsOrDict = Union[RateLimitOptions, RateLimitOptionsDict]
+
+
+class HedgingOptions(_common.BaseModel):
+  """Options to hedge requests against slow backends.
+
+  A request still in flight after the hedging delay is sent a second time, and
+  the first successful response is used. Only non-streamed requests to the
+  hedged methods are hedged.
+  """
+
+  delay: Optional[float] = Field(
+      default=None,
+      description="""Seconds after which a duplicate of a request still in
+      flight is sent. When `latency_percentile` is also set, used until enough
+      latencies have been observed.""",
+  )
+  latency_percentile: Optional[float] = Field(
+      default=None,
+      description="""Percentile of the observed latencies of the same method
+      after which a duplicate of a request still in flight is sent, such as
+      95.""",
+  )
+  methods: Optional[list[str]] = Field(
+      default=None,
+      description="""Methods whose requests are hedged. If not specified,
+      default to countTokens, computeTokens, embedContent, batchEmbedContents
+      and generateContent.""",
+  )
+
+
+class HedgingOptionsDict(TypedDict, total=False):
+  """Options to hedge requests against slow backends.
+
+  A request still in flight after the hedging delay is sent a second time, and
+  the first successful response is used. Only non-streamed requests to the
+  hedged methods are hedged.
+  """
+
+  delay: Optional[float]
+  """Seconds after which a duplicate of a request still in
+      flight is sent. When `latency_percentile` is also set, used until enough
+      latencies have been observed."""
+
+  latency_percentile: Optional[float]
+  """Percentile of the observed latencies of the same method
+      after which a duplicate of a request still in flight is sent, such as
+      95."""
+
+  methods: Optional[list[str]]
+  """Methods whose requests are hedged. If not specified,
+      default to countTokens, computeTokens, embedContent, batchEmbedContents
+      and generateContent."""
+
+
+HedgingOptionsOrDict = Union[HedgingOptions, HedgingOptionsDict]
+
+
+class ConnectionPoolOptions(_common.BaseModel):
+  """Connection pool settings of the default HTTP clients.
+
+  Args set directly in `client_args` or `async_client_args` take precedence.
+  """
+
+  max_connections: Optional[int] = Field(
+      default=None,
+      description="""Maximum number of concurrent connections. If not
+      specified, default to 100 for httpx and unlimited for aiohttp.""",
+  )
+  max_keepalive_connections: Optional[int] = Field(
+      default=None,
+      description="""Maximum number of idle connections kept alive by the
+      httpx clients. If not specified, default to 20.""",
+  )
+  max_connections_per_host: Optional[int] = Field(
+      default=None,
+      description="""Maximum number of concurrent connections to the same
+      host. Only applies to the aiohttp session, as httpx does not limit
+      connections per host. If not specified, connections per host are not
+      limited.""",
+  )
+  keepalive_expiry: Optional[float] = Field(
+      default=None,
+      description="""Seconds an idle connection is kept alive. If not
+      specified, default to 5 seconds for httpx and 15 seconds for aiohttp.""",
+  )
+  http2: Optional[bool] = Field(
+      default=None,
+      description="""Whether the httpx clients use HTTP/2, multiplexing
+      concurrent requests over fewer connections. Requires the `h2` package,
+      installed with the `http2` extra. If not specified, HTTP/2 is used for
+      googleapis.com endpoints when `h2` is installed. The aiohttp session
+      only supports HTTP/1.1.""",
+  )
+
+
+class ConnectionPoolOptionsDict(TypedDict, total=False):
+  """Connection pool settings of the default HTTP clients.
+
+  Args set directly in `client_args` or `async_client_args` take precedence.
+  """
+
+  max_connections: Optional[int]
+  """Maximum number of concurrent connections. If not
+      specified, default to 100 for httpx and unlimited for aiohttp."""
+
+  max_keepalive_connections: Optional[int]
+  """Maximum number of idle connections kept alive by the
+      httpx clients. If not specified, default to 20."""
+
+  max_connections_per_host: Optional[int]
+  """Maximum number of concurrent connections to the same
+      host. Only applies to the aiohttp session, as httpx does not limit
+      connections per host. If not specified, connections per host are not
+      limited."""
+
+  keepalive_expiry: Optional[float]
+  """Seconds an idle connection is kept alive. If not
+      specified, default to 5 seconds for httpx and 15 seconds for aiohttp."""
+
+  http2: Optional[bool]
+  """Whether the httpx clients use HTTP/2, multiplexing
+      concurrent requests over fewer connections. Requires the `h2` package,
+      installed with the `http2` extra. If not specified, HTTP/2 is used for
+      googleapis.com endpoints when `h2` is installed. The aiohttp session
+      only supports HTTP/1.1."""
+
+
+ConnectionPoolOptionsOrDict = Union[
+    ConnectionPoolOptions, ConnectionPoolOptionsDict
+]
+
+
+class WarmupResult(_common.BaseModel):
+  """The time spent in each phase of warming up a client."""
+
+  auth_seconds: Optional[float] = Field(
+      default=None,
+      description="""Seconds spent resolving the credentials and fetching an
+      access token. None if the client authenticates with an API key.""",
+  )
+  connect_seconds: Optional[float] = Field(
+      default=None,
+      description="""Seconds spent opening the pooled connections.""",
+  )
+  connections: Optional[int] = Field(
+      default=None,
+      description="""Number of requests sent concurrently to open the pooled
+      connections. 0 if the transport of the client cannot be warmed up.""",
+  )
+  validators_seconds: Optional[float] = Field(
+      default=None,
+      description="""Seconds spent building the validators of the requested
+      types.""",
+  )
+
+
+class WarmupResultDict(TypedDict, total=False):
+  """The time spent in each phase of warming up a client."""
+
+  auth_seconds: Optional[float]
+  """Seconds spent resolving the credentials and fetching an
+      access token. None if the client authenticates with an API key."""
+
+  connect_seconds: Optional[float]
+  """Seconds spent opening the pooled connections."""
+
+  connections: Optional[int]
+  """Number of requests sent concurrently to open the pooled
+      connections. 0 if the transport of the client cannot be warmed up."""
+
+  validators_seconds: Optional[float]
+  """Seconds spent building the validators of the requested
+      types."""
+
+
+WarmupResultOrDict = Union[WarmupResult, WarmupResultDict]
+
+
 class HttpOptions(_common.BaseModel):
   """HTTP options to be used in each of the requests."""
 
@@ -2644,6 +2900,10 @@ class HttpOptions(_common.BaseModel):
   async_client_args: Optional[dict[str, Any]] = Field(
       default=None, description="""Args passed to the async HTTP client."""
   )
+  connection_pool_options: Optional[ConnectionPoolOptions] = Field(
+      default=None,
+      description="""Connection pool settings of the default HTTP clients.""",
+  )
   extra_body: Optional[dict[str, Any]] = Field(
       default=None,
       description="""Extra parameters to add to the request body.
@@ -2654,6 +2914,80 @@ class HttpOptions(_common.BaseModel):
   retry_options: Optional[HttpRetryOptions] = Field(
       default=None, description="""HTTP retry options for the request."""
   )
+  json_codec: Optional[JsonCodec] = Field(
+      default=None,
+      description="""The JSON codec used to encode request bodies and decode
+      response bodies. Only applied when set on the client. If not specified,
+      default to AUTO.""",
+  )
+  stream_inline_data: Optional[bool] = Field(
+      default=None,
+      description="""Whether to keep inline bytes, such as `Blob.data`, unencoded
+      until the request body is written. Their base64 encoding is then streamed
+      into the request body instead of being built up in memory with the rest
+      of the request. Only applied when set on the client.""",
+  )
+  skip_response_validation: Optional[bool] = Field(
+      default=None,
+      description="""Whether to construct generate content responses without
+      validating them. Only values not already of their field's type are
+      converted, which saves most of the CPU spent on building each response.
+      Only applied when set on the client.""",
+  )
+  upload_chunk_size: Optional[int] = Field(
+      default=None,
+      description="""The size in bytes of each chunk of a resumable file upload.
+      Must be a multiple of 256 KiB. If not specified, default to 8 MiB.""",
+  )
+  upload_max_in_flight_chunks: Optional[int] = Field(
+      default=None,
+      description="""The maximum number of chunks of a resumable file upload
+      that are sent before the earlier ones are acknowledged. Values above 1
+      pipeline the chunks over concurrent requests. If the server does not
+      accept a chunk out of order, the upload resumes one chunk at a time from
+      the offset the server has received. If not specified, default to 1.""",
+  )
+  download_chunk_size: Optional[int] = Field(
+      default=None,
+      description="""The size in bytes of the chunks written to the destination
+      of a streaming file download. If not specified, default to 1 MiB.""",
+  )
+  download_parallel_segments: Optional[int] = Field(
+      default=None,
+      description="""The number of byte ranges of a streaming file download that
+      are fetched concurrently. Only applied when the destination is seekable
+      and the server supports range requests. If not specified, default to 1.""",
+  )
+  download_max_resumes: Optional[int] = Field(
+      default=None,
+      description="""The number of times a streaming file download resumes from
+      the bytes already written after its connection drops. If not specified,
+      default to 0.""",
+  )
+  rate_limit_options: Optional[RateLimitOptions] = Field(
+      default=None,
+      description="""Client-side rate limits on the requests to each model.
+      Only applied when set on the client.""",
+  )
+  hedging_options: Optional[HedgingOptions] = Field(
+      default=None,
+      description="""Options to send a duplicate of slow requests and use the
+      first response. Only applied when set on the client.""",
+  )
+  token_refresh_margin: Optional[float] = Field(
+      default=None,
+      description="""Seconds before its expiry that the access token of the
+      credentials is refreshed in the background, so that requests do not wait
+      for the refresh. 0 disables the background refresh. If not specified,
+      default to 300 seconds. Only applied when set on the client.""",
+  )
+  instrumentation_hooks: Optional[list[Callable[[Any], None]]] = Field(
+      default=None,
+      description="""Callables called with an
+      `instrumentation.InstrumentationEvent` at the end of each phase of a
+      request, such as `instrumentation.OpenTelemetryHook()`. If not specified,
+      requests are not instrumented. Only applied when set on the client.""",
+  )
 
   httpx_client: Optional['HttpxClient'] = Field(
       default=None,
@@ -2693,6 +3027,9 @@ class HttpOptionsDict(TypedDict, total=False):
   async_client_args: Optional[dict[str, Any]]
   """Args passed to the async HTTP client."""
 
+  connection_pool_options: Optional[ConnectionPoolOptionsDict]
+  """Connection pool settings of the default HTTP clients."""
+
   extra_body: Optional[dict[str, Any]]
   """Extra parameters to add to the request body.
       The structure must match the backend API's request structure.
@@ -2702,6 +3039,68 @@ class HttpOptionsDict(TypedDict, total=False):
   retry_options: Optional[HttpRetryOptionsDict]
   """HTTP retry options for the request."""
 
+  json_codec: Optional[JsonCodec]
+  """The JSON codec used to encode request bodies and decode
+      response bodies. Only applied when set on the client. If not specified,
+      default to AUTO."""
+
+  stream_inline_data: Optional[bool]
+  """Whether to keep inline bytes, such as `Blob.data`, unencoded
+      until the request body is written. Their base64 encoding is then streamed
+      into the request body instead of being built up in memory with the rest
+      of the request. Only applied when set on the client."""
+
+  skip_response_validation: Optional[bool]
+  """Whether to construct generate content responses without
+      validating them. Only values not already of their field's type are
+      converted, which saves most of the CPU spent on building each response.
+      Only applied when set on the client."""
+
+  upload_chunk_size: Optional[int]
+  """The size in bytes of each chunk of a resumable file upload.
+      Must be a multiple of 256 KiB. If not specified, default to 8 MiB."""
+
+  upload_max_in_flight_chunks: Optional[int]
+  """The maximum number of chunks of a resumable file upload
+      that are sent before the earlier ones are acknowledged. Values above 1
+      pipeline the chunks over concurrent requests. If the server does not
+      accept a chunk out of order, the upload resumes one chunk at a time from
+      the offset the server has received. If not specified, default to 1."""
+
+  download_chunk_size: Optional[int]
+  """The size in bytes of the chunks written to the destination
+      of a streaming file download. If not specified, default to 1 MiB."""
+
+  download_parallel_segments: Optional[int]
+  """The number of byte ranges of a streaming file download that
+      are fetched concurrently. Only applied when the destination is seekable
+      and the server supports range requests. If not specified, default to 1."""
+
+  download_max_resumes: Optional[int]
+  """The number of times a streaming file download resumes from
+      the bytes already written after its connection drops. If not specified,
+      default to 0."""
+
+  rate_limit_options: Optional[RateLimitOptionsDict]
+  """Client-side rate limits on the requests to each model.
+      Only applied when set on the client."""
+
+  hedging_options: Optional[HedgingOptionsDict]
+  """Options to send a duplicate of slow requests and use the
+      first response. Only applied when set on the client."""
+
+  token_refresh_margin: Optional[float]
+  """Seconds before its expiry that the access token of the
+      credentials is refreshed in the background, so that requests do not wait
+      for the refresh. 0 disables the background refresh. If not specified,
+      default to 300 seconds. Only applied when set on the client."""
+
+  instrumentation_hooks: Optional[list[Callable[[Any], None]]]
+  """Callables called with an
+      `instrumentation.InstrumentationEvent` at the end of each phase of a
+      request, such as `instrumentation.OpenTelemetryHook()`. If not specified,
+      requests are not instrumented. Only applied when set on the client."""
+
 
 HttpOptionsOrDict = Union[HttpOptions, HttpOptionsDict]
 
@@ -5657,6 +6056,25 @@ class AutomaticFunctionCallingConfig(_common.BaseModel):
       GenerateContentResponse.automatic_function_calling_history.
       """,
   )
+  max_concurrent_function_calls: Optional[int] = Field(
+      default=None,
+      description="""If automatic function calling is enabled,
+      maximum number of function calls from one model response to run at
+      the same time. Synchronous methods run them in a thread pool, and
+      asynchronous methods with asyncio.gather. The function responses keep
+      the order of the function calls.
+      If not set, SDK will run the function calls one after another.
+      """,
+  )
+  function_call_timeout: Optional[float] = Field(
+      default=None,
+      description="""If automatic function calling is enabled,
+      timeout in seconds for each function call. A function call that times
+      out gets an error function response. A synchronous function keeps
+      running in its thread after it times out.
+      If not set, function calls have no timeout.
+      """,
+  )
 
 
 class AutomaticFunctionCallingConfigDict(TypedDict, total=False):
@@ -5683,6 +6101,23 @@ class AutomaticFunctionCallingConfigDict(TypedDict, total=False):
       GenerateContentResponse.automatic_function_calling_history.
       """
 
+  max_concurrent_function_calls: Optional[int]
+  """If automatic function calling is enabled,
+      maximum number of function calls from one model response to run at
+      the same time. Synchronous methods run them in a thread pool, and
+      asynchronous methods with asyncio.gather. The function responses keep
+      the order of the function calls.
+      If not set, SDK will run the function calls one after another.
+      """
+
+  function_call_timeout: Optional[float]
+  """If automatic function calling is enabled,
+      timeout in seconds for each function call. A function call that times
+      out gets an error function response. A synchronous function keeps
+      running in its thread after it times out.
+      If not set, function calls have no timeout.
+      """
+
 
 AutomaticFunctionCallingConfigOrDict = Union[
     AutomaticFunctionCallingConfig, AutomaticFunctionCallingConfigDict
@@ -6887,6 +7322,19 @@ class _GenerateContentParameters(_common.BaseModel):
       """,
   )
 
+  @pydantic.field_validator('contents', mode='wrap')
+  @classmethod
+  def _pass_through_content_lists(
+      cls, value: Any, handler: pydantic.ValidatorFunctionWrapHandler
+  ) -> Any:
+    # Multi-turn callers, such as chats and automatic function calling, pass
+    # their whole history as a list of Content. Validating it against the
+    # union tries every item against each member from its attributes, which
+    # grows with the history on every turn, only to keep the same items.
+    if type(value) is list and all(isinstance(item, Content) for item in value):
+      return list(value)
+    return handler(value)
+
 
 class _GenerateContentParametersDict(TypedDict, total=False):
   """Config for models.generate_content parameters."""
@@ -8543,6 +8991,116 @@ class ModelStatusDict(TypedDict, total=False):
 ModelStatusOrDict = Union[ModelStatus, ModelStatusDict]
 
 
+class StreamingStats(_common.BaseModel):
+  """Latency statistics of a streamed response.
+
+  The statistics are attached to the final chunk of the response, the one with
+  a finish reason, and are complete once the stream is exhausted.
+  """
+
+  request_start_time: Optional[float] = Field(
+      default=None,
+      description="""When the request was started, in seconds since the
+      epoch.""",
+  )
+  chunk_times: list[float] = Field(
+      default_factory=list,
+      description="""When each chunk was received and parsed from the wire,
+      before it was converted to a response, in seconds since the epoch.""",
+  )
+  chunk_parse_seconds: list[float] = Field(
+      default_factory=list,
+      description="""Seconds spent converting and validating each chunk into a
+      response.""",
+  )
+  usage_metadata: Optional[GenerateContentResponseUsageMetadata] = Field(
+      default=None,
+      description="""The latest usage metadata of the stream, which covers the
+      whole response once the stream is exhausted.""",
+  )
+
+  @property
+  def time_to_first_chunk(self) -> Optional[float]:
+    """Seconds from the start of the request to the first chunk."""
+    if self.request_start_time is None or not self.chunk_times:
+      return None
+    return self.chunk_times[0] - self.request_start_time
+
+  @property
+  def inter_chunk_gaps(self) -> list[float]:
+    """Seconds between each chunk and the previous one."""
+    return [
+        later - earlier
+        for earlier, later in zip(self.chunk_times, self.chunk_times[1:])
+    ]
+
+  @property
+  def parse_seconds(self) -> float:
+    """Seconds spent converting and validating the chunks."""
+    return sum(self.chunk_parse_seconds)
+
+  @property
+  def tokens_per_second(self) -> Optional[float]:
+    """Output tokens per second, from the first chunk to the last one.
+
+    Output tokens include thinking tokens. None until there are two chunks and
+    usage metadata with output tokens.
+    """
+    if len(self.chunk_times) < 2 or self.usage_metadata is None:
+      return None
+    tokens = (self.usage_metadata.candidates_token_count or 0) + (
+        self.usage_metadata.thoughts_token_count or 0
+    )
+    duration = self.chunk_times[-1] - self.chunk_times[0]
+    if not tokens or duration <= 0:
+      return None
+    return tokens / duration
+
+  def _record_chunk(
+      self,
+      received_at: float,
+      parse_seconds: float,
+      chunk: 'GenerateContentResponse',
+  ) -> None:
+    """Records a chunk, and attaches the statistics to it if it is final."""
+    self.chunk_times.append(received_at)
+    self.chunk_parse_seconds.append(parse_seconds)
+    if chunk.usage_metadata is not None:
+      self.usage_metadata = chunk.usage_metadata
+    if any(
+        candidate.finish_reason is not None
+        for candidate in chunk.candidates or ()
+    ) or (chunk.prompt_feedback and chunk.prompt_feedback.block_reason):
+      chunk.streaming_stats = self
+
+
+class StreamingStatsDict(TypedDict, total=False):
+  """Latency statistics of a streamed response.
+
+  The statistics are attached to the final chunk of the response, the one with
+  a finish reason, and are complete once the stream is exhausted.
+  """
+
+  request_start_time: Optional[float]
+  """When the request was started, in seconds since the
+      epoch."""
+
+  chunk_times: list[float]
+  """When each chunk was received and parsed from the wire,
+      before it was converted to a response, in seconds since the epoch."""
+
+  chunk_parse_seconds: list[float]
+  """Seconds spent converting and validating each chunk into a
+      response."""
+
+  usage_metadata: Optional[GenerateContentResponseUsageMetadataDict]
+  """The latest usage metadata of the stream, which covers the
+      whole response once the stream is exhausted."""
+
+
+StreamingStatsOrDict = Union[StreamingStats, StreamingStatsDict]
+
+
 class GenerateContentResponse(_common.BaseModel):
   """Response message for PredictionService.GenerateContent."""
 
@@ -8583,6 +9141,12 @@ class GenerateContentResponse(_common.BaseModel):
       default=None,
       description="""First candidate from the parsed response if response_schema is provided. Not available for streaming.""",
   )
+  streaming_stats: Optional[StreamingStats] = Field(
+      default=None,
+      exclude=True,
+      description="""Latency statistics of the stream, on its final chunk.
+      Only available for streaming.""",
+  )
 
   def _get_text(self) -> Optional[str]:
     """Returns the concatenation of all text parts in the response.
@@ -8755,8 +9319,11 @@ class GenerateContentResponse(_common.BaseModel):
       *,
       response: dict[str, object],
       kwargs: dict[str, object],
+      skip_validation: bool = False,
   ) -> T:
-    result = super()._from_response(response=response, kwargs=kwargs)
+    result = super()._from_response(
+        response=response, kwargs=kwargs, skip_validation=skip_validation
+    )
 
     # Handles response schema.
     response_schema = _common.get_value_by_path(
@@ -18887,6 +19454,284 @@ class BatchJobDict(TypedDict, total=False):
 BatchJobOrDict = Union[BatchJob, BatchJobDict]
 
 
+class CreateShardedBatchJobConfig(_common.BaseModel):
+  """Config for batches.create_sharded."""
+
+  http_options: Optional[HttpOptions] = Field(
+      default=None, description="""Used to override HTTP request options."""
+  )
+  display_name: Optional[str] = Field(
+      default=None,
+      description="""The display name of the sharded job. The batch job of each shard is
+      named `<display_name>-shard-<index>`.
+      """,
+  )
+  max_requests_per_shard: Optional[int] = Field(
+      default=None,
+      description="""The maximum number of requests in a shard. Defaults to 10,000.
+      """,
+  )
+  max_bytes_per_shard: Optional[int] = Field(
+      default=None,
+      description="""The maximum size in bytes of the input file of a shard. A request
+      larger than this gets a shard of its own. Not limited by default, except for
+      `create_embeddings_sharded`, whose shards are inlined and default to
+      10,000,000 bytes.
+      """,
+  )
+  max_concurrency: Optional[int] = Field(
+      default=None,
+      description="""The maximum number of shards uploaded and submitted at once.
+      Defaults to 4.
+      """,
+  )
+
+
+class CreateShardedBatchJobConfigDict(TypedDict, total=False):
+  """Config for batches.create_sharded."""
+
+  http_options: Optional[HttpOptionsDict]
+  """Used to override HTTP request options."""
+
+  display_name: Optional[str]
+  """The display name of the sharded job. The batch job of each shard is
+      named `<display_name>-shard-<index>`.
+      """
+
+  max_requests_per_shard: Optional[int]
+  """The maximum number of requests in a shard. Defaults to 10,000.
+      """
+
+  max_bytes_per_shard: Optional[int]
+  """The maximum size in bytes of the input file of a shard. A request
+      larger than this gets a shard of its own. Not limited by default, except for
+      `create_embeddings_sharded`, whose shards are inlined and default to
+      10,000,000 bytes.
+      """
+
+  max_concurrency: Optional[int]
+  """The maximum number of shards uploaded and submitted at once.
+      Defaults to 4.
+      """
+
+
+CreateShardedBatchJobConfigOrDict = Union[
+    CreateShardedBatchJobConfig, CreateShardedBatchJobConfigDict
+]
+
+
+class ShardedBatchJob(_common.BaseModel):
+  """A logical batch job whose requests are split across several batch jobs."""
+
+  display_name: Optional[str] = Field(
+      default=None,
+      description="""The display name of the sharded job.
+      """,
+  )
+  jobs: Optional[list[BatchJob]] = Field(
+      default=None,
+      description="""The batch job of each shard, in the order of the requests.
+      """,
+  )
+  request_counts: Optional[list[int]] = Field(
+      default=None,
+      description="""The number of requests in each shard.
+      """,
+  )
+
+  @property
+  def state(self) -> Optional[JobState]:
+    """Returns the combined state of the batch jobs of the shards.
+
+    The state is shared by the shards if they all have the same state.
+    Otherwise it is running while any shard hasn't ended, and partially
+    succeeded or failed once all of them have.
+    """
+    states = [job.state for job in self.jobs or []]
+    if not states or None in states:
+      return None
+    if len(set(states)) == 1:
+      return states[0]
+    if not self.done:
+      waiting = (JobState.JOB_STATE_QUEUED, JobState.JOB_STATE_PENDING)
+      if all(state in waiting for state in states):
+        return JobState.JOB_STATE_PENDING
+      return JobState.JOB_STATE_RUNNING
+    if JobState.JOB_STATE_SUCCEEDED in states:
+      return JobState.JOB_STATE_PARTIALLY_SUCCEEDED
+    return JobState.JOB_STATE_FAILED
+
+  @property
+  def done(self) -> bool:
+    """Returns True if the batch jobs of all the shards have ended."""
+    return bool(self.jobs) and all(job.done for job in self.jobs or [])
+
+
+class ShardedBatchJobDict(TypedDict, total=False):
+  """A logical batch job whose requests are split across several batch jobs."""
+
+  display_name: Optional[str]
+  """The display name of the sharded job.
+      """
+
+  jobs: Optional[list[BatchJobDict]]
+  """The batch job of each shard, in the order of the requests.
+      """
+
+  request_counts: Optional[list[int]]
+  """The number of requests in each shard.
+      """
+
+
+ShardedBatchJobOrDict = Union[ShardedBatchJob, ShardedBatchJobDict]
+
+
+class WaitConfig(_common.BaseModel):
+  """Config for waiting for batch jobs, tuning jobs and operations."""
+
+  http_options: Optional[HttpOptions] = Field(
+      default=None,
+      description="""Used to override HTTP request options of the status requests.""",
+  )
+  initial_delay_seconds: Optional[float] = Field(
+      default=None,
+      description="""The delay before the first status request of a job, and after a
+      job is seen to make progress. Defaults to 5 seconds.
+      """,
+  )
+  max_delay_seconds: Optional[float] = Field(
+      default=None,
+      description="""The maximum delay between two status requests of a job. Defaults
+      to 60 seconds.
+      """,
+  )
+  backoff_multiplier: Optional[float] = Field(
+      default=None,
+      description="""The factor the delay of a job grows by after each status request
+      that shows no progress. Defaults to 1.5.
+      """,
+  )
+  timeout_seconds: Optional[float] = Field(
+      default=None,
+      description="""The deadline for all the jobs to end, after which a `TimeoutError`
+      is raised. Not limited by default.
+      """,
+  )
+  max_concurrency: Optional[int] = Field(
+      default=None,
+      description="""The maximum number of status requests in flight at once. Defaults
+      to 8.
+      """,
+  )
+
+
+class WaitConfigDict(TypedDict, total=False):
+  """Config for waiting for batch jobs, tuning jobs and operations."""
+
+  http_options: Optional[HttpOptionsDict]
+  """Used to override HTTP request options of the status requests."""
+
+  initial_delay_seconds: Optional[float]
+  """The delay before the first status request of a job, and after a
+      job is seen to make progress. Defaults to 5 seconds.
+      """
+
+  max_delay_seconds: Optional[float]
+  """The maximum delay between two status requests of a job. Defaults
+      to 60 seconds.
+      """
+
+  backoff_multiplier: Optional[float]
+  """The factor the delay of a job grows by after each status request
+      that shows no progress. Defaults to 1.5.
+      """
+
+  timeout_seconds: Optional[float]
+  """The deadline for all the jobs to end, after which a `TimeoutError`
+      is raised. Not limited by default.
+      """
+
+  max_concurrency: Optional[int]
+  """The maximum number of status requests in flight at once. Defaults
+      to 8.
+      """
+
+
+WaitConfigOrDict = Union[WaitConfig, WaitConfigDict]
+
+
+class DeferredBatchConfig(_common.BaseModel):
+  """Config for batches.deferred_models."""
+
+  http_options: Optional[HttpOptions] = Field(
+      default=None,
+      description="""Used to override HTTP request options of the batch job requests.""",
+  )
+  display_name: Optional[str] = Field(
+      default=None,
+      description="""The prefix of the display names of the batch jobs, which are
+      named `<display_name>-<index>`.
+      """,
+  )
+  max_requests_per_job: Optional[int] = Field(
+      default=None,
+      description="""The number of requests that submits a batch job right away.
+      Defaults to 1,000.
+      """,
+  )
+  max_bytes_per_job: Optional[int] = Field(
+      default=None,
+      description="""The maximum size in bytes of the requests of a batch job.
+      Defaults to 10,000,000, well within the limit of inlined requests.
+      """,
+  )
+  max_wait_seconds: Optional[float] = Field(
+      default=None,
+      description="""The longest a request waits for more requests to share its batch
+      job before the job is submitted. Defaults to 60 seconds.
+      """,
+  )
+  wait_config: Optional[WaitConfig] = Field(
+      default=None,
+      description="""How the batch jobs are polled until they end.
+      """,
+  )
+
+
+class DeferredBatchConfigDict(TypedDict, total=False):
+  """Config for batches.deferred_models."""
+
+  http_options: Optional[HttpOptionsDict]
+  """Used to override HTTP request options of the batch job requests."""
+
+  display_name: Optional[str]
+  """The prefix of the display names of the batch jobs, which are
+      named `<display_name>-<index>`.
+      """
+
+  max_requests_per_job: Optional[int]
+  """The number of requests that submits a batch job right away.
+      Defaults to 1,000.
+      """
+
+  max_bytes_per_job: Optional[int]
+  """The maximum size in bytes of the requests of a batch job.
+      Defaults to 10,000,000, well within the limit of inlined requests.
+      """
+
+  max_wait_seconds: Optional[float]
+  """The longest a request waits for more requests to share its batch
+      job before the job is submitted. Defaults to 60 seconds.
+      """
+
+  wait_config: Optional[WaitConfigDict]
+  """How the batch jobs are polled until they end.
+      """
+
+
+DeferredBatchConfigOrDict = Union[DeferredBatchConfig, DeferredBatchConfigDict]
+
+
 class EmbedContentBatch(_common.BaseModel):
   """Parameters for the embed_content method."""
 
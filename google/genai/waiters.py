@@ -0,0 +1,514 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Waiters for many batch jobs, tuning jobs and operations at once."""
+
+import asyncio
+import concurrent.futures
+import dataclasses
+import heapq
+import logging
+import math
+import time
+from typing import Any, AsyncIterator, Iterable, Iterator, Optional, TypeVar, Union
+
+import httpx
+
+from . import _api_module
+from . import errors
+from . import types
+
+try:
+  import aiohttp
+except ImportError:
+  aiohttp = None  # type: ignore[assignment]
+
+try:
+  import httpx2
+except ImportError:
+  httpx2 = None  # type: ignore[assignment]
+
+logger = logging.getLogger('google_genai.waiters')
+
+# Errors of a status request, besides API errors, after which the job is
+# polled again later.
+_TRANSIENT_EXC: tuple[type[Exception], ...] = (
+    httpx.TransportError,
+    asyncio.TimeoutError,
+)
+if httpx2 is not None:
+  _TRANSIENT_EXC += (httpx2.TransportError,)
+if aiohttp is not None:
+  _TRANSIENT_EXC += (aiohttp.ClientError,)
+
+_DEFAULT_INITIAL_DELAY_SECONDS = 5.0
+_DEFAULT_MAX_DELAY_SECONDS = 60.0
+_DEFAULT_BACKOFF_MULTIPLIER = 1.5
+_DEFAULT_MAX_CONCURRENCY = 8
+
+Job = TypeVar(
+    'Job',
+    bound=Union[
+        types.BatchJob,
+        types.ShardedBatchJob,
+        types.TuningJob,
+        types.Operation,
+    ],
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class _WaitOptions:
+  """A `WaitConfig` with its defaults filled in."""
+
+  initial_delay_seconds: float
+  max_delay_seconds: float
+  backoff_multiplier: float
+  max_concurrency: int
+  timeout_seconds: Optional[float]
+  http_options: Optional[types.HttpOptions]
+
+
+def _wait_config(config: Optional[types.WaitConfigOrDict]) -> _WaitOptions:
+  """Returns the options of a config with its defaults filled in."""
+  if isinstance(config, dict):
+    config = types.WaitConfig(**config)
+  config = config or types.WaitConfig()
+  options = _WaitOptions(
+      initial_delay_seconds=(
+          config.initial_delay_seconds
+          if config.initial_delay_seconds is not None
+          else _DEFAULT_INITIAL_DELAY_SECONDS
+      ),
+      max_delay_seconds=(
+          config.max_delay_seconds
+          if config.max_delay_seconds is not None
+          else _DEFAULT_MAX_DELAY_SECONDS
+      ),
+      backoff_multiplier=(
+          config.backoff_multiplier
+          if config.backoff_multiplier is not None
+          else _DEFAULT_BACKOFF_MULTIPLIER
+      ),
+      max_concurrency=config.max_concurrency or _DEFAULT_MAX_CONCURRENCY,
+      timeout_seconds=config.timeout_seconds,
+      http_options=config.http_options,
+  )
+  if options.max_concurrency < 1:
+    raise ValueError(
+        f'max_concurrency must be positive, got {options.max_concurrency}.'
+    )
+  if options.backoff_multiplier < 1:
+    raise ValueError(
+        'backoff_multiplier must be at least 1, got'
+        f' {options.backoff_multiplier}.'
+    )
+  return options
+
+
+def _is_done(job: Any) -> bool:
+  if isinstance(job, types.TuningJob):
+    return job.has_ended
+  if isinstance(job, (types.BatchJob, types.ShardedBatchJob, types.Operation)):
+    return bool(job.done)
+  raise TypeError(
+      'Only batch jobs, tuning jobs and operations can be waited for, got'
+      f' {type(job).__name__}.'
+  )
+
+
+def _progress(job: Any) -> Any:
+  """Returns the part of a job that changes as it makes progress."""
+  if isinstance(job, types.ShardedBatchJob):
+    return [shard.state for shard in job.jobs or []]
+  if isinstance(job, types.Operation):
+    return job.metadata
+  return job.state
+
+
+def _next_delay(
+    options: _WaitOptions, delay: float, job: Any, latest: Any
+) -> float:
+  """Returns the delay before the next status request of a job.
+
+  The delay grows with each status request that shows no progress, and
+  starts over when the job makes progress, as it is then likely to make more.
+  """
+  if _progress(latest) != _progress(job):
+    return options.initial_delay_seconds
+  return min(delay * options.backoff_multiplier, options.max_delay_seconds)
+
+
+def _job_label(job: Any) -> str:
+  """Returns how a job is named in logs and errors."""
+  if isinstance(job, types.ShardedBatchJob):
+    if job.display_name:
+      return f'sharded batch job {job.display_name}'
+    names = ', '.join(str(shard.name) for shard in job.jobs or [])
+    return f'sharded batch job of {names}'
+  return str(job.name)
+
+
+def _check_poll_error(job: Any, error: Exception) -> None:
+  """Raises the error of a status request unless it is transient.
+
+  Transient errors, such as rate limiting, server errors and dropped
+  connections, are logged, and the job is polled again after its backoff.
+  """
+  if (
+      isinstance(error, errors.APIError)
+      and (error.code in (408, 429) or error.code >= 500)
+  ) or isinstance(error, _TRANSIENT_EXC):
+    logger.warning(
+        'Getting the status of %s failed with %r. Trying again later.',
+        _job_label(job),
+        error,
+    )
+    return
+  label = _job_label(job)
+  logger.error('Getting the status of %s failed with %r.', label, error)
+  if hasattr(error, 'add_note'):
+    error.add_note(f'Raised while getting the status of {label}.')
+  raise error
+
+
+def _timeout_error(
+    options: _WaitOptions, remaining: int, total: int
+) -> TimeoutError:
+  return TimeoutError(
+      f'{remaining} of {total} jobs did not end within'
+      f' {options.timeout_seconds} seconds.'
+  )
+
+
+class Waiters(_api_module.BaseModule):
+  """Waits for many batch jobs, tuning jobs and operations at once."""
+
+  def _poll(self, job: Job, options: _WaitOptions) -> Job:
+    """Gets the latest status of a job."""
+    get_config = {'http_options': options.http_options}
+    if isinstance(job, types.ShardedBatchJob):
+      from .batches import Batches  # pylint: disable=g-import-not-at-top
+
+      return Batches(self._api_client).get_sharded(job, config=get_config)  # type: ignore[arg-type, return-value]
+    if isinstance(job, types.BatchJob):
+      from .batches import Batches  # pylint: disable=g-import-not-at-top
+
+      return Batches(self._api_client).get(name=job.name, config=get_config)  # type: ignore[arg-type, return-value]
+    if isinstance(job, types.TuningJob):
+      from .tunings import Tunings  # pylint: disable=g-import-not-at-top
+
+      return Tunings(self._api_client).get(name=job.name, config=get_config)  # type: ignore[arg-type, return-value]
+    from .operations import Operations  # pylint: disable=g-import-not-at-top
+
+    return Operations(self._api_client).get(job, config=get_config)  # type: ignore[arg-type, type-var]
+
+  def _as_completed(
+      self, jobs: Iterable[Job], config: Optional[types.WaitConfigOrDict]
+  ) -> Iterator[tuple[int, Job]]:
+    """Yields the index and the latest status of each job once it ends.
+
+    The status requests of all the jobs are scheduled on a single queue and
+    sent by a pool of `max_concurrency` threads, so the number of threads
+    doesn't grow with the number of jobs.
+    """
+    options = _wait_config(config)
+    jobs = list(jobs)
+    deadline = (
+        time.monotonic() + options.timeout_seconds
+        if options.timeout_seconds is not None
+        else math.inf
+    )
+    delays = [options.initial_delay_seconds] * len(jobs)
+    # (Time of the next status request, index) of the jobs that haven't ended.
+    scheduled: list[tuple[float, int]] = []
+    for index, job in enumerate(jobs):
+      if _is_done(job):
+        yield index, job
+      else:
+        heapq.heappush(scheduled, (time.monotonic() + delays[index], index))
+    running: dict[concurrent.futures.Future[Job], int] = {}
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=options.max_concurrency,
+        thread_name_prefix='google-genai-waiters',
+    ) as executor:
+      try:
+        while scheduled or running:
+          now = time.monotonic()
+          if now >= deadline:
+            raise _timeout_error(
+                options, len(scheduled) + len(running), len(jobs)
+            )
+          while (
+              scheduled
+              and scheduled[0][0] <= now
+              and len(running) < options.max_concurrency
+          ):
+            _, index = heapq.heappop(scheduled)
+            running[executor.submit(self._poll, jobs[index], options)] = index
+          wake_at = deadline
+          if scheduled and len(running) < options.max_concurrency:
+            wake_at = min(wake_at, scheduled[0][0])
+          timeout = None if wake_at == math.inf else max(wake_at - now, 0.0)
+          if not running:
+            time.sleep(timeout)  # type: ignore[arg-type]
+            continue
+          finished, _ = concurrent.futures.wait(
+              running,
+              timeout=timeout,
+              return_when=concurrent.futures.FIRST_COMPLETED,
+          )
+          for future in finished:
+            index = running.pop(future)
+            error = future.exception()
+            if error is not None:
+              _check_poll_error(jobs[index], error)  # type: ignore[arg-type]
+              latest = jobs[index]
+            else:
+              latest = future.result()
+            if _is_done(latest):
+              yield index, latest
+              continue
+            delays[index] = _next_delay(
+                options, delays[index], jobs[index], latest
+            )
+            jobs[index] = latest
+            heapq.heappush(scheduled, (time.monotonic() + delays[index], index))
+      finally:
+        for future in running:
+          future.cancel()
+
+  def as_completed(
+      self,
+      jobs: Iterable[Job],
+      *,
+      config: Optional[types.WaitConfigOrDict] = None,
+  ) -> Iterator[Job]:
+    """Yields batch jobs, tuning jobs and operations as they end.
+
+    The status of each job is requested with a backoff of its own: the delay
+    between two requests grows by `backoff_multiplier` up to
+    `max_delay_seconds` while the job shows no progress, and starts over at
+    `initial_delay_seconds` when its state changes. A status request that
+    fails with a transient error, such as a 429 or 5xx error or a dropped
+    connection, counts as no progress. At most `max_concurrency`
+    status requests are in flight at once, from a shared pool of threads.
+
+    Args:
+      jobs: The batch jobs, sharded batch jobs, tuning jobs or operations to
+        wait for. Jobs that have already ended are yielded right away.
+      config: Optional configuration of the backoff, the concurrency and the
+        deadline.
+
+    Yields:
+      The latest status of each job, once it has ended.
+
+    Raises:
+      TimeoutError: If some jobs haven't ended within `timeout_seconds`.
+      APIError: If a status request fails with an error that isn't transient.
+
+    Usage:
+
+    .. code-block:: python
+
+      for job in client.waiters.as_completed(
+          batch_jobs, config={'timeout_seconds': 24 * 60 * 60}
+      ):
+        print(job.name, job.state)
+    """
+    for _, job in self._as_completed(jobs, config):
+      yield job
+
+  def wait(
+      self,
+      jobs: Iterable[Job],
+      *,
+      config: Optional[types.WaitConfigOrDict] = None,
+  ) -> list[Job]:
+    """Waits for batch jobs, tuning jobs and operations to end.
+
+    The jobs are polled as in `as_completed`.
+
+    Args:
+      jobs: The batch jobs, sharded batch jobs, tuning jobs or operations to
+        wait for.
+      config: Optional configuration of the backoff, the concurrency and the
+        deadline.
+
+    Returns:
+      The latest status of the jobs, in the order they were given in.
+
+    Raises:
+      TimeoutError: If some jobs haven't ended within `timeout_seconds`.
+      APIError: If a status request fails with an error that isn't transient.
+
+    Usage:
+
+    .. code-block:: python
+
+      operation = client.models.generate_videos(
+          model='veo-2.0-generate-001', prompt='A cat driving a car.'
+      )
+      [operation] = client.waiters.wait([operation])
+      print(operation.response)
+    """
+    jobs = list(jobs)
+    for index, job in self._as_completed(jobs, config):
+      jobs[index] = job
+    return jobs
+
+
+class AsyncWaiters(_api_module.BaseModule):
+  """Waits for many batch jobs, tuning jobs and operations at once."""
+
+  async def _poll(self, job: Job, options: _WaitOptions) -> Job:
+    """Gets the latest status of a job."""
+    get_config = {'http_options': options.http_options}
+    if isinstance(job, types.ShardedBatchJob):
+      from .batches import AsyncBatches  # pylint: disable=g-import-not-at-top
+
+      return await AsyncBatches(self._api_client).get_sharded(  # type: ignore[return-value]
+          job, config=get_config  # type: ignore[arg-type]
+      )
+    if isinstance(job, types.BatchJob):
+      from .batches import AsyncBatches  # pylint: disable=g-import-not-at-top
+
+      return await AsyncBatches(self._api_client).get(  # type: ignore[return-value]
+          name=job.name, config=get_config  # type: ignore[arg-type]
+      )
+    if isinstance(job, types.TuningJob):
+      from .tunings import AsyncTunings  # pylint: disable=g-import-not-at-top
+
+      return await AsyncTunings(self._api_client).get(  # type: ignore[return-value]
+          name=job.name, config=get_config  # type: ignore[arg-type]
+      )
+    from .operations import AsyncOperations  # pylint: disable=g-import-not-at-top
+
+    return await AsyncOperations(self._api_client).get(job, config=get_config)  # type: ignore[arg-type, type-var]
+
+  async def _as_completed(
+      self, jobs: Iterable[Job], config: Optional[types.WaitConfigOrDict]
+  ) -> AsyncIterator[tuple[int, Job]]:
+    """Yields the index and the latest status of each job once it ends.
+
+    Each job is polled by a task of its own, and a semaphore caps the number
+    of status requests in flight at `max_concurrency`.
+    """
+    options = _wait_config(config)
+    jobs = list(jobs)
+    for job in jobs:
+      _is_done(job)
+    semaphore = asyncio.Semaphore(options.max_concurrency)
+
+    async def wait_for(index: int, job: Job) -> tuple[int, Job]:
+      delay = options.initial_delay_seconds
+      while not _is_done(job):
+        await asyncio.sleep(delay)
+        async with semaphore:
+          try:
+            latest = await self._poll(job, options)
+          except Exception as e:  # pylint: disable=broad-exception-caught
+            _check_poll_error(job, e)
+            latest = job
+        delay = _next_delay(options, delay, job, latest)
+        job = latest
+      return index, job
+
+    tasks = [
+        asyncio.ensure_future(wait_for(index, job))
+        for index, job in enumerate(jobs)
+    ]
+    try:
+      for task in asyncio.as_completed(tasks, timeout=options.timeout_seconds):
+        yield await task
+    except asyncio.TimeoutError:
+      remaining = sum(not task.done() for task in tasks)
+      raise _timeout_error(options, remaining, len(jobs)) from None
+    finally:
+      for task in tasks:
+        task.cancel()
+      await asyncio.gather(*tasks, return_exceptions=True)
+
+  async def as_completed(
+      self,
+      jobs: Iterable[Job],
+      *,
+      config: Optional[types.WaitConfigOrDict] = None,
+  ) -> AsyncIterator[Job]:
+    """Yields batch jobs, tuning jobs and operations as they end.
+
+    The status of each job is requested with a backoff of its own: the delay
+    between two requests grows by `backoff_multiplier` up to
+    `max_delay_seconds` while the job shows no progress, and starts over at
+    `initial_delay_seconds` when its state changes. A status request that
+    fails with a transient error, such as a 429 or 5xx error or a dropped
+    connection, counts as no progress. At most `max_concurrency`
+    status requests are in flight at once.
+
+    Args:
+      jobs: The batch jobs, sharded batch jobs, tuning jobs or operations to
+        wait for. Jobs that have already ended are yielded right away.
+      config: Optional configuration of the backoff, the concurrency and the
+        deadline.
+
+    Yields:
+      The latest status of each job, once it has ended.
+
+    Raises:
+      TimeoutError: If some jobs haven't ended within `timeout_seconds`.
+      APIError: If a status request fails with an error that isn't transient.
+
+    Usage:
+
+    .. code-block:: python
+
+      async for job in client.aio.waiters.as_completed(batch_jobs):
+        print(job.name, job.state)
+    """
+    results = self._as_completed(jobs, config)
+    try:
+      async for _, job in results:
+        yield job
+    finally:
+      await results.aclose()  # type: ignore[attr-defined]
+
+  async def wait(
+      self,
+      jobs: Iterable[Job],
+      *,
+      config: Optional[types.WaitConfigOrDict] = None,
+  ) -> list[Job]:
+    """Waits for batch jobs, tuning jobs and operations to end.
+
+    The jobs are polled as in `as_completed`.
+
+    Args:
+      jobs: The batch jobs, sharded batch jobs, tuning jobs or operations to
+        wait for.
+      config: Optional configuration of the backoff, the concurrency and the
+        deadline.
+
+    Returns:
+      The latest status of the jobs, in the order they were given in.
+
+    Raises:
+      TimeoutError: If some jobs haven't ended within `timeout_seconds`.
+      APIError: If a status request fails with an error that isn't transient.
+    """
+    jobs = list(jobs)
+    async for index, job in self._as_completed(jobs, config):
+      jobs[index] = job
+    return jobs